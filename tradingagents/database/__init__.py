@@ -5,11 +5,14 @@ from .chatter_dal import (
     get_recent_chatter,
     get_chatter_metadata,
     get_chatter_summary,
+    get_chatter_sentiment_summary,
     insert_chatter,
     bulk_insert_chatter,
     ensure_market_chatter_table
 )
+from .chatter_rollup import rebuild_chatter_rollup
 from .migrations import run_migrations, check_migration_status
+from .schema_registry import is_table_ready, invalidate_schema_cache
 
 __all__ = [
     'get_db_connection',
@@ -18,12 +21,18 @@ __all__ = [
     # Migrations
     'run_migrations',
     'check_migration_status',
+    # Schema readiness registry
+    'is_table_ready',
+    'invalidate_schema_cache',
     # Market chatter DAL
     'get_recent_chatter',
     'get_chatter_metadata',
     'get_chatter_summary',
+    'get_chatter_sentiment_summary',
     'insert_chatter',
     'bulk_insert_chatter',
-    'ensure_market_chatter_table'
+    'ensure_market_chatter_table',
+    # Market chatter sentiment rollup
+    'rebuild_chatter_rollup'
 ]
 
@@ -1,13 +1,330 @@
-"""Audit logging for all system operations."""
+"""
+Audit logging for all system operations.
+
+Events are written synchronously by default. When the background audit sink
+is running (start_audit_sink(), called from the FastAPI lifespan), the log_*
+functions only enqueue a row and a writer thread flushes batches with a
+multi-row INSERT on a size or time trigger. A rejected batch is retried
+row by row so one bad event only loses itself.
+"""
 import logging
 import json
+import queue
+import threading
+import time
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from uuid import uuid4
+from psycopg2.extras import execute_values
 from .connection import get_db_connection
 
 logger = logging.getLogger(__name__)
 
+# Background sink defaults
+AUDIT_QUEUE_MAXSIZE = 10000
+AUDIT_BATCH_SIZE = 500
+AUDIT_FLUSH_INTERVAL_SECONDS = 1.0
+AUDIT_BLOCK_TIMEOUT_SECONDS = 0.05
+
+# Overflow policies applied when the queue is full
+OVERFLOW_DROP_NEWEST = 'drop_newest'   # reject the incoming event
+OVERFLOW_DROP_OLDEST = 'drop_oldest'   # evict the oldest queued event
+OVERFLOW_BLOCK = 'block'               # backpressure: wait, then drop newest
+
+_AUDIT_COLUMNS = (
+    'event_type', 'entity_type', 'entity_id', 'action',
+    'user_id', 'request_id', 'details', 'ip_address'
+)
+
+AuditRow = Tuple[Any, ...]
+
+
+def _insert_audit_rows_individually(cur, rows: List[AuditRow]) -> int:
+    """
+    Insert audit rows one statement at a time, each under a savepoint.
+    
+    Used when a multi-row INSERT is rejected as a whole, so one bad event
+    only loses itself. Returns the number of rows that failed.
+    """
+    insert_sql = f"""
+        INSERT INTO audit_log ({', '.join(_AUDIT_COLUMNS)})
+        VALUES ({', '.join(['%s'] * len(_AUDIT_COLUMNS))})
+    """
+    failed = 0
+    for row in rows:
+        try:
+            cur.execute("SAVEPOINT audit_row")
+            cur.execute(insert_sql, row)
+            cur.execute("RELEASE SAVEPOINT audit_row")
+        except Exception as e:
+            cur.execute("ROLLBACK TO SAVEPOINT audit_row")
+            logger.warning(f"[AUDIT] Error writing audit row ({row[0]}/{row[3]}): {e}")
+            failed += 1
+    return failed
+
+
+def _insert_audit_rows(rows: List[AuditRow]) -> int:
+    """
+    Write audit rows with a single multi-row INSERT.
+    
+    If a batch of more than one row is rejected, the transaction is rolled
+    back and the rows are retried one by one. A single row that fails
+    raises, as before.
+    
+    Returns:
+        Number of rows that could not be written.
+    """
+    with get_db_connection() as conn:
+        try:
+            with conn.cursor() as cur:
+                execute_values(
+                    cur,
+                    f"INSERT INTO audit_log ({', '.join(_AUDIT_COLUMNS)}) VALUES %s",
+                    rows,
+                    page_size=len(rows)
+                )
+            conn.commit()
+            return 0
+        except Exception as e:
+            conn.rollback()
+            if len(rows) == 1:
+                raise
+            logger.warning(
+                f"[AUDIT] Batch of {len(rows)} audit rows rejected ({e}), "
+                f"retrying row by row"
+            )
+        with conn.cursor() as cur:
+            failed = _insert_audit_rows_individually(cur, rows)
+        conn.commit()
+        return failed
+
+
+class AuditSink:
+    """
+    Bounded in-memory audit queue drained by a writer thread.
+    
+    Producers pay for a queue put; the writer flushes when a batch reaches
+    batch_size rows or flush_interval seconds have passed since the first
+    queued row. Overflow handling is explicit (see OVERFLOW_* policies) and
+    every dropped event is counted.
+    """
+    
+    def __init__(
+        self,
+        maxsize: int = AUDIT_QUEUE_MAXSIZE,
+        batch_size: int = AUDIT_BATCH_SIZE,
+        flush_interval: float = AUDIT_FLUSH_INTERVAL_SECONDS,
+        overflow_policy: str = OVERFLOW_BLOCK,
+        block_timeout: float = AUDIT_BLOCK_TIMEOUT_SECONDS
+    ):
+        if overflow_policy not in (OVERFLOW_DROP_NEWEST, OVERFLOW_DROP_OLDEST, OVERFLOW_BLOCK):
+            raise ValueError(f"Unknown audit overflow policy '{overflow_policy}'")
+        
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow_policy = overflow_policy
+        self.block_timeout = block_timeout
+        
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=maxsize)
+        self._thread: Optional[threading.Thread] = None
+        self._flush_requested = threading.Event()
+        self._stopping = threading.Event()
+        self._idle = threading.Condition()
+        self._in_flight = 0
+        self._stats = {
+            'enqueued': 0,
+            'written': 0,
+            'dropped': 0,
+            'failed': 0,
+            'batches': 0
+        }
+        self._stats_lock = threading.Lock()
+    
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[key] += amount
+    
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self) -> None:
+        """Start the writer thread (idempotent)."""
+        if self.running:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+        self._thread.start()
+        logger.info(
+            f"[AUDIT] Background sink started (maxsize={self._queue.maxsize}, "
+            f"batch={self.batch_size}, interval={self.flush_interval}s, "
+            f"policy={self.overflow_policy})"
+        )
+    
+    def submit(self, row: AuditRow) -> bool:
+        """
+        Enqueue an audit row without touching the database.
+        
+        Returns:
+            True if queued, False if dropped by the overflow policy.
+        """
+        with self._idle:
+            self._in_flight += 1
+        try:
+            self._queue.put_nowait(row)
+            self._count('enqueued')
+            return True
+        except queue.Full:
+            pass
+        
+        if self.overflow_policy == OVERFLOW_DROP_OLDEST:
+            try:
+                self._queue.get_nowait()
+                self._count('dropped')
+                self._done(1)
+                self._queue.put_nowait(row)
+                self._count('enqueued')
+                return True
+            except (queue.Empty, queue.Full):
+                pass
+        elif self.overflow_policy == OVERFLOW_BLOCK:
+            try:
+                self._queue.put(row, timeout=self.block_timeout)
+                self._count('enqueued')
+                return True
+            except queue.Full:
+                pass
+        
+        self._count('dropped')
+        self._done(1)
+        dropped = self._stats['dropped']
+        if dropped == 1 or dropped % 1000 == 0:
+            logger.warning(f"[AUDIT] Audit queue full, {dropped} events dropped so far")
+        return False
+    
+    def _done(self, count: int) -> None:
+        with self._idle:
+            self._in_flight -= count
+            if self._in_flight <= 0:
+                self._idle.notify_all()
+    
+    def _run(self) -> None:
+        batch: List[AuditRow] = []
+        deadline: Optional[float] = None
+        
+        while not (self._stopping.is_set() and self._queue.empty()):
+            timeout = self.flush_interval if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                batch.append(self._queue.get(timeout=timeout))
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+            except queue.Empty:
+                pass
+            
+            flush_now = (self._flush_requested.is_set() or self._stopping.is_set()) and self._queue.empty()
+            if batch and (len(batch) >= self.batch_size or flush_now
+                          or time.monotonic() >= deadline):
+                self._write(batch)
+                batch = []
+                deadline = None
+            if flush_now:
+                self._flush_requested.clear()
+        
+        if batch:
+            self._write(batch)
+    
+    def _write(self, batch: List[AuditRow]) -> None:
+        try:
+            failed = _insert_audit_rows(batch)
+            self._count('written', len(batch) - failed)
+            self._count('failed', failed)
+            self._count('batches')
+            logger.debug(f"[AUDIT] Flushed {len(batch) - failed} audit rows ({failed} failed)")
+        except Exception as e:
+            self._count('failed', len(batch))
+            logger.error(f"[AUDIT] Failed to flush {len(batch)} audit rows: {e}", exc_info=True)
+        finally:
+            self._done(len(batch))
+    
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Block until every event queued so far has been written (or failed).
+        
+        Returns:
+            True if the queue drained within timeout.
+        """
+        if not self.running:
+            return self._in_flight <= 0
+        self._flush_requested.set()
+        deadline = time.monotonic() + timeout
+        with self._idle:
+            while self._in_flight > 0:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+        return True
+    
+    def stop(self, timeout: float = 10.0) -> None:
+        """Flush pending events and stop the writer thread."""
+        if not self.running:
+            return
+        self._stopping.set()
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning(f"[AUDIT] Audit writer did not stop within {timeout}s: {self.stats()}")
+        else:
+            logger.info(f"[AUDIT] Background sink stopped: {self.stats()}")
+        self._thread = None
+    
+    def stats(self) -> Dict[str, int]:
+        """Return counters plus the current queue depth."""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats['queued'] = self._queue.qsize()
+        return stats
+
+
+_audit_sink: Optional[AuditSink] = None
+_audit_sink_lock = threading.Lock()
+
+
+def start_audit_sink(**kwargs) -> AuditSink:
+    """
+    Start the process-wide background audit sink.
+    
+    Keyword arguments are passed to AuditSink. Safe to call more than once.
+    """
+    global _audit_sink
+    with _audit_sink_lock:
+        if _audit_sink is None or not _audit_sink.running:
+            _audit_sink = AuditSink(**kwargs)
+            _audit_sink.start()
+        return _audit_sink
+
+
+def stop_audit_sink(timeout: float = 10.0) -> None:
+    """Flush and stop the background audit sink; later events are written inline."""
+    global _audit_sink
+    with _audit_sink_lock:
+        sink, _audit_sink = _audit_sink, None
+    if sink is not None:
+        sink.stop(timeout)
+
+
+def get_audit_sink() -> Optional[AuditSink]:
+    """Return the running audit sink, if any."""
+    return _audit_sink
+
+
+def _write_audit_row(row: AuditRow) -> None:
+    """Hand a row to the background sink, or write it inline if none is running."""
+    sink = _audit_sink
+    if sink is not None and sink.running:
+        sink.submit(row)
+        return
+    _insert_audit_rows([row])
+
 # Thread-local storage for request ID (if needed)
 _request_context = {'request_id': None}
 
@@ -47,24 +364,17 @@ def log_data_access(
     effective_user_id = user_id if user_id is not None else agent_name
     
     try:
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute("""
-                    INSERT INTO audit_log 
-                    (event_type, entity_type, entity_id, action, user_id, request_id, details, ip_address)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                """, (
-                    event_type,
-                    entity_type,
-                    entity_id,
-                    'data_access',
-                    effective_user_id,
-                    get_request_id(),
-                    json.dumps(details),
-                    ip_address
-                ))
-                conn.commit()
-                logger.debug(f"Audit log entry created: {event_type}/{entity_type}/{entity_id}")
+        _write_audit_row((
+            event_type,
+            entity_type,
+            entity_id,
+            'data_access',
+            effective_user_id,
+            get_request_id(),
+            json.dumps(details),
+            ip_address
+        ))
+        logger.debug(f"Audit log entry created: {event_type}/{entity_type}/{entity_id}")
     except Exception as e:
         logger.error(f"Failed to write audit log: {e}", exc_info=True)
 
@@ -78,31 +388,25 @@ def log_llm_interaction(
 ):
     """Log an LLM interaction for audit purposes."""
     try:
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                details = {
-                    'agent': agent_name,
-                    'interaction_type': interaction_type,
-                    'input': input_data,
-                    'output': output_data,
-                    'timestamp': datetime.utcnow().isoformat()
-                }
-                
-                cur.execute("""
-                    INSERT INTO audit_log 
-                    (event_type, entity_type, entity_id, action, user_id, request_id, details)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
-                """, (
-                    'llm_interaction',
-                    'agent',
-                    None,
-                    interaction_type,
-                    user_id,
-                    get_request_id(),
-                    json.dumps(details)
-                ))
-                conn.commit()
-                logger.debug(f"LLM interaction logged: {agent_name}/{interaction_type}")
+        details = {
+            'agent': agent_name,
+            'interaction_type': interaction_type,
+            'input': input_data,
+            'output': output_data,
+            'timestamp': datetime.utcnow().isoformat()
+        }
+        
+        _write_audit_row((
+            'llm_interaction',
+            'agent',
+            None,
+            interaction_type,
+            user_id,
+            get_request_id(),
+            json.dumps(details),
+            None
+        ))
+        logger.debug(f"LLM interaction logged: {agent_name}/{interaction_type}")
     except Exception as e:
         logger.error(f"Failed to log LLM interaction: {e}", exc_info=True)
 
@@ -116,29 +420,23 @@ def log_error(
 ):
     """Log an error event."""
     try:
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                details = {
-                    'error_type': error_type,
-                    'error_message': error_message,
-                    'error_details': error_details or {},
-                    'timestamp': datetime.utcnow().isoformat()
-                }
-                
-                cur.execute("""
-                    INSERT INTO audit_log 
-                    (event_type, entity_type, entity_id, action, request_id, details)
-                    VALUES (%s, %s, %s, %s, %s, %s)
-                """, (
-                    'error',
-                    entity_type,
-                    entity_id,
-                    error_type,
-                    get_request_id(),
-                    json.dumps(details)
-                ))
-                conn.commit()
-                logger.error(f"Error logged: {error_type} - {error_message}")
+        details = {
+            'error_type': error_type,
+            'error_message': error_message,
+            'error_details': error_details or {},
+            'timestamp': datetime.utcnow().isoformat()
+        }
+        
+        _write_audit_row((
+            'error',
+            entity_type,
+            entity_id,
+            error_type,
+            None,
+            get_request_id(),
+            json.dumps(details),
+            None
+        ))
+        logger.error(f"Error logged: {error_type} - {error_message}")
     except Exception as e:
         logger.error(f"Failed to log error: {e}", exc_info=True)
-
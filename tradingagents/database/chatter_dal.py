@@ -16,8 +16,16 @@ import json
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Any
 
+from tradingagents.metrics import DB_QUERY_SECONDS, timed
+
 from .connection import get_db_connection
-from .chatter_persist import ensure_market_chatter_table, persist_market_chatter
+from .chatter_persist import (
+    ensure_market_chatter_table,
+    persist_market_chatter,
+    PERSIST_METHOD_COPY
+)
+from .chatter_rollup import ROLLUP_TABLE, get_chatter_rollup, is_chatter_rollup_ready
+from .schema_registry import is_table_ready, invalidate_on_ddl_error
 
 logger = logging.getLogger(__name__)
 
@@ -36,37 +44,69 @@ def _make_response(
 
 
 def _table_exists(cursor, table_name: str) -> bool:
-    """Check if a table exists in the database."""
-    try:
-        cursor.execute("""
-            SELECT EXISTS (
-                SELECT FROM information_schema.tables 
-                WHERE table_name = %s
-            );
-        """, (table_name,))
-        result = cursor.fetchone()
-        return result[0] if result else False
-    except Exception as e:
-        logger.warning(f"Error checking table existence: {e}")
-        return False
+    """
+    Check if a table exists in the database.
+    
+    Served from the process-lifetime schema registry; the catalog is only
+    queried until the table has been seen once.
+    """
+    return is_table_ready(table_name, cursor)
+
+
+def _collapse_stories(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Collapse near-duplicate rows into one item per story cluster.
+    
+    The canonical row represents the story (first row if the canonical is
+    outside the window). It gains story_sources and story_size; its
+    sentiment is the canonical score, else the mean of member scores.
+    Order (newest first) is preserved.
+    """
+    stories: Dict[str, List[Dict[str, Any]]] = {}
+    for item in items:
+        key = item.get("story_cluster_id") or f"{item['source']}:{item['source_id']}"
+        stories.setdefault(key, []).append(item)
+    
+    collapsed = []
+    for members in stories.values():
+        story = next((m for m in members if m.get("is_canonical")), members[0])
+        story = dict(story)
+        story["story_sources"] = sorted({m["source"] for m in members if m.get("source")})
+        story["story_size"] = len(members)
+        if story.get("sentiment_score") is None:
+            scores = [m["sentiment_score"] for m in members if m.get("sentiment_score") is not None]
+            if scores:
+                story["sentiment_score"] = sum(scores) / len(scores)
+                story["sentiment_label"] = next(
+                    m["sentiment_label"] for m in members if m.get("sentiment_score") is not None
+                )
+        collapsed.append(story)
+    return collapsed
 
 
+@timed(DB_QUERY_SECONDS, statement='get_recent_chatter')
 def get_recent_chatter(
     ticker: str,
     days: int = 7,
     limit: int = 100,
-    source: Optional[str] = None
+    source: Optional[str] = None,
+    unique_stories: bool = False
 ) -> Dict[str, Any]:
     """
     Retrieve recent market chatter for a ticker.
     
     SAFE: Never throws. Returns standard dict contract.
     
+    Near-duplicate rows (the same story from several sources) are stored
+    without a body; their summary is filled from the canonical row.
+    
     Args:
         ticker: Stock ticker symbol (e.g., 'AAPL', 'MSFT')
         days: Number of days to look back (default: 7)
         limit: Maximum number of records (default: 100)
         source: Optional filter by source (e.g., 'alpha_vantage', 'rss')
+        unique_stories: Return one item per story cluster instead of one
+            per row (limit still applies to rows)
     
     Returns:
         Standard DAL response:
@@ -74,6 +114,7 @@ def get_recent_chatter(
             "data": {
                 "items": List[dict],
                 "count": int,
+                "row_count": int,
                 "sources": Dict[str, int],
                 "window_days": int
             },
@@ -87,6 +128,7 @@ def get_recent_chatter(
     default_data = {
         "items": [],
         "count": 0,
+        "row_count": 0,
         "sources": {},
         "window_days": days,
         "ticker": ticker
@@ -95,35 +137,44 @@ def get_recent_chatter(
     try:
         with get_db_connection() as conn:
             with conn.cursor() as cur:
-                # Check/create table
+                # Read path: no DDL here. The table and its later columns
+                # are created at startup (bootstrap) and on the write path.
                 if not _table_exists(cur, 'market_chatter'):
-                    logger.info("market_chatter table missing, creating...")
-                    ensure_market_chatter_table()
                     return _make_response(
                         default_data,
                         "no_data",
-                        f"No market chatter data for {ticker} (table just created)"
+                        f"No market chatter data for {ticker} (table does not exist)"
                     )
-                
+
                 # Build query
                 query = """
                     SELECT 
-                        id, ticker, source, source_id, title,
-                        COALESCE(summary, content) as summary, url,
-                        published_at, sentiment_score, sentiment_label,
-                        confidence, source_type, company_name,
-                        created_at, raw_payload
-                    FROM market_chatter
-                    WHERE ticker = %s 
-                      AND published_at >= NOW() - INTERVAL '%s days'
+                        m.id, m.ticker, m.source, m.source_id, m.title,
+                        COALESCE(m.summary, m.content, canon.summary, m.title) as summary, m.url,
+                        m.published_at, m.sentiment_score, m.sentiment_label,
+                        m.confidence, m.source_type, m.company_name,
+                        m.created_at, m.raw_payload,
+                        m.story_cluster_id, m.is_canonical
+                    FROM market_chatter m
+                    LEFT JOIN LATERAL (
+                        SELECT c.summary
+                        FROM market_chatter c
+                        WHERE m.summary IS NULL AND m.content IS NULL
+                          AND c.ticker = m.ticker
+                          AND c.story_cluster_id = m.story_cluster_id
+                          AND c.is_canonical
+                        LIMIT 1
+                    ) canon ON TRUE
+                    WHERE m.ticker = %s 
+                      AND m.published_at >= NOW() - INTERVAL '%s days'
                 """
                 params: List[Any] = [ticker, days]
                 
                 if source:
-                    query += " AND source = %s"
+                    query += " AND m.source = %s"
                     params.append(source)
                 
-                query += " ORDER BY published_at DESC LIMIT %s"
+                query += " ORDER BY m.published_at DESC LIMIT %s"
                 params.append(limit)
                 
                 cur.execute(query, params)
@@ -157,7 +208,9 @@ def get_recent_chatter(
                             "source_type": row[11],
                             "company_name": row[12],
                             "created_at": row[13].isoformat() if row[13] else None,
-                            "raw_payload": json.loads(row[14]) if row[14] else None
+                            "raw_payload": json.loads(row[14]) if row[14] else None,
+                            "story_cluster_id": row[15],
+                            "is_canonical": row[16] is not False
                         }
                         items.append(item)
                         
@@ -169,21 +222,26 @@ def get_recent_chatter(
                         logger.warning(f"Error parsing row {row[0]}: {parse_error}")
                         continue
                 
+                row_count = len(items)
+                if unique_stories:
+                    items = _collapse_stories(items)
+                
                 result_data = {
                     "items": items,
                     "count": len(items),
+                    "row_count": row_count,
                     "sources": sources_count,
                     "window_days": days,
                     "ticker": ticker
                 }
                 
-                return _make_response(
-                    result_data,
-                    "success",
-                    f"Found {len(items)} chatter items for {ticker}"
-                )
+                message = f"Found {row_count} chatter items for {ticker}"
+                if unique_stories:
+                    message = f"Found {row_count} chatter items ({len(items)} unique stories) for {ticker}"
+                return _make_response(result_data, "success", message)
                 
     except Exception as e:
+        invalidate_on_ddl_error(e, 'market_chatter')
         logger.error(f"Error retrieving market chatter for {ticker}: {e}", exc_info=True)
         return _make_response(
             default_data,
@@ -192,95 +250,202 @@ def get_recent_chatter(
         )
 
 
-def get_chatter_summary(ticker: str, days: int = 7) -> Dict[str, Any]:
+# Items attached to a summary for agents (newest unique stories)
+SUMMARY_ITEM_LIMIT = 20
+
+
+def _summarize_rollup(rollup: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine per-source rollup aggregates into summary fields."""
+    labels: Dict[str, int] = {}
+    scored_count = 0
+    sentiment_sum = 0.0
+    for bucket in rollup.values():
+        scored_count += bucket["scored_count"]
+        sentiment_sum += bucket["sentiment_sum"]
+        for label, count in bucket["labels"].items():
+            if count:
+                labels[label] = labels.get(label, 0) + count
+    
+    newest = max((b["last_published_at"] for b in rollup.values() if b["last_published_at"]), default=None)
+    oldest = min((b["first_published_at"] for b in rollup.values() if b["first_published_at"]), default=None)
+    
+    return {
+        "total_count": sum(b["item_count"] for b in rollup.values()),
+        "unique_story_count": sum(b["story_count"] for b in rollup.values()),
+        "scored_count": scored_count,
+        "sources": {source: b["item_count"] for source, b in rollup.items() if b["item_count"]},
+        "sentiment_distribution": labels,
+        "average_sentiment": round(sentiment_sum / scored_count, 4) if scored_count else None,
+        "newest_item_date": newest.isoformat() if newest else None,
+        "oldest_item_date": oldest.isoformat() if oldest else None,
+    }
+
+
+def _summarize_items(chatter_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Summary fields computed from fetched items (used when the rollup is unavailable)."""
+    items = chatter_data.get("items", [])
+    sentiment_dist: Dict[str, int] = {}
+    sentiment_scores = []
+    for item in items:
+        label = item.get("sentiment_label")
+        if label:
+            sentiment_dist[label] = sentiment_dist.get(label, 0) + 1
+        score = item.get("sentiment_score")
+        if score is not None:
+            sentiment_scores.append(score)
+    
+    avg_sentiment = sum(sentiment_scores) / len(sentiment_scores) if sentiment_scores else None
+    dates = [item.get("published_at") for item in items if item.get("published_at")]
+    
+    return {
+        "total_count": chatter_data.get("row_count", len(items)),
+        "unique_story_count": len(items),
+        "scored_count": len(sentiment_scores),
+        "sources": chatter_data.get("sources", {}),
+        "sentiment_distribution": sentiment_dist,
+        "average_sentiment": round(avg_sentiment, 4) if avg_sentiment is not None else None,
+        "newest_item_date": max(dates) if dates else None,
+        "oldest_item_date": min(dates) if dates else None,
+    }
+
+
+def get_chatter_sentiment_summary(ticker: str, days: int = 7) -> Dict[str, Any]:
     """
-    Get a summary of market chatter suitable for agent consumption.
+    Get chatter counts and sentiment aggregates for a ticker.
     
     SAFE: Never throws. Returns standard dict contract.
     
+    Served from the materialized rollup (chatter_rollup.py), so the cost
+    does not depend on chatter volume. Sentiment is weighted by unique
+    story: a story carried by several sources counts once. The window
+    starts at the hour boundary of NOW() - days.
+    
+    Args:
+        ticker: Stock ticker symbol
+        days: Number of days to look back (default: 7)
+    
     Returns:
-        Standard DAL response with summary data
+        Standard DAL response:
+        {
+            "data": {
+                "ticker": str,
+                "window_days": int,
+                "total_count": int,
+                "unique_story_count": int,
+                "scored_count": int,
+                "sources": Dict[str, int],
+                "sentiment_distribution": Dict[str, int],
+                "average_sentiment": Optional[float],
+                "newest_item_date": Optional[str],
+                "oldest_item_date": Optional[str],
+                "has_data": bool
+            },
+            "status": "success" | "no_data" | "error",
+            "message": str
+        }
     """
     ticker = ticker.upper()
     
-    # Default summary
-    default_summary = {
+    summary: Dict[str, Any] = {
         "ticker": ticker,
-        "total_count": 0,
         "window_days": days,
+        "total_count": 0,
+        "unique_story_count": 0,
+        "scored_count": 0,
         "sources": {},
         "sentiment_distribution": {},
         "average_sentiment": None,
         "newest_item_date": None,
         "oldest_item_date": None,
-        "items": [],
         "has_data": False
     }
     
+    rollup = None
+    if is_chatter_rollup_ready():
+        try:
+            rollup = get_chatter_rollup(ticker, days)
+        except Exception as e:
+            invalidate_on_ddl_error(e, ROLLUP_TABLE)
+            logger.warning(f"[ROLLUP] Rollup read failed for {ticker}, aggregating rows: {e}")
+    
+    if rollup is not None:
+        summary.update(_summarize_rollup(rollup))
+    else:
+        chatter_response = get_recent_chatter(ticker, days=days, limit=200, unique_stories=True)
+        if chatter_response["status"] == "error":
+            return _make_response(summary, "error", chatter_response["message"])
+        summary.update(_summarize_items(chatter_response["data"]))
+    
+    if not summary["total_count"]:
+        return _make_response(
+            summary,
+            "no_data",
+            f"No market chatter for {ticker} in last {days} days"
+        )
+    
+    summary["has_data"] = True
+    return _make_response(
+        summary,
+        "success",
+        f"Found {summary['total_count']} chatter items "
+        f"({summary['unique_story_count']} unique stories) for {ticker}"
+    )
+
+
+def get_chatter_summary(ticker: str, days: int = 7) -> Dict[str, Any]:
+    """
+    Get a summary of market chatter suitable for agent consumption.
+    
+    SAFE: Never throws. Returns standard dict contract.
+    
+    Counts and sentiment come from get_chatter_sentiment_summary(); only
+    the newest SUMMARY_ITEM_LIMIT unique stories are fetched as items.
+    
+    Returns:
+        Standard DAL response with summary data
+    """
+    ticker = ticker.upper()
+    
     try:
-        # Get recent chatter
-        chatter_response = get_recent_chatter(ticker, days=days, limit=200)
+        sentiment_response = get_chatter_sentiment_summary(ticker, days)
+        summary = dict(sentiment_response["data"])
+        summary["items"] = []
         
-        if chatter_response["status"] != "success":
+        if sentiment_response["status"] != "success":
             return _make_response(
-                default_summary,
-                chatter_response["status"],
-                chatter_response["message"]
+                summary,
+                sentiment_response["status"],
+                sentiment_response["message"]
             )
         
-        chatter_data = chatter_response["data"]
-        items = chatter_data.get("items", [])
-        
-        if not items:
-            return _make_response(
-                default_summary,
-                "no_data",
-                f"No market chatter for {ticker} in last {days} days"
-            )
-        
-        # Calculate sentiment distribution and average
-        sentiment_dist: Dict[str, int] = {}
-        sentiment_scores = []
-        
-        for item in items:
-            label = item.get("sentiment_label")
-            if label:
-                sentiment_dist[label] = sentiment_dist.get(label, 0) + 1
-            
-            score = item.get("sentiment_score")
-            if score is not None:
-                sentiment_scores.append(score)
-        
-        avg_sentiment = sum(sentiment_scores) / len(sentiment_scores) if sentiment_scores else None
-        
-        # Get date range
-        dates = [item.get("published_at") for item in items if item.get("published_at")]
-        newest = max(dates) if dates else None
-        oldest = min(dates) if dates else None
-        
-        summary = {
-            "ticker": ticker,
-            "total_count": len(items),
-            "window_days": days,
-            "sources": chatter_data.get("sources", {}),
-            "sentiment_distribution": sentiment_dist,
-            "average_sentiment": round(avg_sentiment, 4) if avg_sentiment else None,
-            "newest_item_date": newest,
-            "oldest_item_date": oldest,
-            "items": items[:20],  # Top 20 items for agents
-            "has_data": True
-        }
+        # Rows, not stories, are limited: leave room for duplicates
+        chatter_response = get_recent_chatter(
+            ticker, days=days, limit=SUMMARY_ITEM_LIMIT * 3, unique_stories=True
+        )
+        summary["items"] = chatter_response["data"].get("items", [])[:SUMMARY_ITEM_LIMIT]
         
         return _make_response(
             summary,
             "success",
-            f"Found {len(items)} chatter items for {ticker}"
+            sentiment_response["message"]
         )
         
     except Exception as e:
         logger.error(f"Error getting chatter summary for {ticker}: {e}", exc_info=True)
         return _make_response(
-            default_summary,
+            {
+                "ticker": ticker,
+                "total_count": 0,
+                "unique_story_count": 0,
+                "window_days": days,
+                "sources": {},
+                "sentiment_distribution": {},
+                "average_sentiment": None,
+                "newest_item_date": None,
+                "oldest_item_date": None,
+                "items": [],
+                "has_data": False
+            },
             "error",
             str(e)
         )
@@ -346,6 +511,7 @@ def get_chatter_metadata(ticker: str, days: int = 30) -> Dict[str, Any]:
                 return _make_response(default_metadata, status, None)
                 
     except Exception as e:
+        invalidate_on_ddl_error(e, 'market_chatter')
         logger.error(f"Error getting chatter metadata for {ticker}: {e}")
         return _make_response(default_metadata, "error", str(e))
 
@@ -388,11 +554,16 @@ def insert_chatter(
         )
 
 
-def bulk_insert_chatter(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+def bulk_insert_chatter(
+    items: List[Dict[str, Any]],
+    method: str = PERSIST_METHOD_COPY
+) -> Dict[str, Any]:
     """
     Bulk insert multiple chatter items.
     
     Converts dicts to MarketChatterRecord and uses persist_market_chatter.
+    By default records are written through the COPY staging path; pass
+    method='row' to insert one statement per record.
     
     Returns:
         Standard DAL response with counts
@@ -417,7 +588,7 @@ def bulk_insert_chatter(items: List[Dict[str, Any]]) -> Dict[str, Any]:
                 logger.warning(f"Error converting item to record: {e}")
                 continue
         
-        counts = persist_market_chatter(records)
+        counts = persist_market_chatter(records, method=method)
         
         status = "success" if counts["errors"] == 0 else "error"
         message = f"Inserted {counts['inserted']}, skipped {counts['skipped']}, errors {counts['errors']}"
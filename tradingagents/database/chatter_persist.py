@@ -8,12 +8,27 @@ This ensures:
 - Proper logging and error handling
 """
 
+import io
 import logging
 import json
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, Set, Tuple
+
+from tradingagents import metrics
 
 from .connection import get_db_connection
+from .chatter_rollup import (
+    ROLLUP_SOURCE_COLUMNS,
+    apply_rollup_rows,
+    ensure_chatter_rollup_table,
+    rollup_increment_sql
+)
+from .schema_registry import (
+    is_table_verified,
+    mark_table_ready,
+    invalidate_schema_cache,
+    invalidate_on_ddl_error
+)
 
 logger = logging.getLogger(__name__)
 
@@ -26,9 +41,15 @@ def ensure_market_chatter_table() -> bool:
     Migrations handle adding source_id to legacy tables.
     This function creates the table if it doesn't exist at all.
     
+    The catalog lookup and index DDL run once per process; afterwards the
+    cached readiness from schema_registry short-circuits this call.
+    
     Returns:
         True if table exists or was created, False on error.
     """
+    if is_table_verified('market_chatter'):
+        return True
+    
     try:
         with get_db_connection() as conn:
             with conn.cursor() as cur:
@@ -59,6 +80,10 @@ def ensure_market_chatter_table() -> bool:
                             sentiment_score NUMERIC(5,4),
                             sentiment_label TEXT,
                             confidence NUMERIC(4,3),
+                            sentiment_model TEXT,
+                            story_cluster_id TEXT,
+                            story_simhash BIGINT,
+                            is_canonical BOOLEAN NOT NULL DEFAULT TRUE,
                             source_type TEXT NOT NULL DEFAULT 'news',
                             company_name TEXT,
                             raw_payload JSONB,
@@ -70,6 +95,14 @@ def ensure_market_chatter_table() -> bool:
                     logger.info("[CHATTER] market_chatter table created")
                 else:
                     logger.debug("[CHATTER] market_chatter table already exists")
+                    # Added with ingestion-time sentiment enrichment
+                    cur.execute("""
+                        ALTER TABLE market_chatter
+                            ADD COLUMN IF NOT EXISTS sentiment_model TEXT,
+                            ADD COLUMN IF NOT EXISTS story_cluster_id TEXT,
+                            ADD COLUMN IF NOT EXISTS story_simhash BIGINT,
+                            ADD COLUMN IF NOT EXISTS is_canonical BOOLEAN NOT NULL DEFAULT TRUE;
+                    """)
                 
                 # Create indexes (idempotent)
                 cur.execute("""
@@ -84,17 +117,256 @@ def ensure_market_chatter_table() -> bool:
                     CREATE INDEX IF NOT EXISTS idx_mc_source_source_id 
                         ON market_chatter(source, source_id);
                 """)
+                cur.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_mc_ticker_story 
+                        ON market_chatter(ticker, story_cluster_id);
+                """)
                 
                 conn.commit()
+                mark_table_ready('market_chatter')
                 logger.debug("[CHATTER] market_chatter table and indexes verified")
                 return True
                 
     except Exception as e:
+        invalidate_schema_cache('market_chatter')
         logger.error(f"[CHATTER] Failed to ensure market_chatter table: {e}")
         return False
 
 
-def persist_market_chatter(records: List['MarketChatterRecord']) -> Dict[str, int]:
+# Rows streamed through the staging table per COPY + merge round trip
+COPY_BATCH_SIZE = 5000
+
+# Persistence strategies accepted by persist_market_chatter()
+PERSIST_METHOD_COPY = 'copy'
+PERSIST_METHOD_ROW = 'row'
+
+# Column order shared by the row-by-row INSERT, the COPY stream and the merge
+_CHATTER_COLUMNS = (
+    'ticker', 'source', 'source_id', 'title', 'summary', 'content', 'url',
+    'published_at', 'sentiment_score', 'sentiment_label', 'confidence',
+    'sentiment_model', 'story_cluster_id', 'story_simhash', 'is_canonical',
+    'source_type', 'company_name', 'raw_payload', 'created_at'
+)
+
+# Compact encoder reused for every payload instead of a json.dumps() per row
+_encode_payload = json.JSONEncoder(separators=(',', ':'), default=str).encode
+
+_COPY_ESCAPES = str.maketrans({
+    '\\': '\\\\',
+    '\t': '\\t',
+    '\n': '\\n',
+    '\r': '\\r',
+})
+
+
+def _record_to_row(record: Any) -> tuple:
+    """Convert a MarketChatterRecord (or dict) into a market_chatter row tuple."""
+    # Get dict representation
+    data = record.to_dict() if hasattr(record, 'to_dict') else record
+    
+    # Use summary for both summary and content fields
+    summary = data.get('summary', data.get('content', ''))
+    raw_payload = data.get('raw_payload')
+    
+    return (
+        data.get('ticker', '').upper(),
+        data.get('source', 'unknown'),
+        data.get('source_id', ''),
+        data.get('title'),
+        summary,
+        summary,  # Also store in content for backward compat
+        data.get('url'),
+        data.get('published_at') or datetime.utcnow(),
+        data.get('sentiment_score'),
+        data.get('sentiment_label'),
+        data.get('confidence'),
+        data.get('sentiment_model'),
+        data.get('story_cluster_id'),
+        data.get('story_simhash'),
+        data.get('is_canonical', True),
+        data.get('source_type', 'news'),
+        data.get('company_name'),
+        _encode_payload(raw_payload) if raw_payload else None,
+        data.get('created_at') or datetime.utcnow()
+    )
+
+
+def _record_key(record: Any) -> Tuple[Optional[str], Optional[str]]:
+    """(source, source_id) of a MarketChatterRecord or dict."""
+    if isinstance(record, dict):
+        return record.get('source'), record.get('source_id')
+    return getattr(record, 'source', None), getattr(record, 'source_id', None)
+
+
+def _add_counts(counts: Dict[str, int], batch_counts: Dict[str, int]) -> None:
+    """Add a committed batch's outcome to the running counts."""
+    for key in ('inserted', 'skipped', 'errors'):
+        counts[key] += batch_counts[key]
+
+
+def _copy_field(value: Any) -> str:
+    """Render one value in PostgreSQL COPY text format."""
+    if value is None:
+        return '\\N'
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def _persist_rows_individually(
+    cur,
+    rows: List[tuple],
+    counts: Dict[str, int],
+    rollup: bool = True,
+    failed: Optional[List[tuple]] = None
+) -> None:
+    """
+    Insert rows one statement at a time.
+    
+    Used when explicitly requested and as the fallback that isolates bad
+    rows when a COPY batch is rejected as a whole. Inserted rows are added
+    to the sentiment rollup before the caller commits. The (source,
+    source_id) of rows that fail are appended to failed, if given.
+    """
+    insert_sql = f"""
+        INSERT INTO market_chatter ({', '.join(_CHATTER_COLUMNS)})
+        VALUES ({', '.join(['%s'] * len(_CHATTER_COLUMNS))})
+        ON CONFLICT (source, source_id) DO NOTHING
+        RETURNING {', '.join(ROLLUP_SOURCE_COLUMNS)}
+    """
+    inserted_rows: List[tuple] = []
+    for row in rows:
+        try:
+            cur.execute("SAVEPOINT chatter_row")
+            cur.execute(insert_sql, row)
+            result = cur.fetchone()
+            cur.execute("RELEASE SAVEPOINT chatter_row")
+            if result:
+                counts["inserted"] += 1
+                inserted_rows.append(result)
+            else:
+                counts["skipped"] += 1
+        except Exception as e:
+            cur.execute("ROLLBACK TO SAVEPOINT chatter_row")
+            logger.warning(f"[PERSIST] Error persisting record: {e}")
+            counts["errors"] += 1
+            if failed is not None:
+                failed.append((row[1], row[2]))
+    
+    if rollup:
+        apply_rollup_rows(cur, inserted_rows)
+
+
+def _persist_rows_copy(
+    conn,
+    rows: List[tuple],
+    counts: Dict[str, int],
+    rollup: bool = True,
+    failed: Optional[List[tuple]] = None
+) -> None:
+    """
+    Stream rows into a session-local staging table with COPY and merge them
+    into market_chatter with one set-based INSERT ... SELECT per batch.
+    
+    Duplicates inside a batch keep the first occurrence, matching the
+    row-by-row path, so inserted + skipped always equals the batch size.
+    A batch rejected by PostgreSQL is retried row by row so that only the
+    offending records are counted as errors.
+    
+    The merge statement also adds the rows it inserted to the sentiment
+    rollup (chatter_rollup.py), so both commit or roll back together.
+    
+    A batch's outcome is added to counts only once it has committed, so
+    if a later batch fails the earlier counts remain exact.
+    """
+    columns = ', '.join(_CHATTER_COLUMNS)
+    merge_sql = f"""
+        INSERT INTO market_chatter ({columns})
+        SELECT DISTINCT ON (source, source_id) {columns}
+        FROM market_chatter_staging
+        ORDER BY source, source_id, seq
+        ON CONFLICT (source, source_id) DO NOTHING
+    """
+    if rollup:
+        merge_sql = f"""
+            WITH inserted AS (
+                {merge_sql}
+                RETURNING {', '.join(ROLLUP_SOURCE_COLUMNS)}
+            ), rollup AS (
+                {rollup_increment_sql('inserted')}
+            )
+            SELECT COUNT(*) FROM inserted
+        """
+    
+    for start in range(0, len(rows), COPY_BATCH_SIZE):
+        batch = rows[start:start + COPY_BATCH_SIZE]
+        
+        buffer = io.StringIO()
+        for seq, row in enumerate(batch):
+            buffer.write(str(seq))
+            for value in row:
+                buffer.write('\t')
+                buffer.write(_copy_field(value))
+            buffer.write('\n')
+        buffer.seek(0)
+        
+        batch_counts = {"inserted": 0, "skipped": 0, "errors": 0}
+        try:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    CREATE TEMP TABLE IF NOT EXISTS market_chatter_staging (
+                        seq INTEGER NOT NULL,
+                        ticker TEXT,
+                        source TEXT,
+                        source_id TEXT,
+                        title TEXT,
+                        summary TEXT,
+                        content TEXT,
+                        url TEXT,
+                        published_at TIMESTAMP WITH TIME ZONE,
+                        sentiment_score NUMERIC,
+                        sentiment_label TEXT,
+                        confidence NUMERIC,
+                        sentiment_model TEXT,
+                        story_cluster_id TEXT,
+                        story_simhash BIGINT,
+                        is_canonical BOOLEAN,
+                        source_type TEXT,
+                        company_name TEXT,
+                        raw_payload JSONB,
+                        created_at TIMESTAMP WITH TIME ZONE
+                    ) ON COMMIT DELETE ROWS;
+                """)
+                cur.copy_expert(
+                    f"COPY market_chatter_staging (seq, {columns}) FROM STDIN",
+                    buffer
+                )
+                cur.execute(merge_sql)
+                inserted = cur.fetchone()[0] if rollup else cur.rowcount
+            conn.commit()
+            
+            batch_counts["inserted"] = inserted
+            batch_counts["skipped"] = len(batch) - inserted
+            
+        except Exception as e:
+            conn.rollback()
+            invalidate_on_ddl_error(e, 'market_chatter')
+            logger.warning(
+                f"[PERSIST] COPY batch of {len(batch)} rows rejected ({e}), "
+                f"retrying row by row"
+            )
+            with conn.cursor() as cur:
+                _persist_rows_individually(cur, batch, batch_counts, rollup, failed)
+            conn.commit()
+        
+        _add_counts(counts, batch_counts)
+
+
+def persist_market_chatter(
+    records: List['MarketChatterRecord'],
+    method: str = PERSIST_METHOD_COPY,
+    failed_keys: Optional[Set[Tuple[str, str]]] = None
+) -> Dict[str, int]:
     """
     Persist market chatter records to database.
     
@@ -103,6 +375,12 @@ def persist_market_chatter(records: List['MarketChatterRecord']) -> Dict[str, in
     
     Args:
         records: List of MarketChatterRecord objects
+        method: 'copy' (default) streams records through a staging table
+                with COPY and merges them in one statement per batch;
+                'row' inserts one record per statement.
+        failed_keys: Optional set that receives the (source, source_id) of
+                     every record that was not written (used to release
+                     near-duplicate story clusters, see chatter_dedupe.py)
     
     Returns:
         Dictionary with counts:
@@ -113,8 +391,6 @@ def persist_market_chatter(records: List['MarketChatterRecord']) -> Dict[str, in
             "total": int
         }
     """
-    from tradingagents.dataflows.chatter_schema import MarketChatterRecord
-    
     counts = {
         "inserted": 0,
         "skipped": 0,
@@ -126,72 +402,66 @@ def persist_market_chatter(records: List['MarketChatterRecord']) -> Dict[str, in
         logger.info("[PERSIST] No records to persist")
         return counts
     
+    if method not in (PERSIST_METHOD_COPY, PERSIST_METHOD_ROW):
+        raise ValueError(f"Unknown persist method '{method}'. Use 'copy' or 'row'.")
+    
     # Ensure table exists
+    if failed_keys is None:
+        failed_keys = set()
+    
     if not ensure_market_chatter_table():
         logger.error("[PERSIST] Failed to ensure table exists")
         counts["errors"] = len(records)
+        failed_keys.update(_record_key(record) for record in records)
         return counts
     
+    rollup = ensure_chatter_rollup_table()
+    if not rollup:
+        logger.warning(
+            "[PERSIST] Chatter rollup unavailable; summaries are stale until "
+            "rebuild_chatter_rollup() runs"
+        )
+    
+    rows: List[tuple] = []
+    for record in records:
+        try:
+            rows.append(_record_to_row(record))
+        except Exception as e:
+            logger.warning(f"[PERSIST] Error preparing record: {e}")
+            counts["errors"] += 1
+            failed_keys.add(_record_key(record))
+    prepare_errors = counts["errors"]
+    failed_rows: List[tuple] = []  # (source, source_id)
+    
     try:
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                for record in records:
-                    try:
-                        # Get dict representation
-                        data = record.to_dict() if hasattr(record, 'to_dict') else record
-                        
-                        # Use summary for both summary and content fields
-                        summary = data.get('summary', data.get('content', ''))
-                        
-                        cur.execute("""
-                            INSERT INTO market_chatter (
-                                ticker, source, source_id, title, summary, content, url,
-                                published_at, sentiment_score, sentiment_label, confidence,
-                                source_type, company_name, raw_payload, created_at
-                            ) VALUES (
-                                %s, %s, %s, %s, %s, %s, %s,
-                                %s, %s, %s, %s,
-                                %s, %s, %s::jsonb, %s
-                            )
-                            ON CONFLICT (source, source_id) DO NOTHING
-                            RETURNING id
-                        """, (
-                            data.get('ticker', '').upper(),
-                            data.get('source', 'unknown'),
-                            data.get('source_id', ''),
-                            data.get('title'),
-                            summary,
-                            summary,  # Also store in content for backward compat
-                            data.get('url'),
-                            data.get('published_at') or datetime.utcnow(),
-                            data.get('sentiment_score'),
-                            data.get('sentiment_label'),
-                            data.get('confidence'),
-                            data.get('source_type', 'news'),
-                            data.get('company_name'),
-                            json.dumps(data.get('raw_payload')) if data.get('raw_payload') else None,
-                            data.get('created_at') or datetime.utcnow()
-                        ))
-                        
-                        result = cur.fetchone()
-                        if result:
-                            counts["inserted"] += 1
-                        else:
-                            counts["skipped"] += 1
-                            
-                    except Exception as e:
-                        logger.warning(f"[PERSIST] Error persisting record: {e}")
-                        counts["errors"] += 1
-                        continue
-                
+        with metrics.CHATTER_PERSIST_SECONDS.time(method=method), get_db_connection() as conn:
+            if method == PERSIST_METHOD_COPY:
+                _persist_rows_copy(conn, rows, counts, rollup, failed_rows)
+            else:
+                row_counts = {"inserted": 0, "skipped": 0, "errors": 0}
+                with conn.cursor() as cur:
+                    _persist_rows_individually(cur, rows, row_counts, rollup, failed_rows)
                 conn.commit()
+                _add_counts(counts, row_counts)
                 
     except Exception as e:
+        invalidate_on_ddl_error(e, 'market_chatter')
         logger.error(f"[PERSIST] Database error: {e}", exc_info=True)
-        counts["errors"] = len(records)
+        # Batches committed before the failure keep their counts; every
+        # record not yet accounted for failed. Batches commit in order, so
+        # those are the rows after the settled prefix.
+        settled = counts["inserted"] + counts["skipped"] + counts["errors"] - prepare_errors
+        failed_rows.extend((row[1], row[2]) for row in rows[settled:])
+        counts["errors"] = counts["total"] - counts["inserted"] - counts["skipped"]
+    
+    failed_keys.update(failed_rows)
+    
+    metrics.CHATTER_ROWS_TOTAL.inc(counts["inserted"], outcome="inserted")
+    metrics.CHATTER_ROWS_TOTAL.inc(counts["skipped"], outcome="duplicate")
+    metrics.CHATTER_ROWS_TOTAL.inc(counts["errors"], outcome="error")
     
     logger.info(
-        f"[PERSIST] Complete: inserted={counts['inserted']}, "
+        f"[PERSIST] Complete ({method}): inserted={counts['inserted']}, "
         f"skipped={counts['skipped']}, errors={counts['errors']}, total={counts['total']}"
     )
     
@@ -202,6 +472,129 @@ def persist_market_chatter(records: List['MarketChatterRecord']) -> Dict[str, in
     return counts
 
 
+def load_story_hashes(ticker: str, since: datetime) -> List[Tuple[int, str, datetime]]:
+    """
+    Load SimHashes of canonical stories ingested for a ticker since a time.
+    
+    Used to seed the near-duplicate index (dataflows/chatter_dedupe.py).
+    
+    Args:
+        ticker: Ticker symbol
+        since: Oldest created_at to include
+    
+    Returns:
+        List of (story_simhash, story_cluster_id, created_at), oldest first.
+        Empty on error.
+    """
+    if not ensure_market_chatter_table():
+        return []
+    
+    try:
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    SELECT story_simhash, story_cluster_id, created_at
+                    FROM market_chatter
+                    WHERE ticker = %s
+                      AND created_at >= %s
+                      AND is_canonical
+                      AND story_simhash IS NOT NULL
+                    ORDER BY created_at
+                """, (ticker.upper(), since))
+                return [
+                    (row[0], row[1], row[2].astimezone(timezone.utc).replace(tzinfo=None) if row[2] else None)
+                    for row in cur.fetchall()
+                ]
+    except Exception as e:
+        invalidate_on_ddl_error(e, 'market_chatter')
+        logger.warning(f"[PERSIST] Failed to load story hashes for {ticker}: {e}")
+        return []
+
+
+def promote_story_duplicate(
+    ticker: str,
+    story_cluster_id: str,
+    restore: Optional[Dict[str, Any]] = None
+) -> bool:
+    """
+    Make the earliest persisted near-duplicate of a story canonical.
+    
+    Used when the canonical row of a story cluster was never written
+    (dataflows/chatter_dedupe.py). The promoted row gets the summary and
+    sentiment of the lost canonical record where it has none of its own,
+    and is added to the rollup's story and sentiment aggregates (it was
+    already counted as an item). A no-op if the cluster already has a
+    canonical row, so concurrent callers promote at most one row.
+    
+    Args:
+        ticker: Ticker symbol
+        story_cluster_id: Story cluster of the lost canonical record
+        restore: Optional summary, sentiment_score, sentiment_label,
+                 confidence and sentiment_model of the lost canonical
+    
+    Returns:
+        True if a row was promoted
+    """
+    restore = restore or {}
+    params = {
+        'ticker': ticker.upper(),
+        'cluster': story_cluster_id,
+        'summary': restore.get('summary'),
+        'sentiment_score': restore.get('sentiment_score'),
+        'sentiment_label': restore.get('sentiment_label'),
+        'confidence': restore.get('confidence'),
+        'sentiment_model': restore.get('sentiment_model'),
+    }
+    
+    rollup = ensure_chatter_rollup_table()
+    try:
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                # Serializes promotions of one cluster; the NOT EXISTS check
+                # below then sees any row promoted by a concurrent caller
+                cur.execute(
+                    "SELECT pg_advisory_xact_lock(hashtext(%s))",
+                    (f"market_chatter:{params['ticker']}:{story_cluster_id}",)
+                )
+                cur.execute(f"""
+                    UPDATE market_chatter m SET
+                        is_canonical = TRUE,
+                        summary = COALESCE(m.summary, %(summary)s),
+                        content = COALESCE(m.content, %(summary)s),
+                        sentiment_score = COALESCE(m.sentiment_score, %(sentiment_score)s),
+                        sentiment_label = COALESCE(m.sentiment_label, %(sentiment_label)s),
+                        confidence = COALESCE(m.confidence, %(confidence)s),
+                        sentiment_model = COALESCE(m.sentiment_model, %(sentiment_model)s)
+                    WHERE m.id = (
+                        SELECT id FROM market_chatter
+                        WHERE ticker = %(ticker)s
+                          AND story_cluster_id = %(cluster)s
+                          AND NOT is_canonical
+                        ORDER BY id
+                        LIMIT 1
+                    )
+                    AND NOT EXISTS (
+                        SELECT 1 FROM market_chatter
+                        WHERE ticker = %(ticker)s
+                          AND story_cluster_id = %(cluster)s
+                          AND is_canonical
+                    )
+                    RETURNING {', '.join('m.' + c for c in ROLLUP_SOURCE_COLUMNS)}
+                """, params)
+                promoted = cur.fetchall()
+                if rollup:
+                    apply_rollup_rows(cur, promoted, count_items=False)
+            conn.commit()
+    except Exception as e:
+        invalidate_on_ddl_error(e, 'market_chatter')
+        logger.warning(f"[PERSIST] Failed to promote duplicate of story {story_cluster_id} for {ticker}: {e}")
+        return False
+    
+    if promoted:
+        logger.info(f"[PERSIST] Promoted a near-duplicate to canonical for story {story_cluster_id} ({ticker})")
+    return bool(promoted)
+
+
 def persist_single_record(
     ticker: str,
     source: str,
@@ -237,7 +630,8 @@ def persist_single_record(
         **kwargs
     )
     
-    counts = persist_market_chatter([record])
+    # A single row gains nothing from the COPY staging round trips
+    counts = persist_market_chatter([record], method=PERSIST_METHOD_ROW)
     
     return {
         "success": counts["errors"] == 0,
@@ -0,0 +1,354 @@
+"""
+Materialized per-ticker sentiment rollups for market chatter.
+
+Summary reads (counts per source, label distribution, average sentiment,
+newest/oldest item) used to fetch up to a few hundred market_chatter rows
+and aggregate them in Python on every query. This module maintains the
+same aggregates incrementally, one row per (ticker, hour bucket, source):
+
+    market_chatter_rollup (
+        ticker, bucket_start, source,      -- primary key; bucket_start is
+                                           -- the UTC hour of published_at
+        item_count,                        -- all rows
+        story_count,                       -- canonical rows (unique stories)
+        scored_count, sentiment_sum,       -- canonical rows with a score
+        positive_count, neutral_count,     -- canonical label histogram
+        negative_count,
+        first_published_at, last_published_at,
+        updated_at
+    )
+
+Sentiment aggregates only count canonical rows, so a story carried by
+several sources is weighted once (see dataflows/chatter_dedupe.py).
+
+The rollup is updated inside the persist transaction: the statement that
+merges new rows into market_chatter also adds exactly the rows it
+inserted to their buckets (chatter_persist.py), so the rollup never sees
+a row twice or misses a committed one. A near-duplicate promoted to
+canonical later (promote_story_duplicate) adds only to the story and
+sentiment aggregates, in the promoting transaction. rebuild_chatter_rollup()
+recomputes buckets from market_chatter and is safe to re-run (backfill,
+repair after manual deletes or migrations).
+
+Reads cost one index range scan over at most 24 x days buckets per
+source, independent of chatter volume.
+
+Buckets are UTC hours only if market_chatter.published_at is TIMESTAMP
+WITH TIME ZONE (schema.py). On a table created by the legacy
+migrations/001_market_chatter.sql (plain TIMESTAMP) they would shift with
+the session TimeZone, so ensure_chatter_rollup_table() refuses to enable
+the rollup there and summaries keep aggregating rows.
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from psycopg2.extras import execute_values
+
+from tradingagents.metrics import DB_QUERY_SECONDS, timed
+
+from .connection import get_db_connection
+from .schema_registry import (
+    is_table_ready,
+    is_table_verified,
+    mark_table_ready,
+    invalidate_schema_cache,
+    invalidate_on_ddl_error,
+)
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_TABLE = 'market_chatter_rollup'
+
+# Set once market_chatter.published_at is found to have the wrong type
+_incompatible_reason: Optional[str] = None
+
+
+class RollupSchemaError(Exception):
+    """market_chatter cannot back UTC hour buckets."""
+
+# market_chatter columns a rollup increment is computed from
+ROLLUP_SOURCE_COLUMNS = (
+    'ticker', 'source', 'published_at', 'sentiment_score',
+    'sentiment_label', 'is_canonical'
+)
+
+_ROLLUP_AGGREGATES = """
+    SELECT ticker,
+           date_trunc('hour', published_at AT TIME ZONE 'UTC'),
+           source,
+           {item_count},
+           COUNT(*) FILTER (WHERE is_canonical),
+           COUNT(sentiment_score) FILTER (WHERE is_canonical),
+           COALESCE(SUM(sentiment_score) FILTER (WHERE is_canonical), 0),
+           COUNT(*) FILTER (WHERE is_canonical AND sentiment_label = 'positive'),
+           COUNT(*) FILTER (WHERE is_canonical AND sentiment_label = 'neutral'),
+           COUNT(*) FILTER (WHERE is_canonical AND sentiment_label = 'negative'),
+           MIN(published_at),
+           MAX(published_at),
+           NOW()
+    FROM {relation}
+    WHERE published_at IS NOT NULL{where}
+    GROUP BY 1, 2, 3
+"""
+
+_ROLLUP_INSERT = """
+    INSERT INTO market_chatter_rollup AS r (
+        ticker, bucket_start, source, item_count, story_count,
+        scored_count, sentiment_sum, positive_count, neutral_count,
+        negative_count, first_published_at, last_published_at, updated_at
+    )
+"""
+
+
+def rollup_increment_sql(relation: str, count_items: bool = True) -> str:
+    """
+    SQL that adds the rows of a relation to their rollup buckets.
+
+    Args:
+        relation: Table, CTE name or VALUES list exposing
+            ROLLUP_SOURCE_COLUMNS (only newly inserted rows)
+        count_items: False for rows already counted as items that only
+            now became canonical (promoted near-duplicates)
+
+    Returns:
+        INSERT ... ON CONFLICT DO UPDATE statement
+    """
+    aggregates = _ROLLUP_AGGREGATES.format(
+        relation=relation, where="", item_count="COUNT(*)" if count_items else "0"
+    )
+    return _ROLLUP_INSERT + aggregates + """
+        ON CONFLICT (ticker, bucket_start, source) DO UPDATE SET
+            item_count = r.item_count + EXCLUDED.item_count,
+            story_count = r.story_count + EXCLUDED.story_count,
+            scored_count = r.scored_count + EXCLUDED.scored_count,
+            sentiment_sum = r.sentiment_sum + EXCLUDED.sentiment_sum,
+            positive_count = r.positive_count + EXCLUDED.positive_count,
+            neutral_count = r.neutral_count + EXCLUDED.neutral_count,
+            negative_count = r.negative_count + EXCLUDED.negative_count,
+            first_published_at = LEAST(r.first_published_at, EXCLUDED.first_published_at),
+            last_published_at = GREATEST(r.last_published_at, EXCLUDED.last_published_at),
+            updated_at = NOW()
+    """
+
+
+def apply_rollup_rows(cur, rows: List[tuple], count_items: bool = True) -> None:
+    """
+    Add inserted rows to the rollup within the caller's transaction.
+
+    Args:
+        cur: Cursor of the transaction that inserted the rows
+        rows: Tuples in ROLLUP_SOURCE_COLUMNS order
+        count_items: See rollup_increment_sql()
+    """
+    if not rows:
+        return
+    relation = f"""(
+        SELECT ticker, source, published_at::timestamptz AS published_at,
+               sentiment_score::numeric AS sentiment_score,
+               sentiment_label::text AS sentiment_label,
+               is_canonical::boolean AS is_canonical
+        FROM (VALUES %s) AS v ({', '.join(ROLLUP_SOURCE_COLUMNS)})
+    ) AS inserted_rows"""
+    # One statement for all rows, so each bucket appears once per upsert
+    execute_values(cur, rollup_increment_sql(relation, count_items), rows, page_size=max(len(rows), 1))
+
+
+def _rebuild(cur, ticker: Optional[str] = None, since: Optional[datetime] = None) -> int:
+    """
+    Recompute rollup buckets from market_chatter. Caller owns the transaction.
+
+    The table lock makes concurrent persists wait, so an increment is
+    either already reflected in market_chatter when the buckets are
+    recomputed or applied after the rebuild commits.
+    """
+    cur.execute("LOCK TABLE market_chatter_rollup IN EXCLUSIVE MODE")
+
+    delete_sql = "DELETE FROM market_chatter_rollup WHERE TRUE"
+    where = ""
+    params: List[Any] = []
+    if ticker:
+        delete_sql += " AND ticker = %s"
+        where += " AND ticker = %s"
+        params.append(ticker.upper())
+    if since:
+        delete_sql += " AND bucket_start >= date_trunc('hour', %s::timestamp)"
+        where += " AND published_at >= (date_trunc('hour', %s::timestamp) AT TIME ZONE 'UTC')"
+        params.append(since)
+
+    cur.execute(delete_sql, params)
+    cur.execute(
+        _ROLLUP_INSERT + _ROLLUP_AGGREGATES.format(relation="market_chatter", where=where, item_count="COUNT(*)"),
+        params
+    )
+    return cur.rowcount
+
+
+def _check_published_at_type(cur) -> None:
+    """Raise unless market_chatter.published_at (if present) is timestamptz."""
+    cur.execute("""
+        SELECT data_type FROM information_schema.columns
+        WHERE table_schema = 'public' AND table_name = 'market_chatter'
+          AND column_name = 'published_at'
+    """)
+    row = cur.fetchone()
+    if row and row[0] != 'timestamp with time zone':
+        raise RollupSchemaError(
+            f"market_chatter.published_at is {row[0].upper()}, expected TIMESTAMP WITH "
+            f"TIME ZONE; UTC hour buckets would follow the session TimeZone. Convert it with "
+            f"ALTER TABLE market_chatter ALTER COLUMN published_at TYPE TIMESTAMPTZ "
+            f"USING published_at AT TIME ZONE 'UTC', then restart"
+        )
+
+
+def ensure_chatter_rollup_table() -> bool:
+    """
+    Create the market_chatter_rollup table if it does not exist.
+
+    A newly created rollup is backfilled from existing market_chatter rows
+    in the same transaction. If market_chatter.published_at is not
+    TIMESTAMP WITH TIME ZONE, the rollup is disabled for the life of the
+    process (logged once as an error).
+
+    Returns:
+        True if the table exists or was created, False on error.
+    """
+    global _incompatible_reason
+    if is_table_verified(ROLLUP_TABLE):
+        return True
+    if _incompatible_reason is not None:
+        return False
+
+    try:
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                _check_published_at_type(cur)
+                cur.execute("""
+                    CREATE TABLE IF NOT EXISTS market_chatter_rollup (
+                        ticker TEXT NOT NULL,
+                        bucket_start TIMESTAMP NOT NULL,
+                        source TEXT NOT NULL,
+                        item_count INTEGER NOT NULL DEFAULT 0,
+                        story_count INTEGER NOT NULL DEFAULT 0,
+                        scored_count INTEGER NOT NULL DEFAULT 0,
+                        sentiment_sum NUMERIC NOT NULL DEFAULT 0,
+                        positive_count INTEGER NOT NULL DEFAULT 0,
+                        neutral_count INTEGER NOT NULL DEFAULT 0,
+                        negative_count INTEGER NOT NULL DEFAULT 0,
+                        first_published_at TIMESTAMP WITH TIME ZONE,
+                        last_published_at TIMESTAMP WITH TIME ZONE,
+                        updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+                        PRIMARY KEY (ticker, bucket_start, source)
+                    );
+                """)
+                cur.execute("SELECT to_regclass('public.market_chatter') IS NOT NULL")
+                chatter_exists = cur.fetchone()[0]
+                cur.execute("SELECT EXISTS (SELECT 1 FROM market_chatter_rollup)")
+                populated = cur.fetchone()[0]
+                if chatter_exists and not populated:
+                    buckets = _rebuild(cur)
+                    if buckets:
+                        logger.info(f"[ROLLUP] Backfilled {buckets} chatter rollup buckets")
+        mark_table_ready(ROLLUP_TABLE)
+        logger.info("[ROLLUP] market_chatter_rollup table verified")
+        return True
+    except RollupSchemaError as e:
+        _incompatible_reason = str(e)
+        logger.error(f"[ROLLUP] Chatter rollup disabled: {e}")
+        return False
+    except Exception as e:
+        invalidate_schema_cache(ROLLUP_TABLE)
+        logger.error(f"[ROLLUP] Failed to ensure market_chatter_rollup table: {e}")
+        return False
+
+
+def is_chatter_rollup_ready() -> bool:
+    """
+    Check whether summaries can read the rollup, without running DDL.
+
+    For read paths: the table is created and backfilled by
+    ensure_chatter_rollup_table() on the persist path.
+    """
+    return _incompatible_reason is None and is_table_ready(ROLLUP_TABLE)
+
+
+def rebuild_chatter_rollup(ticker: Optional[str] = None, since: Optional[datetime] = None) -> int:
+    """
+    Recompute rollup buckets from market_chatter.
+
+    Idempotent: the affected buckets are deleted and re-aggregated in one
+    transaction, so the job can be re-run at any time.
+
+    Args:
+        ticker: Optional ticker to rebuild (default: all)
+        since: Optional UTC time; buckets from its hour onward are rebuilt
+
+    Returns:
+        Number of buckets written (0 on error)
+    """
+    if not ensure_chatter_rollup_table():
+        return 0
+
+    try:
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                buckets = _rebuild(cur, ticker, since)
+        logger.info(
+            f"[ROLLUP] Rebuilt {buckets} buckets"
+            f"{f' for {ticker.upper()}' if ticker else ''}{f' since {since}' if since else ''}"
+        )
+        return buckets
+    except Exception as e:
+        invalidate_on_ddl_error(e, ROLLUP_TABLE)
+        logger.error(f"[ROLLUP] Failed to rebuild chatter rollup: {e}")
+        return 0
+
+
+@timed(DB_QUERY_SECONDS, statement='get_chatter_rollup')
+def get_chatter_rollup(ticker: str, days: int) -> Dict[str, Dict[str, Any]]:
+    """
+    Aggregate a ticker's rollup buckets over the last N days, per source.
+
+    The window starts at the hour boundary of NOW() - days.
+
+    Args:
+        ticker: Ticker symbol
+        days: Window in days
+
+    Returns:
+        Dict of source -> {item_count, story_count, scored_count,
+        sentiment_sum, labels, first_published_at, last_published_at}.
+        Raises on database errors.
+    """
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("""
+                SELECT source,
+                       SUM(item_count), SUM(story_count), SUM(scored_count),
+                       SUM(sentiment_sum), SUM(positive_count),
+                       SUM(neutral_count), SUM(negative_count),
+                       MIN(first_published_at), MAX(last_published_at)
+                FROM market_chatter_rollup
+                WHERE ticker = %s
+                  AND bucket_start >= date_trunc(
+                      'hour', (NOW() AT TIME ZONE 'UTC') - make_interval(days => %s)
+                  )
+                GROUP BY source
+            """, (ticker.upper(), days))
+            return {
+                row[0]: {
+                    "item_count": int(row[1]),
+                    "story_count": int(row[2]),
+                    "scored_count": int(row[3]),
+                    "sentiment_sum": float(row[4]),
+                    "labels": {
+                        "positive": int(row[5]),
+                        "neutral": int(row[6]),
+                        "negative": int(row[7]),
+                    },
+                    "first_published_at": row[8],
+                    "last_published_at": row[9],
+                }
+                for row in cur.fetchall()
+            }
@@ -12,6 +12,9 @@ import psycopg2
 from psycopg2 import pool
 from contextlib import contextmanager
 import logging
+import time
+
+from tradingagents import metrics
 
 logger = logging.getLogger(__name__)
 
@@ -140,7 +143,18 @@ def get_db_connection():
     if _connection_pool is None:
         raise RuntimeError("Database connection pool not initialized. Call init_database() first.")
     
-    conn = _connection_pool.getconn()
+    # getconn() never blocks: it returns a connection or raises PoolError
+    # when all maxconn connections are checked out
+    try:
+        conn = _connection_pool.getconn()
+    except pool.PoolError:
+        metrics.DB_POOL_CHECKOUTS_TOTAL.inc(outcome="exhausted")
+        raise
+    except Exception:
+        metrics.DB_POOL_CHECKOUTS_TOTAL.inc(outcome="error")
+        raise
+    metrics.DB_POOL_CHECKOUTS_TOTAL.inc(outcome="ok")
+    acquired = time.perf_counter()
     try:
         yield conn
         conn.commit()
@@ -150,6 +164,7 @@ def get_db_connection():
         raise
     finally:
         _connection_pool.putconn(conn)
+        metrics.DB_CONNECTION_HOLD_SECONDS.observe(time.perf_counter() - acquired)
 
 
 def close_pool():
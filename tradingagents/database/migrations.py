@@ -12,6 +12,7 @@ import logging
 from typing import Tuple, List
 
 from .connection import get_db_connection
+from .schema_registry import invalidate_schema_cache, sync_migration_version
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +38,15 @@ def run_migrations() -> Tuple[bool, List[str]]:
             errors.append(error)
             return False, errors
         
+        # Migration 2: Allow bodiless near-duplicate rows (content NULL)
+        success, error = _migrate_market_chatter_content_nullable()
+        if not success:
+            errors.append(error)
+            return False, errors
+        
+        # Schema may have changed - force tables to be re-verified once
+        invalidate_schema_cache()
+        
         logger.info("[MIGRATIONS] All migrations completed successfully")
         return True, errors
         
@@ -219,6 +229,50 @@ def _migrate_market_chatter_source_id() -> Tuple[bool, str]:
         return False, error_msg
 
 
+def _migrate_market_chatter_content_nullable() -> Tuple[bool, str]:
+    """
+    Migration: Drop NOT NULL on market_chatter.content.
+    
+    Near-duplicates of a story already stored are written without a body
+    (summary and content NULL; see dataflows/chatter_dedupe.py). Tables
+    created by schema.create_tables() or the legacy 001 migration declare
+    content NOT NULL and would reject those rows.
+    
+    Returns:
+        Tuple of (success, error_message)
+    """
+    try:
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    SELECT is_nullable FROM information_schema.columns 
+                    WHERE table_schema = 'public'
+                    AND table_name = 'market_chatter' 
+                    AND column_name = 'content';
+                """)
+                row = cur.fetchone()
+                
+                if row is None:
+                    logger.info("[MIGRATIONS] market_chatter.content does not exist yet - skipping migration")
+                    return True, ""
+                
+                if row[0] == 'NO':
+                    logger.info("[MIGRATIONS] Dropping NOT NULL on market_chatter.content...")
+                    cur.execute("""
+                        ALTER TABLE market_chatter 
+                        ALTER COLUMN content DROP NOT NULL;
+                    """)
+                    logger.info("[MIGRATIONS] market_chatter.content is nullable")
+                
+                conn.commit()
+                return True, ""
+                
+    except Exception as e:
+        error_msg = f"market_chatter content migration failed: {e}"
+        logger.error(f"[MIGRATIONS] {error_msg}")
+        return False, error_msg
+
+
 def check_migration_status() -> dict:
     """
     Check the current migration status of the database.
@@ -231,6 +285,7 @@ def check_migration_status() -> dict:
         "source_id_exists": False,
         "summary_exists": False,
         "unique_constraint_exists": False,
+        "content_nullable": True,
         "row_count": 0,
         "migrations_needed": []
     }
@@ -251,12 +306,13 @@ def check_migration_status() -> dict:
                 if status["market_chatter_exists"]:
                     # Check columns
                     cur.execute("""
-                        SELECT column_name FROM information_schema.columns 
+                        SELECT column_name, is_nullable FROM information_schema.columns 
                         WHERE table_schema = 'public' AND table_name = 'market_chatter';
                     """)
-                    columns = [row[0] for row in cur.fetchall()]
+                    columns = dict(cur.fetchall())
                     status["source_id_exists"] = "source_id" in columns
                     status["summary_exists"] = "summary" in columns
+                    status["content_nullable"] = columns.get("content", "YES") == "YES"
                     
                     # Check constraint
                     cur.execute("""
@@ -279,10 +335,15 @@ def check_migration_status() -> dict:
                         status["migrations_needed"].append("add_summary")
                     if not status["unique_constraint_exists"]:
                         status["migrations_needed"].append("add_unique_constraint")
+                    if not status["content_nullable"]:
+                        status["migrations_needed"].append("drop_content_not_null")
                         
     except Exception as e:
         status["error"] = str(e)
         logger.error(f"[MIGRATIONS] Error checking status: {e}")
     
+    # Cached table readiness is only valid for the migration version it was taken at
+    sync_migration_version(status)
+    
     return status
 
@@ -0,0 +1,19 @@
+-- Migration: 005_market_chatter_content_nullable.sql
+-- Description: Allow market_chatter rows without a body
+-- Date: 2026-10-16
+--
+-- PURPOSE:
+--   Cross-source near-duplicates of a story that is already stored keep
+--   their own row (source, url, title) but are written without a body:
+--   summary and content are NULL (see tradingagents/dataflows/chatter_dedupe.py).
+--   Tables created by 001_market_chatter.sql or schema.create_tables()
+--   declare content NOT NULL and reject those rows.
+--
+-- SAFETY GUARANTEES:
+--   1. Idempotent (DROP NOT NULL on a nullable column is a no-op)
+--   2. No data is changed
+--
+-- NOTE: This migration is also executed programmatically via
+--       tradingagents.database.migrations.run_migrations()
+
+ALTER TABLE market_chatter ALTER COLUMN content DROP NOT NULL;
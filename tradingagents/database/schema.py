@@ -160,11 +160,15 @@ def create_tables():
                     source TEXT NOT NULL,
                     source_type TEXT NOT NULL DEFAULT 'news',
                     title TEXT,
-                    content TEXT NOT NULL,
+                    content TEXT,
                     url TEXT,
                     sentiment_score NUMERIC(4,3),
                     sentiment_label TEXT,
                     confidence NUMERIC(4,3),
+                    sentiment_model TEXT,
+                    story_cluster_id TEXT,
+                    story_simhash BIGINT,
+                    is_canonical BOOLEAN NOT NULL DEFAULT TRUE,
                     published_at TIMESTAMP WITH TIME ZONE,
                     ingested_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
                     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
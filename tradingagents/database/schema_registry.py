@@ -0,0 +1,157 @@
+"""
+Process-lifetime schema readiness registry.
+
+Table existence checks against information_schema and the idempotent
+CREATE ... IF NOT EXISTS statements only need to succeed once per process.
+After a table has been verified its readiness is cached here, so the hot
+ingestion and /query paths never touch the catalog again.
+
+Two facts are cached per table:
+- exists: seen in the catalog (is_table_ready); one lookup covers all
+  TRACKED_TABLES
+- verified: its ensure_* function ran the CREATE/ALTER/index DDL in this
+  process (mark_table_ready); is_table_verified only reports this, so a
+  catalog lookup never lets an ensure_* step skip its column migrations
+
+Cache rules:
+- Only positive results are cached (a missing table is re-checked, so a
+  table created later by ingestion is picked up without a restart)
+- A DDL-class error (undefined table/column/object) invalidates the entry
+- A change in migration status (check_migration_status / run_migrations)
+  invalidates the whole registry
+"""
+
+import logging
+import threading
+from typing import Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Tables verified together in a single catalog round trip
+TRACKED_TABLES = ('market_chatter', 'news', 'technical_indicators')
+
+# SQLSTATE codes meaning the cached schema no longer matches the database
+# 42P01 undefined_table, 42703 undefined_column, 42704 undefined_object
+_DDL_ERROR_CODES = frozenset({'42P01', '42703', '42704'})
+
+_lock = threading.Lock()
+_existing_tables: Dict[str, bool] = {}
+_verified_tables: Dict[str, bool] = {}
+_migration_version: Optional[tuple] = None
+
+
+def _query_existing_tables(cursor, table_names: Iterable[str]) -> set:
+    """Return the subset of table_names present in the database."""
+    cursor.execute("""
+        SELECT table_name FROM information_schema.tables
+        WHERE table_schema = 'public' AND table_name = ANY(%s);
+    """, (list(table_names),))
+    return {row[0] for row in cursor.fetchall()}
+
+
+def is_table_verified(table_name: str) -> bool:
+    """Return whether the table's ensure/DDL step has run in this process."""
+    return bool(_verified_tables.get(table_name))
+
+
+def is_table_ready(table_name: str, cursor=None) -> bool:
+    """
+    Check whether a table exists, consulting the catalog at most once.
+
+    Args:
+        table_name: Table to check
+        cursor: Optional open cursor to reuse for the catalog lookup
+
+    Returns:
+        True if the table exists, False if it does not or the check failed.
+    """
+    if _verified_tables.get(table_name) or _existing_tables.get(table_name):
+        return True
+
+    names = set(TRACKED_TABLES) | {table_name}
+    try:
+        if cursor is not None:
+            existing = _query_existing_tables(cursor, names)
+        else:
+            from .connection import get_db_connection
+            with get_db_connection() as conn:
+                with conn.cursor() as cur:
+                    existing = _query_existing_tables(cur, names)
+    except Exception as e:
+        logger.warning(f"[SCHEMA] Error checking table existence: {e}")
+        return False
+
+    with _lock:
+        for name in existing:
+            _existing_tables[name] = True
+
+    if table_name in existing:
+        logger.debug(f"[SCHEMA] {table_name} verified and cached")
+        return True
+    return False
+
+
+def mark_table_ready(table_name: str) -> None:
+    """Record that a table has been created/verified by DDL in this process."""
+    with _lock:
+        _existing_tables[table_name] = True
+        _verified_tables[table_name] = True
+
+
+def invalidate_schema_cache(table_name: Optional[str] = None) -> None:
+    """
+    Drop cached readiness.
+
+    Args:
+        table_name: Table to invalidate. Invalidates every table if None.
+    """
+    with _lock:
+        if table_name is None:
+            _existing_tables.clear()
+            _verified_tables.clear()
+        else:
+            _existing_tables.pop(table_name, None)
+            _verified_tables.pop(table_name, None)
+    logger.info(f"[SCHEMA] Readiness cache invalidated ({table_name or 'all tables'})")
+
+
+def invalidate_on_ddl_error(error: Exception, table_name: Optional[str] = None) -> bool:
+    """
+    Invalidate cached readiness if an error indicates schema drift.
+
+    Args:
+        error: Exception raised by a query
+        table_name: Table the failing query targeted (all tables if None)
+
+    Returns:
+        True if the cache was invalidated.
+    """
+    if getattr(error, 'pgcode', None) in _DDL_ERROR_CODES:
+        invalidate_schema_cache(table_name)
+        return True
+    return False
+
+
+def sync_migration_version(status: dict) -> None:
+    """
+    Invalidate the registry when the migration status has changed.
+
+    Args:
+        status: Dictionary returned by check_migration_status()
+    """
+    global _migration_version
+
+    if status.get("error"):
+        return
+
+    version = (
+        status.get("market_chatter_exists"),
+        tuple(sorted(status.get("migrations_needed", []))),
+    )
+
+    with _lock:
+        changed = _migration_version is not None and version != _migration_version
+        _migration_version = version
+
+    if changed:
+        invalidate_schema_cache()
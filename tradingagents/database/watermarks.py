@@ -0,0 +1,200 @@
+"""
+Per-(ticker, source) ingestion watermarks.
+
+The freshness-driven scheduler records, for every (ticker, source) pair,
+the start time of its last successful fetch (the watermark) and the
+outcome of its last attempt. Watermarks live in PostgreSQL so a restart
+resumes incrementally instead of re-ingesting the whole universe.
+
+Table:
+    ingestion_watermarks (
+        ticker, source,            -- primary key
+        watermark_at,              -- fetch start of last success
+        last_attempt_at,
+        last_success_at,
+        consecutive_errors,
+        last_fetched, last_inserted,
+        updated_at
+    )
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from psycopg2.extras import execute_values
+
+from .connection import get_db_connection
+from .schema_registry import (
+    is_table_verified,
+    mark_table_ready,
+    invalidate_schema_cache,
+    invalidate_on_ddl_error,
+)
+
+logger = logging.getLogger(__name__)
+
+WATERMARK_TABLE = 'ingestion_watermarks'
+
+
+def ensure_watermark_table() -> bool:
+    """
+    Create the ingestion_watermarks table if it does not exist.
+
+    Returns:
+        True if the table exists or was created, False on error.
+    """
+    if is_table_verified(WATERMARK_TABLE):
+        return True
+
+    try:
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    CREATE TABLE IF NOT EXISTS ingestion_watermarks (
+                        ticker VARCHAR(20) NOT NULL,
+                        source VARCHAR(50) NOT NULL,
+                        watermark_at TIMESTAMP,
+                        last_attempt_at TIMESTAMP,
+                        last_success_at TIMESTAMP,
+                        consecutive_errors INTEGER NOT NULL DEFAULT 0,
+                        last_fetched INTEGER NOT NULL DEFAULT 0,
+                        last_inserted INTEGER NOT NULL DEFAULT 0,
+                        updated_at TIMESTAMP NOT NULL DEFAULT NOW(),
+                        PRIMARY KEY (ticker, source)
+                    );
+                """)
+        mark_table_ready(WATERMARK_TABLE)
+        logger.info("[WATERMARK] ingestion_watermarks table verified")
+        return True
+    except Exception as e:
+        invalidate_schema_cache(WATERMARK_TABLE)
+        logger.error(f"[WATERMARK] Failed to ensure ingestion_watermarks table: {e}")
+        return False
+
+
+def load_watermarks(tickers: Optional[Iterable[str]] = None) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """
+    Load watermarks, optionally restricted to a set of tickers.
+
+    Args:
+        tickers: Optional tickers to load (default: all)
+
+    Returns:
+        Dict keyed by (ticker, source) with watermark_at, last_attempt_at,
+        last_success_at and consecutive_errors. Empty on error.
+    """
+    if not ensure_watermark_table():
+        return {}
+
+    query = """
+        SELECT ticker, source, watermark_at, last_attempt_at,
+               last_success_at, consecutive_errors
+        FROM ingestion_watermarks
+    """
+    params: tuple = ()
+    if tickers is not None:
+        query += " WHERE ticker = ANY(%s)"
+        params = ([t.upper() for t in tickers],)
+
+    try:
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query, params)
+                return {
+                    (row[0], row[1]): {
+                        "watermark_at": row[2],
+                        "last_attempt_at": row[3],
+                        "last_success_at": row[4],
+                        "consecutive_errors": row[5],
+                    }
+                    for row in cur.fetchall()
+                }
+    except Exception as e:
+        invalidate_on_ddl_error(e, WATERMARK_TABLE)
+        logger.warning(f"[WATERMARK] Failed to load watermarks: {e}")
+        return {}
+
+
+def get_ticker_last_success(ticker: str) -> Optional[datetime]:
+    """
+    Return the most recent successful fetch of any source for a ticker.
+
+    Args:
+        ticker: Ticker symbol
+
+    Returns:
+        Timestamp of the latest success, or None if never ingested.
+    """
+    successes = [
+        mark["last_success_at"]
+        for mark in load_watermarks([ticker]).values()
+        if mark["last_success_at"] is not None
+    ]
+    return max(successes) if successes else None
+
+
+def record_watermarks(updates: Iterable[Dict[str, Any]]) -> int:
+    """
+    Upsert the outcome of a batch of (ticker, source) fetches.
+
+    Each update has ticker, source, attempted_at, success, fetched and
+    inserted. A success advances watermark_at to attempted_at and resets
+    the error streak; a failure only records the attempt.
+
+    Args:
+        updates: Iterable of update dicts
+
+    Returns:
+        Number of rows written (0 on error)
+    """
+    rows = [
+        (
+            u["ticker"].upper(),
+            u["source"],
+            u["attempted_at"] if u["success"] else None,
+            u["attempted_at"],
+            u["success"],
+            u.get("fetched", 0),
+            u.get("inserted", 0),
+        )
+        for u in updates
+    ]
+    if not rows or not ensure_watermark_table():
+        return 0
+
+    try:
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                execute_values(cur, """
+                    INSERT INTO ingestion_watermarks AS w (
+                        ticker, source, watermark_at, last_attempt_at,
+                        last_success_at, consecutive_errors,
+                        last_fetched, last_inserted, updated_at
+                    )
+                    SELECT v.ticker, v.source, v.watermark_at::timestamp,
+                           v.attempted_at::timestamp,
+                           CASE WHEN v.success THEN v.attempted_at::timestamp END,
+                           CASE WHEN v.success THEN 0 ELSE 1 END,
+                           v.fetched, v.inserted, NOW()
+                    FROM (VALUES %s) AS v (
+                        ticker, source, watermark_at, attempted_at,
+                        success, fetched, inserted
+                    )
+                    ON CONFLICT (ticker, source) DO UPDATE SET
+                        watermark_at = COALESCE(EXCLUDED.watermark_at, w.watermark_at),
+                        last_attempt_at = EXCLUDED.last_attempt_at,
+                        last_success_at = COALESCE(EXCLUDED.last_success_at, w.last_success_at),
+                        consecutive_errors = CASE
+                            WHEN EXCLUDED.consecutive_errors = 0 THEN 0
+                            ELSE w.consecutive_errors + 1
+                        END,
+                        last_fetched = EXCLUDED.last_fetched,
+                        last_inserted = EXCLUDED.last_inserted,
+                        updated_at = NOW()
+                """, rows)
+        return len(rows)
+    except Exception as e:
+        invalidate_on_ddl_error(e, WATERMARK_TABLE)
+        logger.warning(f"[WATERMARK] Failed to record {len(rows)} watermarks: {e}")
+        return 0
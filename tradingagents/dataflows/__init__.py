@@ -7,7 +7,9 @@ Provides data retrieval and ingestion from various sources.
 # Market chatter ingestion
 from .chatter_interface import ChatterSource, ChatterItem, IngestionResult
 from .alpha_vantage_chatter import AlphaVantageChatterSource, ingest_alpha_vantage_news
-from .ingest_chatter import ingest_chatter, ingest_universe
+from .ingest_chatter import ingest_chatter, ingest_universe, ingest_pairs
+from .chatter_dedupe import assign_story_clusters
+from .chatter_enrichment import enrich_chatter_sentiment, get_sentiment_backend, register_sentiment_backend
 
 __all__ = [
     # Chatter interface
@@ -20,5 +22,12 @@ __all__ = [
     # Ingestion functions
     'ingest_chatter',
     'ingest_universe',
+    'ingest_pairs',
+    # Near-duplicate clustering
+    'assign_story_clusters',
+    # Sentiment enrichment
+    'enrich_chatter_sentiment',
+    'get_sentiment_backend',
+    'register_sentiment_backend',
 ]
 
@@ -7,12 +7,14 @@ Normalizes Alpha Vantage NEWS_SENTIMENT API data into canonical MarketChatterRec
 import logging
 import json
 import hashlib
+import threading
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Any
 
 from .chatter_interface import ChatterSource, IngestionResult
 from .chatter_schema import MarketChatterRecord, SOURCE_TYPE_NEWS
 from .alpha_vantage_news import get_news
+from .alpha_vantage_common import API_BASE_URL
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +28,7 @@ class AlphaVantageChatterSource(ChatterSource):
     
     SOURCE_NAME = "alpha_vantage"
     SOURCE_TYPE = SOURCE_TYPE_NEWS
+    FETCH_URL = API_BASE_URL
     
     def fetch(
         self,
@@ -157,6 +160,7 @@ class AlphaVantageChatterSource(ChatterSource):
                     sentiment_score=sentiment_score,
                     sentiment_label=sentiment_label,
                     confidence=confidence,
+                    sentiment_model=self.SOURCE_NAME if sentiment_score is not None else None,
                     source_type=self.SOURCE_TYPE,
                     company_name=company_name,
                     raw_payload=raw
@@ -174,7 +178,8 @@ class AlphaVantageChatterSource(ChatterSource):
 def ingest_alpha_vantage_news(
     ticker: str,
     company_name: Optional[str] = None,
-    days: int = 7
+    days: int = 7,
+    cancel: Optional[threading.Event] = None
 ) -> Dict[str, Any]:
     """
     Convenience function to ingest Alpha Vantage news for a ticker.
@@ -183,6 +188,7 @@ def ingest_alpha_vantage_news(
         ticker: Stock ticker symbol
         company_name: Optional company name
         days: Number of days to look back (default: 7)
+        cancel: Optional cancellation event set when the source times out
         
     Returns:
         Ingestion result dictionary
@@ -191,5 +197,5 @@ def ingest_alpha_vantage_news(
     end_date = datetime.now()
     start_date = end_date - timedelta(days=days)
     
-    result = source.ingest(ticker, company_name, start_date, end_date)
+    result = source.ingest(ticker, company_name, start_date, end_date, cancel=cancel)
     return result.to_dict()
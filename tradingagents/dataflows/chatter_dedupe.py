@@ -0,0 +1,551 @@
+"""
+Cross-source near-duplicate detection for market chatter.
+
+The same story arrives through Google News, Yahoo Finance, generic RSS and
+Alpha Vantage under different URLs (and so different source_ids). This
+stage runs after normalization and before enrichment/persistence and
+assigns every record a story cluster:
+
+- a 64-bit SimHash is computed over the normalized title + summary
+  (word bigrams; publisher suffixes, URLs and punctuation removed)
+- records of the same ticker whose SimHashes differ in at most
+  chatter_dedupe_max_distance bits (default 7) share a story_cluster_id
+- the first record of a cluster is canonical; later ones keep their own
+  row (source, url, title - source attribution) but are persisted without
+  the body and are not sentiment-scored
+
+Lookups use a banded index: the hash is split into max_distance + 1
+bands, and two hashes within the distance must agree exactly on at least
+one band (pigeonhole), so each lookup only compares against one bucket
+per band. The index is shared by all ingestion threads, so concurrent
+sources agree on one canonical record. It covers a sliding window
+(chatter_dedupe_window_hours) and is seeded per ticker from stories
+already in PostgreSQL.
+
+A canonical story enters the index before its row is written. If that
+write never lands (the source is cancelled or the rows fail),
+mark_stories_persisted() / release_story_clusters() settle the cluster
+so the story does not vanish from sentiment and story counts:
+
+- a duplicate of the story already written (by a concurrent source, or in
+  the same batch) is promoted to canonical in PostgreSQL, with the lost
+  canonical's summary and sentiment where it has none of its own
+- otherwise, if duplicates are still being written, the first of them to
+  land is promoted
+- otherwise the story is dropped, so the next duplicate becomes canonical
+"""
+
+import hashlib
+import logging
+import re
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Collection, Deque, Dict, List, Optional, Set, Tuple
+
+from .chatter_schema import MarketChatterRecord
+from .config import get_config
+
+logger = logging.getLogger(__name__)
+
+SIMHASH_BITS = 64
+_MASK = (1 << SIMHASH_BITS) - 1
+
+# Stories with fewer normalized tokens are too short to cluster safely
+MIN_STORY_TOKENS = 6
+
+# Oldest entries are evicted beyond this many stories per ticker
+MAX_STORIES_PER_TICKER = 5000
+
+# Word bigrams: rewording one word moves ~5 bits, unrelated stories ~30
+_SHINGLE_SIZE = 2
+_URL_RE = re.compile(r"https?://\S+|www\.\S+")
+_TAG_RE = re.compile(r"<[^>]+>")
+_NON_WORD_RE = re.compile(r"[^\w\s]+")
+# "Headline - Reuters", "Headline | Yahoo Finance"
+_PUBLISHER_SUFFIX_RE = re.compile(r"\s+[-|–—]\s+[^-|–—]{1,40}$")
+
+
+def normalize_story_text(title: Optional[str], summary: Optional[str]) -> List[str]:
+    """
+    Normalize title and summary into the tokens used for SimHash.
+
+    Args:
+        title: Record title
+        summary: Record summary/body
+
+    Returns:
+        Lowercase word tokens
+    """
+    title = _PUBLISHER_SUFFIX_RE.sub("", (title or "").strip())
+    text = f"{title} {summary or ''}"
+    text = _URL_RE.sub(" ", _TAG_RE.sub(" ", text))
+    return _NON_WORD_RE.sub(" ", text.lower()).split()
+
+
+def simhash64(tokens: List[str]) -> int:
+    """
+    64-bit SimHash over word shingles.
+
+    Args:
+        tokens: Normalized tokens
+
+    Returns:
+        Unsigned 64-bit fingerprint
+    """
+    if len(tokens) >= _SHINGLE_SIZE:
+        features = [" ".join(tokens[i:i + _SHINGLE_SIZE]) for i in range(len(tokens) - _SHINGLE_SIZE + 1)]
+    else:
+        features = tokens
+
+    weights = [0] * SIMHASH_BITS
+    for feature in features:
+        h = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if (h >> bit) & 1 else -1
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two 64-bit fingerprints."""
+    return bin((a ^ b) & _MASK).count("1")
+
+
+def to_signed64(value: int) -> int:
+    """Unsigned fingerprint -> signed value for a PostgreSQL BIGINT."""
+    return value - (1 << SIMHASH_BITS) if value >= (1 << (SIMHASH_BITS - 1)) else value
+
+
+@dataclass(eq=False)
+class _Story:
+    simhash: int
+    cluster_id: str
+    seen_at: datetime
+    persisted: bool
+    # Duplicates assigned while the canonical row was pending: (source,
+    # source_id) of those not yet settled, and how many were written
+    pending_duplicates: Set[Tuple[str, str]] = field(default_factory=set)
+    written_duplicates: int = 0
+    # The canonical write failed; the next duplicate written is promoted
+    orphaned: bool = False
+    # Summary and sentiment of the lost canonical record
+    restore: Optional[Dict[str, Any]] = None
+
+
+class StoryClusterIndex:
+    """
+    Thread-safe, per-ticker banded SimHash index over recent stories.
+
+    Stories are kept in arrival order (for eviction), in the band buckets
+    (for lookups) and by cluster_id (for settling). A story moves through
+    these states:
+
+    - pending: created by assign() for a canonical record whose row is not
+      written yet. Duplicates assigned now are recorded in
+      pending_duplicates, and each must be settled exactly once with
+      settle_duplicate().
+    - persisted: set by mark_persisted(), by finish_promotion(promoted=True),
+      or for stories seeded from PostgreSQL. This state is final, and
+      release(), settle_duplicate() and finish_promotion() leave it alone.
+    - release() of a pending story: returns "promote" if a duplicate was
+      already written (the caller must then call finish_promotion()),
+      "wait" and marks the story orphaned if duplicates are still pending,
+      otherwise "dropped".
+    - orphaned: the first duplicate settled as written clears the flag and
+      is promoted (the caller calls finish_promotion()). Once the last
+      pending duplicate is settled as not written, the story is dropped.
+    - finish_promotion(promoted=False): the story goes back to orphaned if
+      duplicates are still pending, otherwise it is dropped.
+
+    A dropped story leaves the index, so the next record of it is
+    canonical again.
+    """
+
+    def __init__(self, max_distance: int = 7, window_hours: float = 72):
+        self.max_distance = max_distance
+        self.window = timedelta(hours=window_hours)
+        self.bands = max_distance + 1
+        self.band_bits = SIMHASH_BITS // self.bands
+        self._lock = threading.Lock()
+        self._seed_locks: Dict[str, threading.Lock] = {}
+        self._seeded: set = set()
+        self._stories: Dict[str, Deque[_Story]] = {}
+        self._buckets: Dict[str, List[Dict[int, List[_Story]]]] = {}
+        self._by_cluster: Dict[str, Dict[str, _Story]] = {}
+        self.lookups = 0
+        self.duplicates = 0
+
+    def _band_keys(self, simhash: int) -> List[int]:
+        band_mask = (1 << self.band_bits) - 1
+        return [(simhash >> (band * self.band_bits)) & band_mask for band in range(self.bands)]
+
+    def _add(self, ticker: str, story: _Story) -> None:
+        """Insert a story. Caller holds self._lock."""
+        stories = self._stories.setdefault(ticker, deque())
+        buckets = self._buckets.setdefault(ticker, [{} for _ in range(self.bands)])
+        by_cluster = self._by_cluster.setdefault(ticker, {})
+        stories.append(story)
+        by_cluster[story.cluster_id] = story
+        for band, key in enumerate(self._band_keys(story.simhash)):
+            buckets[band].setdefault(key, []).append(story)
+
+        # Evict stories that left the window or exceed the per-ticker cap
+        cutoff = datetime.utcnow() - self.window
+        while stories and (stories[0].seen_at < cutoff or len(stories) > MAX_STORIES_PER_TICKER):
+            self._unindex(ticker, stories.popleft())
+
+    def _unindex(self, ticker: str, story: _Story) -> None:
+        """Remove a story from the band buckets and the cluster map. Caller holds self._lock."""
+        by_cluster = self._by_cluster[ticker]
+        if by_cluster.get(story.cluster_id) is story:
+            del by_cluster[story.cluster_id]
+        buckets = self._buckets[ticker]
+        for band, key in enumerate(self._band_keys(story.simhash)):
+            bucket = buckets[band].get(key)
+            if bucket:
+                bucket.remove(story)
+                if not bucket:
+                    del buckets[band][key]
+
+    def _find(self, ticker: str, simhash: int) -> Optional[_Story]:
+        """Closest story within max_distance. Caller holds self._lock."""
+        buckets = self._buckets.get(ticker)
+        if not buckets:
+            return None
+        best, best_distance = None, self.max_distance + 1
+        for band, key in enumerate(self._band_keys(simhash)):
+            for story in buckets[band].get(key, ()):
+                distance = hamming_distance(simhash, story.simhash)
+                if distance < best_distance:
+                    best, best_distance = story, distance
+        return best
+
+    def _ensure_seeded(self, ticker: str) -> None:
+        """Load recent canonical stories for a ticker from PostgreSQL once."""
+        if ticker in self._seeded:
+            return
+        with self._lock:
+            seed_lock = self._seed_locks.setdefault(ticker, threading.Lock())
+        with seed_lock:
+            if ticker in self._seeded:
+                return
+            try:
+                from tradingagents.database.chatter_persist import load_story_hashes
+                rows = load_story_hashes(ticker, datetime.utcnow() - self.window)
+            except Exception as e:
+                logger.debug(f"[DEDUPE] Could not seed story index for {ticker}: {e}")
+                rows = []
+            with self._lock:
+                for simhash, cluster_id, seen_at in rows:
+                    if self._find(ticker, simhash & _MASK) is None:
+                        self._add(ticker, _Story(simhash & _MASK, cluster_id, seen_at or datetime.utcnow(), True))
+                self._seeded.add(ticker)
+            if rows:
+                logger.debug(f"[DEDUPE] Seeded {len(rows)} stories for {ticker}")
+
+    def assign(
+        self, ticker: str, simhash: int, key: Optional[Tuple[str, str]] = None
+    ) -> Tuple[str, bool, bool]:
+        """
+        Find or create the story cluster for a fingerprint.
+
+        Args:
+            ticker: Ticker symbol (clusters are per ticker)
+            simhash: Unsigned 64-bit fingerprint
+            key: (source, source_id) of the record; a duplicate of a story
+                whose canonical row is pending must later be settled with
+                settle_duplicate()
+
+        Returns:
+            (cluster_id, is_canonical, canonical_persisted)
+        """
+        self._ensure_seeded(ticker)
+        with self._lock:
+            self.lookups += 1
+            story = self._find(ticker, simhash)
+            if story is not None:
+                self.duplicates += 1
+                if not story.persisted and key is not None:
+                    story.pending_duplicates.add(key)
+                return story.cluster_id, False, story.persisted
+            cluster_id = f"{simhash:016x}"
+            self._add(ticker, _Story(simhash, cluster_id, datetime.utcnow(), False))
+            return cluster_id, True, False
+
+    def mark_persisted(self, ticker: str, cluster_ids: List[str]) -> None:
+        """Record that the canonical rows of these clusters are in the database."""
+        with self._lock:
+            for cluster_id in cluster_ids:
+                story = self._story(ticker, cluster_id)
+                if story is not None:
+                    story.persisted = True
+
+    def _story(self, ticker: str, cluster_id: str) -> Optional[_Story]:
+        """Indexed story of a cluster. Caller holds self._lock."""
+        return self._by_cluster.get(ticker, {}).get(cluster_id)
+
+    def _drop(self, ticker: str, story: _Story) -> None:
+        """Remove a story from the index. Caller holds self._lock."""
+        self._stories[ticker].remove(story)
+        self._unindex(ticker, story)
+
+    def release(self, ticker: str, cluster_id: str, restore: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Settle a cluster whose canonical row was never written.
+
+        Args:
+            ticker: Ticker symbol
+            cluster_id: Story cluster of the lost canonical record
+            restore: Summary and sentiment of the lost canonical record
+
+        Returns:
+            "promote" if a duplicate was already written and must be
+            promoted (then call finish_promotion()), "wait" if the next
+            duplicate written will be promoted, "dropped" if the story left
+            the index, "" if there was nothing to settle
+        """
+        with self._lock:
+            story = self._story(ticker, cluster_id)
+            if story is None or story.persisted:
+                return ""
+            story.restore = restore
+            if story.written_duplicates:
+                return "promote"
+            if story.pending_duplicates:
+                story.orphaned = True
+                return "wait"
+            self._drop(ticker, story)
+            return "dropped"
+
+    def settle_duplicate(
+        self, ticker: str, cluster_id: str, key: Tuple[str, str], written: bool
+    ) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Record the outcome of writing a duplicate assigned while its
+        canonical row was pending.
+
+        Returns:
+            (promote, restore): promote is True if this duplicate was
+            written after the canonical write failed; the caller then
+            promotes it and calls finish_promotion()
+        """
+        with self._lock:
+            story = self._story(ticker, cluster_id)
+            if story is None or key not in story.pending_duplicates:
+                return False, None
+            story.pending_duplicates.discard(key)
+            if story.persisted:
+                return False, None
+            if written:
+                story.written_duplicates += 1
+                if story.orphaned:
+                    story.orphaned = False
+                    return True, story.restore
+            elif story.orphaned and not story.pending_duplicates:
+                self._drop(ticker, story)
+            return False, None
+
+    def finish_promotion(self, ticker: str, cluster_id: str, promoted: bool) -> None:
+        """Record whether a duplicate of a cluster was promoted to canonical."""
+        with self._lock:
+            story = self._story(ticker, cluster_id)
+            if story is None or story.persisted:
+                return
+            if promoted:
+                story.persisted = True
+                story.orphaned = False
+                story.pending_duplicates.clear()
+            elif story.pending_duplicates:
+                story.orphaned = True
+            else:
+                self._drop(ticker, story)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "tickers": len(self._stories),
+                "stories": sum(len(s) for s in self._stories.values()),
+                "lookups": self.lookups,
+                "duplicates": self.duplicates,
+            }
+
+
+_index: Optional[StoryClusterIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_story_index() -> StoryClusterIndex:
+    """Get the process-wide story cluster index."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                config = get_config()
+                _index = StoryClusterIndex(
+                    max_distance=int(config.get("chatter_dedupe_max_distance", 7)),
+                    window_hours=float(config.get("chatter_dedupe_window_hours", 72)),
+                )
+    return _index
+
+
+def assign_story_clusters(records: List[MarketChatterRecord]) -> int:
+    """
+    Assign story clusters to normalized records (in place).
+
+    Sets story_simhash, story_cluster_id and is_canonical. A duplicate
+    drops its body (summary=None) when the canonical record is in the same
+    batch or already persisted; otherwise it keeps the body so the story
+    text survives if the canonical write never lands. Every record must be
+    settled afterwards with mark_stories_persisted() or
+    release_story_clusters().
+
+    Args:
+        records: Normalized records about to be enriched and persisted
+
+    Returns:
+        Number of records identified as duplicates
+    """
+    if not records or not get_config().get("chatter_dedupe_enabled", True):
+        return 0
+
+    index = get_story_index()
+    batch_clusters = set()
+    duplicates = 0
+    for record in records:
+        tokens = normalize_story_text(record.title, record.summary)
+        if len(tokens) < MIN_STORY_TOKENS:
+            continue
+        simhash = simhash64(tokens)
+        cluster_id, is_canonical, canonical_persisted = index.assign(
+            record.ticker, simhash, (record.source, record.source_id)
+        )
+        record.story_simhash = to_signed64(simhash)
+        record.story_cluster_id = cluster_id
+        record.is_canonical = is_canonical
+        if is_canonical:
+            batch_clusters.add(cluster_id)
+        else:
+            duplicates += 1
+            if canonical_persisted or cluster_id in batch_clusters:
+                record.summary = None
+
+    if duplicates:
+        logger.info(f"[DEDUPE] {duplicates}/{len(records)} records are near-duplicates of known stories")
+    return duplicates
+
+
+def _canonical_clusters(records: List[MarketChatterRecord]) -> Dict[str, List[str]]:
+    by_ticker: Dict[str, List[str]] = {}
+    for record in records:
+        if record.is_canonical and record.story_cluster_id:
+            by_ticker.setdefault(record.ticker, []).append(record.story_cluster_id)
+    return by_ticker
+
+
+def _restore_fields(record: MarketChatterRecord) -> Dict[str, Any]:
+    """Summary and sentiment a promoted duplicate inherits from a lost canonical."""
+    return {
+        "summary": record.summary,
+        "sentiment_score": record.sentiment_score,
+        "sentiment_label": record.sentiment_label,
+        "confidence": record.confidence,
+        "sentiment_model": record.sentiment_model,
+    }
+
+
+def _promote(ticker: str, cluster_id: str, restore: Optional[Dict[str, Any]]) -> bool:
+    """Promote the earliest written duplicate of a cluster in PostgreSQL."""
+    try:
+        from tradingagents.database.chatter_persist import promote_story_duplicate
+        promoted = promote_story_duplicate(ticker, cluster_id, restore)
+    except Exception as e:
+        logger.warning(f"[DEDUPE] Could not promote a duplicate of story {cluster_id}: {e}")
+        promoted = False
+    get_story_index().finish_promotion(ticker, cluster_id, promoted)
+    return promoted
+
+
+def _settle_duplicates(records: List[MarketChatterRecord], written: bool) -> int:
+    """Settle duplicate records; returns the number of duplicates promoted."""
+    index = get_story_index()
+    promoted = 0
+    for record in records:
+        if record.is_canonical or not record.story_cluster_id:
+            continue
+        promote, restore = index.settle_duplicate(
+            record.ticker, record.story_cluster_id, (record.source, record.source_id), written
+        )
+        if promote and _promote(record.ticker, record.story_cluster_id, restore):
+            promoted += 1
+    return promoted
+
+
+def mark_stories_persisted(
+    records: List[MarketChatterRecord],
+    failed_keys: Optional[Collection[Tuple[str, str]]] = None
+) -> None:
+    """
+    Record the outcome of persisting clustered records.
+
+    Call after persist_market_chatter(). Canonical records that were
+    written are marked persisted, so later duplicates of these stories are
+    stored without a body. Records listed in failed_keys (their (source,
+    source_id), as collected by persist_market_chatter) are settled as in
+    release_story_clusters(); a written duplicate of a story whose
+    canonical write failed is promoted to canonical.
+    """
+    failed_keys = set(failed_keys or ())
+    written = [r for r in records if (r.source, r.source_id) not in failed_keys]
+    failed = [r for r in records if (r.source, r.source_id) in failed_keys]
+
+    # Duplicates first: a canonical failing in this batch promotes one of them
+    promoted = _settle_duplicates(written, written=True)
+    if promoted:
+        logger.info(f"[DEDUPE] Promoted {promoted} duplicates of stories whose canonical write never landed")
+
+    index = get_story_index()
+    for ticker, cluster_ids in _canonical_clusters(written).items():
+        index.mark_persisted(ticker, cluster_ids)
+    if failed:
+        release_story_clusters(failed)
+
+
+def release_story_clusters(records: List[MarketChatterRecord]) -> int:
+    """
+    Settle the story clusters of records whose rows were never written.
+
+    Call when a source is cancelled or fails after assign_story_clusters().
+    For each lost canonical record, a duplicate already written by another
+    source (or in the same batch) is promoted to canonical; if duplicates
+    are still being written, the first to land is promoted; otherwise the
+    story is dropped so the next duplicate becomes canonical. Stories
+    already persisted (by this or another source) are kept.
+
+    Returns:
+        Number of stories released or promoted
+    """
+    _settle_duplicates(records, written=False)
+
+    index = get_story_index()
+    released = promoted = 0
+    for record in records:
+        if not record.is_canonical or not record.story_cluster_id:
+            continue
+        restore = _restore_fields(record)
+        outcome = index.release(record.ticker, record.story_cluster_id, restore)
+        if outcome == "promote":
+            promoted += _promote(record.ticker, record.story_cluster_id, restore)
+        if outcome:
+            released += 1
+    if released:
+        logger.info(
+            f"[DEDUPE] Released {released} canonical stories whose write never landed "
+            f"({promoted} duplicates promoted)"
+        )
+    return released
@@ -0,0 +1,270 @@
+"""
+Sentiment enrichment stage for market chatter ingestion.
+
+Runs between normalization (MarketChatterRecord) and persistence
+(persist_market_chatter): every record without a sentiment score is scored
+at write time, in batches, by a selectable backend. The backend's model
+version is stored with the score (market_chatter.sentiment_model) so rows
+scored by different models can be told apart and re-scored later.
+
+Backends:
+    lexicon  - rule-based financial lexicon (default, no dependencies)
+    vader    - VADER (vaderSentiment)
+    finbert  - FinBERT (transformers + torch), loaded once per process
+
+Select one with the chatter_sentiment_backend config key
+(CHATTER_SENTIMENT_BACKEND env var). Records that already carry a
+provider score (e.g. Alpha Vantage) and near-duplicates of an already
+scored story (is_canonical=False, see chatter_dedupe.py) are left
+untouched.
+
+Usage:
+    from tradingagents.dataflows.chatter_enrichment import enrich_chatter_sentiment
+
+    enrich_chatter_sentiment(records)   # in place, before persisting
+"""
+
+import logging
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Sequence, Type
+
+from .chatter_schema import MarketChatterRecord
+from .config import get_config
+
+logger = logging.getLogger(__name__)
+
+BACKEND_LEXICON = "lexicon"
+BACKEND_VADER = "vader"
+BACKEND_FINBERT = "finbert"
+
+
+class SentimentBackend(ABC):
+    """
+    A batch sentiment scorer.
+
+    score_batch() returns, per text, a dict with sentiment_score (-1.0 to
+    1.0), sentiment_label (positive/neutral/negative) and confidence.
+    """
+
+    name: str = "unknown"
+
+    @property
+    @abstractmethod
+    def model_version(self) -> str:
+        """Identifier stored in market_chatter.sentiment_model."""
+        pass
+
+    @abstractmethod
+    def score_batch(self, texts: Sequence[str]) -> List[Dict[str, Any]]:
+        """Score a batch of texts, in input order."""
+        pass
+
+
+class LexiconSentimentBackend(SentimentBackend):
+    """Rule-based financial lexicon (vfis.market_chatter.sentiment)."""
+
+    name = BACKEND_LEXICON
+
+    def __init__(self):
+        from vfis.market_chatter.sentiment import get_sentiment_analyzer
+        self._analyzer = get_sentiment_analyzer()
+
+    @property
+    def model_version(self) -> str:
+        return "lexicon-v1"
+
+    def score_batch(self, texts: Sequence[str]) -> List[Dict[str, Any]]:
+        return self._analyzer.analyze_batch(list(texts), use_finbert=False)
+
+
+class VaderSentimentBackend(SentimentBackend):
+    """VADER compound score with the thresholds used by vfis.tools.sentiment_scoring."""
+
+    name = BACKEND_VADER
+
+    def __init__(self):
+        from vaderSentiment import vaderSentiment
+        self._analyzer = vaderSentiment.SentimentIntensityAnalyzer()
+        self._version = getattr(vaderSentiment, "__version__", None)
+
+    @property
+    def model_version(self) -> str:
+        return f"vader-{self._version}" if self._version else "vader"
+
+    def score_batch(self, texts: Sequence[str]) -> List[Dict[str, Any]]:
+        results = []
+        for text in texts:
+            scores = self._analyzer.polarity_scores(text or "")
+            compound = scores["compound"]
+            if compound >= 0.05:
+                label, confidence = "positive", scores["pos"]
+            elif compound <= -0.05:
+                label, confidence = "negative", scores["neg"]
+            else:
+                label, confidence = "neutral", scores["neu"]
+            results.append({
+                "sentiment_score": round(compound, 3),
+                "sentiment_label": label,
+                "confidence": round(confidence, 3),
+            })
+        return results
+
+
+class FinBertSentimentBackend(SentimentBackend):
+    """
+    FinBERT via the process-wide model in vfis.market_chatter.sentiment.
+
+    Forward passes are serialized: sources ingest concurrently, and torch
+    already spreads one batch across all cores.
+    """
+
+    name = BACKEND_FINBERT
+
+    def __init__(self):
+        from vfis.market_chatter.sentiment import get_finbert_model, finbert_sentiment_result
+        self._model = get_finbert_model()
+        if self._model is None:
+            raise RuntimeError("FinBERT model is not available")
+        self._to_result = finbert_sentiment_result
+        self._lock = threading.Lock()
+
+    @property
+    def model_version(self) -> str:
+        return f"finbert:{self._model.model_name}"
+
+    def score_batch(self, texts: Sequence[str]) -> List[Dict[str, Any]]:
+        results: List[Optional[Dict[str, Any]]] = []
+        pending = []
+        for i, text in enumerate(texts):
+            if text and text.strip():
+                results.append(None)
+                pending.append(i)
+            else:
+                results.append({"sentiment_score": 0.0, "sentiment_label": "neutral", "confidence": 0.0})
+        if pending:
+            with self._lock:
+                scores = self._model.predict([texts[i] for i in pending])
+            for i, (positive_score, negative_score) in zip(pending, scores):
+                results[i] = self._to_result(positive_score, negative_score)
+        return results
+
+
+SENTIMENT_BACKENDS: Dict[str, Type[SentimentBackend]] = {
+    BACKEND_LEXICON: LexiconSentimentBackend,
+    BACKEND_VADER: VaderSentimentBackend,
+    BACKEND_FINBERT: FinBertSentimentBackend,
+}
+
+_backends: Dict[str, SentimentBackend] = {}
+_backends_lock = threading.Lock()
+
+
+def register_sentiment_backend(name: str, backend_cls: Type[SentimentBackend]) -> None:
+    """
+    Register an additional sentiment backend.
+
+    Args:
+        name: Name used in chatter_sentiment_backend
+        backend_cls: SentimentBackend subclass (constructed once, on first use)
+    """
+    SENTIMENT_BACKENDS[name] = backend_cls
+    with _backends_lock:
+        _backends.pop(name, None)
+
+
+def get_sentiment_backend(name: Optional[str] = None) -> SentimentBackend:
+    """
+    Get the shared instance of a sentiment backend.
+
+    A backend whose dependencies are missing falls back to the lexicon
+    backend (with a warning); the stored model version reflects the
+    backend actually used.
+
+    Args:
+        name: Backend name (default: chatter_sentiment_backend config key)
+
+    Returns:
+        SentimentBackend instance
+    """
+    name = (name or get_config().get("chatter_sentiment_backend") or BACKEND_LEXICON).lower()
+    backend = _backends.get(name)
+    if backend is not None:
+        return backend
+
+    with _backends_lock:
+        backend = _backends.get(name)
+        if backend is None:
+            backend_cls = SENTIMENT_BACKENDS.get(name)
+            try:
+                if backend_cls is None:
+                    raise ValueError(f"unknown backend (choose from {sorted(SENTIMENT_BACKENDS)})")
+                backend = backend_cls()
+                logger.info(f"[ENRICH] Sentiment backend '{name}' ready ({backend.model_version})")
+            except Exception as e:
+                if name == BACKEND_LEXICON:
+                    raise
+                logger.warning(f"[ENRICH] Sentiment backend '{name}' unavailable ({e}); using lexicon")
+                backend = _backends.get(BACKEND_LEXICON) or LexiconSentimentBackend()
+                _backends[BACKEND_LEXICON] = backend
+            _backends[name] = backend
+    return backend
+
+
+def _record_text(record: MarketChatterRecord) -> str:
+    """Text scored for a record: title and summary."""
+    title = (record.title or "").strip()
+    summary = (record.summary or "").strip()
+    if title and summary and not summary.startswith(title):
+        return f"{title}. {summary}"
+    return summary or title
+
+
+def enrich_chatter_sentiment(
+    records: List[MarketChatterRecord],
+    backend: Optional[SentimentBackend] = None,
+    batch_size: Optional[int] = None
+) -> int:
+    """
+    Score sentiment for canonical records that do not have a score yet.
+
+    Records are updated in place (sentiment_score, sentiment_label,
+    confidence, sentiment_model). Failures are logged and leave the
+    records unscored; persistence is never blocked by enrichment.
+
+    Args:
+        records: Normalized records about to be persisted
+        backend: Optional backend (default: get_sentiment_backend())
+        batch_size: Records per score_batch() call (default: config)
+
+    Returns:
+        Number of records scored
+    """
+    unscored = [r for r in records if r.sentiment_score is None and r.is_canonical]
+    if not unscored:
+        return 0
+
+    try:
+        backend = backend or get_sentiment_backend()
+    except Exception as e:
+        logger.warning(f"[ENRICH] No sentiment backend available: {e}")
+        return 0
+
+    batch_size = batch_size or int(get_config().get("chatter_sentiment_batch_size", 256))
+    scored = 0
+    for start in range(0, len(unscored), batch_size):
+        batch = unscored[start:start + batch_size]
+        try:
+            results = backend.score_batch([_record_text(r) for r in batch])
+        except Exception as e:
+            logger.warning(f"[ENRICH] {backend.name} failed on {len(batch)} records: {e}")
+            continue
+        for record, result in zip(batch, results):
+            record.sentiment_score = result["sentiment_score"]
+            record.sentiment_label = result["sentiment_label"]
+            record.confidence = result["confidence"]
+            record.sentiment_model = backend.model_version
+            scored += 1
+
+    logger.debug(f"[ENRICH] Scored {scored}/{len(unscored)} records with {backend.model_version}")
+    return scored
@@ -10,7 +10,9 @@ NOTE: MarketChatterRecord is defined in chatter_schema.py - use that as the cano
 """
 
 import logging
+import threading
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 from datetime import datetime
 from typing import Optional, Dict, List, Any
 
@@ -79,12 +81,17 @@ class ChatterSource(ABC):
     - normalize(): Convert raw data to canonical MarketChatterRecord
     
     Optional:
-    - analyze_sentiment(): Add sentiment scores
+    - analyze_sentiment(): Add sentiment scores (default: ingestion
+      enrichment stage for items without a provider score)
     """
     
     SOURCE_NAME: str = "unknown"
     SOURCE_TYPE: str = SOURCE_TYPE_NEWS
     
+    # Endpoint fetch() calls; when set, fetch() holds a per-host slot
+    # (ingest_concurrency.host_slot) for the duration of the request
+    FETCH_URL: Optional[str] = None
+    
     @abstractmethod
     def fetch(
         self,
@@ -131,8 +138,11 @@ class ChatterSource(ABC):
         """
         Add sentiment analysis to items.
         
-        Default implementation does nothing. Override in subclasses.
+        Default implementation scores items that have no sentiment yet with
+        the configured enrichment backend. Override in subclasses.
         """
+        from .chatter_enrichment import enrich_chatter_sentiment
+        enrich_chatter_sentiment(items)
         return items
     
     def ingest(
@@ -140,22 +150,34 @@ class ChatterSource(ABC):
         ticker: str,
         company_name: Optional[str] = None,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        cancel: Optional[threading.Event] = None
     ) -> IngestionResult:
         """
         Full ingestion pipeline: fetch, normalize, analyze, store.
         
+        Args:
+            cancel: Optional cancellation event (set when the source times
+                    out); raises SourceCancelled instead of persisting late
+        
         Returns:
             IngestionResult with counts and status
         """
-        from tradingagents.database.chatter_persist import persist_market_chatter
+        from .chatter_dedupe import assign_story_clusters, release_story_clusters
+        from .ingest_chatter import persist_source_records
+        from .ingest_concurrency import SourceCancelled, check_cancelled, host_slot
         
         result = IngestionResult(source=self.SOURCE_NAME, ticker=ticker.upper())
+        items: List[MarketChatterRecord] = []
         
         try:
             # Fetch
             logger.info(f"[{self.SOURCE_NAME}] Fetching chatter for {ticker}")
-            raw_items = self.fetch(ticker, company_name, start_date, end_date)
+            check_cancelled(cancel)
+            slot = host_slot(self.FETCH_URL, cancel) if self.FETCH_URL else nullcontext()
+            with slot:
+                raw_items = self.fetch(ticker, company_name, start_date, end_date)
+            check_cancelled(cancel)
             result.fetched = len(raw_items)
             logger.info(f"[{self.SOURCE_NAME}] Fetched {result.fetched} raw items for {ticker}")
             
@@ -167,11 +189,15 @@ class ChatterSource(ABC):
             items = self.normalize(raw_items, ticker, company_name)
             logger.info(f"[{self.SOURCE_NAME}] Normalized {len(items)} items for {ticker}")
             
+            # Cluster near-duplicate stories across sources
+            assign_story_clusters(items)
+            
             # Analyze sentiment
             items = self.analyze_sentiment(items)
             
-            # Store using centralized persist function
-            counts = persist_market_chatter(items)
+            # Store using centralized persist function (a timed-out source
+            # must not write late); settles the story clusters either way
+            counts = persist_source_records(items, cancel)
             
             result.inserted = counts["inserted"]
             result.skipped = counts["skipped"]
@@ -183,7 +209,11 @@ class ChatterSource(ABC):
                 f"skipped={result.skipped}, errors={result.errors}"
             )
             
+        except SourceCancelled:
+            release_story_clusters(items)
+            raise
         except Exception as e:
+            release_story_clusters(items)
             logger.error(f"[{self.SOURCE_NAME}] Ingestion failed for {ticker}: {e}", exc_info=True)
             result.errors = 1
             result.messages.append(f"Ingestion error: {str(e)}")
@@ -55,6 +55,9 @@ class MarketChatterRecord:
         url: Source URL (nullable)
         published_at: Original publication time
         sentiment_score: Sentiment score -1.0 to 1.0 (nullable)
+        sentiment_model: Model/version that produced sentiment_score (nullable)
+        story_cluster_id: Near-duplicate story cluster (nullable)
+        is_canonical: False for near-duplicates of an earlier record
         created_at: Record creation time (auto-set)
     """
     ticker: str
@@ -71,6 +74,10 @@ class MarketChatterRecord:
     source_type: str = SOURCE_TYPE_NEWS
     sentiment_label: Optional[str] = None
     confidence: Optional[float] = None
+    sentiment_model: Optional[str] = None
+    story_cluster_id: Optional[str] = None
+    story_simhash: Optional[int] = None
+    is_canonical: bool = True
     company_name: Optional[str] = None
     raw_payload: Optional[Dict[str, Any]] = None
     
@@ -108,6 +115,10 @@ class MarketChatterRecord:
             'created_at': self.created_at,
             'source_type': self.source_type,
             'confidence': self.confidence,
+            'sentiment_model': self.sentiment_model,
+            'story_cluster_id': self.story_cluster_id,
+            'story_simhash': self.story_simhash,
+            'is_canonical': self.is_canonical,
             'company_name': self.company_name,
             'raw_payload': self.raw_payload
         }
@@ -128,6 +139,10 @@ class MarketChatterRecord:
             created_at=data.get('created_at') or datetime.utcnow(),
             source_type=data.get('source_type', SOURCE_TYPE_NEWS),
             confidence=data.get('confidence'),
+            sentiment_model=data.get('sentiment_model'),
+            story_cluster_id=data.get('story_cluster_id'),
+            story_simhash=data.get('story_simhash'),
+            is_canonical=data.get('is_canonical', True),
             company_name=data.get('company_name'),
             raw_payload=data.get('raw_payload')
         )
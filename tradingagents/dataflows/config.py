@@ -3,6 +3,8 @@ from typing import Dict, Optional
 
 # Use default config but allow it to be overridden
 _config: Optional[Dict] = None
+# DEFAULT_CONFIG has no "data_dir" key, so DATA_DIR stays None unless a
+# caller sets one; indexing it directly made this module fail to import
 DATA_DIR: Optional[str] = None
 
 
@@ -11,7 +13,7 @@ def initialize_config():
     global _config, DATA_DIR
     if _config is None:
         _config = default_config.DEFAULT_CONFIG.copy()
-        DATA_DIR = _config["data_dir"]
+        DATA_DIR = _config.get("data_dir")
 
 
 def set_config(config: Dict):
@@ -20,7 +22,7 @@ def set_config(config: Dict):
     if _config is None:
         _config = default_config.DEFAULT_CONFIG.copy()
     _config.update(config)
-    DATA_DIR = _config["data_dir"]
+    DATA_DIR = _config.get("data_dir")
 
 
 def get_config() -> Dict:
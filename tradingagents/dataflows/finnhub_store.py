@@ -0,0 +1,219 @@
+"""
+Indexed, memory-resident store for the local Finnhub datasets.
+
+The files under <data_dir>/finnhub_data/<data_type>/ map YYYY-mm-dd to a
+list of entries. get_data_in_range() used to json.load() the whole file
+on every call, and the insider functions deduplicated entries with a
+list scan (O(n^2)). Each file is now parsed once into:
+
+- the dates that have entries, sorted (range lookups by binary search)
+- per date, the ids of its entries in file order
+- one copy of every distinct entry (hash of its canonical JSON), so
+  deduplication is a set lookup on ids
+
+The parsed form is pickled under <data_cache_dir>/finnhub/ and reused
+until the JSON file's size or mtime changes; loaded datasets stay in an
+in-process LRU. After the first load, a range lookup costs
+O(log n + entries returned) regardless of file size.
+
+Usage:
+    from tradingagents.dataflows.finnhub_store import get_finnhub_store
+
+    dataset = get_finnhub_store().load(path)
+    by_date = dataset.range("2024-05-01", "2024-05-15")
+    unique = dataset.unique_entries("2024-05-01", "2024-05-15")
+"""
+
+import bisect
+import hashlib
+import json
+import logging
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Bump when the pickled layout changes
+STORE_FORMAT_VERSION = 1
+
+
+class FinnhubDataset:
+    """One Finnhub file: sorted dates, per-date entry ids, distinct entries."""
+
+    __slots__ = ("dates", "entry_ids", "entries")
+
+    def __init__(self, dates: List[str], entry_ids: List[List[int]], entries: List[Any]):
+        self.dates = dates
+        self.entry_ids = entry_ids
+        self.entries = entries
+
+    @classmethod
+    def from_json(cls, raw: Dict[str, List[Any]]) -> "FinnhubDataset":
+        ids_by_key: Dict[str, int] = {}
+        entries: List[Any] = []
+        dates, entry_ids = [], []
+        for day in sorted(raw):
+            values = raw[day]
+            if not values:
+                continue
+            day_ids = []
+            for entry in values:
+                key = json.dumps(entry, sort_keys=True, separators=(",", ":"))
+                entry_id = ids_by_key.get(key)
+                if entry_id is None:
+                    entry_id = ids_by_key[key] = len(entries)
+                    entries.append(entry)
+                day_ids.append(entry_id)
+            dates.append(day)
+            entry_ids.append(day_ids)
+        return cls(dates, entry_ids, entries)
+
+    def _bounds(self, start_date: str, end_date: str) -> Tuple[int, int]:
+        return bisect.bisect_left(self.dates, start_date), bisect.bisect_right(self.dates, end_date)
+
+    def range(self, start_date: str, end_date: str) -> Dict[str, List[Any]]:
+        """Dates within [start_date, end_date] that have entries -> entries (file order)."""
+        lo, hi = self._bounds(start_date, end_date)
+        entries = self.entries
+        return {
+            self.dates[i]: [entries[entry_id] for entry_id in self.entry_ids[i]]
+            for i in range(lo, hi)
+        }
+
+    def unique_entries(self, start_date: str, end_date: str) -> List[Tuple[str, Any]]:
+        """(date, entry) pairs within the range, each distinct entry once (first date wins)."""
+        lo, hi = self._bounds(start_date, end_date)
+        seen = set()
+        result = []
+        for i in range(lo, hi):
+            for entry_id in self.entry_ids[i]:
+                if entry_id not in seen:
+                    seen.add(entry_id)
+                    result.append((self.dates[i], self.entries[entry_id]))
+        return result
+
+
+class FinnhubStore:
+    """
+    Loads Finnhub files through a pickled index and an in-process LRU.
+
+    Thread-safe; a file is parsed at most once per change.
+    """
+
+    def __init__(self, cache_dir: str, max_cached: int = 64):
+        self.cache_dir = cache_dir
+        self.max_cached = max(1, max_cached)
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._datasets: "OrderedDict[str, Tuple[Tuple[int, float], FinnhubDataset]]" = OrderedDict()
+        self.hits = 0
+        self.index_loads = 0
+        self.parses = 0
+
+    def _index_path(self, path: str) -> str:
+        digest = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()[:12]
+        name = os.path.splitext(os.path.basename(path))[0]
+        return os.path.join(self.cache_dir, f"{name}-{digest}.pkl")
+
+    def _read_index(self, index_path: str, signature: Tuple[int, float]) -> Optional[FinnhubDataset]:
+        try:
+            with open(index_path, "rb") as f:
+                version, stored_signature, dates, entry_ids, entries = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"[FINNHUB] Ignoring unreadable index {index_path}: {e}")
+            return None
+        if version != STORE_FORMAT_VERSION or tuple(stored_signature) != signature:
+            return None
+        return FinnhubDataset(dates, entry_ids, entries)
+
+    def _write_index(self, index_path: str, signature: Tuple[int, float], dataset: FinnhubDataset) -> None:
+        tmp_path = f"{index_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump(
+                    (STORE_FORMAT_VERSION, signature, dataset.dates, dataset.entry_ids, dataset.entries),
+                    f, protocol=pickle.HIGHEST_PROTOCOL
+                )
+            os.replace(tmp_path, index_path)
+        except OSError as e:
+            # The index is an optimization; a read-only cache dir is not an error
+            logger.warning(f"[FINNHUB] Could not write index {index_path}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def load(self, path: str) -> FinnhubDataset:
+        """
+        Dataset of a Finnhub JSON file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        stat = os.stat(path)
+        signature = (stat.st_size, stat.st_mtime)
+        with self._lock:
+            cached = self._datasets.get(path)
+            if cached is not None and cached[0] == signature:
+                self._datasets.move_to_end(path)
+                self.hits += 1
+                return cached[1]
+
+        with self._load_lock:
+            with self._lock:
+                cached = self._datasets.get(path)
+                if cached is not None and cached[0] == signature:
+                    return cached[1]
+
+            index_path = self._index_path(path)
+            dataset = self._read_index(index_path, signature)
+            if dataset is not None:
+                self.index_loads += 1
+            else:
+                with open(path, "r") as f:
+                    dataset = FinnhubDataset.from_json(json.load(f))
+                self.parses += 1
+                self._write_index(index_path, signature, dataset)
+                logger.debug(f"[FINNHUB] Indexed {path}: {len(dataset.dates)} dates, {len(dataset.entries)} entries")
+
+            with self._lock:
+                self._datasets[path] = (signature, dataset)
+                self._datasets.move_to_end(path)
+                while len(self._datasets) > self.max_cached:
+                    self._datasets.popitem(last=False)
+            return dataset
+
+    def clear(self) -> None:
+        """Drop loaded datasets (index files are kept)."""
+        with self._lock:
+            self._datasets.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "cache_dir": self.cache_dir,
+                "cached_datasets": len(self._datasets),
+                "hits": self.hits,
+                "index_loads": self.index_loads,
+                "parses": self.parses,
+            }
+
+
+_store: Optional[FinnhubStore] = None
+_store_lock = threading.Lock()
+
+
+def get_finnhub_store() -> FinnhubStore:
+    """Get the process-wide Finnhub store."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = FinnhubStore(os.path.join(get_config()["data_cache_dir"], "finnhub"))
+    return _store
@@ -1,5 +1,4 @@
 import json
-import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
 import time
@@ -12,6 +11,8 @@ from tenacity import (
     retry_if_result,
 )
 
+from .http_client import http_get
+
 
 def is_rate_limited(response):
     """Check if the response indicates rate limiting (status code 429)"""
@@ -27,7 +28,7 @@ def make_request(url, headers):
     """Make a request with retry logic for rate limiting"""
     # Random delay before each request to avoid detection
     time.sleep(random.uniform(2, 6))
-    response = requests.get(url, headers=headers)
+    response = http_get(url, headers=headers)
     return response
 
 
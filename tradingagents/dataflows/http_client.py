@@ -0,0 +1,300 @@
+"""
+Shared HTTP client for feed and API fetching.
+
+Every outbound GET in the dataflows layer goes through one HttpClient:
+- pooled keep-alive connections (one requests.Session, one pool per host)
+- mandatory (connect, read) timeouts, applied when the caller passes none
+- conditional GET: ETag / Last-Modified validators are persisted per URL
+  in a small SQLite store, and a 304 Not Modified is answered from the
+  stored body, so unchanged feeds cost one cheap round trip
+- per-host counters for requests, bytes received, 304s, errors and latency
+
+Usage:
+    from tradingagents.dataflows.http_client import http_get
+
+    response = http_get(url, params=params, conditional=True)
+    feed = feedparser.parse(response.content)
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from tradingagents import metrics
+
+from .config import get_config
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONNECT_TIMEOUT_SECONDS = 5.0
+DEFAULT_READ_TIMEOUT_SECONDS = 20.0
+DEFAULT_POOL_MAXSIZE = 16
+DEFAULT_USER_AGENT = "vfis-market-intel/1.0"
+
+VALIDATOR_DB_FILENAME = "http_validators.sqlite"
+
+
+class ValidatorStore:
+    """
+    Persistent ETag / Last-Modified store keyed by request URL.
+
+    URLs are stored as SHA-256 digests so query-string API keys never reach
+    disk. The last 200 body is kept alongside the validators so a 304 can
+    be replayed to callers that expect a full response.
+    """
+
+    def __init__(self, path: Optional[str]):
+        """
+        Args:
+            path: SQLite file path, or None for an in-memory store
+        """
+        self.path = path or ":memory:"
+        if path:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS http_validators (
+                url_hash TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                content_type TEXT,
+                body BLOB,
+                updated_at REAL
+            )
+        """)
+        self._conn.commit()
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return stored validators and body for a URL, if any."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, content_type, body FROM http_validators WHERE url_hash = ?",
+                (self._key(url),)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"etag": row[0], "last_modified": row[1], "content_type": row[2], "body": row[3]}
+
+    def put(self, url: str, etag: Optional[str], last_modified: Optional[str],
+            content_type: Optional[str], body: bytes) -> None:
+        """Store validators and body for a URL."""
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO http_validators
+                    (url_hash, etag, last_modified, content_type, body, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (self._key(url), etag, last_modified, content_type, body, time.time())
+            )
+            self._conn.commit()
+
+    def delete(self, url: str) -> None:
+        """Forget validators for a URL."""
+        with self._lock:
+            self._conn.execute("DELETE FROM http_validators WHERE url_hash = ?", (self._key(url),))
+            self._conn.commit()
+
+
+class HttpClient:
+    """Pooled, timeout-enforcing HTTP client with conditional GET support."""
+
+    def __init__(
+        self,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT_SECONDS,
+        read_timeout: float = DEFAULT_READ_TIMEOUT_SECONDS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        validator_store: Optional[ValidatorStore] = None,
+        user_agent: str = DEFAULT_USER_AGENT
+    ):
+        """
+        Args:
+            connect_timeout: Default connect timeout in seconds
+            read_timeout: Default read timeout in seconds
+            pool_maxsize: Keep-alive connections kept per host
+            validator_store: Store for conditional GET validators
+            user_agent: Default User-Agent header
+        """
+        self.timeout: Tuple[float, float] = (connect_timeout, read_timeout)
+        self.validators = validator_store or ValidatorStore(None)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["User-Agent"] = user_agent
+
+        self._stats_lock = threading.Lock()
+        self._host_stats: Dict[str, Dict[str, float]] = {}
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[Any] = None,
+        conditional: bool = False
+    ) -> requests.Response:
+        """
+        Issue a GET request through the shared session.
+
+        Args:
+            url: Request URL
+            params: Optional query parameters
+            headers: Optional extra headers
+            timeout: Optional timeout override (seconds or (connect, read))
+            conditional: Send stored ETag / Last-Modified validators and
+                         replay the stored body on 304 Not Modified
+
+        Returns:
+            requests.Response. A replayed 304 is returned as a 200 with
+            `from_validator_cache` set to True.
+        """
+        request_headers = dict(headers or {})
+        cache_key = None
+        cached = None
+
+        if conditional:
+            cache_key = requests.Request("GET", url, params=params).prepare().url
+            cached = self.validators.get(cache_key)
+            if cached:
+                if cached["etag"]:
+                    request_headers["If-None-Match"] = cached["etag"]
+                if cached["last_modified"]:
+                    request_headers["If-Modified-Since"] = cached["last_modified"]
+
+        host = urlparse(url).hostname or url
+        start = time.monotonic()
+        try:
+            response = self.session.get(
+                url, params=params, headers=request_headers, timeout=timeout or self.timeout
+            )
+        except requests.RequestException:
+            self._record(host, time.monotonic() - start, 0, error=True)
+            raise
+
+        self._record(
+            host, time.monotonic() - start, len(response.content),
+            not_modified=response.status_code == 304
+        )
+        response.from_validator_cache = False
+
+        if not conditional:
+            return response
+
+        if response.status_code == 304 and cached:
+            return self._replay(response, cached)
+
+        if response.status_code == 200:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                self.validators.put(
+                    cache_key, etag, last_modified,
+                    response.headers.get("Content-Type"), response.content
+                )
+        return response
+
+    @staticmethod
+    def _replay(response: requests.Response, cached: Dict[str, Any]) -> requests.Response:
+        """Turn a 304 into the stored 200 response."""
+        replay = requests.Response()
+        replay.status_code = 200
+        replay._content = bytes(cached["body"] or b"")
+        replay.headers.update(response.headers)
+        if cached["content_type"]:
+            replay.headers["Content-Type"] = cached["content_type"]
+        replay.url = response.url
+        replay.request = response.request
+        replay.elapsed = response.elapsed
+        replay.encoding = requests.utils.get_encoding_from_headers(replay.headers)
+        replay.from_validator_cache = True
+        return replay
+
+    def _record(self, host: str, latency: float, nbytes: int,
+                not_modified: bool = False, error: bool = False) -> None:
+        metrics.HTTP_REQUEST_SECONDS.observe(
+            latency, host=host,
+            outcome="error" if error else "not_modified" if not_modified else "ok"
+        )
+        with self._stats_lock:
+            stats = self._host_stats.setdefault(host, {
+                "requests": 0,
+                "bytes": 0,
+                "not_modified": 0,
+                "errors": 0,
+                "total_latency": 0.0,
+                "max_latency": 0.0,
+            })
+            stats["requests"] += 1
+            stats["bytes"] += nbytes
+            stats["total_latency"] += latency
+            stats["max_latency"] = max(stats["max_latency"], latency)
+            if not_modified:
+                stats["not_modified"] += 1
+            if error:
+                stats["errors"] += 1
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Return per-host request, byte, 304, error and latency counters."""
+        with self._stats_lock:
+            result = {}
+            for host, stats in self._host_stats.items():
+                host_stats = dict(stats)
+                host_stats["avg_latency"] = stats["total_latency"] / stats["requests"]
+                result[host] = host_stats
+            return result
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    """Return the process-wide HttpClient, creating it from config on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                config = get_config()
+                store_path = None
+                cache_dir = config.get("data_cache_dir")
+                if cache_dir:
+                    store_path = os.path.join(cache_dir, VALIDATOR_DB_FILENAME)
+                try:
+                    store = ValidatorStore(store_path)
+                except (OSError, sqlite3.Error) as e:
+                    logger.warning(f"[HTTP] Validator store unavailable at {store_path}, using memory: {e}")
+                    store = ValidatorStore(None)
+                _client = HttpClient(
+                    connect_timeout=float(config.get("http_connect_timeout_seconds", DEFAULT_CONNECT_TIMEOUT_SECONDS)),
+                    read_timeout=float(config.get("http_read_timeout_seconds", DEFAULT_READ_TIMEOUT_SECONDS)),
+                    pool_maxsize=int(config.get("http_pool_maxsize", DEFAULT_POOL_MAXSIZE)),
+                    validator_store=store
+                )
+    return _client
+
+
+def http_get(url: str, **kwargs) -> requests.Response:
+    """GET through the process-wide HttpClient (see HttpClient.get)."""
+    return get_http_client().get(url, **kwargs)
+
+
+def get_http_stats() -> Dict[str, Dict[str, float]]:
+    """Return per-host statistics of the process-wide HttpClient."""
+    if _client is None:
+        return {}
+    return _client.stats()
@@ -11,6 +11,8 @@ Supports ingesting from multiple FREE sources (no API keys required):
 All sources flow through the canonical pipeline:
     chatter_schema.py → MarketChatterRecord
     ingest_chatter.py → normalization
+    chatter_dedupe.py → assign_story_clusters() (cross-source near-duplicates)
+    chatter_enrichment.py → enrich_chatter_sentiment() (batched scoring)
     chatter_persist.py → persist_market_chatter()
 
 Usage:
@@ -21,19 +23,32 @@ Usage:
     from tradingagents.dataflows.ingest_chatter import ingest_chatter
     results = ingest_chatter("<TICKER>", days=7)  # Ticker provided dynamically
     
+Sources run concurrently (see ingest_concurrency.py). Concurrency limits and
+the per-source timeout come from the ingest_* keys in DEFAULT_CONFIG.
+
 NOTE: No hardcoded tickers. All ticker values must be provided dynamically.
 """
 
 import argparse
+import functools
 import logging
 import sys
 import hashlib
 import json
+import math
+import threading
 import requests
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Callable
 
 from .chatter_schema import MarketChatterRecord, SOURCE_TYPE_NEWS, SOURCE_TYPE_SOCIAL
+from .chatter_dedupe import assign_story_clusters, mark_stories_persisted, release_story_clusters
+from .chatter_enrichment import enrich_chatter_sentiment
+from .ingest_concurrency import (
+    SourceTask, SourceCancelled, run_source_tasks, host_slot, check_cancelled
+)
+from .http_client import http_get
+from .shared_feeds import SharedFeedCache, GLOBAL_RSS_FEEDS, fetch_feed
 from tradingagents.database.chatter_persist import persist_market_chatter
 
 logger = logging.getLogger(__name__)
@@ -54,11 +69,47 @@ REDDIT_USER_AGENT = "vfis-market-intel/1.0"
 REDDIT_SUBREDDITS = ["wallstreetbets", "stocks", "investing", "StockMarket"]
 
 
+def persist_source_records(
+    records: List[MarketChatterRecord],
+    cancel: Optional[threading.Event] = None
+) -> Dict[str, int]:
+    """
+    Persist one source's clustered records and settle their story clusters.
+    
+    Canonical stories whose rows were written are marked persisted. Those
+    whose write never landed (the source was cancelled, or the rows
+    failed) are released from the story index, so the next duplicate from
+    another source becomes canonical.
+    
+    Args:
+        records: Records after assign_story_clusters() and enrichment
+        cancel: Optional cancellation event; a timed-out source must not
+                write late
+    
+    Returns:
+        Counts from persist_market_chatter()
+    
+    Raises:
+        SourceCancelled: If cancel is set (nothing is written)
+    """
+    try:
+        check_cancelled(cancel)
+        failed_keys: set = set()
+        counts = persist_market_chatter(records, failed_keys=failed_keys)
+    except Exception:
+        release_story_clusters(records)
+        raise
+    mark_stories_persisted(records, failed_keys)
+    return counts
+
+
 def ingest_chatter(
     ticker: str,
     company_name: Optional[str] = None,
     days: int = 7,
-    sources: Optional[List[str]] = None
+    sources: Optional[List[str]] = None,
+    max_workers: Optional[int] = None,
+    source_timeout: Optional[float] = None
 ) -> Dict[str, Any]:
     """
     Ingest market chatter from configured sources.
@@ -72,12 +123,18 @@ def ingest_chatter(
     PAID sources (only if API key exists):
     5. Alpha Vantage (only if ALPHA_VANTAGE_API_KEY exists)
     
+    Sources are fetched concurrently; a source exceeding the per-source
+    timeout is cancelled and reported with an error result.
+    
     Args:
         ticker: Stock ticker symbol (dynamically provided, not hardcoded)
         company_name: Optional company name for broader search
         days: Number of days to look back (default: 7)
         sources: Optional list of sources to ingest from. Default: all available.
                  Valid: ['google_news', 'yahoo_finance', 'reddit', 'rss', 'alpha_vantage']
+        max_workers: Optional global concurrency limit (default: ingest_max_workers)
+        source_timeout: Optional per-source timeout in seconds
+                        (default: ingest_source_timeout_seconds)
     
     Returns:
         Dictionary with results:
@@ -99,7 +156,36 @@ def ingest_chatter(
     from tradingagents.database.chatter_persist import ensure_market_chatter_table
     
     ticker = ticker.upper()
-    results = {
+    results = _empty_ticker_result(ticker, company_name, days)
+    
+    # Ensure table exists
+    if not ensure_market_chatter_table():
+        logger.error("Failed to ensure market_chatter table exists")
+        results["error"] = "Failed to create/verify market_chatter table"
+        return results
+    
+    sources_to_run = _resolve_sources(sources)
+    tasks = [
+        SourceTask(ticker, source_name, ingest_func, company_name, days)
+        for source_name, ingest_func in sources_to_run.items()
+    ]
+    
+    logger.info(f"Ingesting from {', '.join(sources_to_run)} for {ticker}...")
+    source_results = {}
+    for task, source_result in run_source_tasks(tasks, max_workers, source_timeout):
+        source_results[task.source_name] = source_result
+    
+    # Report sources in their configured order regardless of completion order
+    for source_name in sources_to_run:
+        _merge_source_result(results, source_name, source_results[source_name])
+    
+    _log_ticker_summary(results)
+    return results
+
+
+def _empty_ticker_result(ticker: str, company_name: Optional[str], days: int) -> Dict[str, Any]:
+    """Build the per-ticker result dictionary before any source has run."""
+    return {
         "ticker": ticker,
         "company_name": company_name,
         "days": days,
@@ -110,13 +196,18 @@ def ingest_chatter(
         "sources": {},
         "timestamp": datetime.utcnow().isoformat()
     }
+
+
+def _resolve_sources(sources: Optional[List[str]] = None) -> Dict[str, Callable[..., Dict[str, Any]]]:
+    """
+    Map source names to ingest functions.
     
-    # Ensure table exists
-    if not ensure_market_chatter_table():
-        logger.error("Failed to ensure market_chatter table exists")
-        results["error"] = "Failed to create/verify market_chatter table"
-        return results
+    Args:
+        sources: Optional list of sources to restrict to. Default: all available.
     
+    Returns:
+        Ordered dict of source name -> ingest function
+    """
     # Import env from canonical source
     try:
         from vfis.core.env import ALPHA_VANTAGE_AVAILABLE
@@ -142,32 +233,22 @@ def ingest_chatter(
     
     # Filter to requested sources if specified
     if sources:
-        sources_to_run = {k: v for k, v in available_sources.items() if k in sources}
-    else:
-        sources_to_run = available_sources
-    
-    # Run ingestion for each source
-    for source_name, ingest_func in sources_to_run.items():
-        try:
-            logger.info(f"Ingesting from {source_name} for {ticker}...")
-            source_result = ingest_func(ticker, company_name, days)
-            
-            results["sources"][source_name] = source_result
-            results["total_fetched"] += source_result.get("fetched", 0)
-            results["total_inserted"] += source_result.get("inserted", 0)
-            results["total_skipped"] += source_result.get("skipped", 0)
-            results["total_errors"] += source_result.get("errors", 0)
-            
-        except Exception as e:
-            logger.error(f"Error ingesting from {source_name}: {e}", exc_info=True)
-            results["sources"][source_name] = {
-                "error": str(e),
-                "fetched": 0,
-                "inserted": 0,
-                "skipped": 0,
-                "errors": 1
-            }
-            results["total_errors"] += 1
+        return {k: v for k, v in available_sources.items() if k in sources}
+    return available_sources
+
+
+def _merge_source_result(results: Dict[str, Any], source_name: str, source_result: Dict[str, Any]) -> None:
+    """Record one source's result and add its counts to the ticker totals."""
+    results["sources"][source_name] = source_result
+    results["total_fetched"] += source_result.get("fetched", 0)
+    results["total_inserted"] += source_result.get("inserted", 0)
+    results["total_skipped"] += source_result.get("skipped", 0)
+    results["total_errors"] += source_result.get("errors", 0)
+
+
+def _log_ticker_summary(results: Dict[str, Any]) -> None:
+    """Log the outcome of ingestion for one ticker."""
+    ticker = results["ticker"]
     
     # Warn if nothing was inserted
     if results["total_inserted"] == 0 and results["total_fetched"] > 0:
@@ -184,11 +265,23 @@ def ingest_chatter(
         f"skipped={results['total_skipped']}, "
         f"errors={results['total_errors']}"
     )
-    
-    return results
 
 
-def _ingest_google_news(ticker: str, company_name: Optional[str], days: int) -> Dict[str, Any]:
+def _source_cutoff(days: int, since: Optional[datetime] = None) -> datetime:
+    """Oldest published_at a source keeps: the lookback window or the watermark."""
+    cutoff = datetime.utcnow() - timedelta(days=days)
+    if since is not None and since > cutoff:
+        return since
+    return cutoff
+
+
+def _ingest_google_news(
+    ticker: str,
+    company_name: Optional[str],
+    days: int,
+    cancel: Optional[threading.Event] = None,
+    since: Optional[datetime] = None
+) -> Dict[str, Any]:
     """
     Ingest from Google News RSS - FREE, NO API KEY.
     
@@ -198,16 +291,17 @@ def _ingest_google_news(ticker: str, company_name: Optional[str], days: int) ->
         ticker: Stock ticker symbol (uppercase)
         company_name: Optional company name for broader search
         days: Number of days to look back
+        cancel: Optional cancellation event set when the source times out
+        since: Optional incremental watermark; older items are skipped
     
     Returns:
         Dict with fetched, inserted, skipped, errors counts
     """
-    import feedparser
     from urllib.parse import quote_plus
     
     result = {"fetched": 0, "inserted": 0, "skipped": 0, "errors": 0, "source": "google_news"}
     records: List[MarketChatterRecord] = []
-    cutoff = datetime.utcnow() - timedelta(days=days)
+    cutoff = _source_cutoff(days, since)
     
     # Build search query with proper URL encoding
     query_parts = [ticker, "stock"]
@@ -220,7 +314,7 @@ def _ingest_google_news(ticker: str, company_name: Optional[str], days: int) ->
     
     try:
         logger.info(f"[GOOGLE_NEWS] Fetching for {ticker} with query: {query}")
-        feed = feedparser.parse(feed_url)
+        feed = fetch_feed(feed_url, cancel)
         
         if feed.bozo and feed.bozo_exception:
             logger.warning(f"[GOOGLE_NEWS] Feed parse error: {feed.bozo_exception}")
@@ -276,9 +370,13 @@ def _ingest_google_news(ticker: str, company_name: Optional[str], days: int) ->
         logger.warning(f"[GOOGLE_NEWS] Error fetching for {ticker}: {e}")
         result["errors"] += 1
     
-    # Persist via canonical path
+    # Cluster near-duplicate stories, then score the canonical ones
+    assign_story_clusters(records)
+    enrich_chatter_sentiment(records)
+    
+    # Persist via canonical path (a timed-out source must not write late)
     if records:
-        counts = persist_market_chatter(records)
+        counts = persist_source_records(records, cancel)
         result["inserted"] = counts["inserted"]
         result["skipped"] = counts["skipped"]
         result["errors"] += counts["errors"]
@@ -288,7 +386,13 @@ def _ingest_google_news(ticker: str, company_name: Optional[str], days: int) ->
     return result
 
 
-def _ingest_yahoo_finance(ticker: str, company_name: Optional[str], days: int) -> Dict[str, Any]:
+def _ingest_yahoo_finance(
+    ticker: str,
+    company_name: Optional[str],
+    days: int,
+    cancel: Optional[threading.Event] = None,
+    since: Optional[datetime] = None
+) -> Dict[str, Any]:
     """
     Ingest from Yahoo Finance RSS - FREE, NO API KEY.
     
@@ -298,21 +402,21 @@ def _ingest_yahoo_finance(ticker: str, company_name: Optional[str], days: int) -
         ticker: Stock ticker symbol (uppercase)
         company_name: Optional company name (not used in query)
         days: Number of days to look back
+        cancel: Optional cancellation event set when the source times out
+        since: Optional incremental watermark; older items are skipped
     
     Returns:
         Dict with fetched, inserted, skipped, errors counts
     """
-    import feedparser
-    
     result = {"fetched": 0, "inserted": 0, "skipped": 0, "errors": 0, "source": "yahoo_finance"}
     records: List[MarketChatterRecord] = []
-    cutoff = datetime.utcnow() - timedelta(days=days)
+    cutoff = _source_cutoff(days, since)
     
     feed_url = YAHOO_FINANCE_RSS_URL.format(ticker=ticker.upper())
     
     try:
         logger.info(f"[YAHOO] Fetching for {ticker}")
-        feed = feedparser.parse(feed_url)
+        feed = fetch_feed(feed_url, cancel)
         
         if feed.bozo and feed.bozo_exception:
             logger.warning(f"[YAHOO] Feed parse error: {feed.bozo_exception}")
@@ -368,9 +472,13 @@ def _ingest_yahoo_finance(ticker: str, company_name: Optional[str], days: int) -
         logger.warning(f"[YAHOO] Error fetching for {ticker}: {e}")
         result["errors"] += 1
     
-    # Persist via canonical path
+    # Cluster near-duplicate stories, then score the canonical ones
+    assign_story_clusters(records)
+    enrich_chatter_sentiment(records)
+    
+    # Persist via canonical path (a timed-out source must not write late)
     if records:
-        counts = persist_market_chatter(records)
+        counts = persist_source_records(records, cancel)
         result["inserted"] = counts["inserted"]
         result["skipped"] = counts["skipped"]
         result["errors"] += counts["errors"]
@@ -380,7 +488,13 @@ def _ingest_yahoo_finance(ticker: str, company_name: Optional[str], days: int) -
     return result
 
 
-def _ingest_reddit(ticker: str, company_name: Optional[str], days: int) -> Dict[str, Any]:
+def _ingest_reddit(
+    ticker: str,
+    company_name: Optional[str],
+    days: int,
+    cancel: Optional[threading.Event] = None,
+    since: Optional[datetime] = None
+) -> Dict[str, Any]:
     """
     Ingest from Reddit public JSON - FREE, NO AUTH REQUIRED.
     
@@ -391,13 +505,15 @@ def _ingest_reddit(ticker: str, company_name: Optional[str], days: int) -> Dict[
         ticker: Stock ticker symbol (uppercase)
         company_name: Optional company name for broader search
         days: Number of days to look back
+        cancel: Optional cancellation event set when the source times out
+        since: Optional incremental watermark; older items are skipped
     
     Returns:
         Dict with fetched, inserted, skipped, errors counts
     """
     result = {"fetched": 0, "inserted": 0, "skipped": 0, "errors": 0, "source": "reddit"}
     records: List[MarketChatterRecord] = []
-    cutoff = datetime.utcnow() - timedelta(days=days)
+    cutoff = _source_cutoff(days, since)
     
     headers = {
         "User-Agent": REDDIT_USER_AGENT
@@ -410,6 +526,7 @@ def _ingest_reddit(ticker: str, company_name: Optional[str], days: int) -> Dict[
     
     # Search across relevant subreddits
     for subreddit in REDDIT_SUBREDDITS:
+        check_cancelled(cancel)
         try:
             # Use subreddit-specific search endpoint
             url = f"https://www.reddit.com/r/{subreddit}/search.json"
@@ -423,7 +540,8 @@ def _ingest_reddit(ticker: str, company_name: Optional[str], days: int) -> Dict[
             
             logger.debug(f"[REDDIT] Searching r/{subreddit} for {ticker}")
             
-            response = requests.get(url, params=params, headers=headers, timeout=10)
+            with host_slot(url, cancel):
+                response = http_get(url, params=params, headers=headers, conditional=True)
             
             if response.status_code == 429:
                 logger.warning(f"[REDDIT] Rate limited on r/{subreddit}")
@@ -495,9 +613,13 @@ def _ingest_reddit(ticker: str, company_name: Optional[str], days: int) -> Dict[
     
     logger.info(f"[REDDIT] Fetched {result['fetched']} items for {ticker}")
     
-    # Persist via canonical path
+    # Cluster near-duplicate stories, then score the canonical ones
+    assign_story_clusters(records)
+    enrich_chatter_sentiment(records)
+    
+    # Persist via canonical path (a timed-out source must not write late)
     if records:
-        counts = persist_market_chatter(records)
+        counts = persist_source_records(records, cancel)
         result["inserted"] = counts["inserted"]
         result["skipped"] = counts["skipped"]
         result["errors"] += counts["errors"]
@@ -507,63 +629,52 @@ def _ingest_reddit(ticker: str, company_name: Optional[str], days: int) -> Dict[
     return result
 
 
-def _ingest_rss(ticker: str, company_name: Optional[str], days: int) -> Dict[str, Any]:
+def _ingest_rss(
+    ticker: str,
+    company_name: Optional[str],
+    days: int,
+    cancel: Optional[threading.Event] = None,
+    since: Optional[datetime] = None,
+    feed_cache: Optional[SharedFeedCache] = None
+) -> Dict[str, Any]:
     """
     Ingest from generic RSS feeds - FREE, NO API KEY.
     
     Uses various financial news RSS feeds as fallback/additional source.
+    The feeds are global, so they are read through a SharedFeedCache: when
+    called from ingest_universe the cache is shared by the whole cycle and
+    each feed is downloaded once for all tickers.
     
     Args:
         ticker: Stock ticker symbol (uppercase)
         company_name: Optional company name
         days: Number of days to look back
+        cancel: Optional cancellation event set when the source times out
+        since: Optional incremental watermark; older items are skipped
+        feed_cache: Optional per-cycle cache shared across tickers
     
     Returns:
         Dict with fetched, inserted, skipped, errors counts
     """
-    import feedparser
-    
-    RSS_FEEDS = {
-        'CNBC TV18': 'https://www.cnbctv18.com/rss/',
-        'Moneycontrol': 'https://www.moneycontrol.com/rss/',
-        'Economic Times': 'https://economictimes.indiatimes.com/rssfeedsdefault.cms',
-        'MarketWatch': 'https://feeds.marketwatch.com/marketwatch/marketpulse/',
-        'Investing.com': 'https://www.investing.com/rss/news.rss'
-    }
+    if feed_cache is None:
+        feed_cache = SharedFeedCache(GLOBAL_RSS_FEEDS, {ticker: company_name})
     
     result = {"fetched": 0, "inserted": 0, "skipped": 0, "errors": 0, "source": "rss"}
     records: List[MarketChatterRecord] = []
-    cutoff = datetime.utcnow() - timedelta(days=days)
+    cutoff = _source_cutoff(days, since)
     
-    for feed_name, feed_url in RSS_FEEDS.items():
+    for feed_name in feed_cache.feeds:
+        check_cancelled(cancel)
         try:
-            feed = feedparser.parse(feed_url)
-            
-            for entry in feed.entries[:50]:  # Limit per feed
-                # Check if entry mentions ticker
-                title = entry.get('title', '')
-                summary = entry.get('summary', entry.get('description', ''))
-                content = f"{title} {summary}".upper()
-                
-                if ticker not in content:
-                    continue  # Skip irrelevant entries
-                
-                # Parse date
-                published_at = None
-                if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                    try:
-                        published_at = datetime(*entry.published_parsed[:6])
-                    except Exception:
-                        pass
-                
-                if not published_at:
-                    published_at = datetime.utcnow()
+            # Entries already matched to this ticker (by symbol or company name)
+            for entry in feed_cache.entries_for(feed_name, ticker, cancel):
+                published_at = entry["published_at"] or datetime.utcnow()
                 
                 if published_at < cutoff:
                     continue  # Skip old entries
                 
                 # Generate source_id from URL
-                url = entry.get('link', '')
+                url = entry["url"]
                 source_id = hashlib.sha256(f"rss_{url}".encode()).hexdigest()[:32] if url else ''
                 
                 if not source_id:
@@ -573,8 +684,8 @@ def _ingest_rss(ticker: str, company_name: Optional[str], days: int) -> Dict[str
                     ticker=ticker,
                     source='rss',
                     source_id=source_id,
-                    title=title[:500],
-                    summary=summary[:2000],
+                    title=entry["title"][:500],
+                    summary=entry["summary"][:2000],
                     url=url,
                     published_at=published_at,
                     source_type=SOURCE_TYPE_NEWS,
@@ -584,15 +695,21 @@ def _ingest_rss(ticker: str, company_name: Optional[str], days: int) -> Dict[str
                 records.append(record)
                 result["fetched"] += 1
                 
+        except SourceCancelled:
+            raise
         except Exception as e:
             logger.warning(f"[RSS] Error fetching {feed_name}: {e}")
             result["errors"] += 1
     
     logger.info(f"[RSS] Fetched {result['fetched']} items for {ticker}")
     
-    # Persist via canonical path
+    # Cluster near-duplicate stories, then score the canonical ones
+    assign_story_clusters(records)
+    enrich_chatter_sentiment(records)
+    
+    # Persist via canonical path (a timed-out source must not write late)
     if records:
-        counts = persist_market_chatter(records)
+        counts = persist_source_records(records, cancel)
         result["inserted"] = counts["inserted"]
         result["skipped"] = counts["skipped"]
         result["errors"] += counts["errors"]
@@ -602,7 +719,13 @@ def _ingest_rss(ticker: str, company_name: Optional[str], days: int) -> Dict[str
     return result
 
 
-def _ingest_alpha_vantage(ticker: str, company_name: Optional[str], days: int) -> Dict[str, Any]:
+def _ingest_alpha_vantage(
+    ticker: str,
+    company_name: Optional[str],
+    days: int,
+    cancel: Optional[threading.Event] = None,
+    since: Optional[datetime] = None
+) -> Dict[str, Any]:
     """
     Ingest from Alpha Vantage News API - REQUIRES API KEY.
     
@@ -612,15 +735,28 @@ def _ingest_alpha_vantage(ticker: str, company_name: Optional[str], days: int) -
         ticker: Stock ticker symbol
         company_name: Optional company name
         days: Number of days to look back
+        cancel: Optional cancellation event set when the source times out
+        since: Optional incremental watermark; older items are skipped
     
     Returns:
         Dict with fetched, inserted, skipped, errors counts
     """
     from .alpha_vantage_chatter import ingest_alpha_vantage_news
-    return ingest_alpha_vantage_news(ticker, company_name, days)
+    check_cancelled(cancel)
+    
+    # The news API works in whole days; narrow the window to the watermark
+    if since is not None:
+        days = max(1, min(days, math.ceil((datetime.utcnow() - since).total_seconds() / 86400)))
+    return ingest_alpha_vantage_news(ticker, company_name, days, cancel=cancel)
 
 
-def _ingest_twitter(ticker: str, company_name: Optional[str], days: int) -> Dict[str, Any]:
+def _ingest_twitter(
+    ticker: str,
+    company_name: Optional[str],
+    days: int,
+    cancel: Optional[threading.Event] = None,
+    since: Optional[datetime] = None
+) -> Dict[str, Any]:
     """
     Placeholder for Twitter/X ingestion.
     
@@ -634,23 +770,79 @@ def ingest_universe(
     tickers: List[str],
     company_names: Optional[Dict[str, str]] = None,
     days: int = 7,
-    sources: Optional[List[str]] = None
+    sources: Optional[List[str]] = None,
+    max_workers: Optional[int] = None,
+    source_timeout: Optional[float] = None
 ) -> Dict[str, Any]:
     """
     Ingest market chatter for multiple tickers.
     
+    Every (ticker, source) pair is scheduled on one shared pool, so the
+    global and per-host concurrency limits apply across the whole universe.
+    
     Args:
         tickers: List of ticker symbols
         company_names: Optional dict mapping ticker -> company_name
         days: Number of days to look back
         sources: Optional list of sources to use
+        max_workers: Optional global concurrency limit (default: ingest_max_workers)
+        source_timeout: Optional per-source timeout in seconds
+                        (default: ingest_source_timeout_seconds)
     
     Returns:
         Dictionary with results per ticker
     """
+    source_names = list(_resolve_sources(sources))
+    pairs = [(ticker, source_name) for ticker in tickers for source_name in source_names]
+    result = ingest_pairs(
+        pairs, company_names, days,
+        max_workers=max_workers, source_timeout=source_timeout
+    )
+    result["tickers"] = tickers
+    return result
+
+
+def ingest_pairs(
+    pairs: List[tuple],
+    company_names: Optional[Dict[str, str]] = None,
+    days: int = 7,
+    since: Optional[Dict[tuple, datetime]] = None,
+    max_workers: Optional[int] = None,
+    source_timeout: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Ingest an explicit set of (ticker, source) pairs.
+    
+    Used by the freshness-driven scheduler, which refreshes individual
+    pairs rather than whole tickers. Result shape matches ingest_universe;
+    each ticker's "sources" only lists the sources that were run for it.
+    
+    Args:
+        pairs: List of (ticker, source_name) tuples
+        company_names: Optional dict mapping ticker -> company_name
+        days: Number of days to look back
+        since: Optional dict mapping (ticker, source_name) -> incremental
+               watermark; items published before it are skipped
+        max_workers: Optional global concurrency limit (default: ingest_max_workers)
+        source_timeout: Optional per-source timeout in seconds
+                        (default: ingest_source_timeout_seconds)
+    
+    Returns:
+        Dictionary with results per ticker
+    """
+    from tradingagents.database.chatter_persist import ensure_market_chatter_table
+    
     company_names = company_names or {}
+    since = since or {}
+    pairs = [(ticker.upper(), source_name) for ticker, source_name in pairs]
+    
+    ticker_results: Dict[str, Dict[str, Any]] = {}
+    for ticker, _ in pairs:
+        if ticker not in ticker_results:
+            ticker_results[ticker] = _empty_ticker_result(ticker, company_names.get(ticker), days)
+    
     results = {
-        "tickers": tickers,
+        "tickers": list(ticker_results),
         "days": days,
         "results": {},
         "summary": {
@@ -662,10 +854,49 @@ def ingest_universe(
         "timestamp": datetime.utcnow().isoformat()
     }
     
-    for ticker in tickers:
-        company_name = company_names.get(ticker.upper())
-        ticker_result = ingest_chatter(ticker, company_name, days, sources)
-        results["results"][ticker.upper()] = ticker_result
+    if not ensure_market_chatter_table():
+        logger.error("Failed to ensure market_chatter table exists")
+        for ticker_result in ticker_results.values():
+            ticker_result["error"] = "Failed to create/verify market_chatter table"
+        results["results"] = ticker_results
+        return results
+    
+    available_sources = _resolve_sources([source_name for _, source_name in pairs])
+    
+    # Global RSS feeds are fetched once per cycle and fanned out to all tickers
+    rss_tickers = [ticker for ticker, source_name in pairs if source_name == "rss"]
+    if rss_tickers and "rss" in available_sources:
+        feed_cache = SharedFeedCache(
+            GLOBAL_RSS_FEEDS,
+            {ticker: ticker_results[ticker]["company_name"] for ticker in rss_tickers}
+        )
+        available_sources["rss"] = functools.partial(_ingest_rss, feed_cache=feed_cache)
+    else:
+        feed_cache = None
+    
+    tasks = [
+        SourceTask(
+            ticker, source_name, available_sources[source_name],
+            ticker_results[ticker]["company_name"], days,
+            since=since.get((ticker, source_name))
+        )
+        for ticker, source_name in pairs
+        if source_name in available_sources
+    ]
+    
+    source_results: Dict[tuple, Dict[str, Any]] = {}
+    for task, source_result in run_source_tasks(tasks, max_workers, source_timeout):
+        source_results[(task.ticker, task.source_name)] = source_result
+    
+    if feed_cache is not None:
+        logger.info(f"[RSS] Shared feed cache: {feed_cache.stats()}")
+    
+    for ticker, ticker_result in ticker_results.items():
+        for source_name in available_sources:
+            if (ticker, source_name) in source_results:
+                _merge_source_result(ticker_result, source_name, source_results[(ticker, source_name)])
+        _log_ticker_summary(ticker_result)
+        results["results"][ticker] = ticker_result
         
         results["summary"]["total_fetched"] += ticker_result["total_fetched"]
         results["summary"]["total_inserted"] += ticker_result["total_inserted"]
@@ -675,11 +906,11 @@ def ingest_universe(
     # Warn if nothing inserted
     if results["summary"]["total_inserted"] == 0 and results["summary"]["total_fetched"] > 0:
         logger.warning(
-            f"Zero new records from {results['summary']['total_fetched']} fetched items across {len(tickers)} tickers"
+            f"Zero new records from {results['summary']['total_fetched']} fetched items across {len(ticker_results)} tickers"
         )
     
     logger.info(
-        f"Universe ingestion complete: {len(tickers)} tickers, "
+        f"Universe ingestion complete: {len(ticker_results)} tickers, "
         f"total inserted={results['summary']['total_inserted']}"
     )
     
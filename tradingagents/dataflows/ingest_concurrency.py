@@ -0,0 +1,197 @@
+"""
+Concurrent execution engine for market chatter ingestion.
+
+Runs (ticker, source) ingestion tasks on a bounded thread pool with:
+- a global concurrency limit (pool size)
+- a per-host concurrency limit enforced around each HTTP call (host_slot)
+- a per-source timeout measured from the moment a task starts running
+- cooperative cancellation of slow sources via a threading.Event
+
+Source functions keep their (ticker, company_name, days) signature and
+receive the cancellation event as the `cancel` keyword argument and an
+optional incremental lower bound on published_at as `since`. They are
+expected to check `cancel` between network calls and before persisting.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from tradingagents import metrics
+
+from .config import get_config
+
+logger = logging.getLogger(__name__)
+
+# How often the scheduler loop re-checks running tasks for timeouts
+_POLL_INTERVAL_SECONDS = 0.1
+
+_host_lock = threading.Lock()
+_host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+_host_limit: Optional[int] = None
+
+
+class SourceCancelled(Exception):
+    """Raised inside a source when its cancellation event has been set."""
+
+
+def _get_host_semaphore(host: str) -> threading.BoundedSemaphore:
+    """Return the semaphore guarding a host, creating it on first use."""
+    global _host_limit
+    limit = int(get_config().get("ingest_per_host_limit", 2))
+    with _host_lock:
+        if limit != _host_limit:
+            # Limit changed via set_config(): start fresh semaphores
+            _host_semaphores.clear()
+            _host_limit = limit
+        semaphore = _host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = threading.BoundedSemaphore(max(1, limit))
+            _host_semaphores[host] = semaphore
+        return semaphore
+
+
+@contextmanager
+def host_slot(url: str, cancel: Optional[threading.Event] = None) -> Iterator[None]:
+    """
+    Hold one of the per-host concurrency slots for the duration of a request.
+
+    Args:
+        url: URL about to be fetched (its host selects the semaphore)
+        cancel: Optional cancellation event; raises SourceCancelled if set
+                while waiting for a slot
+    """
+    host = urlparse(url).hostname or url
+    semaphore = _get_host_semaphore(host)
+    while not semaphore.acquire(timeout=_POLL_INTERVAL_SECONDS):
+        if cancel is not None and cancel.is_set():
+            raise SourceCancelled(f"cancelled while waiting for {host}")
+    try:
+        if cancel is not None and cancel.is_set():
+            raise SourceCancelled(f"cancelled before request to {host}")
+        yield
+    finally:
+        semaphore.release()
+
+
+def check_cancelled(cancel: Optional[threading.Event]) -> None:
+    """Raise SourceCancelled if the cancellation event is set."""
+    if cancel is not None and cancel.is_set():
+        raise SourceCancelled("source cancelled")
+
+
+@dataclass
+class SourceTask:
+    """One (ticker, source) unit of ingestion work."""
+    ticker: str
+    source_name: str
+    func: Callable[..., Dict[str, Any]]
+    company_name: Optional[str] = None
+    days: int = 7
+    since: Optional[datetime] = None
+    cancel: threading.Event = field(default_factory=threading.Event)
+    started_at: Optional[float] = None
+
+    def run(self) -> Dict[str, Any]:
+        self.started_at = time.monotonic()
+        outcome = "error"
+        try:
+            result = self.func(
+                self.ticker, self.company_name, self.days, cancel=self.cancel, since=self.since
+            )
+            outcome = "error" if result.get("error") else "ok"
+            return result
+        except SourceCancelled:
+            outcome = "cancelled"
+            raise
+        finally:
+            metrics.INGEST_SOURCE_SECONDS.observe(
+                time.monotonic() - self.started_at, source=self.source_name, outcome=outcome
+            )
+
+
+def _error_result(source_name: str, message: str) -> Dict[str, Any]:
+    """Per-source result dictionary for a failed or cancelled source."""
+    return {
+        "error": message,
+        "fetched": 0,
+        "inserted": 0,
+        "skipped": 0,
+        "errors": 1,
+        "source": source_name
+    }
+
+
+def run_source_tasks(
+    tasks: List[SourceTask],
+    max_workers: Optional[int] = None,
+    source_timeout: Optional[float] = None
+) -> Iterator[Tuple[SourceTask, Dict[str, Any]]]:
+    """
+    Run ingestion tasks concurrently, yielding (task, result) as each finishes.
+
+    A task still running source_timeout seconds after it started is
+    cancelled: its event is set, it is reported with an error result, and
+    whatever it returns later is discarded.
+
+    Args:
+        tasks: Tasks to execute
+        max_workers: Global concurrency limit (default: ingest_max_workers)
+        source_timeout: Per-source timeout in seconds
+                        (default: ingest_source_timeout_seconds, 0 disables)
+    """
+    if not tasks:
+        return
+
+    config = get_config()
+    if max_workers is None:
+        max_workers = int(config.get("ingest_max_workers", 8))
+    if source_timeout is None:
+        source_timeout = float(config.get("ingest_source_timeout_seconds", 60))
+    max_workers = max(1, min(max_workers, len(tasks)))
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ingest")
+    pending: Dict[Any, SourceTask] = {}
+    try:
+        pending.update({executor.submit(task.run): task for task in tasks})
+
+        while pending:
+            done, _ = wait(pending, timeout=_POLL_INTERVAL_SECONDS, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                task = pending.pop(future)
+                try:
+                    result = future.result()
+                except SourceCancelled as e:
+                    result = _error_result(task.source_name, f"Cancelled: {e}")
+                except Exception as e:
+                    logger.error(f"Error ingesting from {task.source_name}: {e}", exc_info=True)
+                    result = _error_result(task.source_name, str(e))
+                yield task, result
+
+            if not source_timeout:
+                continue
+
+            now = time.monotonic()
+            for future, task in list(pending.items()):
+                if task.started_at is not None and now - task.started_at > source_timeout:
+                    task.cancel.set()
+                    pending.pop(future)
+                    logger.warning(
+                        f"[INGEST] {task.source_name} for {task.ticker} exceeded "
+                        f"{source_timeout:g}s timeout, cancelled"
+                    )
+                    yield task, _error_result(
+                        task.source_name, f"Timed out after {source_timeout:g}s"
+                    )
+    finally:
+        # Tasks abandoned by an early exit observe their cancel event and stop
+        for task in pending.values():
+            task.cancel.set()
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -1,5 +1,8 @@
+import time
 from typing import Annotated
 
+from tradingagents import metrics
+
 # Import from vendor-specific modules
 from .local import get_YFin_data, get_finnhub_news, get_finnhub_company_insider_sentiment, get_finnhub_company_insider_transactions, get_simfin_balance_sheet, get_simfin_cashflow, get_simfin_income_statements, get_reddit_global_news, get_reddit_company_news
 from .y_finance import get_YFin_data_online, get_stock_stats_indicators_window, get_balance_sheet as get_yfinance_balance_sheet, get_cashflow as get_yfinance_cashflow, get_income_statement as get_yfinance_income_statement, get_insider_transactions as get_yfinance_insider_transactions
@@ -19,6 +22,7 @@ from .alpha_vantage_common import AlphaVantageRateLimitError
 
 # Configuration and routing logic
 from .config import get_config
+from .vendor_cache import get_vendor_cache, vendor_cache_enabled
 
 # Tools organized by category
 TOOLS_CATEGORIES = {
@@ -139,16 +143,37 @@ def get_vendor(category: str, method: str = None) -> str:
     return config.get("data_vendors", {}).get(category, "default")
 
 def route_to_vendor(method: str, *args, **kwargs):
-    """Route method calls to appropriate vendor implementation with fallback support."""
+    """Route method calls to appropriate vendor implementation with fallback support.
+
+    Results are served from the vendor result cache when enabled
+    (see dataflows/vendor_cache.py); failures are never cached.
+    """
     category = get_category_for_method(method)
     vendor_config = get_vendor(category, method)
 
-    # Handle comma-separated vendors
-    primary_vendors = [v.strip() for v in vendor_config.split(',')]
-
     if method not in VENDOR_METHODS:
         raise ValueError(f"Method '{method}' not supported")
 
+    if not vendor_cache_enabled():
+        return _call_vendors(method, vendor_config, *args, **kwargs)[0]
+
+    return get_vendor_cache().get_or_compute(
+        method, category, vendor_config, args, kwargs,
+        lambda: _call_vendors(method, vendor_config, *args, **kwargs)
+    )
+
+
+def _call_vendors(method: str, vendor_config: str, *args, **kwargs):
+    """Call the configured vendors for a method, falling back on failure.
+
+    Returns:
+        (result, primary): primary is False if any result came from a
+        fallback vendor outside the configured chain, or if any
+        implementation raised (the result may then be partial)
+    """
+    # Handle comma-separated vendors
+    primary_vendors = [v.strip() for v in vendor_config.split(',')]
+
     # Get all available vendors for this method for fallback
     all_available_vendors = list(VENDOR_METHODS[method].keys())
     
@@ -168,6 +193,8 @@ def route_to_vendor(method: str, *args, **kwargs):
     vendor_attempt_count = 0
     any_primary_vendor_attempted = False
     successful_vendor = None
+    used_fallback = False
+    any_implementation_failed = False
 
     for vendor in fallback_vendors:
         if vendor not in VENDOR_METHODS[method]:
@@ -197,19 +224,31 @@ def route_to_vendor(method: str, *args, **kwargs):
         # Run methods for this vendor
         vendor_results = []
         for impl_func, vendor_name in vendor_methods:
+            start = time.perf_counter()
             try:
                 print(f"DEBUG: Calling {impl_func.__name__} from vendor '{vendor_name}'...")
                 result = impl_func(*args, **kwargs)
+                metrics.VENDOR_CALL_SECONDS.observe(
+                    time.perf_counter() - start, method=method, vendor=vendor_name, outcome="ok"
+                )
                 vendor_results.append(result)
                 print(f"SUCCESS: {impl_func.__name__} from vendor '{vendor_name}' completed successfully")
                     
             except AlphaVantageRateLimitError as e:
+                metrics.VENDOR_CALL_SECONDS.observe(
+                    time.perf_counter() - start, method=method, vendor=vendor_name, outcome="rate_limited"
+                )
+                any_implementation_failed = True
                 if vendor == "alpha_vantage":
                     print(f"RATE_LIMIT: Alpha Vantage rate limit exceeded, falling back to next available vendor")
                     print(f"DEBUG: Rate limit details: {e}")
                 # Continue to next vendor for fallback
                 continue
             except Exception as e:
+                metrics.VENDOR_CALL_SECONDS.observe(
+                    time.perf_counter() - start, method=method, vendor=vendor_name, outcome="error"
+                )
+                any_implementation_failed = True
                 # Log error but continue with other implementations
                 print(f"FAILED: {impl_func.__name__} from vendor '{vendor_name}' failed: {e}")
                 continue
@@ -218,6 +257,7 @@ def route_to_vendor(method: str, *args, **kwargs):
         if vendor_results:
             results.extend(vendor_results)
             successful_vendor = vendor
+            used_fallback = used_fallback or not is_primary_vendor
             result_summary = f"Got {len(vendor_results)} result(s)"
             print(f"SUCCESS: Vendor '{vendor}' succeeded - {result_summary}")
             
@@ -236,9 +276,12 @@ def route_to_vendor(method: str, *args, **kwargs):
     else:
         print(f"FINAL: Method '{method}' completed with {len(results)} result(s) from {vendor_attempt_count} vendor attempt(s)")
 
+    # Partial or fallback results must not be cached as immutable
+    primary = not (used_fallback or any_implementation_failed)
+
     # Return single result if only one, otherwise concatenate as string
     if len(results) == 1:
-        return results[0]
+        return results[0], primary
     else:
         # Convert all results to strings and concatenate
-        return '\n'.join(str(result) for result in results)
\ No newline at end of file
+        return '\n'.join(str(result) for result in results), primary
\ No newline at end of file
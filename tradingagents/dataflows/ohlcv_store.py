@@ -0,0 +1,380 @@
+"""
+Per-symbol OHLCV store for yfinance daily bars.
+
+The stockstats indicator paths used to key a CSV cache by today's date,
+so every day re-downloaded 15 years of history, and every indicator
+request re-parsed the CSV. This store keeps one file per symbol under
+<data_cache_dir>/ohlcv/ and maintains it incrementally:
+
+- the first request downloads ohlcv_history_years of history
+- later requests append only the bars after the last stored date, at
+  most once per symbol per day (completed sessions only)
+- if the overlapping bar's close no longer matches (a split or dividend
+  re-adjusted the series), the history is downloaded again in full
+- files are Arrow IPC (uncompressed) read through a memory map; without
+  pyarrow the store falls back to CSV files with the same layout
+- loaded frames, their stockstats wrappers and computed indicator
+  columns are kept in an in-process LRU (ohlcv_cache_size symbols), and
+  a file changed by another process is reloaded on its next access
+
+Indicator lookups are pure in-memory operations after the first load.
+In offline mode (technical_indicators vendor "local") the store only
+reads existing files; a missing store file is seeded from the legacy
+<symbol>-YFin-data-*.csv files in data_dir / data_cache_dir.
+
+Usage:
+    from tradingagents.dataflows.ohlcv_store import get_ohlcv_store
+
+    store = get_ohlcv_store()
+    frame = store.get_history("AAPL")
+    rsi = store.get_indicator("AAPL", "rsi")     # {"2024-05-01": 61.2, ...}
+"""
+
+import glob
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from .config import get_config
+
+try:
+    import pyarrow as pa
+    from pyarrow import ipc
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    ipc = None
+
+logger = logging.getLogger(__name__)
+
+OHLCV_COLUMNS = ["Date", "Open", "High", "Low", "Close", "Volume"]
+
+# Relative close difference on the overlapping bar that marks a re-adjusted series
+ADJUSTMENT_TOLERANCE = 0.005
+
+# Pre-store CSV file shipped for offline mode
+LEGACY_CSV_TEMPLATE = "{symbol}-YFin-data-2015-01-01-2025-03-25.csv"
+
+
+def _normalize(data: pd.DataFrame) -> pd.DataFrame:
+    """Bring a yfinance/CSV frame to OHLCV_COLUMNS, sorted by unique Date."""
+    if "Date" not in data.columns:
+        data = data.reset_index()
+        data = data.rename(columns={data.columns[0]: "Date"})
+    dates = pd.to_datetime(data["Date"])
+    if getattr(dates.dt, "tz", None) is not None:
+        dates = dates.dt.tz_localize(None)
+    data = data.assign(Date=dates.dt.normalize())
+    data = data[[c for c in OHLCV_COLUMNS if c in data.columns]]
+    data = data.drop_duplicates(subset="Date", keep="last").sort_values("Date")
+    return data.reset_index(drop=True)
+
+
+@dataclass(eq=False)
+class _Entry:
+    frame: pd.DataFrame
+    mtime: float
+    stats: Any = None
+    dates: Optional[List[str]] = None
+    indicators: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+
+class OHLCVStore:
+    """
+    One incrementally updated file per symbol plus an LRU of loaded frames.
+
+    Thread-safe: the LRU is guarded by one lock, downloads and indicator
+    computation by a lock per symbol.
+    """
+
+    def __init__(self, root: str, max_cached: int = 32, history_years: int = 15):
+        self.root = root
+        self.max_cached = max(1, max_cached)
+        self.history_years = history_years
+        self.extension = ".arrow" if pa is not None else ".csv"
+        self._lock = threading.Lock()
+        self._symbol_locks: Dict[str, threading.RLock] = {}
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._refreshed: Dict[str, date] = {}
+        self.hits = 0
+        self.loads = 0
+        self.downloads = 0
+        self.appended_bars = 0
+        if pa is None:
+            logger.warning("[OHLCV] pyarrow not installed; storing OHLCV history as CSV")
+
+    def path(self, symbol: str) -> str:
+        return os.path.join(self.root, f"{symbol.upper()}{self.extension}")
+
+    def _symbol_lock(self, symbol: str) -> threading.RLock:
+        with self._lock:
+            return self._symbol_locks.setdefault(symbol, threading.RLock())
+
+    # ------------------------------------------------------------------
+    # File I/O
+    # ------------------------------------------------------------------
+    def _read(self, path: str) -> pd.DataFrame:
+        if pa is None:
+            return _normalize(pd.read_csv(path))
+        with pa.memory_map(path, "r") as source:
+            table = ipc.open_file(source).read_all()
+        return table.to_pandas()
+
+    def _write(self, path: str, frame: pd.DataFrame) -> None:
+        """Replace the symbol file atomically (readers never see a partial file)."""
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            if pa is None:
+                frame.to_csv(tmp_path, index=False, date_format="%Y-%m-%d")
+            else:
+                table = pa.Table.from_pandas(frame, preserve_index=False)
+                with pa.OSFile(tmp_path, "wb") as sink:
+                    with ipc.new_file(sink, table.schema) as writer:
+                        writer.write_table(table)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _seed_from_legacy_csv(self, symbol: str) -> Optional[pd.DataFrame]:
+        """Newest legacy CSV for a symbol (offline seed files, old daily cache)."""
+        config = get_config()
+        candidates = []
+        for directory in filter(None, (config.get("data_dir"), config.get("data_cache_dir"))):
+            candidates.append(os.path.join(directory, LEGACY_CSV_TEMPLATE.format(symbol=symbol)))
+            candidates.extend(sorted(glob.glob(os.path.join(directory, f"{symbol}-YFin-data-*.csv")), reverse=True))
+        for candidate in candidates:
+            if os.path.exists(candidate):
+                try:
+                    frame = _normalize(pd.read_csv(candidate))
+                except Exception as e:
+                    logger.warning(f"[OHLCV] Could not read {candidate}: {e}")
+                    continue
+                if not frame.empty:
+                    logger.info(f"[OHLCV] Seeding {symbol} from {os.path.basename(candidate)} ({len(frame)} bars)")
+                    return frame
+        return None
+
+    # ------------------------------------------------------------------
+    # Downloads
+    # ------------------------------------------------------------------
+    def _download(self, symbol: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+        import yfinance as yf
+
+        self.downloads += 1
+        data = yf.download(
+            symbol,
+            start=start.strftime("%Y-%m-%d"),
+            end=end.strftime("%Y-%m-%d"),
+            multi_level_index=False,
+            progress=False,
+            auto_adjust=True,
+        )
+        if data is None or data.empty:
+            return pd.DataFrame(columns=OHLCV_COLUMNS)
+        return _normalize(data)
+
+    def _update(self, symbol: str, frame: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
+        """
+        Append bars after the last stored date (or download the full history).
+
+        Returns the new frame, or None if nothing changed.
+        """
+        today = pd.Timestamp.today().normalize()
+        full_start = today - pd.DateOffset(years=self.history_years)
+
+        if frame is None or frame.empty:
+            data = self._download(symbol, full_start, today)
+            logger.info(f"[OHLCV] Downloaded {len(data)} bars for {symbol}")
+            return data if not data.empty else None
+
+        last = frame["Date"].iloc[-1]
+        if last + pd.Timedelta(days=1) >= today:
+            return None
+
+        # Include the last stored bar to detect a re-adjusted series
+        data = self._download(symbol, last, today)
+        overlap = data[data["Date"] == last]
+        if not overlap.empty:
+            stored_close = float(frame["Close"].iloc[-1])
+            fresh_close = float(overlap["Close"].iloc[0])
+            if stored_close and abs(fresh_close - stored_close) / abs(stored_close) > ADJUSTMENT_TOLERANCE:
+                logger.info(f"[OHLCV] {symbol} history was re-adjusted; downloading in full")
+                data = self._download(symbol, full_start, today)
+                return data if not data.empty else None
+
+        new_bars = data[data["Date"] > last]
+        if new_bars.empty:
+            return None
+        self.appended_bars += len(new_bars)
+        logger.debug(f"[OHLCV] Appended {len(new_bars)} bars to {symbol}")
+        return pd.concat([frame, new_bars], ignore_index=True)
+
+    # ------------------------------------------------------------------
+    # Cache
+    # ------------------------------------------------------------------
+    def _cached(self, symbol: str, path: str) -> Optional[_Entry]:
+        """LRU entry if it still matches the file on disk."""
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            return None
+        with self._lock:
+            entry = self._entries.get(symbol)
+            if entry is None or entry.mtime != mtime:
+                return None
+            self._entries.move_to_end(symbol)
+            self.hits += 1
+            return entry
+
+    def _remember(self, symbol: str, path: str, frame: pd.DataFrame) -> _Entry:
+        entry = _Entry(frame=frame, mtime=os.path.getmtime(path))
+        with self._lock:
+            self._entries[symbol] = entry
+            self._entries.move_to_end(symbol)
+            while len(self._entries) > self.max_cached:
+                self._entries.popitem(last=False)
+        return entry
+
+    def _entry(self, symbol: str, online: bool) -> _Entry:
+        symbol = symbol.upper()
+        path = self.path(symbol)
+        today = date.today()
+        needs_refresh = online and self._refreshed.get(symbol) != today
+
+        entry = self._cached(symbol, path)
+        if entry is not None and not needs_refresh:
+            return entry
+
+        with self._symbol_lock(symbol):
+            entry = self._cached(symbol, path)
+            needs_refresh = online and self._refreshed.get(symbol) != today
+            if entry is not None and not needs_refresh:
+                return entry
+
+            if entry is not None:
+                frame = entry.frame
+            elif os.path.exists(path):
+                frame = self._read(path)
+                self.loads += 1
+            else:
+                frame = self._seed_from_legacy_csv(symbol)
+                if frame is not None:
+                    self._write(path, frame)
+
+            if needs_refresh:
+                try:
+                    updated = self._update(symbol, frame)
+                except Exception as e:
+                    if frame is None:
+                        raise
+                    logger.warning(f"[OHLCV] Update failed for {symbol}, serving stored bars: {e}")
+                    updated = None
+                if updated is not None:
+                    self._write(path, updated)
+                    frame = updated
+                self._refreshed[symbol] = today
+
+            if frame is None:
+                raise FileNotFoundError(f"No OHLCV data stored for {symbol}")
+            if entry is not None and frame is entry.frame:
+                # Unchanged; keep computed indicators
+                entry.mtime = os.path.getmtime(path)
+                return entry
+            return self._remember(symbol, path, frame)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def get_history(self, symbol: str, online: bool = True) -> pd.DataFrame:
+        """
+        Daily bars for a symbol (Date, Open, High, Low, Close, Volume).
+
+        Args:
+            symbol: Ticker symbol
+            online: Append missing trailing bars from yfinance first
+
+        Returns:
+            DataFrame shared with the cache; copy before modifying.
+            Raises FileNotFoundError when offline and nothing is stored.
+        """
+        return self._entry(symbol, online).frame
+
+    def get_indicator(self, symbol: str, indicator: str, online: bool = True) -> Dict[str, Any]:
+        """
+        A stockstats indicator for every stored date.
+
+        Args:
+            symbol: Ticker symbol
+            indicator: stockstats indicator name (e.g. "rsi", "close_50_sma")
+            online: Append missing trailing bars from yfinance first
+
+        Returns:
+            Dict of YYYY-mm-dd -> raw indicator value (NaN where undefined)
+        """
+        entry = self._entry(symbol, online)
+        values = entry.indicators.get(indicator)
+        if values is not None:
+            return values
+
+        with self._symbol_lock(symbol.upper()):
+            values = entry.indicators.get(indicator)
+            if values is None:
+                if entry.stats is None:
+                    from stockstats import wrap
+                    entry.stats = wrap(entry.frame.copy())
+                    entry.dates = entry.frame["Date"].dt.strftime("%Y-%m-%d").tolist()
+                # stockstats keeps row order, so values align with entry.dates
+                column = entry.stats[indicator]
+                values = dict(zip(entry.dates, column.tolist()))
+                entry.indicators[indicator] = values
+        return values
+
+    def clear(self) -> None:
+        """Drop all loaded frames (files are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._refreshed.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "root": self.root,
+                "format": self.extension.lstrip("."),
+                "cached_symbols": len(self._entries),
+                "max_cached": self.max_cached,
+                "hits": self.hits,
+                "loads": self.loads,
+                "downloads": self.downloads,
+                "appended_bars": self.appended_bars,
+            }
+
+
+_store: Optional[OHLCVStore] = None
+_store_lock = threading.Lock()
+
+
+def get_ohlcv_store() -> OHLCVStore:
+    """Get the process-wide OHLCV store."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                config = get_config()
+                _store = OHLCVStore(
+                    root=os.path.join(config["data_cache_dir"], "ohlcv"),
+                    max_cached=int(config.get("ohlcv_cache_size", 32)),
+                    history_years=int(config.get("ohlcv_history_years", 15)),
+                )
+    return _store
+
+
+def is_online() -> bool:
+    """Whether indicator requests may download (technical_indicators vendor != "local")."""
+    return get_config().get("data_vendors", {}).get("technical_indicators") != "local"
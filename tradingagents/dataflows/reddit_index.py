@@ -0,0 +1,385 @@
+"""
+Date-indexed SQLite store for the local Reddit JSONL dumps.
+
+fetch_top_from_category() used to re-read every JSONL file of a category,
+convert every timestamp and run the company regexes on every post, once
+per requested day. This module compacts the dumps once into a SQLite
+file (one per data path, under <data_cache_dir>/reddit_index/):
+
+    reddit_posts (
+        id, category, source_file, line_no,
+        post_date,                      -- YYYY-mm-dd (UTC), indexed with
+        ups,                            -- category/file/upvotes
+        title, content, url
+    )
+    reddit_post_mentions (ticker, post_id)    -- precomputed company matches
+    reddit_sources (category, source_file, size, mtime)
+
+Mentions are computed with the same terms and regex semantics as the
+original scan (ticker_to_company, case-insensitive, title or selftext),
+for "company" categories only. A JSONL file is re-indexed when its size or
+mtime changes, and all mentions are recomputed when the term table does.
+
+A date range is then answered by one indexed query that ranks posts by
+upvotes per (day, subreddit file), so a 7-day lookback reads only the
+matching rows instead of scanning the dataset 7 times. Results come back
+in the order of the old per-day scan: by day, then subreddit files in
+os.listdir() order, then upvotes (ties in file order).
+
+Usage:
+    python -m tradingagents.dataflows.reddit_index --data-path data/reddit_data
+
+    posts = fetch_top_posts("company_news", "2024-05-01", "2024-05-07", 10, query="AAPL",
+                            data_path="data/reddit_data")
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from contextlib import closing
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from .config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Rows inserted per executemany() call while indexing
+INSERT_BATCH_SIZE = 5000
+
+_build_lock = threading.Lock()
+
+
+def _company_terms() -> Dict[str, List[str]]:
+    """Search terms per ticker, as used by the original per-post scan."""
+    from .reddit_utils import ticker_to_company
+
+    terms = {}
+    for ticker, company in ticker_to_company.items():
+        names = company.split(" OR ") if "OR" in company else [company]
+        terms[ticker] = names + [ticker]
+    return terms
+
+
+def _mention_pattern(terms: List[str]) -> "re.Pattern":
+    # Any term matching (re.search semantics) <=> the alternation matching
+    return re.compile("|".join(f"(?:{term})" for term in terms), re.IGNORECASE)
+
+
+def index_path_for(data_path: str) -> str:
+    """SQLite file holding the index of a Reddit data directory."""
+    digest = hashlib.sha1(os.path.abspath(data_path).encode("utf-8")).hexdigest()[:12]
+    return os.path.join(get_config()["data_cache_dir"], "reddit_index", f"reddit-{digest}.sqlite3")
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS reddit_posts (
+            id INTEGER PRIMARY KEY,
+            category TEXT NOT NULL,
+            source_file TEXT NOT NULL,
+            line_no INTEGER NOT NULL,
+            post_date TEXT NOT NULL,
+            ups INTEGER NOT NULL,
+            title TEXT,
+            content TEXT,
+            url TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_reddit_posts_date
+            ON reddit_posts (category, post_date, source_file, ups DESC, line_no);
+        CREATE INDEX IF NOT EXISTS idx_reddit_posts_file
+            ON reddit_posts (category, source_file);
+        CREATE TABLE IF NOT EXISTS reddit_post_mentions (
+            ticker TEXT NOT NULL,
+            post_id INTEGER NOT NULL,
+            PRIMARY KEY (ticker, post_id)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS reddit_sources (
+            category TEXT NOT NULL,
+            source_file TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            mtime REAL NOT NULL,
+            PRIMARY KEY (category, source_file)
+        );
+        CREATE TABLE IF NOT EXISTS reddit_index_meta (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        );
+    """)
+    return conn
+
+
+def _index_mentions(conn: sqlite3.Connection, post_rows: List[tuple], patterns: Dict[str, "re.Pattern"]) -> None:
+    """Insert mention flags for (id, title, content) rows."""
+    mentions = [
+        (ticker, post_id)
+        for post_id, title, content in post_rows
+        for ticker, pattern in patterns.items()
+        if pattern.search(title or "") or pattern.search(content or "")
+    ]
+    conn.executemany("INSERT OR IGNORE INTO reddit_post_mentions (ticker, post_id) VALUES (?, ?)", mentions)
+
+
+def _index_file(
+    conn: sqlite3.Connection,
+    category: str,
+    data_file: str,
+    path: str,
+    patterns: Optional[Dict[str, "re.Pattern"]]
+) -> int:
+    """(Re)index one JSONL file. Caller owns the transaction."""
+    conn.execute(
+        "DELETE FROM reddit_post_mentions WHERE post_id IN "
+        "(SELECT id FROM reddit_posts WHERE category = ? AND source_file = ?)",
+        (category, data_file)
+    )
+    conn.execute("DELETE FROM reddit_posts WHERE category = ? AND source_file = ?", (category, data_file))
+
+    next_id = conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM reddit_posts").fetchone()[0]
+    batch: List[tuple] = []
+    indexed = 0
+
+    def flush() -> None:
+        conn.executemany(
+            "INSERT INTO reddit_posts (id, category, source_file, line_no, post_date, ups, title, content, url) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            batch
+        )
+        if patterns:
+            _index_mentions(conn, [(row[0], row[6], row[7]) for row in batch], patterns)
+        batch.clear()
+
+    with open(path, "rb") as f:
+        for line_no, line in enumerate(f):
+            # skip empty lines
+            if not line.strip():
+                continue
+            parsed_line = json.loads(line)
+            post_date = datetime.fromtimestamp(parsed_line["created_utc"], tz=timezone.utc).strftime("%Y-%m-%d")
+            batch.append((
+                next_id + indexed, category, data_file, line_no, post_date, parsed_line["ups"],
+                parsed_line["title"], parsed_line["selftext"], parsed_line["url"]
+            ))
+            indexed += 1
+            if len(batch) >= INSERT_BATCH_SIZE:
+                flush()
+    if batch:
+        flush()
+
+    stat = os.stat(path)
+    conn.execute(
+        "INSERT OR REPLACE INTO reddit_sources (category, source_file, size, mtime) VALUES (?, ?, ?, ?)",
+        (category, data_file, stat.st_size, stat.st_mtime)
+    )
+    return indexed
+
+
+def build_reddit_index(data_path: str, categories: Optional[List[str]] = None, force: bool = False) -> Dict[str, int]:
+    """
+    Index the JSONL files of a Reddit data directory (incrementally).
+
+    Only new or changed files are read, unless force is set. Mentions are
+    recomputed in full when the company term table changed.
+
+    Args:
+        data_path: Directory with one sub-directory of JSONL files per category
+        categories: Categories to index (default: every sub-directory)
+        force: Re-index every file
+
+    Returns:
+        Dict of category -> posts (re)indexed
+    """
+    index_path = index_path_for(data_path)
+    if categories is None:
+        categories = sorted(
+            name for name in os.listdir(data_path) if os.path.isdir(os.path.join(data_path, name))
+        )
+
+    terms = _company_terms()
+    terms_version = hashlib.sha1(json.dumps(terms, sort_keys=True).encode("utf-8")).hexdigest()
+    patterns = {ticker: _mention_pattern(ticker_terms) for ticker, ticker_terms in terms.items()}
+
+    counts: Dict[str, int] = {}
+    with _build_lock, closing(_connect(index_path)) as conn:
+        with conn:
+            row = conn.execute("SELECT value FROM reddit_index_meta WHERE key = 'terms_version'").fetchone()
+            if row is None or row[0] != terms_version:
+                conn.execute("DELETE FROM reddit_post_mentions")
+                post_rows = conn.execute(
+                    # Case-sensitive, like the "company" in category check
+                    "SELECT id, title, content FROM reddit_posts WHERE instr(category, 'company') > 0"
+                ).fetchall()
+                _index_mentions(conn, post_rows, patterns)
+                conn.execute(
+                    "INSERT OR REPLACE INTO reddit_index_meta (key, value) VALUES ('terms_version', ?)",
+                    (terms_version,)
+                )
+
+        for category in categories:
+            category_dir = os.path.join(data_path, category)
+            known = {
+                source_file: (size, mtime)
+                for source_file, size, mtime in conn.execute(
+                    "SELECT source_file, size, mtime FROM reddit_sources WHERE category = ?", (category,)
+                )
+            }
+            present = set()
+            counts[category] = 0
+            for data_file in sorted(os.listdir(category_dir)):
+                # check if data_file is a .jsonl file
+                if not data_file.endswith(".jsonl"):
+                    continue
+                present.add(data_file)
+                path = os.path.join(category_dir, data_file)
+                stat = os.stat(path)
+                if not force and known.get(data_file) == (stat.st_size, stat.st_mtime):
+                    continue
+                with conn:
+                    counts[category] += _index_file(
+                        conn, category, data_file, path, patterns if "company" in category else None
+                    )
+                logger.info(f"[REDDIT_INDEX] Indexed {category}/{data_file}")
+
+            with conn:
+                for data_file in set(known) - present:
+                    conn.execute(
+                        "DELETE FROM reddit_post_mentions WHERE post_id IN "
+                        "(SELECT id FROM reddit_posts WHERE category = ? AND source_file = ?)",
+                        (category, data_file)
+                    )
+                    conn.execute("DELETE FROM reddit_posts WHERE category = ? AND source_file = ?", (category, data_file))
+                    conn.execute("DELETE FROM reddit_sources WHERE category = ? AND source_file = ?", (category, data_file))
+
+    return counts
+
+
+def fetch_top_posts(
+    category: str,
+    start_date: str,
+    end_date: str,
+    max_limit: int,
+    query: Optional[str] = None,
+    data_path: str = "reddit_data",
+) -> List[Dict[str, Any]]:
+    """
+    Top posts of a category for every day of a date range.
+
+    Same selection as fetch_top_from_category() per day: for each JSONL file
+    (subreddit), the max_limit // <entries in the category directory>
+    highest-upvoted posts of the day, restricted to posts mentioning the
+    company for "company" categories with a query. The index is brought up
+    to date first (only changed files are read).
+
+    Args:
+        category: Category directory (collection of subreddits)
+        start_date: First day, YYYY-mm-dd
+        end_date: Last day, YYYY-mm-dd (inclusive)
+        max_limit: Maximum number of posts per day
+        query: Ticker whose mentions to keep (company categories)
+        data_path: Reddit data directory
+
+    Returns:
+        Posts (title, content, url, upvotes, posted_date) ordered by day,
+        subreddit file (os.listdir() order) and upvotes
+    """
+    listing = os.listdir(os.path.join(data_path, category))
+    entries = len(listing)
+    if max_limit < entries:
+        raise ValueError(
+            "REDDIT FETCHING ERROR: max limit is less than the number of files in the category. Will not be able to fetch any posts"
+        )
+    limit_per_subreddit = max_limit // entries
+
+    # The old scan visited files in directory order
+    files = [name for name in listing if name.endswith(".jsonl")]
+    if not files:
+        return []
+    file_order = {name: position for position, name in enumerate(files)}
+
+    build_reddit_index(data_path, [category])
+
+    params: List[Any] = [category, start_date, end_date]
+    mention_filter = ""
+    ad_hoc_pattern = None
+    if "company" in category and query:
+        if query in _company_terms():
+            mention_filter = (
+                " AND EXISTS (SELECT 1 FROM reddit_post_mentions m WHERE m.ticker = ? AND m.post_id = p.id)"
+            )
+            params.append(query)
+        else:
+            # Not precomputed: match the query itself within the range
+            ad_hoc_pattern = _mention_pattern([query])
+
+    sql = f"""
+        SELECT title, content, url, ups, post_date, source_file, line_no FROM reddit_posts p
+        WHERE category = ? AND post_date BETWEEN ? AND ?{mention_filter}
+    """
+    if ad_hoc_pattern is None:
+        sql = f"""
+            WITH file_order (source_file, position) AS (
+                VALUES {', '.join(['(?, ?)'] * len(files))}
+            )
+            SELECT title, content, url, ups, post_date FROM (
+                SELECT title, content, url, ups, post_date, source_file, line_no,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY post_date, source_file ORDER BY ups DESC, line_no
+                       ) AS rank
+                FROM ({sql})
+            ) ranked
+            JOIN file_order USING (source_file)
+            WHERE rank <= ?
+            ORDER BY post_date, file_order.position, rank
+        """
+        params = [value for item in file_order.items() for value in item] + params
+        params.append(limit_per_subreddit)
+
+    with closing(_connect(index_path_for(data_path))) as conn:
+        rows = conn.execute(sql, params).fetchall()
+
+    if ad_hoc_pattern is not None:
+        ranked: Dict[tuple, List[tuple]] = {}
+        for row in rows:
+            if ad_hoc_pattern.search(row[0] or "") or ad_hoc_pattern.search(row[1] or ""):
+                ranked.setdefault((row[4], row[5]), []).append(row)
+        rows = []
+        for key in sorted(ranked, key=lambda k: (k[0], file_order.get(k[1], len(files)))):
+            rows.extend(sorted(ranked[key], key=lambda r: (-r[3], r[6]))[:limit_per_subreddit])
+
+    return [
+        {
+            "title": row[0],
+            "content": row[1],
+            "url": row[2],
+            "upvotes": row[3],
+            "posted_date": row[4],
+        }
+        for row in rows
+    ]
+
+
+def main():
+    """Build or refresh the Reddit index from the command line."""
+    parser = argparse.ArgumentParser(description="Index local Reddit JSONL dumps by date")
+    parser.add_argument("--data-path", required=True, help="Reddit data directory (one sub-directory per category)")
+    parser.add_argument("--category", action="append", help="Category to index (repeatable; default: all)")
+    parser.add_argument("--force", action="store_true", help="Re-index every file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    counts = build_reddit_index(args.data_path, args.category, force=args.force)
+    for category, indexed in counts.items():
+        print(f"{category}: {indexed} posts indexed")
+    print(f"Index: {index_path_for(args.data_path)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""
+Fetch-once fan-out for the global RSS feeds used by market chatter ingestion.
+
+The generic RSS source reads the same handful of global feeds for every
+ticker. A SharedFeedCache lives for one ingestion cycle: each feed is
+downloaded and parsed once, then every entry is routed to all matching
+tickers in a single pass with a precompiled TickerMatcher. Per-ticker source
+functions only look up the entries routed to them, so feed downloads per
+cycle are independent of the size of the universe.
+
+Usage:
+    cache = SharedFeedCache(GLOBAL_RSS_FEEDS, {"<TICKER>": "<Company>"})
+    entries = cache.entries_for("MarketWatch", "<TICKER>", cancel)
+"""
+
+import logging
+import re
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set
+
+from .http_client import http_get
+from .ingest_concurrency import host_slot, check_cancelled
+
+logger = logging.getLogger(__name__)
+
+# Global financial news feeds shared by every ticker
+GLOBAL_RSS_FEEDS = {
+    'CNBC TV18': 'https://www.cnbctv18.com/rss/',
+    'Moneycontrol': 'https://www.moneycontrol.com/rss/',
+    'Economic Times': 'https://economictimes.indiatimes.com/rssfeedsdefault.cms',
+    'MarketWatch': 'https://feeds.marketwatch.com/marketwatch/marketpulse/',
+    'Investing.com': 'https://www.investing.com/rss/news.rss'
+}
+
+# Entries examined per feed
+FEED_ENTRY_LIMIT = 50
+
+_WAIT_POLL_SECONDS = 0.1
+
+
+def fetch_feed(feed_url: str, cancel: Optional[threading.Event] = None):
+    """
+    Download and parse an RSS/Atom feed through the shared HTTP client.
+
+    Uses a conditional GET, so an unchanged feed is a 304 replayed from the
+    validator store.
+
+    Args:
+        feed_url: Feed URL
+        cancel: Optional cancellation event of the calling source
+
+    Returns:
+        feedparser result
+
+    Raises:
+        requests.RequestException: On timeout, connection or HTTP error
+    """
+    import feedparser
+
+    with host_slot(feed_url, cancel):
+        response = http_get(feed_url, conditional=True)
+    response.raise_for_status()
+    return feedparser.parse(response.content)
+
+
+class TickerMatcher:
+    """
+    Precompiled multi-pattern matcher over ticker symbols and company names.
+
+    All patterns are combined into one alternation (longest first) and
+    matched against upper-cased text, so each entry is scanned once no
+    matter how many tickers are in the universe. Patterns must stand alone:
+    a ticker is not matched inside a longer word (e.g. "AI" in "SAID").
+    """
+
+    def __init__(self, companies: Dict[str, Optional[str]]):
+        """
+        Args:
+            companies: Mapping of ticker -> optional company name
+        """
+        self._owners: Dict[str, Set[str]] = {}
+        for ticker, company_name in companies.items():
+            ticker = ticker.upper()
+            for term in (ticker, company_name):
+                term = (term or '').strip().upper()
+                if term:
+                    self._owners.setdefault(term, set()).add(ticker)
+
+        self._pattern = None
+        if self._owners:
+            alternation = '|'.join(
+                re.escape(term) for term in sorted(self._owners, key=len, reverse=True)
+            )
+            self._pattern = re.compile(rf'(?<![A-Z0-9])(?:{alternation})(?![A-Z0-9])')
+
+    def match(self, text: str) -> Set[str]:
+        """Return the tickers mentioned in text."""
+        if self._pattern is None or not text:
+            return set()
+        tickers: Set[str] = set()
+        for found in self._pattern.finditer(text.upper()):
+            tickers |= self._owners[found.group(0)]
+        return tickers
+
+
+class _FeedState:
+    """Download/routing state of one feed within a cycle."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.loaded = False
+        self.error: Optional[str] = None
+        self.routes: Dict[str, List[Dict[str, Any]]] = {}
+
+
+class SharedFeedCache:
+    """
+    Per-cycle cache that fetches each global feed once and fans entries out.
+
+    Thread-safe: the first task to ask for a feed downloads it while
+    concurrent tasks for other tickers wait for the result.
+    """
+
+    def __init__(self, feeds: Dict[str, str], companies: Dict[str, Optional[str]]):
+        """
+        Args:
+            feeds: Mapping of feed name -> feed URL
+            companies: Mapping of ticker -> optional company name for the cycle
+        """
+        self.feeds = dict(feeds)
+        self.matcher = TickerMatcher(companies)
+        self._states = {name: _FeedState() for name in self.feeds}
+        self._stats_lock = threading.Lock()
+        self.downloads = 0
+        self.lookups = 0
+
+    def entries_for(
+        self,
+        feed_name: str,
+        ticker: str,
+        cancel: Optional[threading.Event] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Return the entries of a feed that mention a ticker.
+
+        Args:
+            feed_name: Key of self.feeds
+            ticker: Ticker symbol
+            cancel: Optional cancellation event of the calling source
+
+        Returns:
+            List of entry dicts with title, summary, url and published_at
+
+        Raises:
+            RuntimeError: If the feed could not be fetched this cycle
+        """
+        state = self._states[feed_name]
+        with self._stats_lock:
+            self.lookups += 1
+
+        while not state.lock.acquire(timeout=_WAIT_POLL_SECONDS):
+            check_cancelled(cancel)
+        try:
+            if not state.loaded:
+                self._load(feed_name, state, cancel)
+        finally:
+            state.lock.release()
+
+        if state.error:
+            raise RuntimeError(state.error)
+        return state.routes.get(ticker.upper(), [])
+
+    def _load(self, feed_name: str, state: _FeedState, cancel: Optional[threading.Event]) -> None:
+        """Download one feed and route its entries to every matching ticker."""
+        feed_url = self.feeds[feed_name]
+        start = time.monotonic()
+        try:
+            feed = fetch_feed(feed_url, cancel)
+        except Exception as e:
+            # Cancellation of one ticker's source must not poison the cycle
+            if cancel is not None and cancel.is_set():
+                raise
+            state.error = str(e)
+            state.loaded = True
+            logger.warning(f"[RSS] Error fetching {feed_name}: {e}")
+            return
+
+        with self._stats_lock:
+            self.downloads += 1
+
+        routed = 0
+        for entry in feed.entries[:FEED_ENTRY_LIMIT]:
+            title = entry.get('title', '')
+            summary = entry.get('summary', entry.get('description', ''))
+            tickers = self.matcher.match(f"{title} {summary}")
+            if not tickers:
+                continue
+
+            published_at = None
+            if hasattr(entry, 'published_parsed') and entry.published_parsed:
+                try:
+                    published_at = datetime(*entry.published_parsed[:6])
+                except Exception:
+                    pass
+
+            item = {
+                'title': title,
+                'summary': summary,
+                'url': entry.get('link', ''),
+                'published_at': published_at,
+            }
+            for ticker in tickers:
+                state.routes.setdefault(ticker, []).append(item)
+            routed += 1
+
+        state.loaded = True
+        logger.info(
+            f"[RSS] {feed_name}: {len(feed.entries)} entries fetched once, "
+            f"{routed} routed to {len(state.routes)} tickers "
+            f"({time.monotonic() - start:.2f}s)"
+        )
+
+    def stats(self) -> Dict[str, int]:
+        """Return download/lookup counters for this cycle."""
+        with self._stats_lock:
+            return {
+                'feeds': len(self.feeds),
+                'downloads': self.downloads,
+                'lookups': self.lookups
+            }
@@ -0,0 +1,263 @@
+"""
+Ticker-partitioned cache of the SimFin fundamentals CSVs.
+
+The get_simfin_* functions in local.py used to parse a full SimFin CSV
+(every US company, every period) on each call, just to pick one row.
+This store converts each CSV once:
+
+- dates are parsed (Report Date / Publish Date as UTC-normalized
+  timestamps, the same values the functions compared against)
+- rows are split per ticker, sorted by Publish Date, and written as one
+  Feather file per ticker (pickle if pyarrow is not installed) under
+  <data_cache_dir>/simfin/<csv name>-<hash>/, with a manifest recording
+  the source file's size and mtime
+- a source CSV whose size or mtime changed is converted again on its
+  next use
+
+Loaded ticker frames stay in an in-process LRU, so a lookup is a binary
+search on an already typed, date-sorted slice.
+
+Usage:
+    from tradingagents.dataflows.simfin_store import get_simfin_store
+
+    row = get_simfin_store().latest_statement(csv_path, "AAPL", "2024-05-01")
+"""
+
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import pandas as pd
+
+from .config import get_config
+
+# pandas Feather I/O needs pyarrow; only check that it is installed
+_HAS_ARROW = importlib.util.find_spec("pyarrow") is not None
+
+logger = logging.getLogger(__name__)
+
+# Bump when the partition layout changes
+STORE_FORMAT_VERSION = 1
+
+DATE_COLUMNS = ("Report Date", "Publish Date")
+
+# Original CSV row number, restored as the index of returned rows
+_ROW_COLUMN = "__row__"
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9._-]")
+
+
+def _partition_name(ticker: str) -> str:
+    safe = _UNSAFE_CHARS.sub("_", ticker)
+    if safe != ticker:
+        safe += "-" + hashlib.sha1(ticker.encode("utf-8")).hexdigest()[:8]
+    return safe
+
+
+class SimFinStore:
+    """
+    Converts SimFin CSVs to per-ticker partitions and caches loaded slices.
+
+    Thread-safe; a CSV is converted at most once per change.
+    """
+
+    def __init__(self, cache_dir: str, max_cached: int = 64):
+        self.cache_dir = cache_dir
+        self.max_cached = max(1, max_cached)
+        self.extension = ".feather" if _HAS_ARROW else ".pkl"
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._manifests: Dict[str, Dict[str, Any]] = {}
+        self._frames: "OrderedDict[Tuple[str, str], Tuple[Tuple[int, float], pd.DataFrame]]" = OrderedDict()
+        self.hits = 0
+        self.loads = 0
+        self.builds = 0
+
+    def _partition_dir(self, csv_path: str) -> str:
+        digest = hashlib.sha1(os.path.abspath(csv_path).encode("utf-8")).hexdigest()[:12]
+        name = os.path.splitext(os.path.basename(csv_path))[0]
+        return os.path.join(self.cache_dir, f"{name}-{digest}")
+
+    @staticmethod
+    def _read_manifest(directory: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(os.path.join(directory, "manifest.json"), "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _build(self, csv_path: str, directory: str, signature: Tuple[int, float]) -> Dict[str, Any]:
+        """Convert a CSV into per-ticker partitions (replacing any previous ones)."""
+        df = pd.read_csv(csv_path, sep=";")
+
+        # Convert date strings to datetime objects and remove any time components
+        for column in DATE_COLUMNS:
+            if column in df.columns:
+                df[column] = pd.to_datetime(df[column], utc=True).dt.normalize()
+        df[_ROW_COLUMN] = df.index
+
+        tmp_dir = f"{directory}.{os.getpid()}.tmp"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.makedirs(tmp_dir)
+
+        sort_column = "Publish Date" if "Publish Date" in df.columns else _ROW_COLUMN
+        partitions = {}
+        for ticker, group in df.groupby("Ticker", sort=False):
+            name = _partition_name(str(ticker)) + self.extension
+            group = group.sort_values(sort_column, kind="stable").reset_index(drop=True)
+            if _HAS_ARROW:
+                group.to_feather(os.path.join(tmp_dir, name))
+            else:
+                group.to_pickle(os.path.join(tmp_dir, name))
+            partitions[str(ticker)] = name
+
+        manifest = {
+            "version": STORE_FORMAT_VERSION,
+            "source_size": signature[0],
+            "source_mtime": signature[1],
+            "rows": len(df),
+            "partitions": partitions,
+        }
+        with open(os.path.join(tmp_dir, "manifest.json"), "w") as f:
+            json.dump(manifest, f)
+
+        old_dir = f"{directory}.{os.getpid()}.old"
+        if os.path.exists(directory):
+            os.replace(directory, old_dir)
+        os.replace(tmp_dir, directory)
+        shutil.rmtree(old_dir, ignore_errors=True)
+
+        self.builds += 1
+        logger.info(f"[SIMFIN] Partitioned {os.path.basename(csv_path)}: {len(df)} rows, {len(partitions)} tickers")
+        return manifest
+
+    def _manifest(self, csv_path: str) -> Tuple[Tuple[int, float], str, Dict[str, Any]]:
+        """Current manifest for a CSV, converting it first if stale."""
+        stat = os.stat(csv_path)
+        signature = (stat.st_size, stat.st_mtime)
+        directory = self._partition_dir(csv_path)
+
+        def is_current(manifest: Optional[Dict[str, Any]]) -> bool:
+            return bool(manifest) and (
+                manifest.get("version") == STORE_FORMAT_VERSION
+                and (manifest.get("source_size"), manifest.get("source_mtime")) == signature
+            )
+
+        manifest = self._manifests.get(csv_path)
+        if is_current(manifest):
+            return signature, directory, manifest
+
+        with self._build_lock:
+            manifest = self._manifests.get(csv_path)
+            if not is_current(manifest):
+                manifest = self._read_manifest(directory)
+                if not is_current(manifest):
+                    manifest = self._build(csv_path, directory, signature)
+                with self._lock:
+                    self._manifests[csv_path] = manifest
+                    for key in [k for k in self._frames if k[0] == csv_path]:
+                        del self._frames[key]
+        return signature, directory, manifest
+
+    def get_ticker_frame(self, csv_path: str, ticker: str) -> Optional[pd.DataFrame]:
+        """
+        All rows of a ticker, sorted by Publish Date, with parsed dates.
+
+        Args:
+            csv_path: SimFin CSV (semicolon-separated)
+            ticker: Ticker symbol (exact match, as in the CSV)
+
+        Returns:
+            DataFrame indexed by the original CSV row number (shared with
+            the cache; copy before modifying), or None if the ticker is absent
+        """
+        signature, directory, manifest = self._manifest(csv_path)
+        key = (csv_path, ticker)
+        with self._lock:
+            cached = self._frames.get(key)
+            if cached is not None and cached[0] == signature:
+                self._frames.move_to_end(key)
+                self.hits += 1
+                return cached[1]
+
+        name = manifest["partitions"].get(ticker)
+        if name is None:
+            return None
+        path = os.path.join(directory, name)
+        frame = pd.read_feather(path) if name.endswith(".feather") else pd.read_pickle(path)
+        frame = frame.set_index(_ROW_COLUMN)
+        frame.index.name = None
+        self.loads += 1
+
+        with self._lock:
+            self._frames[key] = (signature, frame)
+            self._frames.move_to_end(key)
+            while len(self._frames) > self.max_cached:
+                self._frames.popitem(last=False)
+        return frame
+
+    def latest_statement(self, csv_path: str, ticker: str, curr_date: str) -> Optional[pd.Series]:
+        """
+        The most recent row of a ticker published on or before curr_date.
+
+        Ties on Publish Date resolve to the earliest CSV row, as
+        DataFrame.idxmax() did on the unpartitioned CSV.
+
+        Args:
+            csv_path: SimFin CSV
+            ticker: Ticker symbol
+            curr_date: Current date, yyyy-mm-dd
+
+        Returns:
+            Row as a Series, or None if nothing was published by curr_date
+        """
+        frame = self.get_ticker_frame(csv_path, ticker)
+        if frame is None or frame.empty:
+            return None
+
+        # Convert the current date to datetime and normalize
+        curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
+        publish_dates = frame["Publish Date"]
+        end = publish_dates.searchsorted(curr_date_dt, side="right")
+        if end == 0:
+            return None
+        start = publish_dates.searchsorted(publish_dates.iloc[end - 1], side="left")
+        return frame.iloc[start]
+
+    def clear(self) -> None:
+        """Drop loaded frames (partitions on disk are kept)."""
+        with self._lock:
+            self._frames.clear()
+            self._manifests.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "cache_dir": self.cache_dir,
+                "format": self.extension.lstrip("."),
+                "cached_frames": len(self._frames),
+                "hits": self.hits,
+                "loads": self.loads,
+                "builds": self.builds,
+            }
+
+
+_store: Optional[SimFinStore] = None
+_store_lock = threading.Lock()
+
+
+def get_simfin_store() -> SimFinStore:
+    """Get the process-wide SimFin store."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = SimFinStore(os.path.join(get_config()["data_cache_dir"], "simfin"))
+    return _store
@@ -1,9 +1,6 @@
 import pandas as pd
-import yfinance as yf
-from stockstats import wrap
 from typing import Annotated
-import os
-from .config import get_config, DATA_DIR
+from .ohlcv_store import get_ohlcv_store, is_online
 
 
 class StockstatsUtils:
@@ -17,66 +14,17 @@ class StockstatsUtils:
             str, "curr date for retrieving stock price data, YYYY-mm-dd"
         ],
     ):
-        # Get config and set up data directory path
-        config = get_config()
-        online = config["data_vendors"]["technical_indicators"] != "local"
+        # Bars come from the per-symbol OHLCV store; offline mode only reads
+        # stored (or pre-seeded) files, online mode appends missing bars first
+        try:
+            values = get_ohlcv_store().get_indicator(symbol, indicator, online=is_online())
+        except FileNotFoundError:
+            raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
 
-        df = None
-        data = None
+        curr_date = pd.to_datetime(curr_date).strftime("%Y-%m-%d")
 
-        if not online:
-            try:
-                data = pd.read_csv(
-                    os.path.join(
-                        DATA_DIR,
-                        f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-                    )
-                )
-                df = wrap(data)
-            except FileNotFoundError:
-                raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
-        else:
-            # Get today's date as YYYY-mm-dd to add to cache
-            today_date = pd.Timestamp.today()
-            curr_date = pd.to_datetime(curr_date)
-
-            end_date = today_date
-            start_date = today_date - pd.DateOffset(years=15)
-            start_date = start_date.strftime("%Y-%m-%d")
-            end_date = end_date.strftime("%Y-%m-%d")
-
-            # Get config and ensure cache directory exists
-            os.makedirs(config["data_cache_dir"], exist_ok=True)
-
-            data_file = os.path.join(
-                config["data_cache_dir"],
-                f"{symbol}-YFin-data-{start_date}-{end_date}.csv",
-            )
-
-            if os.path.exists(data_file):
-                data = pd.read_csv(data_file)
-                data["Date"] = pd.to_datetime(data["Date"])
-            else:
-                data = yf.download(
-                    symbol,
-                    start=start_date,
-                    end=end_date,
-                    multi_level_index=False,
-                    progress=False,
-                    auto_adjust=True,
-                )
-                data = data.reset_index()
-                data.to_csv(data_file, index=False)
-
-            df = wrap(data)
-            df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
-            curr_date = curr_date.strftime("%Y-%m-%d")
-
-        df[indicator]  # trigger stockstats to calculate the indicator
-        matching_rows = df[df["Date"].str.startswith(curr_date)]
-
-        if not matching_rows.empty:
-            indicator_value = matching_rows[indicator].values[0]
+        if curr_date in values:
+            indicator_value = values[curr_date]
             return indicator_value
         else:
             return "N/A: Not a trading day (weekend or holiday)"
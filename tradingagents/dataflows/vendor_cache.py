@@ -0,0 +1,462 @@
+"""
+Result cache in front of route_to_vendor().
+
+Analysts, debate rounds and repeated TradingAgentsGraph.propagate() runs
+ask for the same (method, ticker, date range) many times. Results are
+cached by a hash of the method, the configured vendor chain and the call
+arguments, in two tiers:
+
+- memory: an LRU bounded by entry count and approximate size
+- disk: a SQLite file (<data_cache_dir>/vendor_cache.sqlite3) bounded by
+  total size, evicting least recently used entries; it survives restarts
+  and is shared by processes on the same host
+
+Freshness:
+- every category has a TTL (vendor_cache_ttl_seconds)
+- results for price, indicator and news calls whose latest date argument
+  lies before the settle window (vendor_cache_settle_days) are historical
+  and never expire; fundamentals always use the TTL because several
+  vendors ignore curr_date and return the latest filing
+- vendor functions report many failures as return values ("Error
+  retrieving ...", "No data found for symbol ..."); such results,
+  results served by a fallback vendor and results missing the output of
+  an implementation that raised always use the TTL, and failures are
+  kept in memory only, so a transient outage never outlives the TTL or
+  a restart
+- empty results and raised errors are not cached
+
+Concurrent misses on one key wait for a single vendor call. Hit/miss
+counts are in stats() and the vfis_vendor_cache_requests_total metric.
+
+Usage:
+    from tradingagents.dataflows.vendor_cache import bypass_vendor_cache, get_vendor_cache
+
+    with bypass_vendor_cache():      # force vendor calls (results are still stored)
+        graph.propagate(ticker, date)
+
+    get_vendor_cache().stats()
+
+Set vendor_cache_enabled=False (VENDOR_CACHE_ENABLED=false) to disable.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from tradingagents import metrics
+
+from .config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Categories whose results are fixed once their dates are in the past
+IMMUTABLE_CATEGORIES = frozenset({"core_stock_apis", "technical_indicators", "news_data"})
+
+DEFAULT_TTL_SECONDS = 3600
+
+# Disk size is enforced every N writes
+PRUNE_EVERY_WRITES = 50
+
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+# Failure messages returned (not raised) by y_finance, alpha_vantage*,
+# postgresql_data and the local readers
+_FAILURE_PREFIX_RE = re.compile(r"^\s*(error\b|failed\b|no [\w ]*data\b)", re.IGNORECASE)
+_FAILURE_MARKERS = (
+    "error retrieving",
+    "error getting",
+    "no data found",
+    "no data available",
+    "no data returned",
+    '"error message"',
+    '"information"',
+)
+
+_bypass: ContextVar[bool] = ContextVar("vendor_cache_bypass", default=False)
+
+
+def _latest_date(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Optional[date]:
+    """Latest YYYY-mm-dd argument of a call, if any."""
+    latest = None
+    for value in list(args) + list(kwargs.values()):
+        if isinstance(value, str) and _DATE_RE.match(value):
+            try:
+                parsed = date.fromisoformat(value)
+            except ValueError:
+                continue
+            if latest is None or parsed > latest:
+                latest = parsed
+    return latest
+
+
+def looks_like_failure(result: Any) -> bool:
+    """Whether a vendor result is an error or no-data message rather than data."""
+    if not isinstance(result, str):
+        return False
+    if _FAILURE_PREFIX_RE.match(result):
+        return True
+    head = result[:2000].lower()
+    return any(marker in head for marker in _FAILURE_MARKERS)
+
+
+def vendor_cache_key(method: str, vendor_config: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> str:
+    """Content address of a route_to_vendor() call."""
+    canonical = json.dumps(
+        {"method": method, "vendors": vendor_config, "args": list(args), "kwargs": kwargs},
+        sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class VendorResultCache:
+    """
+    Two-tier (memory LRU + SQLite) cache of vendor results.
+
+    Thread-safe; each tier has its own lock.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str],
+        ttl_seconds: Dict[str, int],
+        settle_days: int = 1,
+        max_entries: int = 512,
+        max_memory_bytes: int = 64 * 1024 * 1024,
+        max_disk_bytes: int = 512 * 1024 * 1024,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.settle_days = settle_days
+        self.max_entries = max(1, max_entries)
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+
+        # key -> (expires_at or None, size, value)
+        self._memory: "OrderedDict[str, Tuple[Optional[float], int, Any]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._memory_lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disk_lock = threading.Lock()
+        self._disk_writes = 0
+        self._inflight: Dict[str, threading.Lock] = {}
+        self._inflight_lock = threading.Lock()
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.stores = 0
+        self.evictions = 0
+        self.errors = 0
+
+    # ------------------------------------------------------------------
+    # Freshness
+    # ------------------------------------------------------------------
+    def expiry_for(
+        self,
+        category: str,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        allow_immutable: bool = True,
+    ) -> Optional[float]:
+        """Absolute expiry time of a result, or None if it never expires."""
+        if allow_immutable and category in IMMUTABLE_CATEGORIES:
+            latest = _latest_date(args, kwargs)
+            if latest is not None and latest < date.today() - timedelta(days=self.settle_days):
+                return None
+        return time.time() + self.ttl_seconds.get(category, DEFAULT_TTL_SECONDS)
+
+    # ------------------------------------------------------------------
+    # Memory tier
+    # ------------------------------------------------------------------
+    def _memory_get(self, key: str) -> Tuple[bool, Any]:
+        with self._memory_lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return False, None
+            expires_at, size, value = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._memory[key]
+                self._memory_bytes -= size
+                return False, None
+            self._memory.move_to_end(key)
+            return True, value
+
+    def _memory_put(self, key: str, expires_at: Optional[float], size: int, value: Any) -> None:
+        if size > self.max_memory_bytes:
+            return
+        with self._memory_lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= previous[1]
+            self._memory[key] = (expires_at, size, value)
+            self._memory_bytes += size
+            while len(self._memory) > self.max_entries or self._memory_bytes > self.max_memory_bytes:
+                _, (_, evicted_size, _) = self._memory.popitem(last=False)
+                self._memory_bytes -= evicted_size
+                self.evictions += 1
+
+    # ------------------------------------------------------------------
+    # Disk tier
+    # ------------------------------------------------------------------
+    def _connect(self) -> sqlite3.Connection:
+        """Open the store on first use. Caller holds self._disk_lock."""
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS vendor_results (
+                    cache_key TEXT PRIMARY KEY,
+                    method TEXT NOT NULL,
+                    value BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_vendor_results_accessed ON vendor_results (accessed_at)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _disk_get(self, key: str) -> Tuple[bool, Any, Optional[float], int]:
+        if not self.path:
+            return False, None, None, 0
+        try:
+            with self._disk_lock:
+                conn = self._connect()
+                now = time.time()
+                row = conn.execute(
+                    "SELECT value, expires_at, size FROM vendor_results "
+                    "WHERE cache_key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                    (key, now)
+                ).fetchone()
+                if row is None:
+                    return False, None, None, 0
+                conn.execute("UPDATE vendor_results SET accessed_at = ? WHERE cache_key = ?", (now, key))
+                conn.commit()
+            return True, pickle.loads(row[0]), row[1], row[2]
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"[VENDOR_CACHE] Disk lookup failed: {e}")
+            return False, None, None, 0
+
+    def _disk_put(self, key: str, method: str, blob: bytes, expires_at: Optional[float]) -> None:
+        if not self.path or len(blob) > self.max_disk_bytes:
+            return
+        now = time.time()
+        try:
+            with self._disk_lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO vendor_results "
+                    "(cache_key, method, value, size, created_at, expires_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, method, blob, len(blob), now, expires_at, now)
+                )
+                self._disk_writes += 1
+                if self._disk_writes % PRUNE_EVERY_WRITES == 0:
+                    self._prune(conn, now)
+                conn.commit()
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"[VENDOR_CACHE] Disk store failed: {e}")
+
+    def _prune(self, conn: sqlite3.Connection, now: float) -> None:
+        """Drop expired rows, then least recently used rows beyond max_disk_bytes."""
+        conn.execute("DELETE FROM vendor_results WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM vendor_results").fetchone()[0]
+        if total <= self.max_disk_bytes:
+            return
+        excess = total - self.max_disk_bytes
+        freed = 0
+        doomed = []
+        for cache_key, size in conn.execute("SELECT cache_key, size FROM vendor_results ORDER BY accessed_at"):
+            doomed.append((cache_key,))
+            freed += size
+            if freed >= excess:
+                break
+        conn.executemany("DELETE FROM vendor_results WHERE cache_key = ?", doomed)
+        self.evictions += len(doomed)
+        logger.debug(f"[VENDOR_CACHE] Evicted {len(doomed)} disk entries ({freed} bytes)")
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def get_or_compute(
+        self,
+        method: str,
+        category: str,
+        vendor_config: str,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        compute: Callable[[], Tuple[Any, bool]],
+    ) -> Any:
+        """
+        Cached result of a vendor call, computing (and storing) it on a miss.
+
+        Args:
+            method: Tool method name (e.g. "get_stock_data")
+            category: Its TOOLS_CATEGORIES category
+            vendor_config: Configured vendor chain (part of the key)
+            args: Positional call arguments
+            kwargs: Keyword call arguments
+            compute: Performs the vendor call; returns (result, primary),
+                primary being False if any part came from a fallback vendor
+                or any vendor implementation raised
+
+        Returns:
+            The vendor result
+        """
+        key = vendor_cache_key(method, vendor_config, args, kwargs)
+
+        if _bypass.get():
+            self.bypassed += 1
+            metrics.VENDOR_CACHE_REQUESTS_TOTAL.inc(method=method, outcome="bypass")
+            result, primary = compute()
+            self._store(key, method, category, args, kwargs, result, primary)
+            return result
+
+        found, value = self._lookup(key, method, count_miss=False)
+        if found:
+            return value
+
+        # One vendor call per key; concurrent callers wait for its result
+        with self._inflight_lock:
+            key_lock = self._inflight.setdefault(key, threading.Lock())
+        with key_lock:
+            try:
+                found, value = self._lookup(key, method)
+                if found:
+                    return value
+                result, primary = compute()
+                self._store(key, method, category, args, kwargs, result, primary)
+                return result
+            finally:
+                with self._inflight_lock:
+                    self._inflight.pop(key, None)
+
+    def _lookup(self, key: str, method: str, count_miss: bool = True) -> Tuple[bool, Any]:
+        found, value = self._memory_get(key)
+        if found:
+            self.memory_hits += 1
+            metrics.VENDOR_CACHE_REQUESTS_TOTAL.inc(method=method, outcome="hit_memory")
+            return True, value
+
+        found, value, expires_at, size = self._disk_get(key)
+        if found:
+            self.disk_hits += 1
+            metrics.VENDOR_CACHE_REQUESTS_TOTAL.inc(method=method, outcome="hit_disk")
+            self._memory_put(key, expires_at, size, value)
+            return True, value
+
+        if count_miss:
+            self.misses += 1
+            metrics.VENDOR_CACHE_REQUESTS_TOTAL.inc(method=method, outcome="miss")
+        return False, None
+
+    def _store(self, key: str, method: str, category: str, args, kwargs, result: Any, primary: bool) -> None:
+        if result is None or (isinstance(result, str) and not result.strip()):
+            return
+        failure = looks_like_failure(result)
+        try:
+            blob = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.debug(f"[VENDOR_CACHE] Result of {method} is not cacheable: {e}")
+            return
+        expires_at = self.expiry_for(category, args, kwargs, allow_immutable=primary and not failure)
+        self._memory_put(key, expires_at, len(blob), result)
+        if failure:
+            logger.debug(f"[VENDOR_CACHE] {method} returned a failure message; caching in memory until TTL")
+        else:
+            self._disk_put(key, method, blob, expires_at)
+        self.stores += 1
+
+    def clear(self) -> None:
+        """Delete all cached results (both tiers)."""
+        with self._memory_lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+        if self.path:
+            with self._disk_lock:
+                self._connect().execute("DELETE FROM vendor_results")
+                self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters, hit rate and tier sizes."""
+        hits = self.memory_hits + self.disk_hits
+        lookups = hits + self.misses
+        with self._memory_lock:
+            memory_entries, memory_bytes = len(self._memory), self._memory_bytes
+        return {
+            "path": self.path,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "errors": self.errors,
+            "hit_rate": round(hits / lookups, 3) if lookups else None,
+            "memory_entries": memory_entries,
+            "memory_bytes": memory_bytes,
+        }
+
+
+_cache: Optional[VendorResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_vendor_cache() -> VendorResultCache:
+    """Get the process-wide vendor result cache."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                config = get_config()
+                path = config.get("vendor_cache_path")
+                if path is None:
+                    path = os.path.join(config["data_cache_dir"], "vendor_cache.sqlite3")
+                _cache = VendorResultCache(
+                    path=path or None,
+                    ttl_seconds=dict(config.get("vendor_cache_ttl_seconds") or {}),
+                    settle_days=int(config.get("vendor_cache_settle_days", 1)),
+                    max_entries=int(config.get("vendor_cache_max_entries", 512)),
+                    max_memory_bytes=int(config.get("vendor_cache_max_memory_mb", 64)) * 1024 * 1024,
+                    max_disk_bytes=int(config.get("vendor_cache_max_disk_mb", 512)) * 1024 * 1024,
+                )
+    return _cache
+
+
+def vendor_cache_enabled() -> bool:
+    return bool(get_config().get("vendor_cache_enabled", True))
+
+
+@contextmanager
+def bypass_vendor_cache() -> Iterator[None]:
+    """
+    Skip cache lookups for vendor calls made in this context.
+
+    Fresh results are still stored. The flag is a contextvar, so it
+    follows the caller into worker threads started with copy_context().
+    """
+    token = _bypass.set(True)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
@@ -30,4 +30,37 @@ DEFAULT_CONFIG = {
     "db_ssl": os.getenv("DATABASE_SSL", "false").lower() in ("true", "1", "yes"),
     # Data staleness threshold (in days)
     "data_staleness_threshold_days": 90,
+    # Market chatter ingestion concurrency
+    "ingest_max_workers": int(os.getenv("INGEST_MAX_WORKERS", "8")),
+    "ingest_per_host_limit": int(os.getenv("INGEST_PER_HOST_LIMIT", "2")),
+    "ingest_source_timeout_seconds": float(os.getenv("INGEST_SOURCE_TIMEOUT_SECONDS", "60")),
+    # Shared HTTP client (pooled sessions, timeouts, conditional GET)
+    "http_connect_timeout_seconds": float(os.getenv("HTTP_CONNECT_TIMEOUT_SECONDS", "5")),
+    "http_read_timeout_seconds": float(os.getenv("HTTP_READ_TIMEOUT_SECONDS", "20")),
+    "http_pool_maxsize": int(os.getenv("HTTP_POOL_MAXSIZE", "16")),
+    # Sentiment enrichment at ingestion (lexicon | vader | finbert)
+    "chatter_sentiment_backend": os.getenv("CHATTER_SENTIMENT_BACKEND", "lexicon"),
+    "chatter_sentiment_batch_size": int(os.getenv("CHATTER_SENTIMENT_BATCH_SIZE", "256")),
+    # Cross-source near-duplicate clustering (SimHash)
+    "chatter_dedupe_enabled": os.getenv("CHATTER_DEDUPE_ENABLED", "true").lower() in ("true", "1", "yes"),
+    "chatter_dedupe_max_distance": int(os.getenv("CHATTER_DEDUPE_MAX_DISTANCE", "7")),
+    "chatter_dedupe_window_hours": float(os.getenv("CHATTER_DEDUPE_WINDOW_HOURS", "72")),
+    # Per-symbol OHLCV store for stockstats indicators (dataflows/ohlcv_store.py)
+    "ohlcv_cache_size": int(os.getenv("OHLCV_CACHE_SIZE", "32")),
+    "ohlcv_history_years": int(os.getenv("OHLCV_HISTORY_YEARS", "15")),
+    # Result cache in front of route_to_vendor (dataflows/vendor_cache.py)
+    "vendor_cache_enabled": os.getenv("VENDOR_CACHE_ENABLED", "true").lower() in ("true", "1", "yes"),
+    "vendor_cache_path": os.getenv("VENDOR_CACHE_PATH"),  # default: <data_cache_dir>/vendor_cache.sqlite3; "" = memory only
+    "vendor_cache_ttl_seconds": {
+        "core_stock_apis": 3600,
+        "technical_indicators": 3600,
+        "fundamental_data": 86400,
+        "news_data": 1800,
+    },
+    "vendor_cache_settle_days": int(os.getenv("VENDOR_CACHE_SETTLE_DAYS", "1")),
+    "vendor_cache_max_entries": int(os.getenv("VENDOR_CACHE_MAX_ENTRIES", "512")),
+    "vendor_cache_max_memory_mb": int(os.getenv("VENDOR_CACHE_MAX_MEMORY_MB", "64")),
+    "vendor_cache_max_disk_mb": int(os.getenv("VENDOR_CACHE_MAX_DISK_MB", "512")),
+    # In-process metrics exported at GET /metrics (tradingagents/metrics.py)
+    "metrics_enabled": os.getenv("METRICS_ENABLED", "true").lower() in ("true", "1", "yes"),
 }
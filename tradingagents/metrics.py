@@ -0,0 +1,336 @@
+"""
+In-process counters and latency histograms with Prometheus text output.
+
+Every metric used by the ingestion and query paths is declared here, so
+the full set is exported (with zero samples) before the first event. The
+API serves render_prometheus() at GET /metrics.
+
+Recording is a no-op while metrics are disabled (metrics_enabled config
+key / METRICS_ENABLED env var, or set_metrics_enabled(False)): inc() and
+observe() return after one flag check, and time()/timed() skip the clock
+entirely.
+
+Usage:
+    from tradingagents import metrics
+
+    with metrics.DB_QUERY_SECONDS.time(statement="get_news"):
+        ...
+    metrics.CHATTER_ROWS_TOTAL.inc(inserted, outcome="inserted")
+
+No client library is required; the exposition format is written directly.
+"""
+
+import bisect
+import functools
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from tradingagents.default_config import DEFAULT_CONFIG
+
+# Seconds; covers a cached DB read up to a slow LLM call
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+_enabled = bool(DEFAULT_CONFIG.get("metrics_enabled", True))
+_registry: List["_Metric"] = []
+_registry_lock = threading.Lock()
+
+
+def metrics_enabled() -> bool:
+    """Return whether metrics are being recorded."""
+    return _enabled
+
+
+def set_metrics_enabled(enabled: bool) -> None:
+    """Turn recording on or off at runtime (collected values are kept)."""
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], object] = {}
+        with _registry_lock:
+            _registry.append(self)
+
+    def _key(self, labels: Dict[str, object]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def _labels(self, key: Tuple[str, ...], extra: str = "") -> str:
+        pairs = [f'{n}="{_escape(v)}"' for n, v in zip(self.labelnames, key)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def _samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {_escape(self.documentation)}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Counter(_Metric):
+    """Monotonically increasing count, per label combination."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        if not _enabled:
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> Iterator[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield f"{self.name}{self._labels(key)} {_format_value(value)}"
+
+
+class _Timer:
+    __slots__ = ("_histogram", "_labels", "_start")
+
+    def __init__(self, histogram: "Histogram", labels: Dict[str, object]):
+        self._histogram = histogram
+        self._labels = labels
+
+    def __enter__(self) -> "_Timer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._histogram.observe(time.perf_counter() - self._start, **self._labels)
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullTimer":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class Histogram(_Metric):
+    """Distribution of observed values (e.g. latencies in seconds)."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        if not _enabled:
+            return
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # per-bucket counts (non-cumulative; +Inf last), sum
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][index] += 1
+            state[1] += value
+
+    def time(self, **labels):
+        """Context manager observing the elapsed time of its block."""
+        return _Timer(self, labels) if _enabled else _NULL_TIMER
+
+    def count(self, **labels) -> int:
+        state = self._values.get(self._key(labels))
+        return sum(state[0]) if state else 0
+
+    def _samples(self) -> Iterator[str]:
+        with self._lock:
+            items = sorted((key, (list(state[0]), state[1])) for key, state in self._values.items())
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{self._labels(key, le)} {cumulative}"
+            yield f"{self.name}_sum{self._labels(key)} {_format_value(total)}"
+            yield f"{self.name}_count{self._labels(key)} {cumulative}"
+
+
+def timed(histogram: Histogram, **labels) -> Callable:
+    """
+    Decorator observing a function's duration in a histogram.
+
+    Adds an outcome label ("ok" or "error") when the histogram has one.
+    """
+    with_outcome = "outcome" in histogram.labelnames
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            outcome = "error"
+            try:
+                result = func(*args, **kwargs)
+                outcome = "ok"
+                return result
+            finally:
+                if with_outcome:
+                    histogram.observe(time.perf_counter() - start, outcome=outcome, **labels)
+                else:
+                    histogram.observe(time.perf_counter() - start, **labels)
+        return wrapper
+
+    return decorator
+
+
+def render_prometheus() -> str:
+    """Render every registered metric in the Prometheus text format (0.0.4)."""
+    with _registry_lock:
+        metrics = list(_registry)
+    return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+def reset_metrics() -> None:
+    """Drop all recorded values (tests, benchmarks)."""
+    with _registry_lock:
+        metrics = list(_registry)
+    for metric in metrics:
+        metric.clear()
+
+
+def get_metric(name: str) -> Optional[_Metric]:
+    """Look up a registered metric by name."""
+    with _registry_lock:
+        return next((m for m in _registry if m.name == name), None)
+
+
+# -----------------------------------------------------------------------------
+# Ingestion
+# -----------------------------------------------------------------------------
+INGEST_SOURCE_SECONDS = Histogram(
+    "vfis_ingest_source_seconds",
+    "Time to fetch, enrich and persist one (ticker, source) task",
+    ("source", "outcome"),
+)
+HTTP_REQUEST_SECONDS = Histogram(
+    "vfis_http_request_seconds",
+    "Latency of outbound HTTP GETs by host",
+    ("host", "outcome"),
+)
+CHATTER_ROWS_TOTAL = Counter(
+    "vfis_chatter_rows_total",
+    "Market chatter records persisted, by outcome (inserted, duplicate, error)",
+    ("outcome",),
+)
+CHATTER_PERSIST_SECONDS = Histogram(
+    "vfis_chatter_persist_seconds",
+    "Time to persist one batch of market chatter records",
+    ("method",),
+)
+
+# -----------------------------------------------------------------------------
+# Database
+# -----------------------------------------------------------------------------
+DB_QUERY_SECONDS = Histogram(
+    "vfis_db_query_seconds",
+    "Database read time by statement",
+    ("statement", "outcome"),
+)
+DB_POOL_CHECKOUTS_TOTAL = Counter(
+    "vfis_db_pool_checkouts_total",
+    "Connection pool checkouts by outcome (ok, exhausted, error); the pool never waits",
+    ("outcome",),
+)
+DB_CONNECTION_HOLD_SECONDS = Histogram(
+    "vfis_db_connection_hold_seconds",
+    "Time a pooled connection is held (one transaction)",
+)
+
+# -----------------------------------------------------------------------------
+# LLM
+# -----------------------------------------------------------------------------
+LLM_CALL_SECONDS = Histogram(
+    "vfis_llm_call_seconds",
+    "LLM call latency by deployment",
+    ("deployment", "outcome"),
+)
+LLM_TOKENS_TOTAL = Counter(
+    "vfis_llm_tokens_total",
+    "LLM tokens by deployment and kind (prompt, completion)",
+    ("deployment", "kind"),
+)
+LLM_CACHE_REQUESTS_TOTAL = Counter(
+    "vfis_llm_cache_requests_total",
+    "LLM response cache lookups by outcome (hit, miss, bypass)",
+    ("outcome",),
+)
+
+# -----------------------------------------------------------------------------
+# Query path
+# -----------------------------------------------------------------------------
+QUERY_SECONDS = Histogram(
+    "vfis_query_seconds",
+    "End-to-end assemble_final_output time",
+    ("outcome",),
+)
+QUERY_STAGE_SECONDS = Histogram(
+    "vfis_query_stage_seconds",
+    "Per-stage query time (bull, bear, risk, chatter_sentiment)",
+    ("stage", "outcome"),
+)
+QUERY_STAGES_ABANDONED_TOTAL = Counter(
+    "vfis_query_stages_abandoned_total",
+    "Query stages still running after their timeout (cancelled cooperatively)",
+    ("stage",),
+)
+VENDOR_CALL_SECONDS = Histogram(
+    "vfis_vendor_call_seconds",
+    "Data vendor call time in route_to_vendor",
+    ("method", "vendor", "outcome"),
+)
+VENDOR_CACHE_REQUESTS_TOTAL = Counter(
+    "vfis_vendor_cache_requests_total",
+    "route_to_vendor result cache lookups by outcome (hit_memory, hit_disk, miss, bypass)",
+    ("method", "outcome"),
+)
@@ -14,6 +14,7 @@ from .bear_agent import BearAgent
 from .debate_orchestrator import DebateOrchestrator
 from .risk_management_agent import RiskManagementAgent, RiskLevel
 from .final_output_assembly import FinalOutputAssembly
+from .registry import get_agent_registry, get_final_output_assembly
 
 __all__ = [
     'VerifiedDataAgent',
@@ -22,5 +23,7 @@ __all__ = [
     'DebateOrchestrator',
     'RiskManagementAgent',
     'RiskLevel',
-    'FinalOutputAssembly'
+    'FinalOutputAssembly',
+    'get_agent_registry',
+    'get_final_output_assembly'
 ]
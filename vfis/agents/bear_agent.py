@@ -16,8 +16,10 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from vfis.tools.postgres_dal import VFISDataAccess, DataStatus
-from vfis.tools.llm_factory import create_azure_openai_llm
+from vfis.tools.llm_factory import get_shared_azure_openai_llm
+from vfis.tools.llm_cache import cached_llm_invoke
 from tradingagents.database.audit import log_data_access
+from tradingagents.database.schema_registry import is_table_ready, invalidate_on_ddl_error
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +38,7 @@ class BearAgent:
         Args:
             llm_model: LLM model name (ignored for Azure OpenAI, deployment name comes from env)
         """
-        self.llm = create_azure_openai_llm(temperature=0)
+        self.llm = get_shared_azure_openai_llm(temperature=0)
         self.agent_name = "BearAgent"
     
     def analyze_risk_signals(
@@ -171,13 +173,7 @@ class BearAgent:
             with get_db_connection() as conn:
                 with conn.cursor() as cur:
                     # Check if news table exists
-                    cur.execute("""
-                        SELECT EXISTS (
-                            SELECT FROM information_schema.tables 
-                            WHERE table_name = 'news'
-                        );
-                    """)
-                    if not cur.fetchone()[0]:
+                    if not is_table_ready('news', cur):
                         return signals
                     
                     # Get recent negative sentiment news
@@ -211,6 +207,7 @@ class BearAgent:
                             'url': url
                         })
         except Exception as e:
+            invalidate_on_ddl_error(e, 'news')
             logger.warning(f"Failed to get sentiment data for {ticker}: {e}")
         
         return signals
@@ -224,13 +221,7 @@ class BearAgent:
             with get_db_connection() as conn:
                 with conn.cursor() as cur:
                     # Check if technical_indicators table exists
-                    cur.execute("""
-                        SELECT EXISTS (
-                            SELECT FROM information_schema.tables 
-                            WHERE table_name = 'technical_indicators'
-                        );
-                    """)
-                    if not cur.fetchone()[0]:
+                    if not is_table_ready('technical_indicators', cur):
                         return signals
                     
                     # Get recent technical indicators that suggest bearishness
@@ -268,6 +259,7 @@ class BearAgent:
                             'indicator': indicator_name
                         })
         except Exception as e:
+            invalidate_on_ddl_error(e, 'technical_indicators')
             logger.warning(f"Failed to get technical indicators for {ticker}: {e}")
         
         return signals
@@ -356,6 +348,9 @@ class BearAgent:
         Format signals into structured output using LLM for reasoning only.
         
         CRITICAL: LLM only structures existing data. Does not generate numbers.
+        
+        The response is reused for identical signals within the LLM cache
+        freshness window (vfis.tools.llm_cache).
         """
         system_prompt = """You are a Bear Agent that analyzes ONLY risk and downside signals from financial data.
 
@@ -392,7 +387,12 @@ DO NOT generate any financial numbers. Only reference numbers from the provided
                 HumanMessage(content=human_prompt)
             ]
             
-            response = self.llm.invoke(messages)
+            # analysis_date changes daily without changing the prompt
+            llm_summary = cached_llm_invoke(
+                self.llm,
+                messages,
+                data={k: v for k, v in signals.items() if k != 'analysis_date'}
+            )
             
             # Parse LLM response and merge with original signals data
             structured_output = {
@@ -402,7 +402,7 @@ DO NOT generate any financial numbers. Only reference numbers from the provided
                 'data_sources': signals['data_sources'],
                 'warnings': signals['warnings'],
                 'citations': signals.get('citations', []),
-                'llm_summary': response.content,
+                'llm_summary': llm_summary,
                 'agent_name': self.agent_name
             }
             
@@ -0,0 +1,201 @@
+"""
+Concurrent execution of independent analysis stages.
+
+The bull analysis, bear analysis, risk classification and chatter
+sentiment aggregation for a query only read data and call the LLM
+independently of each other. run_stages() runs them side by side on a
+shared thread pool, so query latency approaches the slowest stage instead
+of the sum of all stages.
+
+Each stage has its own timeout. A stage that times out or raises yields
+its fallback value (partial result) instead of failing the whole query.
+A timed-out stage is cancelled cooperatively: its cancel event is set and
+the stage stops at its next LLM call or VFISDataAccess read
+(vfis.tools.stage_cancel). Until then it still holds a pool worker; such
+abandoned stages are counted (vfis_query_stages_abandoned_total) and, while
+STAGE_POOL_MAX_ABANDONED of them are still running, new queries get their
+fallbacks immediately instead of queueing behind them.
+
+Stages run in a copy of the caller's contextvars context, so the request
+data context (vfis.tools.data_context) is shared with the worker threads.
+"""
+
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+from tradingagents import metrics
+from vfis.core.env import QUERY_STAGE_TIMEOUT_SECONDS
+from vfis.tools.stage_cancel import check_stage_cancelled, stage_cancel_scope
+
+logger = logging.getLogger(__name__)
+
+# Shared across requests; sized for a few concurrent queries x 4 stages
+STAGE_POOL_MAX_WORKERS = 32
+# Timed-out stages still running at which new stages are not submitted
+STAGE_POOL_MAX_ABANDONED = STAGE_POOL_MAX_WORKERS // 2
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+_abandoned = 0
+_abandoned_lock = threading.Lock()
+
+
+@dataclass
+class Stage:
+    """One independent unit of work within a query."""
+    name: str
+    func: Callable[[], Any]
+    fallback: Callable[[str], Any]
+    timeout: Optional[float] = None
+    cancel: threading.Event = field(default_factory=threading.Event)
+    finished: bool = field(default=False, repr=False)
+    abandoned: bool = field(default=False, repr=False)
+
+
+@dataclass
+class StageResult:
+    """Outcome of a stage: its value, or the fallback and why."""
+    name: str
+    value: Any
+    ok: bool
+    elapsed_ms: float
+    error: Optional[str] = None
+    timed_out: bool = False
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=STAGE_POOL_MAX_WORKERS, thread_name_prefix="query-stage"
+                )
+    return _executor
+
+
+def abandoned_stage_count() -> int:
+    """Number of timed-out stages still holding a pool worker."""
+    with _abandoned_lock:
+        return _abandoned
+
+
+def _run_stage(stage: Stage) -> tuple:
+    """Worker body: run the stage under its cancel event and time it."""
+    global _abandoned
+    start = time.perf_counter()
+    try:
+        with stage_cancel_scope(stage.cancel):
+            # Timed out while still queued
+            check_stage_cancelled()
+            value = stage.func()
+        return value, time.perf_counter() - start
+    finally:
+        with _abandoned_lock:
+            stage.finished = True
+            if stage.abandoned:
+                _abandoned -= 1
+                remaining = _abandoned
+        if stage.abandoned:
+            logger.info(
+                f"[STAGES] Abandoned {stage.name} stage released its worker after "
+                f"{time.perf_counter() - start:.1f}s ({remaining} still running)"
+            )
+
+
+def _abandon(stage: Stage, future) -> None:
+    """Cancel a timed-out stage; count it if it keeps running."""
+    global _abandoned
+    stage.cancel.set()
+    if future.cancel():
+        return
+    with _abandoned_lock:
+        if stage.finished:
+            return
+        stage.abandoned = True
+        _abandoned += 1
+        running = _abandoned
+    metrics.QUERY_STAGES_ABANDONED_TOTAL.inc(stage=stage.name)
+    logger.warning(
+        f"[STAGES] {stage.name} stage still running after its timeout; "
+        f"{running} abandoned stage(s) holding pool workers"
+    )
+
+
+def _saturated_results(stages: tuple, abandoned: int) -> Dict[str, StageResult]:
+    """Fallback results for a query that found the pool saturated."""
+    message = f"stage pool saturated ({abandoned} abandoned stages still running)"
+    logger.warning(f"[STAGES] {message}; using partial results for {len(stages)} stages")
+    results = {}
+    for stage in stages:
+        reason = f"{stage.name} skipped: {message}"
+        results[stage.name] = StageResult(stage.name, stage.fallback(reason), False, 0.0, error=reason)
+        metrics.QUERY_STAGE_SECONDS.observe(0.0, stage=stage.name, outcome='saturated')
+    return results
+
+
+def run_stages(*stages: Stage) -> Dict[str, StageResult]:
+    """
+    Run stages concurrently and collect their results.
+
+    Timeouts are measured from the moment the stages are submitted, so the
+    whole call returns within the largest stage timeout. If
+    STAGE_POOL_MAX_ABANDONED timed-out stages are still running, nothing
+    is submitted and every stage yields its fallback.
+
+    Args:
+        *stages: Stages to run
+
+    Returns:
+        Dict of stage name -> StageResult, in the order given
+    """
+    abandoned = abandoned_stage_count()
+    if abandoned >= STAGE_POOL_MAX_ABANDONED:
+        return _saturated_results(stages, abandoned)
+
+    executor = _get_executor()
+    submitted_at = time.perf_counter()
+    futures = {
+        stage.name: executor.submit(contextvars.copy_context().run, _run_stage, stage)
+        for stage in stages
+    }
+
+    results: Dict[str, StageResult] = {}
+    for stage in stages:
+        timeout = stage.timeout if stage.timeout is not None else QUERY_STAGE_TIMEOUT_SECONDS
+        remaining = max(0.0, timeout - (time.perf_counter() - submitted_at))
+        try:
+            value, elapsed = futures[stage.name].result(timeout=remaining)
+            results[stage.name] = StageResult(stage.name, value, True, elapsed * 1000)
+        except FutureTimeoutError:
+            _abandon(stage, futures[stage.name])
+            message = f"{stage.name} timed out after {timeout:g}s"
+            logger.warning(f"[STAGES] {message}; using partial result")
+            results[stage.name] = StageResult(
+                stage.name, stage.fallback(message), False, timeout * 1000,
+                error=message, timed_out=True
+            )
+        except Exception as e:
+            message = f"{stage.name} failed: {e}"
+            logger.error(f"[STAGES] {message}", exc_info=True)
+            results[stage.name] = StageResult(
+                stage.name, stage.fallback(message), False,
+                (time.perf_counter() - submitted_at) * 1000, error=message
+            )
+
+    for r in results.values():
+        outcome = 'ok' if r.ok else 'timeout' if r.timed_out else 'error'
+        metrics.QUERY_STAGE_SECONDS.observe(r.elapsed_ms / 1000, stage=r.name, outcome=outcome)
+
+    logger.info(
+        "[STAGES] " + ", ".join(
+            f"{r.name}={r.elapsed_ms:.0f}ms{'' if r.ok else ' (partial)'}" for r in results.values()
+        ) + f"; wall={(time.perf_counter() - submitted_at) * 1000:.0f}ms"
+    )
+    return results
@@ -14,11 +14,26 @@ from datetime import date
 
 from vfis.agents.bull_agent import BullAgent
 from vfis.agents.bear_agent import BearAgent
+from vfis.agents.concurrent_stages import Stage, run_stages
 from tradingagents.database.audit import log_data_access
 
 logger = logging.getLogger(__name__)
 
 
+def _partial_signals(ticker: str, agent_name: str, signals_key: str, reason: str) -> Dict[str, Any]:
+    """Agent output used when a debate stage timed out or failed."""
+    return {
+        'ticker': ticker,
+        'agent_name': agent_name,
+        'analysis_date': date.today().isoformat(),
+        signals_key: [],
+        'warnings': [f"{agent_name} analysis unavailable: {reason}"],
+        'data_sources': [],
+        'citations': [],
+        'llm_summary': ''
+    }
+
+
 class DebateOrchestrator:
     """
     Orchestrates debate between Bull and Bear agents.
@@ -44,6 +59,8 @@ class DebateOrchestrator:
         """
         Conduct structured debate between Bull and Bear agents.
         
+        The two perspectives are independent and run concurrently.
+        
         Args:
             ticker: Company ticker symbol
             user_query: Original user query
@@ -51,19 +68,48 @@ class DebateOrchestrator:
         Returns:
             Structured debate output with both perspectives
         """
-        try:
-            # Get Bull perspective
-            bull_signals = self.bull_agent.analyze_positive_signals(
-                ticker=ticker,
-                user_query=user_query
-            )
-            
-            # Get Bear perspective
-            bear_signals = self.bear_agent.analyze_risk_signals(
-                ticker=ticker,
-                user_query=user_query
-            )
+        stages = run_stages(
+            self.bull_stage(ticker, user_query),
+            self.bear_stage(ticker, user_query)
+        )
+        return self.build_debate_output(ticker, stages['bull'].value, stages['bear'].value)
+    
+    def bull_stage(self, ticker: str, user_query: str, timeout: Optional[float] = None) -> Stage:
+        """Bull analysis as a concurrent stage (fallback: no signals plus a warning)."""
+        return Stage(
+            name='bull',
+            func=lambda: self.bull_agent.analyze_positive_signals(ticker=ticker, user_query=user_query),
+            fallback=lambda reason: _partial_signals(ticker, 'BullAgent', 'positive_signals', reason),
+            timeout=timeout
+        )
+    
+    def bear_stage(self, ticker: str, user_query: str, timeout: Optional[float] = None) -> Stage:
+        """Bear analysis as a concurrent stage (fallback: no signals plus a warning)."""
+        return Stage(
+            name='bear',
+            func=lambda: self.bear_agent.analyze_risk_signals(ticker=ticker, user_query=user_query),
+            fallback=lambda reason: _partial_signals(ticker, 'BearAgent', 'risk_signals', reason),
+            timeout=timeout
+        )
+    
+    def build_debate_output(
+        self,
+        ticker: str,
+        bull_signals: Dict[str, Any],
+        bear_signals: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Combine Bull and Bear results into the structured debate output.
+        
+        Args:
+            ticker: Company ticker symbol
+            bull_signals: Output of BullAgent.analyze_positive_signals
+            bear_signals: Output of BearAgent.analyze_risk_signals
             
+        Returns:
+            Structured debate output with both perspectives
+        """
+        try:
             # Assemble structured debate output
             debate_output = {
                 'ticker': ticker,
@@ -9,18 +9,45 @@ STRICT RULES:
 """
 
 import logging
+import time
 from typing import Dict, Any, Optional, List
+from datetime import date
 
+from vfis.agents.concurrent_stages import Stage, run_stages
 from vfis.agents.debate_orchestrator import DebateOrchestrator
 from vfis.agents.risk_management_agent import RiskManagementAgent
 from vfis.tools.subscriber_matching import SubscriberMatcher, SubscriberRiskTolerance
 from vfis.tools.postgres_dal import VFISDataAccess
-from tradingagents.database.chatter_dal import get_recent_chatter  # Canonical DAL
+from vfis.tools.data_context import request_data_context
+from tradingagents.database.chatter_dal import get_chatter_sentiment_summary  # Canonical DAL
 from tradingagents.database.audit import log_data_access
+from tradingagents.metrics import QUERY_SECONDS
 
 logger = logging.getLogger(__name__)
 
 
+def _partial_risk_assessment(ticker: str, reason: str) -> Dict[str, Any]:
+    """Risk assessment used when the risk stage timed out or failed."""
+    return {
+        'ticker': ticker,
+        'analysis_date': date.today().isoformat(),
+        'risk_level': 'UNKNOWN',
+        'error': reason,
+        'risk_factors': [],
+        'warnings': [f"Risk classification unavailable: {reason}"]
+    }
+
+
+def _partial_chatter(ticker: str) -> Dict[str, Any]:
+    """Neutral market chatter used when the sentiment stage timed out or failed."""
+    return {
+        'summary': f'Unable to retrieve market chatter for {ticker}',
+        'sentiment_score': 0.0,
+        'sentiment_label': 'neutral',
+        'item_count': 0
+    }
+
+
 class FinalOutputAssembly:
     """
     Assembles final structured output combining all analysis components.
@@ -28,6 +55,15 @@ class FinalOutputAssembly:
     CRITICAL: All data from PostgreSQL with explicit limitations stated.
     """
     
+    # Per-stage timeouts in seconds (None = QUERY_STAGE_TIMEOUT_SECONDS).
+    # Risk and chatter are DB-only; bull/bear wait on the LLM.
+    STAGE_TIMEOUTS: Dict[str, Optional[float]] = {
+        'bull': None,
+        'bear': None,
+        'risk': 30.0,
+        'chatter_sentiment': 15.0,
+    }
+    
     def __init__(self, llm_model: Optional[str] = None):
         """
         Initialize Final Output Assembly.
@@ -37,7 +73,7 @@ class FinalOutputAssembly:
         """
         self.debate_orchestrator = DebateOrchestrator(llm_model=llm_model)
         self.risk_agent = RiskManagementAgent()
-        self.subscriber_matcher = SubscriberMatcher()
+        self.subscriber_matcher = SubscriberMatcher(risk_agent=self.risk_agent)
         # NOTE: Using canonical chatter_dal instead of deprecated storage module
     
     def assemble_final_output(
@@ -49,6 +85,10 @@ class FinalOutputAssembly:
         """
         Assemble complete structured output for a ticker.
         
+        Runs inside a request data context so every VFISDataAccess read
+        shared by the debate, risk and subscriber components hits
+        PostgreSQL once per query.
+        
         Args:
             ticker: Company ticker symbol
             subscriber_risk_tolerance: Optional subscriber risk tolerance for matching
@@ -57,27 +97,55 @@ class FinalOutputAssembly:
         Returns:
             Complete structured analysis output
         """
+        start = time.perf_counter()
+        with request_data_context() as data_ctx:
+            output = self._assemble_final_output(ticker, subscriber_risk_tolerance, user_query)
+        QUERY_SECONDS.observe(
+            time.perf_counter() - start, outcome='error' if output.get('error') else 'ok'
+        )
+        
+        logger.info(f"[DATA_CTX] Data access for {ticker}: {data_ctx.stats()}")
+        return output
+    
+    def _assemble_final_output(
+        self,
+        ticker: str,
+        subscriber_risk_tolerance: Optional[SubscriberRiskTolerance],
+        user_query: str
+    ) -> Dict[str, Any]:
+        """Assemble the output; see assemble_final_output()."""
         try:
-            # 1. Bull vs Bear Debate
-            debate_output = self.debate_orchestrator.conduct_debate(
-                ticker=ticker,
-                user_query=user_query
+            # 1-3. Bull, Bear, Risk Classification and Market Chatter are
+            # independent; run them concurrently. A stage that times out or
+            # fails contributes its partial result and a warning.
+            stages = run_stages(
+                self.debate_orchestrator.bull_stage(ticker, user_query, self.STAGE_TIMEOUTS['bull']),
+                self.debate_orchestrator.bear_stage(ticker, user_query, self.STAGE_TIMEOUTS['bear']),
+                Stage(
+                    name='risk',
+                    func=lambda: self.risk_agent.classify_risk(ticker=ticker, user_query=user_query),
+                    fallback=lambda reason: _partial_risk_assessment(ticker, reason),
+                    timeout=self.STAGE_TIMEOUTS['risk']
+                ),
+                Stage(
+                    name='chatter_sentiment',
+                    func=lambda: self._get_market_chatter_and_sentiment(ticker),
+                    fallback=lambda reason: _partial_chatter(ticker),
+                    timeout=self.STAGE_TIMEOUTS['chatter_sentiment']
+                )
             )
-            
-            # 2. Risk Classification
-            risk_assessment = self.risk_agent.classify_risk(
-                ticker=ticker,
-                user_query=user_query
+            debate_output = self.debate_orchestrator.build_debate_output(
+                ticker, stages['bull'].value, stages['bear'].value
             )
-            
-            # 3. Market Chatter and Sentiment
-            market_chatter_data = self._get_market_chatter_and_sentiment(ticker)
+            risk_assessment = stages['risk'].value
+            market_chatter_data = stages['chatter_sentiment'].value
             
             # 4. Latest Financial Metrics
             latest_financial_metrics = self._get_latest_financial_metrics(ticker)
             
-            # 5. Subscriber Matching for all risk levels
-            subscriber_views = self._get_all_subscriber_views(ticker, user_query)
+            # 5. Subscriber Matching for all risk levels (reuses the risk
+            # assessment above; no further risk classification per query)
+            subscriber_views = self._get_all_subscriber_views(ticker, user_query, risk_assessment)
             
             # 6. Subscriber Matching (if subscriber tolerance provided)
             subscriber_match = None
@@ -85,7 +153,8 @@ class FinalOutputAssembly:
                 subscriber_match = self.subscriber_matcher.match_company_to_subscriber(
                     ticker=ticker,
                     subscriber_risk_tolerance=subscriber_risk_tolerance,
-                    user_query=user_query
+                    user_query=user_query,
+                    risk_assessment=risk_assessment
                 )
             
             # 7. Assemble final output
@@ -284,31 +353,26 @@ class FinalOutputAssembly:
             Dictionary with market chatter summary and sentiment data
         """
         try:
-            # Get recent market chatter (last 30 days) - using canonical DAL
+            # Counts and sentiment for the last 30 days from the chatter rollup
             # Returns standard DAL response: {"data": {...}, "status": str, "message": str}
-            chatter_response = get_recent_chatter(ticker, days=30, limit=100)
+            # Sentiment is per story: duplicates across sources count once
+            chatter_response = get_chatter_sentiment_summary(ticker, days=30)
             
-            # Handle new dict contract
-            if isinstance(chatter_response, dict):
-                if chatter_response.get("status") == "error":
-                    logger.warning(f"Market chatter error: {chatter_response.get('message')}")
-                    return {
-                        'summary': f'Unable to retrieve market chatter for {ticker}',
-                        'sentiment_score': 0.0,
-                        'sentiment_label': 'neutral',
-                        'item_count': 0
-                    }
-                
-                # Extract data from response
-                data = chatter_response.get("data", chatter_response)
-                chatter_items = data.get("items", [])
-                sources = data.get("sources", {})
-            else:
-                # Legacy: direct list return
-                chatter_items = chatter_response if isinstance(chatter_response, list) else []
-                sources = {}
+            if chatter_response.get("status") == "error":
+                logger.warning(f"Market chatter error: {chatter_response.get('message')}")
+                return {
+                    'summary': f'Unable to retrieve market chatter for {ticker}',
+                    'sentiment_score': 0.0,
+                    'sentiment_label': 'neutral',
+                    'item_count': 0
+                }
+            
+            data = chatter_response.get("data", {})
+            row_count = data.get("total_count", 0)
+            story_count = data.get("unique_story_count", 0)
+            sources = data.get("sources", {})
             
-            if not chatter_items:
+            if not row_count:
                 return {
                     'summary': f'No market chatter found for {ticker} in the last 30 days.',
                     'sentiment_score': 0.0,
@@ -316,18 +380,8 @@ class FinalOutputAssembly:
                     'item_count': 0
                 }
             
-            # Compute overall sentiment from individual sentiment scores
-            sentiment_scores = []
-            for item in chatter_items:
-                score = item.get('sentiment_score')
-                if score is not None:
-                    try:
-                        sentiment_scores.append(float(score))
-                    except (ValueError, TypeError):
-                        pass
-            
-            if sentiment_scores:
-                avg_sentiment = sum(sentiment_scores) / len(sentiment_scores)
+            avg_sentiment = data.get("average_sentiment")
+            if avg_sentiment is not None:
                 # Determine label
                 if avg_sentiment > 0.2:
                     sentiment_label = 'bullish'
@@ -339,13 +393,10 @@ class FinalOutputAssembly:
                 avg_sentiment = 0.0
                 sentiment_label = 'neutral'
             
-            # Build sources if not already provided
-            if not sources:
-                for item in chatter_items:
-                    source = item.get('source', 'unknown')
-                    sources[source] = sources.get(source, 0) + 1
-            
-            summary_parts = [f"Found {len(chatter_items)} market chatter items from {len(sources)} sources"]
+            summary_parts = [
+                f"Found {row_count} market chatter items ({story_count} unique stories) "
+                f"from {len(sources)} sources"
+            ]
             if sources:
                 summary_parts.append(f"Sources: {', '.join([f'{k} ({v})' for k, v in sources.items()])}")
             
@@ -353,7 +404,8 @@ class FinalOutputAssembly:
                 'summary': '. '.join(summary_parts),
                 'sentiment_score': round(avg_sentiment, 3),
                 'sentiment_label': sentiment_label,
-                'item_count': len(chatter_items)
+                'item_count': row_count,
+                'unique_story_count': story_count
             }
             
         except Exception as e:
@@ -435,27 +487,35 @@ class FinalOutputAssembly:
                 ]
             }
     
-    def _get_all_subscriber_views(self, ticker: str, user_query: str) -> Dict[str, Dict[str, Any]]:
+    def _get_all_subscriber_views(
+        self,
+        ticker: str,
+        user_query: str,
+        risk_assessment: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Dict[str, Any]]:
         """
         Get subscriber views for all risk levels.
         
         Args:
             ticker: Company ticker symbol
             user_query: User query for audit logging
+            risk_assessment: Precomputed risk assessment for the ticker
             
         Returns:
             Dictionary with subscriber views for each risk level
         """
         views = {}
         try:
-            # Get views for each risk level
-            for risk_level in [SubscriberRiskTolerance.LOW_RISK, SubscriberRiskTolerance.MODERATE_RISK, SubscriberRiskTolerance.HIGH_RISK]:
-                match_result = self.subscriber_matcher.match_company_to_subscriber(
-                    ticker=ticker,
-                    subscriber_risk_tolerance=risk_level,
-                    user_query=user_query
-                )
-                
+            # Get views for each risk level in one pass
+            risk_levels = [SubscriberRiskTolerance.LOW_RISK, SubscriberRiskTolerance.MODERATE_RISK, SubscriberRiskTolerance.HIGH_RISK]
+            match_results = self.subscriber_matcher.match_company_to_subscribers(
+                ticker=ticker,
+                subscriber_risk_tolerances=risk_levels,
+                user_query=user_query,
+                risk_assessment=risk_assessment
+            )
+            
+            for risk_level, match_result in zip(risk_levels, match_results):
                 key = 'low_risk' if risk_level == SubscriberRiskTolerance.LOW_RISK else \
                       'moderate_risk' if risk_level == SubscriberRiskTolerance.MODERATE_RISK else 'high_risk'
                 
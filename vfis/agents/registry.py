@@ -0,0 +1,117 @@
+"""
+Process-wide agent registry for VFIS.
+
+Building a FinalOutputAssembly constructs a DebateOrchestrator (BullAgent,
+BearAgent and their LLM clients), a RiskManagementAgent and a
+SubscriberMatcher. None of these hold per-request state - everything a
+query needs is passed as arguments and request-scoped data lives in the
+request data context - so one instance per process is shared by every
+request.
+
+Usage:
+    from vfis.agents.registry import get_final_output_assembly
+
+    assembly = get_final_output_assembly()
+    output = assembly.assemble_final_output(ticker, ...)
+
+Call warm_agent_registry() at startup to move construction off the first
+request.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from vfis.agents.final_output_assembly import FinalOutputAssembly
+
+logger = logging.getLogger(__name__)
+
+
+class AgentRegistry:
+    """Thread-safe, lazily populated cache of shared agent graphs."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Guards the counters; separate so hits never wait behind a build
+        self._stats_lock = threading.Lock()
+        self._assemblies: Dict[Optional[str], FinalOutputAssembly] = {}
+        self.builds = 0
+        self.hits = 0
+        self.build_seconds = 0.0
+
+    def get_final_output_assembly(self, llm_model: Optional[str] = None) -> FinalOutputAssembly:
+        """
+        Return the shared FinalOutputAssembly for an LLM model.
+
+        Args:
+            llm_model: LLM model name for debate agents
+
+        Returns:
+            Shared FinalOutputAssembly (built once per process and model)
+        """
+        assembly = self._assemblies.get(llm_model)
+        if assembly is not None:
+            with self._stats_lock:
+                self.hits += 1
+            return assembly
+
+        with self._lock:
+            assembly = self._assemblies.get(llm_model)
+            if assembly is None:
+                start = time.perf_counter()
+                assembly = FinalOutputAssembly(llm_model=llm_model)
+                elapsed = time.perf_counter() - start
+                self._assemblies[llm_model] = assembly
+                with self._stats_lock:
+                    self.builds += 1
+                    self.build_seconds += elapsed
+                logger.info(f"[AGENTS] Built shared FinalOutputAssembly in {elapsed * 1000:.1f}ms")
+            else:
+                with self._stats_lock:
+                    self.hits += 1
+            return assembly
+
+    def clear(self) -> None:
+        """Drop cached agents (e.g. after LLM configuration changes)."""
+        with self._lock:
+            self._assemblies.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return build/reuse counters."""
+        with self._stats_lock:
+            return {
+                "assemblies": len(self._assemblies),
+                "builds": self.builds,
+                "hits": self.hits,
+                "build_ms": round(self.build_seconds * 1000, 1),
+            }
+
+
+_registry = AgentRegistry()
+
+
+def get_agent_registry() -> AgentRegistry:
+    """Return the process-wide agent registry."""
+    return _registry
+
+
+def get_final_output_assembly(llm_model: Optional[str] = None) -> FinalOutputAssembly:
+    """Return the shared FinalOutputAssembly (see AgentRegistry)."""
+    return _registry.get_final_output_assembly(llm_model)
+
+
+def warm_agent_registry() -> bool:
+    """
+    Build the default agent graph eagerly.
+
+    Returns:
+        True if the agents were built, False if construction failed (the
+        first request will retry and surface the error).
+    """
+    try:
+        _registry.get_final_output_assembly()
+        return True
+    except Exception as e:
+        logger.warning(f"[AGENTS] Agent warm-up failed, will build on first request: {e}")
+        return False
@@ -17,6 +17,7 @@ from enum import Enum
 from vfis.tools.postgres_dal import VFISDataAccess, DataStatus
 from tradingagents.database.connection import get_db_connection
 from tradingagents.database.audit import log_data_access
+from tradingagents.database.schema_registry import is_table_ready, invalidate_on_ddl_error
 
 logger = logging.getLogger(__name__)
 
@@ -239,13 +240,7 @@ class RiskManagementAgent:
         try:
             with get_db_connection() as conn:
                 with conn.cursor() as cur:
-                    cur.execute("""
-                        SELECT EXISTS (
-                            SELECT FROM information_schema.tables 
-                            WHERE table_name = 'news'
-                        );
-                    """)
-                    if not cur.fetchone()[0]:
+                    if not is_table_ready('news', cur):
                         warnings.append("News table does not exist")
                         return {'factors': factors, 'warnings': warnings}
                     
@@ -292,6 +287,7 @@ class RiskManagementAgent:
             }
         
         except Exception as e:
+            invalidate_on_ddl_error(e, 'news')
             logger.warning(f"Failed to assess sentiment risk for {ticker}: {e}")
             return {'factors': factors, 'warnings': [f"Sentiment risk assessment failed: {str(e)}"]}
     
@@ -303,13 +299,7 @@ class RiskManagementAgent:
         try:
             with get_db_connection() as conn:
                 with conn.cursor() as cur:
-                    cur.execute("""
-                        SELECT EXISTS (
-                            SELECT FROM information_schema.tables 
-                            WHERE table_name = 'technical_indicators'
-                        );
-                    """)
-                    if not cur.fetchone()[0]:
+                    if not is_table_ready('technical_indicators', cur):
                         warnings.append("Technical indicators table does not exist")
                         return {'factors': factors, 'warnings': warnings}
                     
@@ -346,6 +336,7 @@ class RiskManagementAgent:
             }
         
         except Exception as e:
+            invalidate_on_ddl_error(e, 'technical_indicators')
             logger.warning(f"Failed to assess technical risk for {ticker}: {e}")
             return {'factors': factors, 'warnings': [f"Technical risk assessment failed: {str(e)}"]}
     
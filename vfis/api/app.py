@@ -50,7 +50,9 @@ async def lifespan(app: FastAPI):
     3. Initialize database connection pool
     4. Ensure required tables exist
     5. Start background ingestion scheduler
-    6. Run startup validation
+    6. Start background audit sink
+    7. Build shared agents (agent registry)
+    8. Run startup validation
     
     CRITICAL: If bootstrap fails, the application MUST crash.
     Azure App Service requires startup failure to crash the process.
@@ -78,6 +80,16 @@ async def lifespan(app: FastAPI):
     for warning in result.warnings:
         logger.warning(f"[STARTUP] Warning: {warning}")
     
+    # Move audit writes off the request path (flushed again on shutdown)
+    from tradingagents.database.audit import start_audit_sink
+    start_audit_sink()
+    logger.info("[STARTUP] Background audit sink started")
+    
+    # Build agents and LLM clients once; requests share them
+    from vfis.agents.registry import warm_agent_registry
+    if warm_agent_registry():
+        logger.info("[STARTUP] Agent registry warmed")
+    
     # Run additional startup validation (non-fatal)
     try:
         validation_result = startup_validation()
@@ -111,6 +123,14 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.warning(f"[SHUTDOWN] Error stopping scheduler: {e}")
         
+        # Flush queued audit events before the process exits
+        try:
+            from tradingagents.database.audit import stop_audit_sink
+            stop_audit_sink()
+            logger.info("[SHUTDOWN] Audit sink flushed")
+        except Exception as e:
+            logger.warning(f"[SHUTDOWN] Error flushing audit sink: {e}")
+        
         logger.info("Shutdown complete")
 
 
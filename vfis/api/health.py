@@ -13,11 +13,21 @@ import os
 from typing import Dict, Any, List
 from datetime import datetime
 
+from fastapi.concurrency import run_in_threadpool
+
 from tradingagents.database.connection import get_db_connection
 
 logger = logging.getLogger(__name__)
 
 
+def _probe_database() -> None:
+    """Round-trip SELECT 1 (blocking; run off the event loop)."""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+            cur.fetchone()
+
+
 async def health_check() -> Dict[str, Any]:
     """
     Health check endpoint for Azure App Service.
@@ -35,10 +45,7 @@ async def health_check() -> Dict[str, Any]:
     
     # Check database connectivity
     try:
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute("SELECT 1")
-                cur.fetchone()
+        await run_in_threadpool(_probe_database)
         health_status["checks"]["database"] = {
             "status": "healthy",
             "message": "Database connection successful"
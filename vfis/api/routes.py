@@ -17,13 +17,19 @@ ALL responses follow DAL contract:
 """
 
 import logging
+import time
+from contextlib import nullcontext
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
 from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel, Field, field_validator
 
-from vfis.agents.final_output_assembly import FinalOutputAssembly
+from vfis.agents.registry import get_final_output_assembly
+from vfis.tools.llm_cache import bypass_llm_cache, get_llm_cache
+from tradingagents import metrics
 from vfis.tools.subscriber_matching import SubscriberRiskTolerance
 from tradingagents.database.audit import log_data_access
 
@@ -53,6 +59,10 @@ class QueryRequest(BaseModel):
         None, 
         description="Optional query intent or description"
     )
+    bypass_cache: bool = Field(
+        False,
+        description="Skip cached LLM responses and call the model for fresh analysis"
+    )
     
     @field_validator('ticker')
     @classmethod
@@ -106,8 +116,9 @@ class QueryResponseData(BaseModel):
 class QueryResponse(BaseModel):
     """Response model for /query endpoint - follows DAL contract."""
     data: Optional[QueryResponseData]
-    status: str  # "success" | "no_data" | "error"
+    status: str  # "success" | "pending" | "no_data" | "error"
     message: Optional[str]
+    job: Optional[Dict[str, Any]] = None  # Ingestion job handle when status is "pending"
 
 
 class IngestionRequest(BaseModel):
@@ -169,7 +180,13 @@ async def query_intelligence(
     Output:
     - DAL contract response with analysis data
     
-    NOTE: If ticker hasn't been ingested yet, triggers ingestion synchronously.
+    NOTE: If ticker hasn't been ingested yet, starts (or joins) a background
+    ingestion job and returns status "pending" with a job handle to poll at
+    GET /api/v1/ingestion/jobs/{job_id}. If an earlier job finished without
+    ingesting the ticker, the query is answered from existing data while
+    ingestion is retried in the background (ingestion_triggered=True).
+    All blocking work runs in the threadpool so the event loop stays
+    responsive while analyses are in flight.
     """
     start_time = datetime.now()
     ingestion_triggered = False
@@ -198,28 +215,50 @@ async def query_intelligence(
         )
         
         # CRITICAL: Ensure ingestion BEFORE query reads
-        # Use centralized ingestion module
-        from vfis.ingestion import ensure_ticker_ingested
-        
-        ingest_result = ensure_ticker_ingested(request.ticker, days=7)
+        # Cold tickers are ingested by a de-duplicated background job
+        from vfis.ingestion.scheduler import is_ticker_ingested, record_query_demand
+        from vfis.ingestion.jobs import RETRY_INGESTION_AFTER_SECONDS, get_job_manager
+        
+        record_query_demand(request.ticker)
+        
+        if not await run_in_threadpool(is_ticker_ingested, request.ticker):
+            manager = get_job_manager()
+            previous = manager.last_finished_job_for(request.ticker)
+            if previous is None:
+                job = manager.submit(request.ticker, days=7)
+                logger.info(f"On-demand ingestion for {request.ticker} running as job {job.job_id}")
+                return QueryResponse(
+                    data=None,
+                    status="pending",
+                    message=(
+                        f"Ingestion in progress for {request.ticker}; "
+                        f"poll /api/v1/ingestion/jobs/{job.job_id} and retry the query when it succeeds"
+                    ),
+                    job=job.to_dict()
+                )
+            
+            # An earlier job finished without the ticker being recorded as
+            # ingested (it failed, or every source failed). Answer from the
+            # data that exists instead of "pending" forever, and retry
+            # ingestion in the background after a cool-down.
+            if (manager.active_job_for(request.ticker) is not None
+                    or time.monotonic() - previous.finished_monotonic >= RETRY_INGESTION_AFTER_SECONDS):
+                job = manager.submit(request.ticker, days=7)
+                ingestion_triggered = True
+                logger.info(f"Retrying ingestion for {request.ticker} as job {job.job_id}")
+            else:
+                logger.warning(
+                    f"Ingestion for {request.ticker} did not complete (job {previous.job_id} "
+                    f"{previous.status}); answering from existing data"
+                )
         
-        if ingest_result["status"] == "success" and not ingest_result["data"].get("already_ingested"):
-            ingestion_triggered = True
-            logger.info(
-                f"On-demand ingestion for {request.ticker}: "
-                f"fetched={ingest_result['data'].get('fetched', 0)}, "
-                f"inserted={ingest_result['data'].get('inserted', 0)}"
-            )
-        elif ingest_result["status"] == "error":
-            # Log warning but continue - don't fail the request
-            logger.warning(f"Ingestion warning for {request.ticker}: {ingest_result['message']}")
-        
-        # Assemble final output using VFIS system
-        assembly = FinalOutputAssembly()
-        output = assembly.assemble_final_output(
-            ticker=request.ticker,
-            subscriber_risk_tolerance=subscriber_risk,
-            user_query=request.query_intent or f"Query for {request.ticker}"
+        # Assemble final output using VFIS system (blocking: DB reads + LLM debate)
+        output = await run_in_threadpool(
+            _assemble_output,
+            request.ticker,
+            subscriber_risk,
+            request.query_intent or f"Query for {request.ticker}",
+            request.bypass_cache
         )
         
         # Calculate processing time
@@ -233,7 +272,8 @@ async def query_intelligence(
         )
         
         # Log audit
-        log_data_access(
+        await run_in_threadpool(
+            log_data_access,
             event_type='api_query',
             entity_type='ticker_analysis',
             entity_id=None,
@@ -304,7 +344,8 @@ async def query_intelligence(
         logger.error(f"Error processing query: {e}", exc_info=True)
         
         # Log audit for error
-        log_data_access(
+        await run_in_threadpool(
+            log_data_access,
             event_type='api_query_error',
             entity_type='ticker_analysis',
             entity_id=None,
@@ -322,6 +363,50 @@ async def query_intelligence(
         )
 
 
+def _assemble_output(
+    ticker: str,
+    subscriber_risk: SubscriberRiskTolerance,
+    user_query: str,
+    bypass_cache: bool = False
+) -> Dict[str, Any]:
+    """Run the full (blocking) analysis; called from the threadpool."""
+    assembly = get_final_output_assembly()
+    with bypass_llm_cache() if bypass_cache else nullcontext():
+        return assembly.assemble_final_output(
+            ticker=ticker,
+            subscriber_risk_tolerance=subscriber_risk,
+            user_query=user_query
+        )
+
+
+@router.get("/ingestion/jobs/{job_id}", response_model=IngestionResponse)
+async def ingestion_job_status(job_id: str) -> IngestionResponse:
+    """
+    Poll a background on-demand ingestion job started by /query.
+    
+    Args:
+        job_id: Job id from the /query "job" handle
+    
+    Returns:
+        DAL contract response with the job status and, once finished, its result
+    """
+    from vfis.ingestion.jobs import get_ingestion_job
+    
+    job = get_ingestion_job(job_id)
+    if job is None:
+        return IngestionResponse(
+            data=None,
+            status="no_data",
+            message=f"Unknown or expired ingestion job: {job_id}"
+        )
+    
+    return IngestionResponse(
+        data=job.to_dict(),
+        status="success",
+        message=f"Ingestion job for {job.ticker} is {job.status}"
+    )
+
+
 @router.get("/health")
 async def health():
     """Health check endpoint."""
@@ -329,6 +414,22 @@ async def health():
     return await health_check()
 
 
+@router.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics() -> PlainTextResponse:
+    """
+    Prometheus scrape endpoint.
+    
+    Exposes ingestion (per-source latency, rows inserted vs duplicates),
+    database (query time by statement, pool wait), LLM (latency, tokens,
+    cache hits) and query stage metrics in the text exposition format.
+    Not wrapped in the DAL contract: the body is what Prometheus parses.
+    """
+    return PlainTextResponse(
+        metrics.render_prometheus(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
 @router.get("/scheduler/status", response_model=SchedulerStatusResponse)
 async def scheduler_status() -> SchedulerStatusResponse:
     """
@@ -598,6 +699,7 @@ async def debug_agents() -> DebugResponse:
     Shows:
     - Agent classes available
     - LLM configuration status
+    - LLM response cache hit rate
     - Any initialization errors
     
     Returns:
@@ -639,6 +741,12 @@ async def debug_agents() -> DebugResponse:
                     "error": str(e)
                 }
         
+        # LLM response cache hit rate
+        try:
+            agent_status["llm_cache"] = get_llm_cache().stats()
+        except Exception as e:
+            agent_status["llm_cache"] = {"error": str(e)}
+        
         all_available = all(a.get("available", False) for a in agent_status["agents"].values())
         
         return DebugResponse(
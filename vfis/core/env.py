@@ -139,6 +139,40 @@ ACTIVE_TICKERS: List[str] = [
 ]
 INGESTION_INTERVAL_SECONDS: int = int(_get_optional("INGESTION_INTERVAL_SECONDS", "300"))
 INGESTION_LOOKBACK_DAYS: int = int(_get_optional("INGESTION_LOOKBACK_DAYS", "7"))
+# Scheduler ticks per interval; each tick refreshes ~1/N of the universe
+INGESTION_SPREAD_SLOTS: int = max(1, int(_get_optional("INGESTION_SPREAD_SLOTS", "10")))
+# Re-fetch window below the watermark for late-published items
+INGESTION_WATERMARK_OVERLAP_SECONDS: int = int(_get_optional("INGESTION_WATERMARK_OVERLAP_SECONDS", "3600"))
+# Half-life of the per-ticker query demand score
+INGESTION_DEMAND_HALF_LIFE_SECONDS: int = int(_get_optional("INGESTION_DEMAND_HALF_LIFE_SECONDS", "3600"))
+
+# -----------------------------------------------------------------------------
+# QUERY PIPELINE
+# -----------------------------------------------------------------------------
+# Default per-stage timeout for the concurrent bull/bear/risk/chatter stages
+QUERY_STAGE_TIMEOUT_SECONDS: float = float(_get_optional("QUERY_STAGE_TIMEOUT_SECONDS", "90"))
+
+# -----------------------------------------------------------------------------
+# SENTIMENT (FINBERT)
+# -----------------------------------------------------------------------------
+# Max texts per FinBERT forward pass
+SENTIMENT_BATCH_SIZE: int = max(1, int(_get_optional("SENTIMENT_BATCH_SIZE", "32")))
+# Max padded tokens (batch rows x longest row) per forward pass
+SENTIMENT_MAX_BATCH_TOKENS: int = max(512, int(_get_optional("SENTIMENT_MAX_BATCH_TOKENS", "8192")))
+# torch intra-op threads for inference (0 = all CPUs available to the process)
+SENTIMENT_TORCH_THREADS: int = int(_get_optional("SENTIMENT_TORCH_THREADS", "0"))
+
+# -----------------------------------------------------------------------------
+# LLM RESPONSE CACHE
+# -----------------------------------------------------------------------------
+# Reuse agent LLM responses for identical prompts and input data
+LLM_CACHE_ENABLED: bool = _get_optional("LLM_CACHE_ENABLED", "true").lower() in ("true", "1", "yes")
+# Data-freshness window: how long a cached response may be served
+LLM_CACHE_TTL_SECONDS: int = int(_get_optional("LLM_CACHE_TTL_SECONDS", "3600"))
+# SQLite file holding cached responses
+LLM_CACHE_PATH: str = _get_optional(
+    "LLM_CACHE_PATH", str(Path.home() / ".cache" / "vfis" / "llm_cache.sqlite3")
+)
 
 # -----------------------------------------------------------------------------
 # API CONFIGURATION
@@ -188,6 +222,12 @@ def get_env_status() -> dict:
             "active_tickers": ACTIVE_TICKERS,
             "interval_seconds": INGESTION_INTERVAL_SECONDS,
             "lookback_days": INGESTION_LOOKBACK_DAYS,
+            "spread_slots": INGESTION_SPREAD_SLOTS,
+        },
+        "llm_cache": {
+            "enabled": LLM_CACHE_ENABLED,
+            "ttl_seconds": LLM_CACHE_TTL_SECONDS,
+            "path": LLM_CACHE_PATH,
         },
         "api": {
             "host": API_HOST,
@@ -268,6 +308,22 @@ __all__ = [
     "ACTIVE_TICKERS",
     "INGESTION_INTERVAL_SECONDS",
     "INGESTION_LOOKBACK_DAYS",
+    "INGESTION_SPREAD_SLOTS",
+    "INGESTION_WATERMARK_OVERLAP_SECONDS",
+    "INGESTION_DEMAND_HALF_LIFE_SECONDS",
+    
+    # Query pipeline
+    "QUERY_STAGE_TIMEOUT_SECONDS",
+    
+    # Sentiment
+    "SENTIMENT_BATCH_SIZE",
+    "SENTIMENT_MAX_BATCH_TOKENS",
+    "SENTIMENT_TORCH_THREADS",
+    
+    # LLM response cache
+    "LLM_CACHE_ENABLED",
+    "LLM_CACHE_TTL_SECONDS",
+    "LLM_CACHE_PATH",
     
     # API
     "API_HOST",
@@ -185,7 +185,8 @@ def ensure_ticker_ingested(ticker: str, days: int = 7) -> Dict[str, Any]:
     """
     Ensure a ticker has been ingested.
     
-    Checks if ticker was already ingested this session. If not, runs ingestion.
+    Checks if ticker was already ingested (this session or per the persisted
+    watermarks). If not, runs ingestion.
     Use this for on-demand ingestion before queries.
     
     Args:
@@ -200,10 +201,15 @@ def ensure_ticker_ingested(ticker: str, days: int = 7) -> Dict[str, Any]:
             "message": str
         }
     """
-    from vfis.ingestion.scheduler import is_ticker_ingested, ingest_ticker_if_missing
+    from vfis.ingestion.scheduler import (
+        is_ticker_ingested, ingest_ticker_if_missing, record_query_demand
+    )
     
     ticker = ticker.upper()
     
+    # Queried tickers are refreshed with higher priority by the scheduler
+    record_query_demand(ticker)
+    
     try:
         if is_ticker_ingested(ticker):
             return {
@@ -0,0 +1,200 @@
+"""
+Background on-demand ingestion jobs for VFIS.
+
+A /query for a cold ticker must not block the API while chatter is
+fetched. Instead, ingestion for that ticker is submitted as a background
+job. Jobs are de-duplicated per ticker: concurrent requests for the same
+ticker share the running job and receive the same job handle, which can be
+polled via GET /ingestion/jobs/{job_id}.
+
+Usage:
+    from vfis.ingestion.jobs import submit_ingestion_job, get_ingestion_job
+
+    job = submit_ingestion_job("<TICKER>", days=7)
+    ...
+    job = get_ingestion_job(job.job_id)
+    if job.status == JOB_SUCCEEDED: ...
+"""
+
+import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+# Concurrent on-demand ingestions (each one already fans out per source)
+MAX_CONCURRENT_JOBS = 2
+
+# Finished jobs stay pollable for this long
+FINISHED_JOB_TTL_SECONDS = 3600
+
+# A ticker whose last job did not leave it ingested is retried after this long
+RETRY_INGESTION_AFTER_SECONDS = 300
+
+
+@dataclass
+class IngestionJob:
+    """Handle for one background on-demand ingestion."""
+    ticker: str
+    days: int
+    job_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: str = JOB_PENDING
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    finished_monotonic: Optional[float] = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in (JOB_SUCCEEDED, JOB_FAILED)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for API responses."""
+        return {
+            "job_id": self.job_id,
+            "ticker": self.ticker,
+            "days": self.days,
+            "status": self.status,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class IngestionJobManager:
+    """
+    Runs ingestion jobs on a small thread pool, one active job per ticker.
+
+    Thread-safe.
+    """
+
+    def __init__(self, max_workers: int = MAX_CONCURRENT_JOBS):
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, IngestionJob] = {}
+        self._active_by_ticker: Dict[str, IngestionJob] = {}
+        self._last_finished_by_ticker: Dict[str, IngestionJob] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="ingest-job"
+        )
+
+    def submit(self, ticker: str, days: int = 7) -> IngestionJob:
+        """
+        Start ingestion for a ticker, or join the job already running for it.
+
+        Args:
+            ticker: Ticker symbol
+            days: Days to look back
+
+        Returns:
+            The (possibly shared) job handle
+        """
+        ticker = ticker.upper()
+        with self._lock:
+            self._prune()
+            job = self._active_by_ticker.get(ticker)
+            if job is not None:
+                logger.debug(f"[INGEST_JOB] Joining job {job.job_id} for {ticker}")
+                return job
+
+            job = IngestionJob(ticker=ticker, days=days)
+            self._jobs[job.job_id] = job
+            self._active_by_ticker[ticker] = job
+
+        logger.info(f"[INGEST_JOB] Submitted job {job.job_id} for {ticker}")
+        self._executor.submit(self._run, job)
+        return job
+
+    def get(self, job_id: str) -> Optional[IngestionJob]:
+        """Return a job by id, or None if unknown or expired."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def active_job_for(self, ticker: str) -> Optional[IngestionJob]:
+        """Return the pending/running job for a ticker, if any."""
+        with self._lock:
+            return self._active_by_ticker.get(ticker.upper())
+
+    def last_finished_job_for(self, ticker: str) -> Optional[IngestionJob]:
+        """Return the most recent finished job for a ticker, if not expired."""
+        with self._lock:
+            return self._last_finished_by_ticker.get(ticker.upper())
+
+    def _run(self, job: IngestionJob) -> None:
+        from vfis.ingestion.scheduler import ingest_ticker_if_missing
+
+        job.status = JOB_RUNNING
+        job.started_at = datetime.utcnow()
+        try:
+            result = ingest_ticker_if_missing(job.ticker, days=job.days)
+            job.result = {
+                "already_ingested": result is None,
+                "fetched": (result or {}).get("total_fetched", 0),
+                "inserted": (result or {}).get("total_inserted", 0),
+                "errors": (result or {}).get("total_errors", 0),
+            }
+            job.status = JOB_SUCCEEDED
+        except Exception as e:
+            logger.error(f"[INGEST_JOB] Job {job.job_id} for {job.ticker} failed: {e}", exc_info=True)
+            job.error = str(e)
+            job.status = JOB_FAILED
+        finally:
+            job.finished_at = datetime.utcnow()
+            job.finished_monotonic = time.monotonic()
+            with self._lock:
+                if self._active_by_ticker.get(job.ticker) is job:
+                    del self._active_by_ticker[job.ticker]
+                self._last_finished_by_ticker[job.ticker] = job
+            logger.info(
+                f"[INGEST_JOB] Job {job.job_id} for {job.ticker} {job.status} "
+                f"in {(job.finished_at - job.started_at).total_seconds():.1f}s"
+            )
+
+    def _prune(self) -> None:
+        """Drop finished jobs past their TTL. Caller holds self._lock."""
+        cutoff = time.monotonic() - FINISHED_JOB_TTL_SECONDS
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished_monotonic is not None and job.finished_monotonic < cutoff
+        ]
+        for job_id in expired:
+            job = self._jobs.pop(job_id)
+            if self._last_finished_by_ticker.get(job.ticker) is job:
+                del self._last_finished_by_ticker[job.ticker]
+
+
+_manager: Optional[IngestionJobManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> IngestionJobManager:
+    """Get or create the process-wide job manager."""
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                _manager = IngestionJobManager()
+    return _manager
+
+
+def submit_ingestion_job(ticker: str, days: int = 7) -> IngestionJob:
+    """Submit (or join) background ingestion for a ticker."""
+    return get_job_manager().submit(ticker, days)
+
+
+def get_ingestion_job(job_id: str) -> Optional[IngestionJob]:
+    """Look up a background ingestion job by id."""
+    return get_job_manager().get(job_id)
@@ -24,6 +24,7 @@ from pathlib import Path
 from tradingagents.database.connection import get_db_connection, init_database
 from tradingagents.database.dal import FinancialDataAccess
 from tradingagents.database.audit import log_data_access
+from tradingagents.database.schema_registry import is_table_ready, invalidate_on_ddl_error
 
 logger = logging.getLogger(__name__)
 
@@ -182,13 +183,7 @@ class NewsIngester:
                     with get_db_connection() as conn:
                         with conn.cursor() as cur:
                             # Check if news table exists
-                            cur.execute("""
-                                SELECT EXISTS (
-                                    SELECT FROM information_schema.tables 
-                                    WHERE table_name = 'news'
-                                );
-                            """)
-                            if not cur.fetchone()[0]:
+                            if not is_table_ready('news', cur):
                                 results['errors'].append("News table does not exist")
                                 continue
                             
@@ -213,6 +208,7 @@ class NewsIngester:
                     conn.commit()
                 
                 except Exception as e:
+                    invalidate_on_ddl_error(e, 'news')
                     error_msg = f"Failed to insert article '{article['headline'][:50]}...': {str(e)}"
                     logger.warning(error_msg)
                     results['errors'].append(error_msg)
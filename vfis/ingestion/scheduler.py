@@ -3,7 +3,13 @@ Background ingestion scheduler for VFIS.
 
 Implements Option A: Scheduled Background Ingestion
 
-- Runs automatically every 5 minutes (configurable)
+- Freshness-driven: every (ticker, source) pair has a watermark persisted in
+  PostgreSQL (ingestion_watermarks), so a restart resumes incrementally
+- A priority queue orders due pairs by staleness and recent query demand;
+  hot tickers are refreshed more often than cold ones
+- Work is spread over INGESTION_SPREAD_SLOTS ticks per interval instead of
+  bursting the whole universe once per INGESTION_INTERVAL_SECONDS
+- Sources only keep items newer than the watermark (minus an overlap)
 - RSS ingestion by DEFAULT (no API key needed)
 - Alpha Vantage only if API key exists
 - Populates market_chatter table before API reads
@@ -12,16 +18,21 @@ Implements Option A: Scheduled Background Ingestion
 - Tickers discovered dynamically from database or env vars (NO HARDCODING)
 """
 
+import heapq
 import logging
+import math
 import threading
 import time
-from datetime import datetime
-from typing import List, Optional, Dict, Any, Set
+from datetime import datetime, timedelta
+from typing import List, Optional, Dict, Any, Set, Tuple
 
 # Import configuration from canonical source
 from vfis.core.env import (
     INGESTION_INTERVAL_SECONDS,
     INGESTION_LOOKBACK_DAYS,
+    INGESTION_SPREAD_SLOTS,
+    INGESTION_WATERMARK_OVERLAP_SECONDS,
+    INGESTION_DEMAND_HALF_LIFE_SECONDS,
     ACTIVE_TICKERS as ENV_ACTIVE_TICKERS,
     ALPHA_VANTAGE_AVAILABLE,
 )
@@ -32,6 +43,186 @@ logger = logging.getLogger(__name__)
 _ingested_tickers: Set[str] = set()
 _ingested_tickers_lock = threading.Lock()
 
+# Query demand: ticker -> (decayed score, monotonic time of last update)
+_query_demand: Dict[str, Tuple[float, float]] = {}
+_query_demand_lock = threading.Lock()
+
+# Demand at which a queried (non-active) ticker joins the refresh queue
+DEMAND_TRACK_THRESHOLD = 1.0
+
+# Upper bound on the demand boost: hot pairs refresh at most 1 + N times per interval
+MAX_DEMAND_BOOST = 3.0
+
+# Spare per-tick capacity so demand-boosted refreshes do not starve cold pairs
+TICK_BUDGET_HEADROOM = 1.5
+
+# Failed pairs back off exponentially, capped at this many intervals
+MAX_ERROR_BACKOFF = 8
+
+
+def record_query_demand(ticker: str) -> None:
+    """
+    Count one user query for a ticker.
+
+    Demand decays with a half-life of INGESTION_DEMAND_HALF_LIFE_SECONDS and
+    raises the refresh priority of the ticker in the scheduler queue.
+    """
+    ticker = ticker.upper()
+    now = time.monotonic()
+    with _query_demand_lock:
+        _query_demand[ticker] = (_decayed_demand(ticker, now) + 1.0, now)
+
+
+def get_query_demand(ticker: str) -> float:
+    """Return the current decayed query demand for a ticker."""
+    with _query_demand_lock:
+        return _decayed_demand(ticker.upper(), time.monotonic())
+
+
+def _decayed_demand(ticker: str, now: float) -> float:
+    """Decay a stored demand score to now. Caller holds _query_demand_lock."""
+    entry = _query_demand.get(ticker)
+    if entry is None:
+        return 0.0
+    score, updated = entry
+    if INGESTION_DEMAND_HALF_LIFE_SECONDS <= 0:
+        return score
+    return score * 0.5 ** ((now - updated) / INGESTION_DEMAND_HALF_LIFE_SECONDS)
+
+
+def _get_demanded_tickers() -> List[str]:
+    """Tickers whose recent query demand warrants scheduled refreshes."""
+    now = time.monotonic()
+    with _query_demand_lock:
+        for ticker in list(_query_demand):
+            if _decayed_demand(ticker, now) < 0.01:
+                del _query_demand[ticker]
+        return [
+            ticker for ticker in _query_demand
+            if _decayed_demand(ticker, now) >= DEMAND_TRACK_THRESHOLD
+        ]
+
+
+class FreshnessQueue:
+    """
+    Priority queue of (ticker, source) pairs keyed by staleness and demand.
+
+    A pair's refresh target is INGESTION_INTERVAL_SECONDS shortened by query
+    demand. A pair is due once its last success is older than the target
+    (failures back off from the last attempt instead). Due pairs are popped
+    in order of how overdue they are relative to their target; pairs never
+    ingested come first.
+    """
+
+    def __init__(self, interval_seconds: float):
+        self.interval_seconds = float(interval_seconds)
+        self._lock = threading.Lock()
+        self._pairs: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._loaded_tickers: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._pairs)
+
+    def sync(self, tickers: List[str], sources: List[str]) -> None:
+        """Track exactly tickers x sources, loading persisted watermarks for new tickers."""
+        wanted = {(t.upper(), s) for t in tickers for s in sources}
+        new_tickers = {t for t, _ in wanted} - self._loaded_tickers
+
+        persisted: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        if new_tickers:
+            from tradingagents.database.watermarks import load_watermarks
+            persisted = load_watermarks(new_tickers)
+            logger.info(
+                f"[SCHEDULER] Loaded {len(persisted)} persisted watermarks "
+                f"for {len(new_tickers)} tickers"
+            )
+
+        with self._lock:
+            for pair in list(self._pairs):
+                if pair not in wanted:
+                    del self._pairs[pair]
+            for pair in wanted:
+                if pair not in self._pairs:
+                    self._pairs[pair] = dict(persisted.get(pair) or {
+                        "watermark_at": None,
+                        "last_attempt_at": None,
+                        "last_success_at": None,
+                        "consecutive_errors": 0,
+                    })
+            self._loaded_tickers = {t for t, _ in wanted}
+
+    def _target_seconds(self, ticker: str) -> float:
+        demand = min(get_query_demand(ticker), MAX_DEMAND_BOOST)
+        return self.interval_seconds / (1.0 + demand)
+
+    def pop_due(self, now: datetime, limit: int) -> List[Tuple[str, str]]:
+        """
+        Return up to limit due pairs, most overdue first.
+
+        Args:
+            now: Current UTC time
+            limit: Maximum number of pairs to return
+        """
+        heap = []
+        with self._lock:
+            for (ticker, source), mark in self._pairs.items():
+                target = self._target_seconds(ticker)
+                last_success = mark["last_success_at"]
+                last_attempt = mark["last_attempt_at"]
+
+                if last_success is None and last_attempt is None:
+                    heapq.heappush(heap, (-math.inf, ticker, source))
+                    continue
+
+                if last_attempt is not None and (last_success is None or last_attempt > last_success):
+                    backoff = min(2 ** max(mark["consecutive_errors"] - 1, 0), MAX_ERROR_BACKOFF)
+                    due_at = last_attempt + timedelta(seconds=target * backoff)
+                else:
+                    due_at = last_success + timedelta(seconds=target)
+                if now < due_at:
+                    continue
+
+                reference = last_success or last_attempt
+                staleness = (now - reference).total_seconds() / target
+                heapq.heappush(heap, (-staleness, ticker, source))
+
+        return [(ticker, source) for _, ticker, source in heapq.nsmallest(limit, heap)]
+
+    def since_for(self, ticker: str, source: str) -> Optional[datetime]:
+        """Incremental lower bound for a pair: watermark minus the overlap window."""
+        with self._lock:
+            mark = self._pairs.get((ticker, source))
+            watermark = mark["watermark_at"] if mark else None
+        if watermark is None:
+            return None
+        return watermark - timedelta(seconds=INGESTION_WATERMARK_OVERLAP_SECONDS)
+
+    def record(self, ticker: str, source: str, attempted_at: datetime, success: bool) -> None:
+        """Update in-memory state after a fetch (mirrors record_watermarks)."""
+        with self._lock:
+            mark = self._pairs.get((ticker, source))
+            if mark is None:
+                return
+            mark["last_attempt_at"] = attempted_at
+            if success:
+                mark["watermark_at"] = attempted_at
+                mark["last_success_at"] = attempted_at
+                mark["consecutive_errors"] = 0
+            else:
+                mark["consecutive_errors"] += 1
+
+    def stats(self, now: datetime) -> Dict[str, Any]:
+        """Return queue size and staleness summary."""
+        with self._lock:
+            successes = [m["last_success_at"] for m in self._pairs.values() if m["last_success_at"]]
+            return {
+                "tracked_pairs": len(self._pairs),
+                "never_ingested": len(self._pairs) - len(successes),
+                "max_staleness_seconds": (
+                    round(max((now - s).total_seconds() for s in successes), 1) if successes else None
+                ),
+            }
+
 
 class IngestionScheduler:
     """
@@ -67,6 +258,10 @@ class IngestionScheduler:
         self._error_count = 0
         self._total_inserted = 0
         self._last_result: Optional[Dict[str, Any]] = None
+        self._tick_seconds = INGESTION_INTERVAL_SECONDS / INGESTION_SPREAD_SLOTS
+        self._tickers: List[str] = []
+        self._tickers_refreshed_at: Optional[float] = None
+        self.queue = FreshnessQueue(INGESTION_INTERVAL_SECONDS)
     
     def start(self):
         """Start the background ingestion scheduler."""
@@ -87,6 +282,7 @@ class IngestionScheduler:
             # Log configuration (using canonical env)
             logger.info(
                 f"[SCHEDULER] Started (interval={INGESTION_INTERVAL_SECONDS}s, "
+                f"tick={self._tick_seconds:.0f}s, "
                 f"lookback={INGESTION_LOOKBACK_DAYS}d, "
                 f"alpha_vantage={'enabled' if ALPHA_VANTAGE_AVAILABLE else 'disabled'})"
             )
@@ -119,6 +315,8 @@ class IngestionScheduler:
             "error_count": self._error_count,
             "total_inserted": self._total_inserted,
             "interval_seconds": INGESTION_INTERVAL_SECONDS,
+            "tick_seconds": self._tick_seconds,
+            "queue": self.queue.stats(datetime.utcnow()),
             "alpha_vantage_enabled": ALPHA_VANTAGE_AVAILABLE,
             "last_result": self._last_result
         }
@@ -130,49 +328,58 @@ class IngestionScheduler:
         # Run immediately on startup
         self._run_ingestion()
         
+        # Tick several times per interval so load is spread evenly
         while not self._stop_event.is_set():
-            if self._stop_event.wait(timeout=INGESTION_INTERVAL_SECONDS):
+            if self._stop_event.wait(timeout=self._tick_seconds):
                 break
             self._run_ingestion()
         
         logger.info("[SCHEDULER] Loop ended")
     
-    def _run_ingestion(self):
-        """Execute one ingestion cycle."""
-        self._run_count += 1
-        self._last_run = datetime.utcnow()
-        
-        logger.info(f"[SCHEDULER] Starting cycle #{self._run_count}")
+    def _refresh_tickers(self) -> List[str]:
+        """Re-discover active tickers at most once per interval."""
+        now = time.monotonic()
+        if (self._tickers_refreshed_at is None
+                or now - self._tickers_refreshed_at >= INGESTION_INTERVAL_SECONDS):
+            self._tickers = get_active_tickers()
+            self._tickers_refreshed_at = now
         
+        # Tickers users keep querying stay fresh even if they are not active
+        demanded = [t for t in _get_demanded_tickers() if t not in self._tickers]
+        return self._tickers + demanded
+    
+    def _run_ingestion(self):
+        """Execute one scheduler tick: refresh the most overdue pairs."""
         try:
             # Get tickers dynamically - NO HARDCODED FALLBACK
-            tickers = get_active_tickers()
+            tickers = self._refresh_tickers()
             
             if not tickers:
                 logger.warning("[SCHEDULER] No active tickers found - nothing to ingest")
                 logger.warning("[SCHEDULER] Set ACTIVE_TICKERS env var or add companies to database")
                 return
             
-            logger.info(f"[SCHEDULER] Ingesting for {len(tickers)} tickers: {tickers[:5]}{'...' if len(tickers) > 5 else ''}")
+            self.queue.sync(tickers, _get_available_sources())
+            budget = math.ceil(len(self.queue) * TICK_BUDGET_HEADROOM / INGESTION_SPREAD_SLOTS)
+            pairs = self.queue.pop_due(datetime.utcnow(), budget)
+            
+            if not pairs:
+                logger.debug(f"[SCHEDULER] Nothing due across {len(self.queue)} pairs")
+                return
+            
+            self._run_count += 1
+            self._last_run = datetime.utcnow()
+            logger.info(
+                f"[SCHEDULER] Starting cycle #{self._run_count}: {len(pairs)} due pairs "
+                f"of {len(self.queue)} (budget={budget})"
+            )
             
-            # Run ingestion
-            result = ingest_for_tickers(tickers, days=INGESTION_LOOKBACK_DAYS)
+            since = {pair: self.queue.since_for(*pair) for pair in pairs}
+            result = ingest_for_pairs(pairs, days=INGESTION_LOOKBACK_DAYS, since=since)
             
             self._last_result = result
             self._total_inserted += result.get("total_inserted", 0)
             
-            # Track ingested tickers
-            with _ingested_tickers_lock:
-                _ingested_tickers.update(tickers)
-            
-            # Warn if nothing inserted
-            if result.get("total_inserted", 0) == 0 and result.get("total_fetched", 0) > 0:
-                logger.warning(
-                    f"[SCHEDULER] Zero new records from {result.get('total_fetched', 0)} fetched items"
-                )
-            elif result.get("total_fetched", 0) == 0:
-                logger.warning("[SCHEDULER] Zero items fetched - check data sources")
-            
             logger.info(
                 f"[SCHEDULER] Cycle #{self._run_count} complete: "
                 f"fetched={result.get('total_fetched', 0)}, "
@@ -241,6 +448,9 @@ def ingest_for_tickers(
     - Generic RSS feeds (free)
     - Alpha Vantage (only if ALPHA_VANTAGE_API_KEY exists)
     
+    Runs the full lookback window for every source and advances the
+    watermarks of the pairs that succeeded.
+    
     Args:
         tickers: List of ticker symbols (dynamic, not hardcoded)
         days: Days to look back
@@ -248,17 +458,43 @@ def ingest_for_tickers(
     Returns:
         Aggregated results dict
     """
+    pairs = [(t.upper(), source) for t in tickers for source in _get_available_sources()]
+    results = ingest_for_pairs(pairs, days=days)
+    results["tickers"] = tickers
+    return results
+
+
+def ingest_for_pairs(
+    pairs: List[Tuple[str, str]],
+    days: int = 7,
+    since: Optional[Dict[Tuple[str, str], Optional[datetime]]] = None
+) -> Dict[str, Any]:
+    """
+    Ingest specific (ticker, source) pairs and record their watermarks.
+    
+    Args:
+        pairs: List of (ticker, source) tuples
+        days: Days to look back
+        since: Optional per-pair incremental lower bound on published_at
+    
+    Returns:
+        Aggregated results dict (same shape as ingest_for_tickers)
+    """
     # Use CANONICAL ingestion module - no duplicate logic
-    from tradingagents.dataflows.ingest_chatter import ingest_universe
+    from tradingagents.dataflows.ingest_chatter import ingest_pairs
     
-    logger.info(f"[SCHEDULER] Delegating to canonical ingest_universe for {len(tickers)} tickers")
+    tickers = list(dict.fromkeys(ticker for ticker, _ in pairs))
+    sources_run = {source for _, source in pairs}
+    logger.info(
+        f"[SCHEDULER] Delegating {len(pairs)} pairs for {len(tickers)} tickers "
+        f"to canonical ingest_pairs"
+    )
     
-    # Run canonical ingestion
-    result = ingest_universe(tickers, days=days)
+    attempted_at = datetime.utcnow()
+    since = {pair: value for pair, value in (since or {}).items() if value is not None}
+    result = ingest_pairs(pairs, days=days, since=since)
     
-    # Track all tickers as ingested
-    with _ingested_tickers_lock:
-        _ingested_tickers.update([t.upper() for t in tickers])
+    _record_outcomes(result, attempted_at)
     
     # Build results in expected format
     results = {
@@ -268,7 +504,7 @@ def ingest_for_tickers(
         "total_inserted": result["summary"]["total_inserted"],
         "total_skipped": result["summary"]["total_skipped"],
         "total_errors": result["summary"]["total_errors"],
-        "sources_used": _get_available_sources(),
+        "sources_used": [s for s in _get_available_sources() if s in sources_run],
         "ticker_results": {},
         "timestamp": result["timestamp"]
     }
@@ -286,9 +522,45 @@ def ingest_for_tickers(
             }
         }
     
+    # Warn if nothing inserted
+    if results["total_inserted"] == 0 and results["total_fetched"] > 0:
+        logger.warning(
+            f"[SCHEDULER] Zero new records from {results['total_fetched']} fetched items"
+        )
+    
     return results
 
 
+def _record_outcomes(result: Dict[str, Any], attempted_at: datetime) -> None:
+    """Persist per-pair watermarks and mirror them into the scheduler queue."""
+    from tradingagents.database.watermarks import record_watermarks
+    
+    updates = []
+    for ticker, ticker_data in result.get("results", {}).items():
+        for source, source_data in ticker_data.get("sources", {}).items():
+            # Partial failures (e.g. one subreddit) still advance the watermark
+            success = "error" not in source_data and (
+                source_data.get("errors", 0) == 0 or source_data.get("fetched", 0) > 0
+            )
+            updates.append({
+                "ticker": ticker,
+                "source": source,
+                "attempted_at": attempted_at,
+                "success": success,
+                "fetched": source_data.get("fetched", 0),
+                "inserted": source_data.get("inserted", 0),
+            })
+    
+    record_watermarks(updates)
+    
+    queue = get_scheduler().queue
+    for update in updates:
+        queue.record(update["ticker"], update["source"], attempted_at, update["success"])
+    
+    with _ingested_tickers_lock:
+        _ingested_tickers.update(u["ticker"] for u in updates if u["success"])
+
+
 def _get_available_sources() -> List[str]:
     """Get list of available sources."""
     sources = ["google_news", "yahoo_finance", "reddit", "rss"]
@@ -298,9 +570,24 @@ def _get_available_sources() -> List[str]:
 
 
 def is_ticker_ingested(ticker: str) -> bool:
-    """Check if a ticker has been ingested this session."""
+    """
+    Check if a ticker has been ingested.
+    
+    Consults the in-process set first, then the persisted watermarks, so a
+    restart does not trigger on-demand re-ingestion of known tickers.
+    """
+    ticker = ticker.upper()
     with _ingested_tickers_lock:
-        return ticker.upper() in _ingested_tickers
+        if ticker in _ingested_tickers:
+            return True
+    
+    from tradingagents.database.watermarks import get_ticker_last_success
+    if get_ticker_last_success(ticker) is None:
+        return False
+    
+    with _ingested_tickers_lock:
+        _ingested_tickers.add(ticker)
+    return True
 
 
 def ingest_ticker_if_missing(ticker: str, days: int = 7) -> Optional[Dict[str, Any]]:
@@ -319,10 +606,9 @@ def ingest_ticker_if_missing(ticker: str, days: int = 7) -> Optional[Dict[str, A
     """
     ticker = ticker.upper()
     
-    with _ingested_tickers_lock:
-        if ticker in _ingested_tickers:
-            logger.debug(f"[INGEST] Ticker {ticker} already ingested this session")
-            return None
+    if is_ticker_ingested(ticker):
+        logger.debug(f"[INGEST] Ticker {ticker} already ingested")
+        return None
     
     logger.info(f"[INGEST] On-demand ingestion triggered for {ticker}")
     result = ingest_for_tickers([ticker], days=days)
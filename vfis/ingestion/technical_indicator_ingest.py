@@ -16,8 +16,20 @@ import scripts.init_env  # Loads and validates environment variables
 import logging
 from datetime import date, timedelta
 from typing import Dict, Any
-from vfis.tools.technical_indicators import TechnicalIndicators, store_technical_indicators
-from tradingagents.database.connection import init_database
+import pandas as pd
+from vfis.tools.technical_indicators import (
+    IncrementalIndicatorEngine,
+    TechnicalIndicators,
+    ensure_indicator_state_table,
+    fetch_ohlc_bars,
+    get_company_id,
+    indicator_rows,
+    load_indicator_state,
+    lock_indicator_state,
+    save_indicator_state,
+    upsert_indicator_rows,
+)
+from tradingagents.database.connection import get_db_connection, init_database
 from tradingagents.database.audit import log_data_access
 
 logger = logging.getLogger(__name__)
@@ -49,66 +61,81 @@ class TechnicalIndicatorIngester:
         self,
         start_date: date,
         end_date: date,
-        source: str = 'computed'
+        source: str = 'computed',
+        full_refresh: bool = False
     ) -> Dict[str, Any]:
         """
         Compute and store all technical indicators.
         
+        Indicators are computed over the full stored OHLC history. When an
+        engine state exists for the ticker, only bars after its last date are
+        processed (start_date is then ignored); otherwise, or with
+        full_refresh, the history is recomputed and values from start_date
+        onward are stored. Values and the new state are written in one
+        transaction.
+        
         Args:
-            start_date: Start date for computation
-            end_date: End date for computation
+            start_date: First date to store on a full recompute
+            end_date: Last bar to include
             source: Source identifier (default 'computed')
+            full_refresh: Ignore the stored state (e.g. after OHLC corrections)
             
         Returns:
             Dictionary with ingestion results
         """
         results = {
             'success': False,
+            'mode': 'full',
+            'bars_processed': 0,
             'indicators_computed': 0,
             'records_inserted': 0,
             'errors': []
         }
         
+        # Without the state table every run is a full recompute
+        state_available = ensure_indicator_state_table()
+        
         try:
-            # Compute all indicators
-            indicators_df = self.indicator_computer.compute_all_indicators(
-                start_date=start_date,
-                end_date=end_date
-            )
-            
-            if indicators_df.empty:
-                results['errors'].append(f"No OHLC data available for {self.ticker}")
-                logger.warning(f"No indicators computed for {self.ticker}: No OHLC data")
-                return results
-            
-            # Store each indicator
-            indicator_names = [
-                'sma_20', 'sma_50', 'sma_200',
-                'ema_12', 'ema_26',
-                'rsi',
-                'macd', 'macd_signal', 'macd_histogram',
-                'bb_upper', 'bb_middle', 'bb_lower',
-                'stoch_k', 'stoch_d'
-            ]
+            with get_db_connection() as conn:
+                with conn.cursor() as cur:
+                    company_id = get_company_id(cur, self.ticker)
+                    if company_id is None:
+                        results['errors'].append(f"Company {self.ticker} not found in database")
+                        logger.error(f"Company {self.ticker} not found in database")
+                        return results
+                    
+                    state = None
+                    if state_available:
+                        lock_indicator_state(cur, self.ticker)
+                        if not full_refresh:
+                            state = load_indicator_state(cur, self.ticker)
+                    engine = IncrementalIndicatorEngine(state)
+                    if state is not None:
+                        results['mode'] = 'incremental'
+                        bars = fetch_ohlc_bars(cur, self.ticker, end_date, after=engine.last_date)
+                    else:
+                        bars = fetch_ohlc_bars(cur, self.ticker, end_date)
+                    
+                    if not bars:
+                        if state is None:
+                            results['errors'].append(f"No OHLC data available for {self.ticker}")
+                            logger.warning(f"No indicators computed for {self.ticker}: No OHLC data")
+                        else:
+                            results['success'] = True
+                            logger.info(f"Indicators for {self.ticker} are up to date ({engine.last_date})")
+                        return results
+                    
+                    indicators_df = engine.update(bars)
+                    if state is None:
+                        indicators_df = indicators_df[indicators_df.index >= pd.Timestamp(start_date)]
+                    
+                    rows = indicator_rows(company_id, indicators_df, source)
+                    results['bars_processed'] = len(bars)
+                    results['indicators_computed'] = len({row[1] for row in rows})
+                    results['records_inserted'] = upsert_indicator_rows(cur, rows)
+                    if state_available:
+                        save_indicator_state(cur, self.ticker, engine)
             
-            total_records = 0
-            for indicator_name in indicator_names:
-                if indicator_name in indicators_df.columns:
-                    try:
-                        records = store_technical_indicators(
-                            ticker=self.ticker,
-                            indicator_name=indicator_name,
-                            indicator_values=indicators_df[indicator_name],
-                            source=source
-                        )
-                        total_records += records
-                        results['indicators_computed'] += 1
-                    except Exception as e:
-                        error_msg = f"Failed to store {indicator_name}: {str(e)}"
-                        logger.error(error_msg)
-                        results['errors'].append(error_msg)
-            
-            results['records_inserted'] = total_records
             results['success'] = True
             
             # Log audit
@@ -120,6 +147,8 @@ class TechnicalIndicatorIngester:
                     'ticker': self.ticker,
                     'start_date': start_date.isoformat(),
                     'end_date': end_date.isoformat(),
+                    'mode': results['mode'],
+                    'bars_processed': results['bars_processed'],
                     'indicators_computed': results['indicators_computed'],
                     'records_inserted': results['records_inserted'],
                     'source': source
@@ -129,7 +158,8 @@ class TechnicalIndicatorIngester:
             
             logger.info(
                 f"Computed and stored {results['indicators_computed']} indicators "
-                f"for {self.ticker}: {results['records_inserted']} records"
+                f"for {self.ticker} ({results['mode']}, {results['bars_processed']} bars): "
+                f"{results['records_inserted']} records"
             )
             
         except Exception as e:
@@ -144,7 +174,8 @@ def ingest_technical_indicators(
     ticker: str,
     start_date: date,
     end_date: date,
-    source: str = 'computed'
+    source: str = 'computed',
+    full_refresh: bool = False
 ) -> Dict[str, Any]:
     """
     Convenience function to ingest technical indicators.
@@ -154,6 +185,7 @@ def ingest_technical_indicators(
         start_date: Start date for computation
         end_date: End date for computation
         source: Source identifier
+        full_refresh: Recompute the full history instead of new bars only
         
     Returns:
         Dictionary with ingestion results
@@ -162,7 +194,8 @@ def ingest_technical_indicators(
     return ingester.ingest_indicators(
         start_date=start_date,
         end_date=end_date,
-        source=source
+        source=source,
+        full_refresh=full_refresh
     )
 
 
@@ -214,6 +247,12 @@ Examples:
         help='Source identifier (default: computed)'
     )
     
+    parser.add_argument(
+        '--full-refresh',
+        action='store_true',
+        help='Recompute indicators over the full OHLC history (default: only new bars)'
+    )
+    
     parser.add_argument(
         '--log-level',
         type=str,
@@ -244,7 +283,8 @@ Examples:
             ticker=args.ticker,
             start_date=start_date,
             end_date=end_date,
-            source=args.source
+            source=args.source,
+            full_refresh=args.full_refresh
         )
         
         # Print summary
@@ -254,6 +294,7 @@ Examples:
         print(f"Ticker: {args.ticker}")
         print(f"Start date: {start_date.isoformat()}")
         print(f"End date: {end_date.isoformat()}")
+        print(f"Mode: {results['mode']} ({results['bars_processed']} bars)")
         print(f"Indicators computed: {results['indicators_computed']}")
         print(f"Records inserted: {results['records_inserted']}")
         print(f"Success: {results['success']}")
@@ -26,7 +26,7 @@ from typing import List, Dict, Set
 from datetime import datetime
 
 from vfis.market_chatter.sources import NewsSource, TwitterSource, RedditSource
-from vfis.market_chatter.sentiment import analyze_sentiment
+from vfis.market_chatter.sentiment import analyze_sentiment_batch
 
 logger = logging.getLogger(__name__)
 
@@ -83,22 +83,20 @@ class MarketChatterAggregator:
         normalized = self._normalize_chatter(all_chatter)
         deduplicated = self._deduplicate(normalized)
         
-        # Add sentiment analysis
-        enriched = []
-        for item in deduplicated:
-            try:
-                sentiment_result = analyze_sentiment(item["content"])
-                item["sentiment_score"] = sentiment_result["sentiment_score"]
-                item["sentiment_label"] = sentiment_result["sentiment_label"]
-                item["confidence"] = sentiment_result["confidence"]
-                enriched.append(item)
-            except Exception as e:
-                logger.warning(f"Sentiment analysis failed for item: {e}")
-                # Add item without sentiment
-                item["sentiment_score"] = None
-                item["sentiment_label"] = None
-                item["confidence"] = None
-                enriched.append(item)
+        # Add sentiment analysis (one batched pass over all items)
+        enriched = deduplicated
+        try:
+            sentiment_results = analyze_sentiment_batch([item["content"] for item in enriched])
+        except Exception as e:
+            logger.warning(f"Sentiment analysis failed for items: {e}")
+            # Add items without sentiment
+            sentiment_results = [
+                {"sentiment_score": None, "sentiment_label": None, "confidence": None}
+            ] * len(enriched)
+        for item, sentiment_result in zip(enriched, sentiment_results):
+            item["sentiment_score"] = sentiment_result["sentiment_score"]
+            item["sentiment_label"] = sentiment_result["sentiment_label"]
+            item["confidence"] = sentiment_result["confidence"]
         
         logger.info(f"Aggregated {len(enriched)} unique chatter items for {ticker}")
         return enriched
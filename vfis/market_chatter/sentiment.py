@@ -4,13 +4,28 @@ Sentiment analysis engine for market chatter.
 Implements hybrid sentiment analysis:
 - Phase 1: Rule-based lexicon with financial polarity weighting
 - Phase 2: FinBERT (optional, auto-detected if available)
+
+The FinBERT model is loaded once per process and shared by all analyzers
+(get_sentiment_analyzer() returns the process-wide analyzer). Lists of
+texts are scored with analyze_batch(): texts are truncated on tokens, not
+characters, sorted by token length and packed into dynamic batches bounded
+by SENTIMENT_BATCH_SIZE rows and SENTIMENT_MAX_BATCH_TOKENS padded tokens,
+so short posts are not padded to the length of long articles.
 """
 
 import logging
+import os
 import re
-from typing import Dict, Tuple, Optional
+import threading
+from typing import Dict, List, Tuple, Optional
 from collections import Counter
 
+from vfis.core.env import (
+    SENTIMENT_BATCH_SIZE,
+    SENTIMENT_MAX_BATCH_TOKENS,
+    SENTIMENT_TORCH_THREADS,
+)
+
 logger = logging.getLogger(__name__)
 
 # Try to import FinBERT (optional)
@@ -24,6 +39,9 @@ except ImportError:
     logger.info("FinBERT not available - using rule-based sentiment analysis only")
 
 
+FINBERT_MODEL_NAME = "ProsusAI/finbert"
+FINBERT_MAX_TOKENS = 512
+
 # Financial lexicon with polarity scores (-1.0 to +1.0)
 FINANCIAL_LEXICON = {
     # Positive terms
@@ -56,34 +74,310 @@ NEGATION_PATTERNS = [
     r"aren't\s+\w+",
 ]
 
+# Negation cue words (the words NEGATION_PATTERNS start with)
+NEGATION_CUES = ("not", "no", "never", "can't", "won't", "doesn't", "isn't", "aren't")
+
+
+def _rule_based_result(scores: List[float]) -> Dict[str, float]:
+    """Turn the polarity scores of matched lexicon terms into a sentiment result."""
+    if not scores:
+        return {
+            "sentiment_score": 0.0,
+            "sentiment_label": "neutral",
+            "confidence": 0.3
+        }
+    
+    # Average score, normalized to -1.0 to +1.0
+    avg_score = sum(scores) / len(scores)
+    # Clip to valid range
+    sentiment_score = max(-1.0, min(1.0, avg_score))
+    
+    # Determine label
+    if sentiment_score > 0.2:
+        sentiment_label = "positive"
+    elif sentiment_score < -0.2:
+        sentiment_label = "negative"
+    else:
+        sentiment_label = "neutral"
+    
+    # Confidence based on absolute score magnitude
+    confidence = min(0.9, abs(sentiment_score) * 1.5)
+    
+    return {
+        "sentiment_score": round(sentiment_score, 3),
+        "sentiment_label": sentiment_label,
+        "confidence": round(confidence, 3)
+    }
+
+
+class LexiconScorer:
+    """
+    Rule-based lexicon scorer built on precompiled patterns.
+    
+    All lexicon terms are matched in one pass by a single alternation
+    (whole words only, like the word tokenization it replaces), and
+    the negation patterns are folded into one search, so the cost per text
+    no longer grows with lexicon size.
+    
+    Negation:
+    - negation_window=None (default): a negation anywhere in the text flips
+      and halves every matched term, as the original scorer did.
+    - negation_window=N: only terms within N tokens after a negation cue
+      are flipped.
+    """
+    
+    def __init__(
+        self,
+        lexicon: Dict[str, float] = FINANCIAL_LEXICON,
+        negation_window: Optional[int] = None
+    ):
+        """
+        Compile the matcher.
+        
+        Args:
+            lexicon: Term -> polarity (-1.0 to +1.0); terms are single words
+            negation_window: Tokens after a negation cue that it applies to
+                (None = whole text)
+        """
+        self.lexicon = {term.lower(): score for term, score in lexicon.items()}
+        self.negation_window = negation_window
+        
+        # Longest first so no term shadows a longer one sharing its prefix
+        terms = sorted(self.lexicon, key=len, reverse=True)
+        self._term_pattern = re.compile(
+            r"(?<!\w)(?:" + "|".join(re.escape(t) for t in terms) + r")(?!\w)"
+        )
+        # Same matches as any(re.search(p) for p in NEGATION_PATTERNS)
+        self._negation_pattern = re.compile(
+            "(?:" + "|".join(re.escape(c) for c in NEGATION_CUES) + r")\s+\w"
+        )
+        self._token_pattern = re.compile(r"\w+(?:'\w+)?")
+        self._cues = frozenset(NEGATION_CUES)
+    
+    def score(self, text: str) -> Dict[str, float]:
+        """
+        Score one text.
+        
+        Args:
+            text: Text to analyze
+            
+        Returns:
+            Sentiment result dictionary
+        """
+        text_lower = text.lower()
+        if self.negation_window is not None:
+            return _rule_based_result(self._windowed_scores(text_lower))
+        
+        lexicon = self.lexicon
+        scores = [lexicon[m] for m in self._term_pattern.findall(text_lower)]
+        
+        # Flip score if negation detected, reducing magnitude for negated sentiment
+        if scores and self._negation_pattern.search(text_lower):
+            scores = [-score * 0.5 if score != 0 else score for score in scores]
+        
+        return _rule_based_result(scores)
+    
+    def score_batch(self, texts: List[str]) -> List[Dict[str, float]]:
+        """
+        Score many texts.
+        
+        Args:
+            texts: Texts to analyze
+            
+        Returns:
+            One sentiment result dictionary per text, in input order
+        """
+        return [self.score(text) for text in texts]
+    
+    def _windowed_scores(self, text_lower: str) -> List[float]:
+        """Lexicon scores with negation limited to negation_window tokens."""
+        lexicon = self.lexicon
+        scores = []
+        negated_until = -1
+        for index, token in enumerate(self._token_pattern.findall(text_lower)):
+            if token in self._cues:
+                negated_until = index + self.negation_window
+            elif token in lexicon:
+                score = lexicon[token]
+                if index <= negated_until and score != 0:
+                    score = -score * 0.5
+                scores.append(score)
+        return scores
+
+
+_lexicon_scorer = LexiconScorer()
+
+
+def _configure_torch_threads() -> None:
+    """Use all available cores for intra-op work and one inter-op thread."""
+    num_threads = SENTIMENT_TORCH_THREADS
+    if num_threads <= 0:
+        try:
+            num_threads = len(os.sched_getaffinity(0))
+        except AttributeError:
+            num_threads = os.cpu_count() or 1
+    torch.set_num_threads(num_threads)
+    try:
+        # Only settable before the first parallel op in the process
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass
+    logger.info(f"[SENTIMENT] torch using {num_threads} intra-op threads")
+
+
+class FinBertModel:
+    """
+    FinBERT tokenizer and model with batched CPU inference.
+    
+    Load once per process via get_finbert_model().
+    """
+    
+    def __init__(self, model_name: str = FINBERT_MODEL_NAME):
+        """
+        Load the FinBERT tokenizer and model.
+        
+        Args:
+            model_name: Hugging Face model name
+        """
+        _configure_torch_threads()
+        logger.info(f"Loading FinBERT model: {model_name}")
+        self.model_name = model_name
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        self.model = AutoModelForSequenceClassification.from_pretrained(model_name)
+        self.model.eval()  # Set to evaluation mode
+        
+        # FinBERT labels: [positive, negative, neutral]; read from config when present
+        label2id = {k.lower(): v for k, v in (self.model.config.label2id or {}).items()}
+        self.positive_index = label2id.get("positive", 0)
+        self.negative_index = label2id.get("negative", 1)
+        logger.info("FinBERT model loaded successfully")
+    
+    def predict(
+        self,
+        texts: List[str],
+        batch_size: int = SENTIMENT_BATCH_SIZE,
+        max_batch_tokens: int = SENTIMENT_MAX_BATCH_TOKENS
+    ) -> List[Tuple[float, float]]:
+        """
+        Score texts in length-bucketed dynamic batches.
+        
+        Args:
+            texts: Non-empty texts to score
+            batch_size: Max texts per forward pass
+            max_batch_tokens: Max padded tokens per forward pass
+            
+        Returns:
+            (positive, negative) probabilities per text, in input order
+        """
+        # Token-accurate truncation; no padding until batches are formed
+        encodings = self.tokenizer(
+            texts,
+            truncation=True,
+            max_length=FINBERT_MAX_TOKENS
+        )["input_ids"]
+        
+        order = sorted(range(len(texts)), key=lambda i: len(encodings[i]))
+        results: List[Optional[Tuple[float, float]]] = [None] * len(texts)
+        
+        batch: List[int] = []
+        for index in order:
+            # Rows are sorted, so the new row is the longest in the batch
+            longest = len(encodings[index])
+            if batch and (len(batch) >= batch_size or longest * (len(batch) + 1) > max_batch_tokens):
+                self._predict_batch(batch, encodings, results)
+                batch = []
+            batch.append(index)
+        if batch:
+            self._predict_batch(batch, encodings, results)
+        
+        return results
+    
+    def _predict_batch(
+        self,
+        batch: List[int],
+        encodings: List[List[int]],
+        results: List[Optional[Tuple[float, float]]]
+    ) -> None:
+        inputs = self.tokenizer.pad(
+            {"input_ids": [encodings[i] for i in batch]},
+            return_tensors="pt"
+        )
+        with torch.inference_mode():
+            logits = self.model(**inputs).logits
+            predictions = torch.nn.functional.softmax(logits, dim=-1).tolist()
+        for index, probabilities in zip(batch, predictions):
+            results[index] = (probabilities[self.positive_index], probabilities[self.negative_index])
+
+
+_finbert_model: Optional[FinBertModel] = None
+_finbert_load_attempted = False
+_finbert_lock = threading.Lock()
+
+
+def get_finbert_model() -> Optional[FinBertModel]:
+    """
+    Get the process-wide FinBERT model, loading it on first use.
+    
+    Returns:
+        FinBertModel, or None if transformers/torch are missing or loading failed
+    """
+    global _finbert_model, _finbert_load_attempted
+    if _finbert_load_attempted or not FINBERT_AVAILABLE:
+        return _finbert_model
+    
+    with _finbert_lock:
+        if not _finbert_load_attempted:
+            try:
+                _finbert_model = FinBertModel()
+            except Exception as e:
+                logger.warning(f"Failed to load FinBERT model: {e}. Using rule-based only.")
+                _finbert_model = None
+            _finbert_load_attempted = True
+    return _finbert_model
+
+
+def finbert_sentiment_result(positive_score: float, negative_score: float) -> Dict[str, float]:
+    """
+    Convert FinBERT class probabilities to a sentiment result.
+    
+    Args:
+        positive_score: Probability of the positive class
+        negative_score: Probability of the negative class
+    
+    Returns:
+        Sentiment result dictionary
+    """
+    # Convert to -1.0 to +1.0 scale
+    sentiment_score = positive_score - negative_score
+    
+    # Determine label
+    if sentiment_score > 0.15:
+        sentiment_label = "positive"
+    elif sentiment_score < -0.15:
+        sentiment_label = "negative"
+    else:
+        sentiment_label = "neutral"
+    
+    # Confidence is the distance from neutral
+    confidence = abs(sentiment_score)
+    
+    return {
+        "sentiment_score": round(sentiment_score, 3),
+        "sentiment_label": sentiment_label,
+        "confidence": round(confidence, 3)
+    }
+
 
 class SentimentAnalyzer:
     """
     Hybrid sentiment analyzer with rule-based and FinBERT options.
+    
+    Cheap to construct: the FinBERT model is shared process-wide.
     """
     
     def __init__(self):
         """Initialize sentiment analyzer."""
-        self.finbert_model = None
-        self.finbert_tokenizer = None
-        self._initialize_finbert()
-    
-    def _initialize_finbert(self):
-        """Initialize FinBERT model if available."""
-        if not FINBERT_AVAILABLE:
-            return
-        
-        try:
-            model_name = "ProsusAI/finbert"
-            logger.info(f"Loading FinBERT model: {model_name}")
-            self.finbert_tokenizer = AutoTokenizer.from_pretrained(model_name)
-            self.finbert_model = AutoModelForSequenceClassification.from_pretrained(model_name)
-            self.finbert_model.eval()  # Set to evaluation mode
-            logger.info("FinBERT model loaded successfully")
-        except Exception as e:
-            logger.warning(f"Failed to load FinBERT model: {e}. Using rule-based only.")
-            self.finbert_model = None
-            self.finbert_tokenizer = None
+        self.finbert = get_finbert_model()
     
     def analyze(self, text: str, use_finbert: bool = True) -> Dict[str, float]:
         """
@@ -99,78 +393,47 @@ class SentimentAnalyzer:
             - sentiment_label: "positive", "neutral", or "negative"
             - confidence: float between 0.0 and 1.0
         """
-        if not text or not text.strip():
-            return {
-                "sentiment_score": 0.0,
-                "sentiment_label": "neutral",
-                "confidence": 0.0
-            }
-        
-        # Try FinBERT first if available and requested
-        if use_finbert and self.finbert_model and self.finbert_tokenizer:
-            try:
-                finbert_result = self._analyze_with_finbert(text)
-                if finbert_result:
-                    return finbert_result
-            except Exception as e:
-                logger.warning(f"FinBERT analysis failed: {e}. Falling back to rule-based.")
-        
-        # Fall back to rule-based analysis
-        return self._analyze_rule_based(text)
+        return self.analyze_batch([text], use_finbert=use_finbert)[0]
     
-    def _analyze_with_finbert(self, text: str) -> Optional[Dict[str, float]]:
+    def analyze_batch(self, texts: List[str], use_finbert: bool = True) -> List[Dict[str, float]]:
         """
-        Analyze sentiment using FinBERT.
+        Analyze sentiment of many texts.
         
         Args:
-            text: Text to analyze
+            texts: Texts to analyze
+            use_finbert: Whether to use FinBERT if available (default: True)
             
         Returns:
-            Sentiment result dictionary or None if analysis fails
+            One result dictionary per text (see analyze()), in input order
         """
-        try:
-            # Tokenize and encode
-            inputs = self.finbert_tokenizer(
-                text[:512],  # FinBERT max length
-                return_tensors="pt",
-                truncation=True,
-                padding=True,
-                max_length=512
-            )
-            
-            # Get predictions
-            with torch.no_grad():
-                outputs = self.finbert_model(**inputs)
-                predictions = torch.nn.functional.softmax(outputs.logits, dim=-1)
-            
-            # FinBERT labels: [positive, negative, neutral]
-            positive_score = predictions[0][0].item()
-            negative_score = predictions[0][1].item()
-            neutral_score = predictions[0][2].item()
-            
-            # Convert to -1.0 to +1.0 scale
-            sentiment_score = positive_score - negative_score
-            
-            # Determine label
-            if sentiment_score > 0.15:
-                sentiment_label = "positive"
-            elif sentiment_score < -0.15:
-                sentiment_label = "negative"
+        results: List[Optional[Dict[str, float]]] = [None] * len(texts)
+        pending = []
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                results[i] = {
+                    "sentiment_score": 0.0,
+                    "sentiment_label": "neutral",
+                    "confidence": 0.0
+                }
             else:
-                sentiment_label = "neutral"
-            
-            # Confidence is the distance from neutral
-            confidence = abs(sentiment_score)
-            
-            return {
-                "sentiment_score": round(sentiment_score, 3),
-                "sentiment_label": sentiment_label,
-                "confidence": round(confidence, 3)
-            }
-            
-        except Exception as e:
-            logger.error(f"Error in FinBERT analysis: {e}", exc_info=True)
-            return None
+                pending.append(i)
+        
+        # Try FinBERT first if available and requested
+        if pending and use_finbert and self.finbert:
+            try:
+                scores = self.finbert.predict([texts[i] for i in pending])
+                for i, (positive_score, negative_score) in zip(pending, scores):
+                    results[i] = finbert_sentiment_result(positive_score, negative_score)
+                pending = []
+            except Exception as e:
+                logger.warning(f"FinBERT analysis failed: {e}. Falling back to rule-based.")
+        
+        # Fall back to rule-based analysis
+        if pending:
+            for i, result in zip(pending, _lexicon_scorer.score_batch([texts[i] for i in pending])):
+                results[i] = result
+        
+        return results
     
     def _analyze_rule_based(self, text: str) -> Dict[str, float]:
         """
@@ -182,50 +445,21 @@ class SentimentAnalyzer:
         Returns:
             Sentiment result dictionary
         """
-        text_lower = text.lower()
-        words = re.findall(r'\b\w+\b', text_lower)
-        
-        # Check for negation patterns
-        has_negation = any(re.search(pattern, text_lower) for pattern in NEGATION_PATTERNS)
-        
-        # Calculate sentiment score
-        scores = []
-        for word in words:
-            if word in FINANCIAL_LEXICON:
-                score = FINANCIAL_LEXICON[word]
-                # Flip score if negation detected
-                if has_negation and score != 0:
-                    score = -score * 0.5  # Reduce magnitude for negated sentiment
-                scores.append(score)
-        
-        if not scores:
-            return {
-                "sentiment_score": 0.0,
-                "sentiment_label": "neutral",
-                "confidence": 0.3
-            }
-        
-        # Average score, normalized to -1.0 to +1.0
-        avg_score = sum(scores) / len(scores)
-        # Clip to valid range
-        sentiment_score = max(-1.0, min(1.0, avg_score))
-        
-        # Determine label
-        if sentiment_score > 0.2:
-            sentiment_label = "positive"
-        elif sentiment_score < -0.2:
-            sentiment_label = "negative"
-        else:
-            sentiment_label = "neutral"
-        
-        # Confidence based on absolute score magnitude
-        confidence = min(0.9, abs(sentiment_score) * 1.5)
-        
-        return {
-            "sentiment_score": round(sentiment_score, 3),
-            "sentiment_label": sentiment_label,
-            "confidence": round(confidence, 3)
-        }
+        return _lexicon_scorer.score(text)
+
+
+_analyzer: Optional[SentimentAnalyzer] = None
+_analyzer_lock = threading.Lock()
+
+
+def get_sentiment_analyzer() -> SentimentAnalyzer:
+    """Get the process-wide sentiment analyzer."""
+    global _analyzer
+    if _analyzer is None:
+        with _analyzer_lock:
+            if _analyzer is None:
+                _analyzer = SentimentAnalyzer()
+    return _analyzer
 
 
 def analyze_sentiment(text: str, use_finbert: bool = True) -> Dict[str, float]:
@@ -239,6 +473,18 @@ def analyze_sentiment(text: str, use_finbert: bool = True) -> Dict[str, float]:
     Returns:
         Sentiment result dictionary
     """
-    analyzer = SentimentAnalyzer()
-    return analyzer.analyze(text, use_finbert=use_finbert)
+    return get_sentiment_analyzer().analyze(text, use_finbert=use_finbert)
+
 
+def analyze_sentiment_batch(texts: List[str], use_finbert: bool = True) -> List[Dict[str, float]]:
+    """
+    Convenience function to analyze sentiment of many texts.
+    
+    Args:
+        texts: Texts to analyze
+        use_finbert: Whether to use FinBERT if available
+        
+    Returns:
+        One sentiment result dictionary per text, in input order
+    """
+    return get_sentiment_analyzer().analyze_batch(texts, use_finbert=use_finbert)
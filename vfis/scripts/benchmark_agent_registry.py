@@ -0,0 +1,125 @@
+"""
+Benchmark: per-request agent construction vs the shared agent registry.
+
+Replaces the Azure OpenAI client class with a stub whose constructor takes
+--construct-ms (client construction cost: config validation, HTTP client
+and connection pool setup), so no credentials or network are needed.
+Then measures, over --requests simulated queries:
+
+1. fresh: every request builds a FinalOutputAssembly with new LLM clients
+   (the behaviour before the registry and the shared LLM client)
+2. shared: every request takes the assembly from the agent registry
+
+and reports the per-request construction cost of each. Finally --threads
+workers hit a new registry at once; exactly one build must happen and
+every other request must be counted as a hit.
+
+USAGE:
+    python -m vfis.scripts.benchmark_agent_registry
+    python -m vfis.scripts.benchmark_agent_registry --requests 200 --construct-ms 25 --threads 32
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import vfis.tools.llm_factory as llm_factory
+from vfis.agents.final_output_assembly import FinalOutputAssembly
+from vfis.agents.registry import AgentRegistry
+
+
+class _StubLLM:
+    """Stands in for AzureChatOpenAI; construction costs a fixed delay."""
+
+    construct_seconds = 0.0
+    constructed = 0
+    _lock = threading.Lock()
+
+    def __init__(self, **kwargs):
+        time.sleep(self.construct_seconds)
+        with _StubLLM._lock:
+            _StubLLM.constructed += 1
+        self.kwargs = kwargs
+
+
+def _per_request_ms(seconds: float, requests: int) -> float:
+    return round(seconds * 1000 / requests, 3)
+
+
+def measure_fresh(requests: int) -> float:
+    start = time.perf_counter()
+    for _ in range(requests):
+        llm_factory._shared_llms.clear()
+        FinalOutputAssembly()
+    return time.perf_counter() - start
+
+
+def measure_shared(requests: int) -> float:
+    registry = AgentRegistry()
+    start = time.perf_counter()
+    for _ in range(requests):
+        registry.get_final_output_assembly()
+    return time.perf_counter() - start
+
+
+def check_concurrent_hits(threads: int, per_thread: int) -> bool:
+    registry = AgentRegistry()
+    barrier = threading.Barrier(threads)
+
+    def worker():
+        barrier.wait()
+        for _ in range(per_thread):
+            registry.get_final_output_assembly()
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        for future in [pool.submit(worker) for _ in range(threads)]:
+            future.result()
+
+    stats = registry.stats()
+    total = threads * per_thread
+    print(f"concurrent_requests: {total} ({threads} threads)")
+    print(f"registry_stats: {stats}")
+
+    ok = stats["builds"] == 1 and stats["hits"] == total - 1
+    if not ok:
+        print("FAIL: concurrent requests built more than once or lost hit counts")
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare per-request and shared agent construction")
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--construct-ms", type=float, default=10.0, help="Stub LLM client construction time")
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--per-thread", type=int, default=500, help="Registry lookups per thread")
+    args = parser.parse_args()
+
+    # Only read by the real factory before it calls the (stubbed) client class
+    for name in ("AZURE_OPENAI_API_KEY", "AZURE_OPENAI_ENDPOINT", "AZURE_OPENAI_DEPLOYMENT_NAME"):
+        os.environ.setdefault(name, "benchmark")
+    _StubLLM.construct_seconds = args.construct_ms / 1000
+    llm_factory.AzureChatOpenAI = _StubLLM
+
+    fresh = measure_fresh(args.requests)
+    fresh_clients = _StubLLM.constructed
+    llm_factory._shared_llms.clear()
+    _StubLLM.constructed = 0
+    shared = measure_shared(args.requests)
+    shared_clients = _StubLLM.constructed
+
+    print(f"requests: {args.requests}")
+    print(f"stub_construct_ms: {args.construct_ms:g}")
+    print(f"fresh: {_per_request_ms(fresh, args.requests)} ms/request, {fresh_clients} LLM clients built")
+    print(f"shared: {_per_request_ms(shared, args.requests)} ms/request, {shared_clients} LLM clients built")
+    if shared > 0:
+        print(f"speedup: {fresh / shared:.0f}x")
+
+    if not check_concurrent_hits(args.threads, args.per_thread):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
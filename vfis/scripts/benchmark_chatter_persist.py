@@ -0,0 +1,132 @@
+"""
+Benchmark: row-by-row INSERT vs COPY + merge for persist_market_chatter.
+
+Writes the same number of synthetic records through both persistence
+paths against the configured PostgreSQL (POSTGRES_* env vars), each with
+its own source_ids, and reports rows/second for each. The COPY batch is
+then persisted again to check that duplicates are reported exactly
+(inserted=0, skipped=N). Rows and rollup buckets written under the
+benchmark ticker are deleted afterwards unless --keep is given.
+
+Use a local or scratch database: the benchmark writes real rows.
+
+USAGE:
+    python -m vfis.scripts.benchmark_chatter_persist --records 50000
+    python -m vfis.scripts.benchmark_chatter_persist --records 5000 --ticker ZZTEST --keep
+"""
+import argparse
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from tradingagents.database.connection import get_db_connection, init_database
+from tradingagents.database.migrations import run_migrations
+from tradingagents.database.chatter_persist import (
+    PERSIST_METHOD_COPY,
+    PERSIST_METHOD_ROW,
+    persist_market_chatter,
+)
+from tradingagents.dataflows.chatter_schema import MarketChatterRecord
+
+_HEADLINES = [
+    "{t} beats earnings estimates and raises full-year guidance",
+    "Analysts cut {t} price target on weaker margins",
+    "{t} announces new buyback program",
+    "Regulators open probe into {t} accounting",
+    "{t} shares flat ahead of product launch",
+]
+
+
+def _synthetic_records(ticker: str, count: int, prefix: str, seed: int) -> List[MarketChatterRecord]:
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    records = []
+    for i in range(count):
+        title = rng.choice(_HEADLINES).format(t=ticker)
+        records.append(MarketChatterRecord(
+            ticker=ticker,
+            source="rss",
+            source_id=f"{prefix}-{i}",
+            title=title,
+            summary=f"{title}. Body text\twith tabs, newlines\nand a backslash \\ in it.",
+            url=f"https://bench.example/{prefix}/{i}",
+            published_at=now - timedelta(minutes=rng.randint(0, 7 * 24 * 60)),
+            sentiment_score=round(rng.uniform(-1, 1), 4),
+            sentiment_label=rng.choice(["positive", "neutral", "negative"]),
+            confidence=0.5,
+            raw_payload={"feed": "benchmark", "i": i},
+        ))
+    return records
+
+
+def _timed_persist(records: List[MarketChatterRecord], method: str) -> Dict[str, float]:
+    start = time.perf_counter()
+    counts = persist_market_chatter(records, method=method)
+    seconds = time.perf_counter() - start
+    counts = dict(counts)
+    counts["seconds"] = round(seconds, 2)
+    counts["rows_per_s"] = round(len(records) / seconds, 1) if seconds > 0 else float("inf")
+    return counts
+
+
+def _cleanup(ticker: str) -> None:
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM market_chatter WHERE ticker = %s", (ticker,))
+            cur.execute("DELETE FROM market_chatter_rollup WHERE ticker = %s", (ticker,))
+        conn.commit()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare row-by-row and COPY chatter persistence")
+    parser.add_argument("--records", type=int, default=50000, help="Records per path")
+    parser.add_argument("--ticker", default="ZZBENCH", help="Ticker the benchmark rows are written under")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--keep", action="store_true", help="Keep benchmark rows afterwards")
+    args = parser.parse_args()
+
+    init_database()
+    migrated, errors = run_migrations()
+    if not migrated:
+        print(f"FAIL: migrations did not complete: {errors}")
+        return 1
+
+    ticker = args.ticker.upper()
+    run_id = uuid.uuid4().hex[:8]
+    row_records = _synthetic_records(ticker, args.records, f"bench-row-{run_id}", args.seed)
+    copy_records = _synthetic_records(ticker, args.records, f"bench-copy-{run_id}", args.seed)
+
+    # Warm-up: table/rollup verification and connection pool
+    persist_market_chatter(_synthetic_records(ticker, 10, f"bench-warm-{run_id}", args.seed))
+
+    try:
+        row = _timed_persist(row_records, PERSIST_METHOD_ROW)
+        copy = _timed_persist(copy_records, PERSIST_METHOD_COPY)
+        duplicate = _timed_persist(copy_records, PERSIST_METHOD_COPY)
+    finally:
+        if not args.keep:
+            _cleanup(ticker)
+
+    print(f"records: {args.records}")
+    print(f"row: {row}")
+    print(f"copy: {copy}")
+    print(f"copy_duplicates: {duplicate}")
+    if copy["seconds"] > 0:
+        print(f"speedup: {row['seconds'] / copy['seconds']:.1f}x")
+
+    exact = (
+        row["inserted"] == args.records and not row["errors"]
+        and copy["inserted"] == args.records and not copy["errors"]
+        and duplicate["inserted"] == 0 and duplicate["skipped"] == args.records
+    )
+    if not exact:
+        print("FAIL: inserted/skipped counts do not match the records written")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+"""
+Benchmark: concurrent vs sequential query stages with a delayed stub LLM.
+
+Builds the four analysis stages of a query (bull, bear, risk,
+chatter_sentiment) whose work is a stub LLM call that sleeps for a fixed
+delay, so no database, credentials or network are needed. Then:
+
+1. sequential: calls the stage functions one after another (the old path)
+2. concurrent: runs the same stages through run_stages(); wall time should
+   approach the slowest stage instead of the sum
+3. timeout: the bear stub hangs for --hang-ms with a --stage-timeout-ms
+   timeout; run_stages() must return at about the timeout with the bear
+   fallback (partial result) and the other stages' real values
+4. abandoned: a timed-out stage made of many short stub LLM calls must see
+   its cancel event at the next call and release its pool worker within
+   about one call
+
+USAGE:
+    python -m vfis.scripts.benchmark_query_stages
+    python -m vfis.scripts.benchmark_query_stages --llm-ms 800 --hang-ms 5000 --stage-timeout-ms 1500
+"""
+import argparse
+import sys
+import time
+from typing import Dict, List
+
+from vfis.agents.concurrent_stages import Stage, abandoned_stage_count, run_stages
+from vfis.tools.stage_cancel import check_stage_cancelled
+
+
+class _StubLLM:
+    """Stands in for the chat model; every call takes a fixed delay."""
+
+    def __init__(self, delay_seconds: float):
+        self.delay_seconds = delay_seconds
+
+    def invoke(self, prompt: str) -> str:
+        # Same check as vfis.tools.llm_cache before a real LLM call
+        check_stage_cancelled()
+        time.sleep(self.delay_seconds)
+        return f"summary of: {prompt}"
+
+
+def _fallback(name: str):
+    def fallback(reason: str) -> Dict[str, str]:
+        return {"stage": name, "partial": True, "warning": reason}
+    return fallback
+
+
+def _stages(delays_ms: Dict[str, float], timeout_ms: Dict[str, float]) -> List[Stage]:
+    stages = []
+    for name, delay in delays_ms.items():
+        llm = _StubLLM(delay / 1000)
+        timeout = timeout_ms.get(name)
+        stages.append(Stage(
+            name=name,
+            func=lambda llm=llm, name=name: {"stage": name, "partial": False, "text": llm.invoke(name)},
+            fallback=_fallback(name),
+            timeout=timeout / 1000 if timeout is not None else None,
+        ))
+    return stages
+
+
+def measure_sequential(stages: List[Stage]) -> float:
+    start = time.perf_counter()
+    for stage in stages:
+        stage.func()
+    return time.perf_counter() - start
+
+
+def measure_concurrent(stages: List[Stage]) -> float:
+    start = time.perf_counter()
+    results = run_stages(*stages)
+    elapsed = time.perf_counter() - start
+    if not all(r.ok for r in results.values()):
+        raise RuntimeError(f"stages failed: { {n: r.error for n, r in results.items() if not r.ok} }")
+    return elapsed
+
+
+def check_stage_timeout(llm_ms: float, hang_ms: float, stage_timeout_ms: float) -> bool:
+    delays = {"bull": llm_ms, "bear": hang_ms, "risk": llm_ms / 4, "chatter_sentiment": llm_ms / 4}
+    stages = _stages(delays, {name: stage_timeout_ms for name in delays})
+
+    start = time.perf_counter()
+    results = run_stages(*stages)
+    elapsed = time.perf_counter() - start
+
+    print(f"stage_timeout: {stage_timeout_ms:g}ms (bear hangs {hang_ms:g}ms)")
+    print(f"timeout_wall: {elapsed * 1000:.0f}ms")
+    for name, r in results.items():
+        state = "timed out" if r.timed_out else "ok" if r.ok else "error"
+        print(f"  {name}: {state}, partial={r.value['partial']}, {r.elapsed_ms:.0f}ms")
+
+    ok = (
+        results["bear"].timed_out
+        and results["bear"].value["partial"]
+        and all(results[name].ok and not results[name].value["partial"]
+                for name in ("bull", "risk", "chatter_sentiment"))
+        and elapsed * 1000 < stage_timeout_ms + llm_ms / 2
+    )
+    if not ok:
+        print("FAIL: timed-out stage did not yield its partial result at the stage timeout")
+    return ok
+
+
+def check_abandoned_release(llm_ms: float, stage_timeout_ms: float) -> bool:
+    step = _StubLLM(llm_ms / 4000)
+    calls = {"count": 0}
+
+    def many_calls() -> Dict[str, str]:
+        while True:
+            calls["count"] += 1
+            step.invoke("step")
+
+    stage = Stage(name="bear", func=many_calls, fallback=_fallback("bear"), timeout=stage_timeout_ms / 1000)
+    results = run_stages(stage)
+    abandoned_at_return = abandoned_stage_count()
+    calls_at_return = calls["count"]
+
+    deadline = time.perf_counter() + 2 * step.delay_seconds + 1.0
+    while not stage.finished and time.perf_counter() < deadline:
+        time.sleep(0.01)
+    extra_calls = calls["count"] - calls_at_return
+
+    print(f"abandoned: counted={stage.abandoned}, released={stage.finished}, "
+          f"pool_abandoned {abandoned_at_return} -> {abandoned_stage_count()}, "
+          f"calls_after_timeout={extra_calls}")
+    ok = results["bear"].timed_out and stage.finished and extra_calls <= 1
+    if not ok:
+        print("FAIL: abandoned stage kept running after its cancel event was set")
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare concurrent and sequential query stages")
+    parser.add_argument("--llm-ms", type=float, default=400, help="Stub LLM delay for bull/bear")
+    parser.add_argument("--hang-ms", type=float, default=3000, help="Delay of the hanging stage")
+    parser.add_argument("--stage-timeout-ms", type=float, default=800, help="Per-stage timeout")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    # Debate stages call the LLM; risk and chatter sentiment only read data
+    delays = {"bull": args.llm_ms, "bear": args.llm_ms, "risk": args.llm_ms / 4, "chatter_sentiment": args.llm_ms / 4}
+    stages = _stages(delays, {})
+
+    sequential = min(measure_sequential(stages) for _ in range(args.rounds))
+    concurrent = min(measure_concurrent(stages) for _ in range(args.rounds))
+
+    print(f"stage_delays_ms: {delays}")
+    print(f"sequential_wall: {sequential * 1000:.0f}ms (sum of stages {sum(delays.values()):.0f}ms)")
+    print(f"concurrent_wall: {concurrent * 1000:.0f}ms (slowest stage {max(delays.values()):.0f}ms)")
+    print(f"speedup: {sequential / concurrent:.1f}x")
+
+    ok = concurrent * 1000 < max(delays.values()) + args.llm_ms / 2
+    if not ok:
+        print("FAIL: concurrent wall time is not close to the slowest stage")
+    if not check_stage_timeout(args.llm_ms, args.hang_ms, args.stage_timeout_ms):
+        ok = False
+    if not check_abandoned_release(args.llm_ms, args.stage_timeout_ms):
+        ok = False
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
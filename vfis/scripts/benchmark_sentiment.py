@@ -0,0 +1,186 @@
+"""
+Benchmark: per-text vs batched sentiment scoring on CPU.
+
+Scores the same corpus twice: once one text at a time through the
+original single-text path (kept below as the reference: one unpadded
+FinBERT forward pass per text, or the per-word lexicon scorer) and once
+with the process-wide analyzer's analyze_batch(), and reports
+texts/second for each. The corpus mixes short posts and long
+articles so length bucketing is exercised. FinBERT is used when
+transformers and torch are installed; otherwise both runs use the
+rule-based scorer.
+
+With --rule-based, the compiled lexicon scorer is also checked against the
+original per-word implementation (kept below as the reference): every
+score must be identical, and both throughputs are reported.
+
+USAGE:
+    python -m vfis.scripts.benchmark_sentiment --texts 512
+    python -m vfis.scripts.benchmark_sentiment --input headlines.txt
+    python -m vfis.scripts.benchmark_sentiment --rule-based --texts 50000
+"""
+import argparse
+import random
+import re
+import sys
+import time
+from typing import Dict, List
+
+from vfis.market_chatter.sentiment import (
+    FINANCIAL_LEXICON,
+    NEGATION_PATTERNS,
+    LexiconScorer,
+    finbert_sentiment_result,
+    get_sentiment_analyzer,
+)
+
+_SAMPLE_SENTENCES = [
+    "Shares rally after the company beat earnings estimates and raised guidance.",
+    "Analysts downgrade the stock on concern over rising debt and weak margins.",
+    "Revenue growth was stable while the dividend was maintained.",
+    "The lawsuit adds uncertainty; volatility is likely to persist.",
+    "Strong demand and a new partnership support the bullish outlook.",
+    "Guidance disappointing, shares plunge in after-hours trading.",
+]
+
+
+def _synthetic_corpus(count: int, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(count):
+        # Mostly short posts, some long articles
+        sentences = rng.choice([1, 1, 1, 2, 3, 12, 40])
+        corpus.append(" ".join(rng.choice(_SAMPLE_SENTENCES) for _ in range(sentences)))
+    return corpus
+
+
+def _throughput(count: int, seconds: float) -> float:
+    return round(count / seconds, 1) if seconds > 0 else float("inf")
+
+
+def _reference_rule_based(text: str) -> Dict[str, float]:
+    """Original rule-based scorer: per-word lookup plus one search per negation pattern."""
+    text_lower = text.lower()
+    words = re.findall(r'\b\w+\b', text_lower)
+    has_negation = any(re.search(pattern, text_lower) for pattern in NEGATION_PATTERNS)
+    scores = []
+    for word in words:
+        if word in FINANCIAL_LEXICON:
+            score = FINANCIAL_LEXICON[word]
+            if has_negation and score != 0:
+                score = -score * 0.5
+            scores.append(score)
+    if not scores:
+        return {"sentiment_score": 0.0, "sentiment_label": "neutral", "confidence": 0.3}
+    sentiment_score = max(-1.0, min(1.0, sum(scores) / len(scores)))
+    if sentiment_score > 0.2:
+        sentiment_label = "positive"
+    elif sentiment_score < -0.2:
+        sentiment_label = "negative"
+    else:
+        sentiment_label = "neutral"
+    confidence = min(0.9, abs(sentiment_score) * 1.5)
+    return {
+        "sentiment_score": round(sentiment_score, 3),
+        "sentiment_label": sentiment_label,
+        "confidence": round(confidence, 3),
+    }
+
+
+def _reference_finbert(finbert, text: str) -> Dict[str, float]:
+    """Original FinBERT path: one tokenizer call and forward pass per text."""
+    import torch
+
+    inputs = finbert.tokenizer(
+        text[:512],
+        return_tensors="pt",
+        truncation=True,
+        padding=True,
+        max_length=512
+    )
+    with torch.no_grad():
+        outputs = finbert.model(**inputs)
+        predictions = torch.nn.functional.softmax(outputs.logits, dim=-1)
+    return finbert_sentiment_result(
+        predictions[0][finbert.positive_index].item(),
+        predictions[0][finbert.negative_index].item()
+    )
+
+
+def _reference_per_text(analyzer, text: str, use_finbert: bool) -> Dict[str, float]:
+    """Score one text the way SentimentAnalyzer.analyze() did before batching."""
+    if not text or not text.strip():
+        return {"sentiment_score": 0.0, "sentiment_label": "neutral", "confidence": 0.0}
+    if use_finbert and analyzer.finbert:
+        return _reference_finbert(analyzer.finbert, text)
+    return _reference_rule_based(text)
+
+
+def _check_lexicon(texts: List[str]) -> int:
+    """Compare the compiled lexicon scorer with the reference; return mismatches."""
+    scorer = LexiconScorer()
+
+    start = time.perf_counter()
+    reference = [_reference_rule_based(text) for text in texts]
+    reference_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    compiled = scorer.score_batch(texts)
+    compiled_seconds = time.perf_counter() - start
+
+    mismatches = sum(1 for a, b in zip(reference, compiled) if a != b)
+    print(f"lexicon_reference: {_throughput(len(texts), reference_seconds)} texts/s")
+    print(f"lexicon_compiled: {_throughput(len(texts), compiled_seconds)} texts/s")
+    print(f"lexicon_mismatches: {mismatches}")
+    return mismatches
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare per-text and batched sentiment throughput")
+    parser.add_argument("--texts", type=int, default=512, help="Synthetic corpus size")
+    parser.add_argument("--input", help="Optional file with one text per line (overrides --texts)")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--rule-based", action="store_true", help="Benchmark the lexicon scorer only")
+    args = parser.parse_args()
+
+    if args.input:
+        with open(args.input, encoding="utf-8") as f:
+            texts = [line.strip() for line in f if line.strip()]
+    else:
+        texts = _synthetic_corpus(args.texts, args.seed)
+
+    use_finbert = not args.rule_based
+    analyzer = get_sentiment_analyzer()
+    backend = "finbert" if use_finbert and analyzer.finbert else "rule-based"
+
+    # Warm-up (model load, first-call allocations)
+    analyzer.analyze_batch(texts[:8], use_finbert=use_finbert)
+
+    start = time.perf_counter()
+    per_text = [_reference_per_text(analyzer, text, use_finbert) for text in texts]
+    per_text_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = analyzer.analyze_batch(texts, use_finbert=use_finbert)
+    batched_seconds = time.perf_counter() - start
+
+    max_delta = max(
+        (abs(a["sentiment_score"] - b["sentiment_score"]) for a, b in zip(per_text, batched)),
+        default=0.0
+    )
+
+    print(f"backend: {backend}")
+    print(f"texts: {len(texts)}")
+    print(f"per_text: {per_text_seconds:.2f}s ({_throughput(len(texts), per_text_seconds)} texts/s)")
+    print(f"batched: {batched_seconds:.2f}s ({_throughput(len(texts), batched_seconds)} texts/s)")
+    print(f"speedup: {per_text_seconds / batched_seconds:.2f}x" if batched_seconds > 0 else "speedup: n/a")
+    print(f"max_score_delta: {max_delta:.3f}")
+
+    if args.rule_based and _check_lexicon(texts):
+        print("FAIL: compiled lexicon scores differ from the reference implementation")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+Check: one bad audit event does not take its batch down with it.
+
+Runs an AuditSink (tradingagents/database/audit.py) against the configured
+PostgreSQL (POSTGRES_* env vars) and queues --rows events under a
+throwaway request_id, one of which has an event_type longer than the
+audit_log column allows. The multi-row INSERT is rejected as a whole, so
+the sink must retry the batch row by row and then:
+
+1. every good row is in audit_log
+2. the bad row is not, and it is the only event counted as failed
+
+Use a local or scratch database: the check writes real rows, and deletes
+them afterwards unless --keep is given.
+
+USAGE:
+    python -m vfis.scripts.check_audit_sink
+    python -m vfis.scripts.check_audit_sink --rows 200 --keep
+"""
+import argparse
+import json
+import sys
+import uuid
+
+from tradingagents.database.audit import AuditSink
+from tradingagents.database.connection import get_db_connection, init_database
+
+
+def _row(request_id: str, event_type: str, index: int) -> tuple:
+    return (
+        event_type, 'check', index, 'data_access', 'check_audit_sink',
+        request_id, json.dumps({'index': index}), None
+    )
+
+
+def _written(request_id: str) -> int:
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT COUNT(*) FROM audit_log WHERE request_id = %s", (request_id,))
+            return int(cur.fetchone()[0])
+
+
+def _cleanup(request_id: str) -> None:
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM audit_log WHERE request_id = %s", (request_id,))
+        conn.commit()
+
+
+def check_bad_row_isolated(request_id: str, rows: int) -> bool:
+    bad_index = rows // 2
+    sink = AuditSink(batch_size=rows, flush_interval=0.5)
+    sink.start()
+    try:
+        for index in range(rows):
+            event_type = 'x' * 200 if index == bad_index else 'audit_check'
+            sink.submit(_row(request_id, event_type, index))
+        drained = sink.flush(timeout=10.0)
+    finally:
+        sink.stop()
+
+    stats = sink.stats()
+    written = _written(request_id)
+    print(f"bad_row_isolated: drained={drained}, rows_in_db={written}, stats={stats}")
+
+    ok = drained and written == rows - 1 and stats['written'] == rows - 1 and stats['failed'] == 1
+    if not ok:
+        print(f"FAIL: expected {rows - 1} rows written and 1 failed")
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check that a bad audit row does not fail its batch")
+    parser.add_argument("--rows", type=int, default=50, help="Events in the batch, including the bad one")
+    parser.add_argument("--keep", action="store_true", help="Keep the rows written by the check")
+    args = parser.parse_args()
+
+    init_database()
+    request_id = f"audit-check-{uuid.uuid4().hex[:12]}"
+    try:
+        passed = check_bad_row_isolated(request_id, args.rows)
+    finally:
+        if not args.keep:
+            _cleanup(request_id)
+
+    if not passed:
+        return 1
+    print("PASS: a rejected audit batch is retried row by row and only the bad row is lost")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+"""
+Check: keep-alive reuse, conditional GET and default timeouts of the shared
+HTTP client, against a local test server (no network).
+
+Starts an HTTP/1.1 server on 127.0.0.1 that serves a feed with an ETag and
+a Last-Modified header, answers matching If-None-Match / If-Modified-Since
+with 304 Not Modified, and counts TCP connections, full responses and 304s.
+Then:
+
+1. keep-alive: --requests plain GETs through one HttpClient must share a
+   single connection, while the same GETs via bare requests.get() open one
+   connection each
+2. conditional GET: --requests conditional GETs must cost one full response
+   and then only 304s, each replayed with the stored body; after the feed
+   changes, the next GET must fetch the new body in full
+3. timeout: a GET to an endpoint slower than the client's read timeout must
+   raise instead of hanging
+
+USAGE:
+    python -m vfis.scripts.check_http_client
+    python -m vfis.scripts.check_http_client --requests 50 --read-timeout 0.5
+"""
+import argparse
+import hashlib
+import sys
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict
+
+import requests
+
+from tradingagents.dataflows.http_client import HttpClient, ValidatorStore
+
+
+class _FeedState:
+    """Feed body, its validators and server-side counters."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts: Dict[str, int] = {"connections": 0, "full": 0, "not_modified": 0}
+        self.set_body(b"<rss><channel><item><title>first</title></item></channel></rss>")
+
+    def set_body(self, body: bytes) -> None:
+        with self.lock:
+            self.body = body
+            self.etag = '"%s"' % hashlib.sha1(body).hexdigest()
+            self.last_modified = formatdate(time.time(), usegmt=True)
+
+    def count(self, name: str) -> None:
+        with self.lock:
+            self.counts[name] += 1
+
+    def snapshot(self) -> Dict[str, int]:
+        with self.lock:
+            return dict(self.counts)
+
+    def reset(self) -> None:
+        with self.lock:
+            for name in self.counts:
+                self.counts[name] = 0
+
+
+def _make_handler(state: _FeedState, slow_seconds: float):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            # One handler instance per TCP connection
+            super().setup()
+            state.count("connections")
+
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            if self.path.startswith("/slow"):
+                time.sleep(slow_seconds)
+                self._send(200, b"late")
+                return
+
+            with state.lock:
+                body, etag, last_modified = state.body, state.etag, state.last_modified
+            if_none_match = self.headers.get("If-None-Match")
+            if_modified_since = self.headers.get("If-Modified-Since")
+            if (if_none_match and if_none_match == etag) or (
+                not if_none_match and if_modified_since == last_modified
+            ):
+                state.count("not_modified")
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            state.count("full")
+            self._send(200, body, {"ETag": etag, "Last-Modified": last_modified})
+
+        def _send(self, status, body, headers=None):
+            self.send_response(status)
+            self.send_header("Content-Type", "application/rss+xml")
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+    return Handler
+
+
+def check_keep_alive(client: HttpClient, base_url: str, state: _FeedState, n: int) -> bool:
+    state.reset()
+    for _ in range(n):
+        client.get(f"{base_url}/feed").raise_for_status()
+    pooled = state.snapshot()
+
+    state.reset()
+    for _ in range(n):
+        requests.get(f"{base_url}/feed", timeout=5).raise_for_status()
+    bare = state.snapshot()
+
+    print(f"requests: {n}")
+    print(f"shared_client_connections: {pooled['connections']}")
+    print(f"bare_requests_connections: {bare['connections']}")
+
+    ok = pooled["connections"] == 1 and pooled["full"] == n and bare["connections"] == n
+    if not ok:
+        print("FAIL: shared client did not reuse its keep-alive connection")
+    return ok
+
+
+def check_conditional(client: HttpClient, base_url: str, state: _FeedState, n: int) -> bool:
+    state.reset()
+    url = f"{base_url}/feed?q=conditional"
+    bodies = [client.get(url, conditional=True) for _ in range(n)]
+    unchanged = state.snapshot()
+    replayed = sum(1 for r in bodies if r.from_validator_cache)
+    same_body = all(r.status_code == 200 and r.content == state.body for r in bodies)
+
+    state.set_body(b"<rss><channel><item><title>second</title></item></channel></rss>")
+    changed = client.get(url, conditional=True)
+    after_change = state.snapshot()
+
+    print(f"conditional_full_responses: {unchanged['full']}")
+    print(f"conditional_304_responses: {unchanged['not_modified']}")
+    print(f"replayed_from_validator_cache: {replayed}")
+    print(f"bytes_per_host: { {h: s['bytes'] for h, s in client.stats().items()} }")
+    print(f"after_change: full={after_change['full'] - unchanged['full']}, "
+          f"fresh_body={changed.content == state.body and not changed.from_validator_cache}")
+
+    ok = (
+        unchanged["full"] == 1
+        and unchanged["not_modified"] == n - 1
+        and replayed == n - 1
+        and same_body
+        and after_change["full"] == 2
+        and changed.content == state.body
+        and not changed.from_validator_cache
+    )
+    if not ok:
+        print("FAIL: conditional GET did not answer unchanged feeds with 304 and the stored body")
+    return ok
+
+
+def check_timeout(client: HttpClient, base_url: str, read_timeout: float) -> bool:
+    start = time.perf_counter()
+    try:
+        client.get(f"{base_url}/slow")
+        raised = None
+    except requests.Timeout as e:
+        raised = type(e).__name__
+    elapsed = time.perf_counter() - start
+
+    print(f"read_timeout: {read_timeout:g}s")
+    print(f"slow_endpoint: {raised or 'no timeout'} after {elapsed:.2f}s")
+
+    ok = raised is not None and elapsed < read_timeout + 1.0
+    if not ok:
+        print("FAIL: default read timeout was not applied")
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check keep-alive reuse and conditional GET of the HTTP client")
+    parser.add_argument("--requests", type=int, default=20, help="GETs per scenario")
+    parser.add_argument("--read-timeout", type=float, default=0.5, help="Client read timeout in seconds")
+    args = parser.parse_args()
+
+    state = _FeedState()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(state, slow_seconds=args.read_timeout * 4))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    client = HttpClient(connect_timeout=2.0, read_timeout=args.read_timeout, validator_store=ValidatorStore(None))
+    try:
+        passed = [
+            check_keep_alive(client, base_url, state, args.requests),
+            check_conditional(client, base_url, state, args.requests),
+            check_timeout(client, base_url, args.read_timeout),
+        ]
+    finally:
+        client.session.close()
+        server.shutdown()
+        server.server_close()
+
+    if not all(passed):
+        return 1
+    print("PASS: keep-alive reuse, 304 replay and default timeouts hold")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
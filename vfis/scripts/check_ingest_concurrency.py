@@ -0,0 +1,210 @@
+"""
+Check: per-host limits, per-source timeouts and late writes in concurrent
+chatter ingestion, using sources with injected latency (no network).
+
+Runs three scenarios through ingest_concurrency.run_source_tasks():
+
+1. per-host limit: many stub sources hold host_slot() on two hosts for
+   --latency seconds each; at most ingest_per_host_limit requests may be
+   in flight per host, and the two hosts must proceed in parallel
+2. timeout: a source slower than --timeout is reported as timed out at
+   about --timeout seconds while a fast source still succeeds, and the
+   slow source never reaches its persist step
+3. Alpha Vantage: the real _ingest_alpha_vantage path with a slow stub
+   fetch and a recording persist function; once timed out, nothing may
+   be persisted
+
+USAGE:
+    python -m vfis.scripts.check_ingest_concurrency
+    python -m vfis.scripts.check_ingest_concurrency --per-host-limit 3 --latency 0.3 --timeout 0.5
+"""
+import argparse
+import importlib
+import sys
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, List
+
+from tradingagents.dataflows.config import set_config
+from tradingagents.dataflows.ingest_concurrency import (
+    SourceTask,
+    check_cancelled,
+    host_slot,
+    run_source_tasks,
+)
+
+
+class _InFlight:
+    """Tracks concurrent requests per host."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.current: Dict[str, int] = defaultdict(int)
+        self.peak: Dict[str, int] = defaultdict(int)
+
+    def enter(self, host: str) -> None:
+        with self._lock:
+            self.current[host] += 1
+            self.peak[host] = max(self.peak[host], self.current[host])
+
+    def leave(self, host: str) -> None:
+        with self._lock:
+            self.current[host] -= 1
+
+
+def _ok_result(source: str) -> Dict[str, Any]:
+    return {"fetched": 1, "inserted": 1, "skipped": 0, "errors": 0, "source": source}
+
+
+def check_per_host_limit(limit: int, latency: float, per_host: int) -> bool:
+    in_flight = _InFlight()
+
+    def make_source(host: str):
+        def source(ticker, company_name, days, cancel=None, since=None):
+            with host_slot(f"https://{host}/feed?q={ticker}", cancel):
+                in_flight.enter(host)
+                try:
+                    time.sleep(latency)
+                finally:
+                    in_flight.leave(host)
+            return _ok_result(host)
+        return source
+
+    hosts = ["a.example", "b.example"]
+    tasks = [
+        SourceTask(ticker=f"T{i}", source_name=host, func=make_source(host))
+        for host in hosts for i in range(per_host)
+    ]
+    start = time.perf_counter()
+    results = [result for _, result in run_source_tasks(tasks, max_workers=len(tasks), source_timeout=0)]
+    elapsed = time.perf_counter() - start
+
+    # Hosts run side by side, each in waves of `limit` requests
+    expected = -(-per_host // limit) * latency
+    print(f"per_host_limit: {limit}")
+    print(f"peak_in_flight: {dict(in_flight.peak)}")
+    print(f"wall_time: {elapsed:.2f}s (expected ~{expected:.2f}s, sequential {len(tasks) * latency:.2f}s)")
+
+    ok = (
+        all(not r.get("error") for r in results)
+        and all(in_flight.peak[host] == min(limit, per_host) for host in hosts)
+        and elapsed < expected + len(hosts) * latency
+    )
+    if not ok:
+        print("FAIL: per-host limit not enforced, or hosts did not run in parallel")
+    return ok
+
+
+def check_timeout(timeout: float) -> bool:
+    persisted: List[str] = []
+
+    def slow_source(ticker, company_name, days, cancel=None, since=None):
+        # Fetch in small steps, checking for cancellation between "requests"
+        deadline = time.monotonic() + 3 * timeout
+        while time.monotonic() < deadline:
+            check_cancelled(cancel)
+            time.sleep(timeout / 20)
+        check_cancelled(cancel)
+        persisted.append(ticker)
+        return _ok_result("slow")
+
+    def fast_source(ticker, company_name, days, cancel=None, since=None):
+        time.sleep(timeout / 10)
+        return _ok_result("fast")
+
+    tasks = [
+        SourceTask(ticker="SLOW", source_name="slow", func=slow_source),
+        SourceTask(ticker="FAST", source_name="fast", func=fast_source),
+    ]
+    start = time.perf_counter()
+    results = {task.source_name: result for task, result in run_source_tasks(tasks, source_timeout=timeout)}
+    elapsed = time.perf_counter() - start
+
+    # Give an uncancelled source time to write late
+    time.sleep(3 * timeout)
+
+    print(f"timeout: {timeout:.2f}s")
+    print(f"slow_result: {results['slow'].get('error')}")
+    print(f"fast_result: {'ok' if not results['fast'].get('error') else results['fast']['error']}")
+    print(f"wall_time: {elapsed:.2f}s")
+    print(f"late_writes: {persisted}")
+
+    ok = (
+        "Timed out" in (results["slow"].get("error") or "")
+        and not results["fast"].get("error")
+        and elapsed < 2 * timeout
+        and not persisted
+    )
+    if not ok:
+        print("FAIL: slow source was not cancelled in time, or wrote after its timeout")
+    return ok
+
+
+def check_alpha_vantage_cancel(timeout: float) -> bool:
+    # The package re-exports the ingest_chatter() function under the module's name
+    ingest_chatter = importlib.import_module("tradingagents.dataflows.ingest_chatter")
+    from tradingagents.dataflows.alpha_vantage_chatter import AlphaVantageChatterSource
+    from tradingagents.dataflows.ingest_chatter import _ingest_alpha_vantage
+
+    persisted: List[Any] = []
+
+    def slow_fetch(self, ticker, company_name=None, start_date=None, end_date=None):
+        time.sleep(2 * timeout)
+        return [{
+            "title": f"{ticker} shares rise after results beat estimates",
+            "url": f"https://example.com/{ticker}",
+            "time_published": time.strftime("%Y%m%dT%H%M%S"),
+            "summary": "Quarterly results beat estimates on strong demand.",
+            "source": "stub",
+        }]
+
+    def recording_persist(records, *args, **kwargs):
+        persisted.extend(records)
+        return {"inserted": len(records), "skipped": 0, "errors": 0}
+
+    original_fetch = AlphaVantageChatterSource.fetch
+    original_persist = ingest_chatter.persist_market_chatter
+    AlphaVantageChatterSource.fetch = slow_fetch
+    ingest_chatter.persist_market_chatter = recording_persist
+    try:
+        tasks = [SourceTask(ticker="AVSTUB", source_name="alpha_vantage", func=_ingest_alpha_vantage)]
+        results = [result for _, result in run_source_tasks(tasks, source_timeout=timeout)]
+        # The fetch finishes after the timeout; the source must not persist
+        time.sleep(2 * timeout)
+    finally:
+        AlphaVantageChatterSource.fetch = original_fetch
+        ingest_chatter.persist_market_chatter = original_persist
+
+    print(f"alpha_vantage_result: {results[0].get('error')}")
+    print(f"alpha_vantage_late_writes: {len(persisted)}")
+
+    ok = "Timed out" in (results[0].get("error") or "") and not persisted
+    if not ok:
+        print("FAIL: Alpha Vantage source persisted after its timeout")
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check ingestion per-host limits and source timeouts")
+    parser.add_argument("--per-host-limit", type=int, default=2)
+    parser.add_argument("--per-host-tasks", type=int, default=6, help="Stub sources per host")
+    parser.add_argument("--latency", type=float, default=0.2, help="Injected seconds per request")
+    parser.add_argument("--timeout", type=float, default=0.5, help="Per-source timeout in seconds")
+    args = parser.parse_args()
+
+    set_config({"ingest_per_host_limit": args.per_host_limit, "chatter_dedupe_enabled": False})
+
+    passed = [
+        check_per_host_limit(args.per_host_limit, args.latency, args.per_host_tasks),
+        check_timeout(args.timeout),
+        check_alpha_vantage_cancel(args.timeout),
+    ]
+    if not all(passed):
+        return 1
+    print("PASS: per-host limits, timeouts and cancellation before persist hold")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
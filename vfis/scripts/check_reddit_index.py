@@ -0,0 +1,166 @@
+"""
+Check: the Reddit index returns exactly what the old per-day JSONL scan did.
+
+Writes a small synthetic Reddit dump to a temporary directory (no network,
+no database) and compares fetch_top_posts() (reddit_index.py) for whole
+date ranges against the old local.py path: one fetch_top_from_category()
+scan of every JSONL file per day, reproduced here as it was before the
+index. The dump covers:
+
+1. company categories with a ticker query: mention filtering with the
+   "A OR B" company terms and case-insensitive matches
+2. a mixed-case category name ("Company_Picks"): the old check
+   "company" in category is case-sensitive, so no filter applies
+3. equal upvotes within a file (ties keep file order) and several files
+   per category (results follow os.listdir() order, not name order)
+4. a ticker outside ticker_to_company, matched ad hoc by the index (the
+   old scan raised KeyError; the reference uses the ticker as its only term)
+
+Results must be equal item by item, in the same order.
+
+USAGE:
+    python -m vfis.scripts.check_reddit_index
+    python -m vfis.scripts.check_reddit_index --days 10 --posts 40
+"""
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from tradingagents.dataflows.config import set_config
+from tradingagents.dataflows.reddit_index import fetch_top_posts
+from tradingagents.dataflows.reddit_utils import ticker_to_company
+
+_START = datetime(2024, 5, 1, tzinfo=timezone.utc)
+_PHRASES = [
+    "Apple earnings beat", "apple stock dips", "APPLE supply chain", "AAPL calls printing",
+    "Facebook ad revenue", "Meta layoffs", "Nvidia guidance", "rates and the Fed",
+    "market wrap", "ZZZQ short squeeze", "zzzq to the moon",
+]
+_CATEGORIES = {
+    "company_news": ["stocks.jsonl", "investing.jsonl", "wallstreetbets.jsonl"],
+    "global_news": ["worldnews.jsonl", "economics.jsonl"],
+    "Company_Picks": ["picks_b.jsonl", "picks_a.jsonl"],
+}
+
+
+def _old_fetch_top_from_category(
+    category: str, date: str, max_limit: int, query: Optional[str], data_path: str
+) -> List[Dict[str, Any]]:
+    """reddit_utils.fetch_top_from_category before the index (one day)."""
+    all_content = []
+    limit_per_subreddit = max_limit // len(os.listdir(os.path.join(data_path, category)))
+    for data_file in os.listdir(os.path.join(data_path, category)):
+        if not data_file.endswith(".jsonl"):
+            continue
+        all_content_curr_subreddit = []
+        with open(os.path.join(data_path, category, data_file), "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                parsed_line = json.loads(line)
+                post_date = datetime.fromtimestamp(parsed_line["created_utc"], tz=timezone.utc).strftime("%Y-%m-%d")
+                if post_date != date:
+                    continue
+                if "company" in category and query:
+                    company = ticker_to_company.get(query, query)
+                    search_terms = company.split(" OR ") if "OR" in company else [company]
+                    search_terms.append(query)
+                    if not any(
+                        re.search(term, parsed_line["title"], re.IGNORECASE)
+                        or re.search(term, parsed_line["selftext"], re.IGNORECASE)
+                        for term in search_terms
+                    ):
+                        continue
+                all_content_curr_subreddit.append({
+                    "title": parsed_line["title"],
+                    "content": parsed_line["selftext"],
+                    "url": parsed_line["url"],
+                    "upvotes": parsed_line["ups"],
+                    "posted_date": post_date,
+                })
+        all_content_curr_subreddit.sort(key=lambda x: x["upvotes"], reverse=True)
+        all_content.extend(all_content_curr_subreddit[:limit_per_subreddit])
+    return all_content
+
+
+def _old_range(category: str, start: str, end: str, max_limit: int, query: Optional[str], data_path: str):
+    """The old local.py loop: one scan per day from start to end."""
+    posts = []
+    day = datetime.strptime(start, "%Y-%m-%d")
+    while day <= datetime.strptime(end, "%Y-%m-%d"):
+        posts.extend(_old_fetch_top_from_category(category, day.strftime("%Y-%m-%d"), max_limit, query, data_path))
+        day += timedelta(days=1)
+    return posts
+
+
+def _write_dump(data_path: str, days: int, posts_per_file: int, rng: random.Random) -> None:
+    for category, files in _CATEGORIES.items():
+        os.makedirs(os.path.join(data_path, category))
+        for data_file in files:
+            with open(os.path.join(data_path, category, data_file), "w") as f:
+                for i in range(posts_per_file):
+                    created = _START + timedelta(days=rng.randrange(days), seconds=rng.randrange(86400))
+                    f.write(json.dumps({
+                        "created_utc": created.timestamp(),
+                        # Few distinct values, so ties are common
+                        "ups": rng.choice([1, 5, 5, 20, 20, 100]),
+                        "title": f"{rng.choice(_PHRASES)} #{i}",
+                        "selftext": rng.choice(["", rng.choice(_PHRASES)]),
+                        "url": f"https://reddit.example/{category}/{data_file}/{i}",
+                    }) + "\n")
+                    if i % 7 == 0:
+                        f.write("\n")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check Reddit index results against the old per-day scan")
+    parser.add_argument("--days", type=int, default=6, help="Days covered by the dump")
+    parser.add_argument("--posts", type=int, default=30, help="Posts per JSONL file")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    start = _START.strftime("%Y-%m-%d")
+    end = (_START + timedelta(days=args.days - 1)).strftime("%Y-%m-%d")
+    cases = [
+        ("company_news", start, end, 10, "AAPL"),
+        ("company_news", start, end, 10, "META"),
+        ("company_news", start, end, 10, "ZZZQ"),
+        ("company_news", start, start, 10, None),
+        ("global_news", start, end, 5, None),
+        ("Company_Picks", start, end, 10, "AAPL"),
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_path = os.path.join(tmp, "reddit_data")
+        _write_dump(data_path, args.days, args.posts, random.Random(args.seed))
+        set_config({"data_cache_dir": os.path.join(tmp, "cache")})
+
+        ok = True
+        for category, case_start, case_end, limit, query in cases:
+            expected = _old_range(category, case_start, case_end, limit, query, data_path)
+            actual = fetch_top_posts(category, case_start, case_end, limit, query, data_path=data_path)
+            match = actual == expected
+            print(f"{category} {case_start}..{case_end} limit={limit} query={query}: "
+                  f"old={len(expected)} index={len(actual)} {'match' if match else 'MISMATCH'}")
+            if not match:
+                for i, (a, e) in enumerate(zip(actual, expected)):
+                    if a != e:
+                        print(f"  first difference at {i}: index={a['url']} old={e['url']}")
+                        break
+                ok = False
+
+    if not ok:
+        print("FAIL: index results differ from the old per-day scan")
+        return 1
+    print("PASS: index results match the old per-day scan, in order")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
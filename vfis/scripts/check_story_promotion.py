@@ -0,0 +1,245 @@
+"""
+Check: a story survives when its canonical chatter row is never written.
+
+Drives persist_source_records() (ingest_chatter.py) and the story index
+(chatter_dedupe.py) against the configured PostgreSQL (POSTGRES_* env
+vars), under a throwaway ticker per scenario:
+
+1. cancel after duplicate persisted: source B writes a near-duplicate
+   while source A's canonical record is pending, then A is cancelled;
+   B's row must become canonical with A's sentiment
+2. cancel before duplicate persisted: A is cancelled while B's duplicate
+   is still in flight; B's row must become canonical once written
+3. canonical row fails in the same batch: the canonical record is
+   rejected by PostgreSQL while its bodiless duplicate is written; the
+   duplicate must become canonical with the canonical's summary
+4. no duplicates: A is cancelled and nothing was written; the story must
+   leave the index so the next record of it is canonical
+
+Each scenario also checks that a later duplicate stays non-canonical,
+that the story is seeded from PostgreSQL after a restart
+(load_story_hashes), and that the ticker's rollup matches its rows.
+
+The connection pool and schema are set up first, as at startup:
+init_database() (schema.create_tables) and then run_migrations().
+
+Use a local or scratch database: the check writes real rows, and deletes
+them afterwards unless --keep is given.
+
+USAGE:
+    python -m vfis.scripts.check_story_promotion
+    python -m vfis.scripts.check_story_promotion --keep
+"""
+import argparse
+import sys
+import threading
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from tradingagents.database.chatter_persist import load_story_hashes
+from tradingagents.database.connection import get_db_connection, init_database
+from tradingagents.database.migrations import run_migrations
+from tradingagents.dataflows.chatter_dedupe import assign_story_clusters
+from tradingagents.dataflows.chatter_schema import MarketChatterRecord
+from tradingagents.dataflows.config import set_config
+from tradingagents.dataflows.ingest_chatter import persist_source_records
+from tradingagents.dataflows.ingest_concurrency import SourceCancelled
+
+_TITLE = "{t} beats quarterly earnings estimates and raises full year revenue guidance"
+_SUMMARY = "{t} reported strong demand across all regions, lifting margins and cash flow."
+
+
+def _record(ticker: str, source: str, suffix: str) -> MarketChatterRecord:
+    return MarketChatterRecord(
+        ticker=ticker,
+        source=source,
+        source_id=f"story-check-{suffix}",
+        title=_TITLE.format(t=ticker),
+        summary=_SUMMARY.format(t=ticker),
+        url=f"https://check.example/{ticker}/{suffix}",
+        published_at=datetime.utcnow() - timedelta(hours=1),
+    )
+
+
+def _scored(record: MarketChatterRecord) -> MarketChatterRecord:
+    """Stand-in for enrichment of a canonical record."""
+    record.sentiment_score = 0.8
+    record.sentiment_label = "positive"
+    record.confidence = 0.9
+    record.sentiment_model = "check"
+    return record
+
+
+def _cancelled_persist(records: List[MarketChatterRecord]) -> bool:
+    cancel = threading.Event()
+    cancel.set()
+    try:
+        persist_source_records(records, cancel)
+    except SourceCancelled:
+        return True
+    return False
+
+
+def _rows(ticker: str) -> List[Dict[str, Any]]:
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("""
+                SELECT source_id, is_canonical, summary, sentiment_score, story_cluster_id
+                FROM market_chatter WHERE ticker = %s ORDER BY id
+            """, (ticker,))
+            return [
+                {"source_id": r[0], "is_canonical": r[1], "summary": r[2],
+                 "sentiment_score": float(r[3]) if r[3] is not None else None, "cluster": r[4]}
+                for r in cur.fetchall()
+            ]
+
+
+def _rollup_matches(ticker: str) -> bool:
+    """Rollup totals equal the aggregates recomputed from market_chatter."""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("""
+                SELECT COALESCE(SUM(item_count), 0), COALESCE(SUM(story_count), 0),
+                       COALESCE(SUM(scored_count), 0)
+                FROM market_chatter_rollup WHERE ticker = %s
+            """, (ticker,))
+            rollup = tuple(int(v) for v in cur.fetchone())
+            cur.execute("""
+                SELECT COUNT(*), COUNT(*) FILTER (WHERE is_canonical),
+                       COUNT(sentiment_score) FILTER (WHERE is_canonical)
+                FROM market_chatter WHERE ticker = %s AND published_at IS NOT NULL
+            """, (ticker,))
+            rows = tuple(int(v) for v in cur.fetchone())
+    if rollup != rows:
+        print(f"  rollup (items, stories, scored)={rollup}, rows={rows}")
+    return rollup == rows
+
+
+def _cleanup(ticker: str) -> None:
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM market_chatter WHERE ticker = %s", (ticker,))
+            cur.execute("DELETE FROM market_chatter_rollup WHERE ticker = %s", (ticker,))
+        conn.commit()
+
+
+def _verify(
+    label: str,
+    ticker: str,
+    promoted_id: Optional[str],
+    expect_summary: bool,
+    expect_score: Optional[float]
+) -> bool:
+    rows = _rows(ticker)
+    canonical = [r for r in rows if r["is_canonical"]]
+
+    # A later duplicate of a surviving story must stay non-canonical
+    later = _record(ticker, "yahoo_finance", f"{ticker}-later")
+    assign_story_clusters([later])
+    survives = promoted_id is not None
+
+    seeded = {cluster for _, cluster, _ in load_story_hashes(ticker, datetime.utcnow() - timedelta(days=1))}
+    rollup_ok = _rollup_matches(ticker)
+
+    print(f"{label}: rows={[(r['source_id'], r['is_canonical']) for r in rows]}")
+    if survives:
+        row = canonical[0] if canonical else {}
+        print(f"  canonical={row.get('source_id')} summary={'yes' if row.get('summary') else 'no'} "
+              f"sentiment={row.get('sentiment_score')} later_is_canonical={later.is_canonical} "
+              f"seeded={row.get('cluster') in seeded} rollup_ok={rollup_ok}")
+        ok = (
+            len(canonical) == 1
+            and canonical[0]["source_id"] == promoted_id
+            and bool(canonical[0]["summary"]) == expect_summary
+            and canonical[0]["sentiment_score"] == expect_score
+            and not later.is_canonical
+            and canonical[0]["cluster"] in seeded
+            and rollup_ok
+        )
+    else:
+        print(f"  later_is_canonical={later.is_canonical} rollup_ok={rollup_ok}")
+        ok = not rows and later.is_canonical and rollup_ok
+
+    if not ok:
+        print(f"FAIL: {label}")
+    return ok
+
+
+def check_cancel_after_duplicate_persisted(ticker: str) -> bool:
+    a = _record(ticker, "rss", f"{ticker}-a")
+    b = _record(ticker, "google_news", f"{ticker}-b")
+    assign_story_clusters([a])
+    _scored(a)
+    assign_story_clusters([b])
+    persist_source_records([b])
+    cancelled = _cancelled_persist([a])
+    return cancelled and _verify("cancel_after_duplicate_persisted", ticker, b.source_id, True, 0.8)
+
+
+def check_cancel_before_duplicate_persisted(ticker: str) -> bool:
+    a = _record(ticker, "rss", f"{ticker}-a")
+    b = _record(ticker, "google_news", f"{ticker}-b")
+    assign_story_clusters([a])
+    _scored(a)
+    assign_story_clusters([b])
+    cancelled = _cancelled_persist([a])
+    persist_source_records([b])
+    return cancelled and _verify("cancel_before_duplicate_persisted", ticker, b.source_id, True, 0.8)
+
+
+def check_same_batch_canonical_fails(ticker: str) -> bool:
+    # An unparseable timestamp makes PostgreSQL reject only the canonical row
+    a = _scored(_record(ticker, "rss", f"{ticker}-a"))
+    b = _record(ticker, "rss", f"{ticker}-b")
+    assign_story_clusters([a, b])
+    a.published_at = "not a timestamp"
+    counts = persist_source_records([a, b])
+    print(f"  same-batch persist counts: {counts}")
+    return counts["errors"] == 1 and _verify("same_batch_canonical_fails", ticker, b.source_id, True, 0.8)
+
+
+def check_no_duplicates(ticker: str) -> bool:
+    a = _record(ticker, "rss", f"{ticker}-a")
+    assign_story_clusters([a])
+    cancelled = _cancelled_persist([a])
+    return cancelled and _verify("no_duplicates", ticker, None, False, None)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check story promotion when canonical chatter writes fail")
+    parser.add_argument("--keep", action="store_true", help="Keep the rows written by the check")
+    args = parser.parse_args()
+
+    init_database()
+    migrated, errors = run_migrations()
+    if not migrated:
+        print(f"FAIL: migrations did not complete: {errors}")
+        return 1
+
+    set_config({"chatter_dedupe_enabled": True})
+    run_id = uuid.uuid4().hex[:6].upper()
+    scenarios = [
+        (check_cancel_after_duplicate_persisted, f"ZZP{run_id}A"),
+        (check_cancel_before_duplicate_persisted, f"ZZP{run_id}B"),
+        (check_same_batch_canonical_fails, f"ZZP{run_id}C"),
+        (check_no_duplicates, f"ZZP{run_id}D"),
+    ]
+
+    passed = []
+    try:
+        for check, ticker in scenarios:
+            passed.append(check(ticker))
+    finally:
+        if not args.keep:
+            for _, ticker in scenarios:
+                _cleanup(ticker)
+
+    if not all(passed):
+        return 1
+    print("PASS: lost canonical writes promote a written duplicate or release the story")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+"""
+Check: partial vendor results are never cached as immutable.
+
+Replaces the get_news vendor implementations with stubs (no network) and
+routes historical-date calls through route_to_vendor() with the vendor
+cache on a temporary SQLite file. Then:
+
+1. complete: every implementation of the "local" vendor succeeds; the
+   historical result is stored without expiry (control)
+2. implementation raised: one implementation of the "local" vendor
+   raises; the combined partial result must be stored with the TTL
+3. chain vendor raised: one vendor of a comma-separated primary chain
+   raises; the result of the others must be stored with the TTL
+
+In every case both the memory and the disk entry are inspected.
+
+USAGE:
+    python -m vfis.scripts.check_vendor_cache
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+from typing import List, Optional, Tuple
+
+import tradingagents.dataflows.vendor_cache as vendor_cache
+from tradingagents.dataflows.config import set_config
+from tradingagents.dataflows.interface import VENDOR_METHODS, route_to_vendor
+from tradingagents.dataflows.vendor_cache import vendor_cache_key
+
+# Long settled, so a complete result is historical
+_ARGS = ("STUB", "2020-01-02", "2020-01-09")
+
+
+def _ok(name: str):
+    def impl(ticker, start_date, end_date):
+        return f"{name} news for {ticker} {start_date}..{end_date}"
+    impl.__name__ = name
+    return impl
+
+
+def _raising(name: str):
+    def impl(ticker, start_date, end_date):
+        raise ConnectionError(f"{name} unavailable")
+    impl.__name__ = name
+    return impl
+
+
+def _expiry(path: str, vendor_config: str) -> Tuple[Optional[float], Optional[float], bool]:
+    """Memory and disk expires_at of the cached get_news entry, and whether it exists."""
+    key = vendor_cache_key("get_news", vendor_config, _ARGS, {})
+    cache = vendor_cache.get_vendor_cache()
+    memory = cache._memory.get(key)
+    with sqlite3.connect(path) as conn:
+        row = conn.execute("SELECT expires_at FROM vendor_results WHERE cache_key = ?", (key,)).fetchone()
+    stored = memory is not None and row is not None
+    return (memory[0] if memory else None), (row[0] if row else None), stored
+
+
+def _scenario(label: str, directory: str, vendor_config: str, vendors: dict, expect_immutable: bool) -> bool:
+    # A fresh cache file per scenario, so no scenario is served another's entry
+    path = os.path.join(directory, f"{label}.sqlite3")
+    VENDOR_METHODS["get_news"] = vendors
+    set_config({"data_vendors": {"news_data": vendor_config}, "tool_vendors": {}, "vendor_cache_path": path})
+    vendor_cache._cache = None
+
+    result = route_to_vendor("get_news", *_ARGS)
+    memory_expiry, disk_expiry, stored = _expiry(path, vendor_config)
+    immutable = stored and memory_expiry is None and disk_expiry is None
+
+    print(f"{label}: vendors={vendor_config!r} stored={stored} "
+          f"memory_expires_at={memory_expiry} disk_expires_at={disk_expiry}")
+    print(f"  result: {result!r}")
+
+    ok = stored and immutable == expect_immutable
+    if not ok:
+        expected = "without expiry" if expect_immutable else "with a TTL"
+        print(f"FAIL: {label} result was not cached {expected}")
+    return ok
+
+
+def main() -> int:
+    original_methods = dict(VENDOR_METHODS["get_news"])
+    directory = tempfile.mkdtemp(prefix="vendor_cache_check_")
+    set_config({"vendor_cache_enabled": True, "vendor_cache_settle_days": 1})
+
+    try:
+        passed: List[bool] = [
+            _scenario("complete", directory, "local", {
+                "local": [_ok("finnhub"), _ok("reddit"), _ok("google")],
+            }, expect_immutable=True),
+            _scenario("implementation_raised", directory, "local", {
+                "local": [_ok("finnhub"), _ok("reddit"), _raising("google")],
+            }, expect_immutable=False),
+            _scenario("chain_vendor_raised", directory, "alpha_vantage,google", {
+                "alpha_vantage": _raising("alpha_vantage"),
+                "google": _ok("google"),
+            }, expect_immutable=False),
+        ]
+    finally:
+        VENDOR_METHODS["get_news"] = original_methods
+        vendor_cache._cache = None
+
+    if not all(passed):
+        return 1
+    print("PASS: only complete primary results are cached without expiry")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
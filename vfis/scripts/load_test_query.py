@@ -0,0 +1,133 @@
+"""
+Load test: /health latency while /query requests are in flight.
+
+Measures /health latency on an idle server (baseline), then again while
+CONCURRENCY /query requests run continuously. With the query path running
+its blocking work off the event loop, the two distributions should match;
+a blocked event loop shows up as /health latencies close to the duration
+of a /query.
+
+USAGE:
+    # Start the API first, e.g. uvicorn vfis.api.app:app --port 8000
+    python -m vfis.scripts.load_test_query --ticker AAPL --concurrency 8 --duration 30
+
+The run fails if no /query completed with a DAL status (e.g. every
+request hit a 404), since /health latency then says nothing about load.
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+import httpx
+
+# Router prefix in vfis/api/app.py
+API_PREFIX = "/api/v1"
+
+# Statuses a /query response can carry (QueryResponse.status)
+QUERY_STATUSES = ("success", "pending", "no_data", "error")
+
+
+def _summarize(latencies_ms: List[float]) -> Dict[str, float]:
+    if not latencies_ms:
+        return {"count": 0}
+    ordered = sorted(latencies_ms)
+    return {
+        "count": len(ordered),
+        "p50_ms": round(statistics.median(ordered), 1),
+        "p95_ms": round(ordered[int(0.95 * (len(ordered) - 1))], 1),
+        "max_ms": round(ordered[-1], 1),
+    }
+
+
+async def _probe_health(client: httpx.AsyncClient, stop: asyncio.Event,
+                        interval: float, latencies_ms: List[float]) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await client.get(f"{API_PREFIX}/health")
+        latencies_ms.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(interval)
+
+
+async def _run_queries(client: httpx.AsyncClient, stop: asyncio.Event,
+                       ticker: str, statuses: Dict[str, int]) -> None:
+    payload = {"ticker": ticker, "subscriber_risk_profile": "MODERATE"}
+    while not stop.is_set():
+        try:
+            response = await client.post(f"{API_PREFIX}/query", json=payload)
+            if response.status_code == 200:
+                status = response.json().get("status", "http_200")
+            else:
+                status = f"http_{response.status_code}"
+        except httpx.HTTPError as e:
+            status = type(e).__name__
+        statuses[status] = statuses.get(status, 0) + 1
+
+
+async def run_load_test(base_url: str, ticker: str, concurrency: int,
+                        duration: float, interval: float) -> Dict[str, object]:
+    timeout = httpx.Timeout(600.0)
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout) as client:
+        # Baseline: /health with no queries in flight
+        idle: List[float] = []
+        stop = asyncio.Event()
+        probe = asyncio.create_task(_probe_health(client, stop, interval, idle))
+        await asyncio.sleep(min(duration, 5.0))
+        stop.set()
+        await probe
+
+        # Under load: /health while queries run continuously
+        loaded: List[float] = []
+        statuses: Dict[str, int] = {}
+        stop = asyncio.Event()
+        tasks = [asyncio.create_task(_probe_health(client, stop, interval, loaded))]
+        tasks += [
+            asyncio.create_task(_run_queries(client, stop, ticker, statuses))
+            for _ in range(concurrency)
+        ]
+        await asyncio.sleep(duration)
+        stop.set()
+        await asyncio.gather(*tasks)
+
+    return {
+        "health_idle": _summarize(idle),
+        "health_under_query_load": _summarize(loaded),
+        "query_statuses": statuses,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check /health latency under /query load")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--ticker", required=True, help="Ticker to query")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent /query loops")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds under load")
+    parser.add_argument("--interval", type=float, default=0.1, help="Seconds between /health probes")
+    parser.add_argument("--max-p95-ratio", type=float, default=3.0,
+                        help="Fail if loaded /health p95 exceeds idle p95 by this factor")
+    args = parser.parse_args()
+
+    report = asyncio.run(run_load_test(
+        args.base_url, args.ticker.upper(), args.concurrency, args.duration, args.interval
+    ))
+    for key, value in report.items():
+        print(f"{key}: {value}")
+
+    completed = sum(report["query_statuses"].get(status, 0) for status in QUERY_STATUSES)
+    if not completed:
+        print(f"FAIL: no /query request completed (statuses: {report['query_statuses']})")
+        return 1
+
+    idle_p95 = report["health_idle"].get("p95_ms")
+    loaded_p95 = report["health_under_query_load"].get("p95_ms")
+    if idle_p95 and loaded_p95 and loaded_p95 > max(idle_p95 * args.max_p95_ratio, 50.0):
+        print(f"FAIL: /health p95 {loaded_p95}ms under load vs {idle_p95}ms idle")
+        return 1
+    print("PASS: /health latency unaffected by in-flight /query requests")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""
+Request-scoped data context for the VFIS query path.
+
+A single query fans out to BullAgent, BearAgent, RiskManagementAgent,
+SubscriberMatcher and FinalOutputAssembly, which all read the same company,
+financial statements and news for one ticker. While a RequestDataContext is
+active, VFISDataAccess results are memoized per (method, arguments) so each
+distinct dataset is read from PostgreSQL exactly once per request.
+
+Usage:
+    from vfis.tools.data_context import request_data_context
+
+    with request_data_context() as data_ctx:
+        output = assembly.assemble_final_output(ticker, ...)
+    logger.info(data_ctx.stats())
+
+Outside an active context VFISDataAccess behaves exactly as before.
+"""
+
+import copy
+import functools
+import inspect
+import logging
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional
+
+from vfis.tools.stage_cancel import check_stage_cancelled
+
+logger = logging.getLogger(__name__)
+
+# Arguments that only feed audit logging and never change the data returned
+AUDIT_ONLY_ARGS = frozenset({'agent_name', 'user_query'})
+
+_current_context: ContextVar[Optional['RequestDataContext']] = ContextVar(
+    'vfis_request_data_context', default=None
+)
+
+
+class RequestDataContext:
+    """
+    Memoization scope for the life of one query.
+
+    Thread-safe: concurrent lookups of the same key wait for the first
+    loader instead of issuing a duplicate read.
+    """
+
+    def __init__(self):
+        self._results: Dict[Hashable, Any] = {}
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Any],
+        should_cache: Callable[[Any], bool] = lambda result: True
+    ) -> Any:
+        """
+        Return the memoized result for key, calling loader on first use.
+
+        Args:
+            key: Hashable (method, arguments) key
+            loader: Zero-argument callable that performs the actual read
+            should_cache: Predicate deciding whether a result may be reused
+
+        Returns:
+            A private copy of the result, so callers cannot mutate the cache.
+        """
+        with self._lock:
+            if key in self._results:
+                self.hits += 1
+                return copy.deepcopy(self._results[key])
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                if key in self._results:
+                    self.hits += 1
+                    return copy.deepcopy(self._results[key])
+                self.misses += 1
+
+            result = loader()
+            if should_cache(result):
+                with self._lock:
+                    self._results[key] = copy.deepcopy(result)
+            return result
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters for this request."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._results)
+            }
+
+
+def get_request_data_context() -> Optional[RequestDataContext]:
+    """Return the active request data context, if any."""
+    return _current_context.get()
+
+
+@contextmanager
+def request_data_context() -> Iterator[RequestDataContext]:
+    """
+    Activate a request data context for the enclosed block.
+
+    Nested use reuses the outer context so one query keeps a single cache.
+    """
+    existing = _current_context.get()
+    if existing is not None:
+        yield existing
+        return
+
+    ctx = RequestDataContext()
+    token = _current_context.set(ctx)
+    try:
+        yield ctx
+    finally:
+        _current_context.reset(token)
+        logger.debug(f"[DATA_CTX] Request data context closed: {ctx.stats()}")
+
+
+def request_memoized(
+    should_cache: Callable[[Any], bool] = lambda result: True
+) -> Callable:
+    """
+    Decorator memoizing a data access function inside a request context.
+
+    The cache key is the function name plus its bound arguments (defaults
+    applied, audit-only arguments dropped, ticker upper-cased). Calls made
+    by a cancelled query stage raise StageCancelled instead of reading.
+
+    Args:
+        should_cache: Predicate deciding whether a result may be reused
+            (e.g. ERROR results are retried instead of memoized)
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            check_stage_cancelled()
+            ctx = _current_context.get()
+            if ctx is None:
+                return func(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key_args = []
+            for name, value in bound.arguments.items():
+                if name in AUDIT_ONLY_ARGS:
+                    continue
+                if name == 'ticker' and isinstance(value, str):
+                    value = value.upper()
+                key_args.append((name, value))
+            key = (func.__qualname__, tuple(key_args))
+
+            return ctx.get_or_load(key, lambda: func(*args, **kwargs), should_cache)
+
+        return wrapper
+
+    return decorator
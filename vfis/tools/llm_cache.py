@@ -0,0 +1,298 @@
+"""
+Content-addressed cache for agent LLM responses.
+
+BullAgent and BearAgent ask the LLM to structure signals that only change
+when the underlying financials, news or technicals change. Responses are
+stored in a local SQLite file keyed by a hash of:
+
+- the deployment name and temperature of the client
+- the rendered prompt messages (covers template changes)
+- a canonical fingerprint of the input data
+
+A repeat query within the data-freshness window (LLM_CACHE_TTL_SECONDS)
+is answered from the cache without calling the model. Cache failures never
+block the LLM call.
+
+Usage:
+    from vfis.tools.llm_cache import cached_llm_invoke, bypass_llm_cache
+
+    content = cached_llm_invoke(self.llm, messages, data=signals)
+
+    with bypass_llm_cache():          # force fresh responses (still stored)
+        output = assembly.assemble_final_output(...)
+
+Set LLM_CACHE_ENABLED=false to disable the cache entirely.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional, Sequence
+
+from tradingagents import metrics
+from vfis.core.env import (
+    AZURE_OPENAI_DEPLOYMENT_NAME,
+    LLM_CACHE_ENABLED,
+    LLM_CACHE_PATH,
+    LLM_CACHE_TTL_SECONDS,
+)
+from vfis.tools.stage_cancel import check_stage_cancelled
+
+logger = logging.getLogger(__name__)
+
+# Expired rows are purged every N writes
+PURGE_EVERY_WRITES = 100
+
+_bypass: ContextVar[bool] = ContextVar('vfis_llm_cache_bypass', default=False)
+
+
+def fingerprint(value: Any) -> str:
+    """
+    Stable SHA-256 of a JSON-serializable value (dict key order ignored).
+
+    Args:
+        value: Data to fingerprint (dates and other objects via str())
+
+    Returns:
+        Hex digest
+    """
+    canonical = json.dumps(value, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def _message_payload(messages: Sequence[Any]) -> list:
+    return [
+        {'type': getattr(m, 'type', type(m).__name__), 'content': getattr(m, 'content', str(m))}
+        for m in messages
+    ]
+
+
+class LLMResponseCache:
+    """
+    SQLite-backed response store with per-entry expiry.
+
+    Thread-safe; one connection per process, serialized by a lock.
+    """
+
+    def __init__(self, path: str, ttl_seconds: int):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.errors = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the store on first use. Caller holds self._lock."""
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    cache_key TEXT PRIMARY KEY,
+                    content TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            """)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached content for key, or None if missing or expired."""
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT content FROM llm_responses WHERE cache_key = ? AND expires_at > ?",
+                    (key, time.time())
+                ).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+                self.hits += 1
+                return row[0]
+        except Exception as e:
+            with self._lock:
+                self.errors += 1
+            logger.warning(f"[LLM_CACHE] Lookup failed: {e}")
+            return None
+
+    def put(self, key: str, content: str, ttl_seconds: Optional[int] = None) -> None:
+        """Store content for key (replacing any previous entry)."""
+        now = time.time()
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_responses (cache_key, content, created_at, expires_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, content, now, now + ttl)
+                )
+                self._writes += 1
+                if self._writes % PURGE_EVERY_WRITES == 0:
+                    conn.execute("DELETE FROM llm_responses WHERE expires_at <= ?", (now,))
+                conn.commit()
+        except Exception as e:
+            with self._lock:
+                self.errors += 1
+            logger.warning(f"[LLM_CACHE] Store failed: {e}")
+
+    def record_bypass(self) -> None:
+        """Count a call that skipped the cache lookup."""
+        with self._lock:
+            self.bypassed += 1
+
+    def clear(self) -> None:
+        """Delete all cached responses."""
+        with self._lock:
+            self._connect().execute("DELETE FROM llm_responses")
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the hit rate of looked-up calls."""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": LLM_CACHE_ENABLED,
+            "path": self.path,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "errors": self.errors,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+        }
+
+
+_cache: Optional[LLMResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """Return the process-wide LLM response cache."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = LLMResponseCache(LLM_CACHE_PATH, LLM_CACHE_TTL_SECONDS)
+    return _cache
+
+
+@contextmanager
+def bypass_llm_cache() -> Iterator[None]:
+    """
+    Skip cache lookups for LLM calls made in this context.
+
+    Fresh responses are still stored. The flag is a contextvar, so it
+    follows the query into run_stages() worker threads.
+    """
+    token = _bypass.set(True)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
+
+
+def _deployment(llm: Any) -> Optional[str]:
+    return (
+        getattr(llm, 'deployment_name', None)
+        or getattr(llm, 'model_name', None)
+        or AZURE_OPENAI_DEPLOYMENT_NAME
+    )
+
+
+def _invoke(llm: Any, messages: Sequence[Any]) -> str:
+    """Call the LLM, recording latency and token usage."""
+    check_stage_cancelled()
+    deployment = _deployment(llm) or 'unknown'
+    start = time.perf_counter()
+    try:
+        response = llm.invoke(messages)
+    except Exception:
+        metrics.LLM_CALL_SECONDS.observe(time.perf_counter() - start, deployment=deployment, outcome='error')
+        raise
+    metrics.LLM_CALL_SECONDS.observe(time.perf_counter() - start, deployment=deployment, outcome='ok')
+
+    usage = getattr(response, 'usage_metadata', None) or {}
+    if usage:
+        prompt_tokens, completion_tokens = usage.get('input_tokens', 0), usage.get('output_tokens', 0)
+    else:
+        usage = (getattr(response, 'response_metadata', None) or {}).get('token_usage') or {}
+        prompt_tokens, completion_tokens = usage.get('prompt_tokens', 0), usage.get('completion_tokens', 0)
+    metrics.LLM_TOKENS_TOTAL.inc(prompt_tokens or 0, deployment=deployment, kind='prompt')
+    metrics.LLM_TOKENS_TOTAL.inc(completion_tokens or 0, deployment=deployment, kind='completion')
+    return response.content
+
+
+def llm_cache_key(llm: Any, messages: Sequence[Any], data: Any = None) -> str:
+    """
+    Content address of an LLM call.
+
+    Args:
+        llm: Chat model client (deployment name and temperature are read from it)
+        messages: Rendered prompt messages
+        data: Input data the prompt was rendered from
+
+    Returns:
+        Hex cache key
+    """
+    return fingerprint({
+        'deployment': _deployment(llm),
+        'temperature': getattr(llm, 'temperature', None),
+        'prompt': fingerprint(_message_payload(messages)),
+        'data': fingerprint(data),
+    })
+
+
+def cached_llm_invoke(
+    llm: Any,
+    messages: Sequence[Any],
+    data: Any = None,
+    ttl_seconds: Optional[int] = None
+) -> str:
+    """
+    Invoke the LLM unless an identical call was answered within the TTL.
+
+    Args:
+        llm: Chat model client
+        messages: Prompt messages
+        data: Input data fingerprinted into the key (exclude values that
+            change on every query but do not affect the prompt)
+        ttl_seconds: Override the default data-freshness window
+
+    Returns:
+        Response content
+    """
+    if not LLM_CACHE_ENABLED:
+        return _invoke(llm, messages)
+
+    cache = get_llm_cache()
+    key = llm_cache_key(llm, messages, data)
+
+    if _bypass.get():
+        cache.record_bypass()
+        metrics.LLM_CACHE_REQUESTS_TOTAL.inc(outcome='bypass')
+    else:
+        content = cache.get(key)
+        if content is not None:
+            metrics.LLM_CACHE_REQUESTS_TOTAL.inc(outcome='hit')
+            logger.debug(f"[LLM_CACHE] Hit {key[:12]}")
+            return content
+        metrics.LLM_CACHE_REQUESTS_TOTAL.inc(outcome='miss')
+
+    content = _invoke(llm, messages)
+    cache.put(key, content, ttl_seconds)
+    return content
@@ -2,12 +2,19 @@
 LLM Factory for Azure OpenAI Cognitive Services.
 
 This module provides a centralized factory function for creating Azure OpenAI
-AzureChatOpenAI instances with consistent configuration.
+AzureChatOpenAI instances with consistent configuration, and a process-wide
+cache so agents share one client (and its connection pool) per temperature.
 """
 
 import os
+import threading
+from typing import Dict
+
 from langchain_openai import AzureChatOpenAI
 
+_shared_llms: Dict[float, AzureChatOpenAI] = {}
+_shared_llms_lock = threading.Lock()
+
 
 def create_azure_openai_llm(temperature: float = 0) -> AzureChatOpenAI:
     """
@@ -43,3 +50,27 @@ def create_azure_openai_llm(temperature: float = 0) -> AzureChatOpenAI:
         temperature=temperature
     )
 
+
+def get_shared_azure_openai_llm(temperature: float = 0) -> AzureChatOpenAI:
+    """
+    Return the process-wide AzureChatOpenAI client for a temperature.
+    
+    The client is created on first use and reused by every agent afterwards.
+    AzureChatOpenAI holds no per-call state, so sharing it across threads
+    and requests is safe.
+    
+    Args:
+        temperature: Temperature parameter for the LLM (default: 0)
+        
+    Returns:
+        Shared AzureChatOpenAI instance
+    """
+    key = float(temperature)
+    llm = _shared_llms.get(key)
+    if llm is None:
+        with _shared_llms_lock:
+            llm = _shared_llms.get(key)
+            if llm is None:
+                llm = create_azure_openai_llm(temperature=temperature)
+                _shared_llms[key] = llm
+    return llm
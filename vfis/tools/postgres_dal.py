@@ -21,6 +21,9 @@ from decimal import Decimal
 
 # Import database connection from tradingagents package
 from tradingagents.database.connection import get_db_connection
+from tradingagents.database.schema_registry import is_table_ready, invalidate_on_ddl_error
+from tradingagents.metrics import DB_QUERY_SECONDS, timed
+from vfis.tools.data_context import request_memoized
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +52,11 @@ class DataStatus(Enum):
     ERROR = "ERROR"
 
 
+def _is_cacheable(result: Tuple[Any, DataStatus]) -> bool:
+    """ERROR results are retried on the next call instead of memoized."""
+    return result[1] != DataStatus.ERROR
+
+
 class VFISDataAccess:
     """
     Data Access Layer for Verified Financial Intelligence System.
@@ -59,9 +67,15 @@ class VFISDataAccess:
     - Explicit status reporting (SUCCESS, NO_DATA, STALE_DATA, ERROR)
     - Comprehensive audit logging
     - Windows-compatible operations
+    
+    Inside a request data context (vfis.tools.data_context) every read
+    method is memoized per (method, arguments), so a dataset is fetched
+    and audited once per query no matter how many agents ask for it.
     """
     
     @staticmethod
+    @request_memoized()
+    @timed(DB_QUERY_SECONDS, statement='get_company_by_ticker')
     def get_company_by_ticker(ticker: str) -> Optional[Dict[str, Any]]:
         """
         Get company information by ticker symbol.
@@ -98,6 +112,8 @@ class VFISDataAccess:
             raise
     
     @staticmethod
+    @request_memoized(_is_cacheable)
+    @timed(DB_QUERY_SECONDS, statement='get_quarterly_financials')
     def get_quarterly_financials(
         ticker: str,
         fiscal_year: Optional[int] = None,
@@ -252,6 +268,8 @@ class VFISDataAccess:
             return {}, DataStatus.ERROR
     
     @staticmethod
+    @request_memoized(_is_cacheable)
+    @timed(DB_QUERY_SECONDS, statement='get_annual_financials')
     def get_annual_financials(
         ticker: str,
         fiscal_year: Optional[int] = None,
@@ -401,6 +419,8 @@ class VFISDataAccess:
             return {}, DataStatus.ERROR
     
     @staticmethod
+    @request_memoized(_is_cacheable)
+    @timed(DB_QUERY_SECONDS, statement='get_news')
     def get_news(
         ticker: str,
         limit: int = 10,
@@ -431,13 +451,7 @@ class VFISDataAccess:
             with get_db_connection() as conn:
                 with conn.cursor() as cur:
                     # Check if news table exists (it will be added to schema)
-                    cur.execute("""
-                        SELECT EXISTS (
-                            SELECT FROM information_schema.tables 
-                            WHERE table_name = 'news'
-                        );
-                    """)
-                    table_exists = cur.fetchone()[0]
+                    table_exists = is_table_ready('news', cur)
                     
                     if not table_exists:
                         # News table not yet created, return NO_DATA
@@ -507,6 +521,7 @@ class VFISDataAccess:
                     return articles, status
                     
         except Exception as e:
+            invalidate_on_ddl_error(e, 'news')
             logger.error(f"Error retrieving news for {ticker}: {e}")
             VFISDataAccess._log_audit(
                 agent_name=agent_name,
@@ -518,6 +533,8 @@ class VFISDataAccess:
             return [], DataStatus.ERROR
     
     @staticmethod
+    @request_memoized(_is_cacheable)
+    @timed(DB_QUERY_SECONDS, statement='get_technical_indicators')
     def get_technical_indicators(
         ticker: str,
         indicator_name: Optional[str] = None,
@@ -550,13 +567,7 @@ class VFISDataAccess:
             with get_db_connection() as conn:
                 with conn.cursor() as cur:
                     # Check if technical_indicators table exists
-                    cur.execute("""
-                        SELECT EXISTS (
-                            SELECT FROM information_schema.tables 
-                            WHERE table_name = 'technical_indicators'
-                        );
-                    """)
-                    table_exists = cur.fetchone()[0]
+                    table_exists = is_table_ready('technical_indicators', cur)
                     
                     if not table_exists:
                         VFISDataAccess._log_audit(
@@ -616,6 +627,7 @@ class VFISDataAccess:
                     return indicators, DataStatus.SUCCESS
                     
         except Exception as e:
+            invalidate_on_ddl_error(e, 'technical_indicators')
             logger.error(f"Error retrieving technical indicators for {ticker}: {e}")
             VFISDataAccess._log_audit(
                 agent_name=agent_name,
@@ -76,6 +76,18 @@ def create_vfis_tables():
             if not cur.fetchone():
                 cur.execute("ALTER TABLE technical_indicators ADD COLUMN source VARCHAR(50) DEFAULT 'computed';")
             
+            # Per-ticker state of the incremental indicator engine
+            cur.execute("""
+                CREATE TABLE IF NOT EXISTS technical_indicator_state (
+                    ticker VARCHAR(20) PRIMARY KEY,
+                    last_date DATE NOT NULL,
+                    bar_count INTEGER NOT NULL,
+                    engine_version INTEGER NOT NULL,
+                    state JSONB NOT NULL,
+                    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+                );
+            """)
+            
             # Create indexes for performance
             cur.execute("CREATE INDEX IF NOT EXISTS idx_news_company_id ON news(company_id);")
             cur.execute("CREATE INDEX IF NOT EXISTS idx_news_published_at ON news(published_at DESC);")
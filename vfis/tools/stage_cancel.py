@@ -0,0 +1,42 @@
+"""
+Cooperative cancellation for concurrent query stages.
+
+run_stages() (vfis.agents.concurrent_stages) gives each stage a
+threading.Event and activates it in the stage's worker thread. When the
+stage times out the event is set; LLM calls (vfis.tools.llm_cache) and
+VFISDataAccess reads (vfis.tools.data_context) call check_stage_cancelled()
+before starting, so an abandoned stage stops at its next LLM or database
+call instead of holding a pool worker until it finishes on its own.
+
+Outside a stage check_stage_cancelled() does nothing.
+"""
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+_current_cancel: ContextVar[Optional[threading.Event]] = ContextVar(
+    'vfis_stage_cancel', default=None
+)
+
+
+class StageCancelled(Exception):
+    """Raised inside a stage whose cancellation event has been set."""
+
+
+@contextmanager
+def stage_cancel_scope(cancel: threading.Event) -> Iterator[None]:
+    """Make cancel the current stage's cancellation event for the enclosed block."""
+    token = _current_cancel.set(cancel)
+    try:
+        yield
+    finally:
+        _current_cancel.reset(token)
+
+
+def check_stage_cancelled() -> None:
+    """Raise StageCancelled if the current stage has been cancelled."""
+    cancel = _current_cancel.get()
+    if cancel is not None and cancel.is_set():
+        raise StageCancelled("query stage cancelled")
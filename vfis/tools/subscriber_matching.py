@@ -9,7 +9,7 @@ STRICT RULES:
 """
 
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 from enum import Enum
 
 from vfis.agents.risk_management_agent import RiskManagementAgent, RiskLevel
@@ -31,15 +31,21 @@ class SubscriberMatcher:
     CRITICAL: Deterministic matching rules, no LLM logic.
     """
     
-    def __init__(self):
-        """Initialize Subscriber Matcher."""
-        self.risk_agent = RiskManagementAgent()
+    def __init__(self, risk_agent: Optional[RiskManagementAgent] = None):
+        """
+        Initialize Subscriber Matcher.
+        
+        Args:
+            risk_agent: Optional RiskManagementAgent to share (default: new instance)
+        """
+        self.risk_agent = risk_agent or RiskManagementAgent()
     
     def match_company_to_subscriber(
         self,
         ticker: str,
         subscriber_risk_tolerance: SubscriberRiskTolerance,
-        user_query: str = "Match company to subscriber"
+        user_query: str = "Match company to subscriber",
+        risk_assessment: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Determine if a company matches subscriber's risk tolerance.
@@ -48,52 +54,102 @@ class SubscriberMatcher:
             ticker: Company ticker symbol
             subscriber_risk_tolerance: Subscriber's risk tolerance level
             user_query: Original user query for audit logging
+            risk_assessment: Optional precomputed RiskManagementAgent.classify_risk
+                output for the ticker (classified here if omitted)
             
         Returns:
             Dictionary with matching result and explanation
         """
+        return self.match_company_to_subscribers(
+            ticker=ticker,
+            subscriber_risk_tolerances=[subscriber_risk_tolerance],
+            user_query=user_query,
+            risk_assessment=risk_assessment
+        )[0]
+    
+    def match_company_to_subscribers(
+        self,
+        ticker: str,
+        subscriber_risk_tolerances: Sequence[SubscriberRiskTolerance],
+        user_query: str = "Match company to subscribers",
+        risk_assessment: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Match one company against N subscriber profiles.
+        
+        The company's risk is classified at most once (not at all when
+        risk_assessment is given); each distinct tolerance is then evaluated
+        once and shared by every profile with that tolerance.
+        
+        Args:
+            ticker: Company ticker symbol
+            subscriber_risk_tolerances: Risk tolerance of each subscriber profile
+            user_query: Original user query for audit logging
+            risk_assessment: Optional precomputed RiskManagementAgent.classify_risk
+                output for the ticker (classified here if omitted)
+            
+        Returns:
+            One matching result per profile, in the order given
+        """
         try:
-            # Get company risk classification
-            risk_assessment = self.risk_agent.classify_risk(
-                ticker=ticker,
-                user_query=user_query
-            )
+            if risk_assessment is None:
+                # Get company risk classification
+                risk_assessment = self.risk_agent.classify_risk(
+                    ticker=ticker,
+                    user_query=user_query
+                )
             
-            risk_level_str = risk_assessment.get('risk_level', 'UNKNOWN')
-            try:
-                company_risk_level = RiskLevel[risk_level_str]
-            except KeyError:
-                # If risk level is not a valid enum value, default to HIGH for safety
-                logger.warning(f"Invalid risk level '{risk_level_str}', defaulting to HIGH")
-                company_risk_level = RiskLevel.HIGH
+            company_risk_level = self._resolve_company_risk_level(risk_assessment)
+            matching_rules = self._get_matching_rules()
             
-            # Deterministic matching rules
-            is_match, warning = self._check_match(company_risk_level, subscriber_risk_tolerance)
+            # Deterministic matching rules, evaluated once per distinct tolerance
+            outcomes = {}
+            for tolerance in set(subscriber_risk_tolerances):
+                is_match, warning = self._check_match(company_risk_level, tolerance)
+                outcomes[tolerance] = (
+                    is_match,
+                    warning,
+                    self._generate_explanation(is_match, company_risk_level, tolerance, warning)
+                )
             
-            result = {
-                'ticker': ticker,
-                'subscriber_risk_tolerance': subscriber_risk_tolerance.value,
-                'company_risk_level': company_risk_level.value,
-                'is_match': is_match,
-                'warning': warning,
-                'matching_rules': self._get_matching_rules(),
-                'explanation': self._generate_explanation(
-                    is_match, company_risk_level, subscriber_risk_tolerance, warning
-                ),
-                'risk_assessment': risk_assessment
-            }
+            results = []
+            for tolerance in subscriber_risk_tolerances:
+                is_match, warning, explanation = outcomes[tolerance]
+                results.append({
+                    'ticker': ticker,
+                    'subscriber_risk_tolerance': tolerance.value,
+                    'company_risk_level': company_risk_level.value,
+                    'is_match': is_match,
+                    'warning': warning,
+                    'matching_rules': matching_rules,
+                    'explanation': explanation,
+                    'risk_assessment': risk_assessment
+                })
             
-            return result
+            return results
         
         except Exception as e:
             logger.error(f"Subscriber matching failed for {ticker}: {e}", exc_info=True)
-            return {
-                'ticker': ticker,
-                'subscriber_risk_tolerance': subscriber_risk_tolerance.value,
-                'is_match': False,
-                'error': str(e),
-                'explanation': f"Matching failed: {str(e)}"
-            }
+            return [
+                {
+                    'ticker': ticker,
+                    'subscriber_risk_tolerance': tolerance.value,
+                    'is_match': False,
+                    'error': str(e),
+                    'explanation': f"Matching failed: {str(e)}"
+                }
+                for tolerance in subscriber_risk_tolerances
+            ]
+    
+    def _resolve_company_risk_level(self, risk_assessment: Dict[str, Any]) -> RiskLevel:
+        """Map a risk assessment to a RiskLevel (HIGH if missing or invalid)."""
+        risk_level_str = risk_assessment.get('risk_level', 'UNKNOWN')
+        try:
+            return RiskLevel[risk_level_str]
+        except KeyError:
+            # If risk level is not a valid enum value, default to HIGH for safety
+            logger.warning(f"Invalid risk level '{risk_level_str}', defaulting to HIGH")
+            return RiskLevel.HIGH
     
     def _check_match(
         self,
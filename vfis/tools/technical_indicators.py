@@ -11,15 +11,33 @@ STRICT RULES:
 - No forecasting
 
 This module computes technical indicators from stored OHLC data.
+
+IncrementalIndicatorEngine carries the recurrence state of every indicator
+(EMA values, the last close, and the rolling windows behind SMA, RSI,
+Bollinger and Stochastic) from one bar to the next. The state is persisted
+per ticker in technical_indicator_state, so a daily run only processes the
+bars after the last stored date. A full recompute runs the same engine from
+an empty state, which makes incremental and full results identical: rolling
+values are computed from the window contents alone (math.fsum), never from
+a running sum that depends on earlier history.
 """
 
+import json
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+import math
+from collections import deque
+from typing import List, Dict, Any, Iterable, Optional, Sequence, Tuple
 from datetime import date, datetime, timedelta
 import pandas as pd
 import numpy as np
+from psycopg2.extras import Json, execute_values
 
 from tradingagents.database.connection import get_db_connection
+from tradingagents.database.schema_registry import (
+    is_table_verified,
+    mark_table_ready,
+    invalidate_schema_cache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -272,6 +290,9 @@ class TechnicalIndicators:
         """
         Compute all technical indicators for the given date range.
         
+        Runs IncrementalIndicatorEngine from an empty state over the range,
+        so the values match an incremental run over the same bars.
+        
         Returns:
             DataFrame with all indicator values
         """
@@ -282,39 +303,378 @@ class TechnicalIndicators:
             logger.warning(f"No OHLC data available for {self.ticker}")
             return pd.DataFrame()
         
-        close = ohlc_df['close']
-        high = ohlc_df['high']
-        low = ohlc_df['low']
-        
-        # Initialize result DataFrame
-        result_df = pd.DataFrame(index=ohlc_df.index)
-        result_df['close'] = close
-        
-        # Compute indicators
-        result_df['sma_20'] = self.compute_sma(close, 20)
-        result_df['sma_50'] = self.compute_sma(close, 50)
-        result_df['sma_200'] = self.compute_sma(close, 200)
-        
-        result_df['ema_12'] = self.compute_ema(close, 12)
-        result_df['ema_26'] = self.compute_ema(close, 26)
-        
-        result_df['rsi'] = self.compute_rsi(close, 14)
+        engine = IncrementalIndicatorEngine()
+        return engine.update(
+            (idx, row['high'], row['low'], row['close'])
+            for idx, row in ohlc_df.iterrows()
+        )
+
+
+# Indicator series produced by IncrementalIndicatorEngine, in storage order
+INDICATOR_NAMES = [
+    'sma_20', 'sma_50', 'sma_200',
+    'ema_12', 'ema_26',
+    'rsi',
+    'macd', 'macd_signal', 'macd_histogram',
+    'bb_upper', 'bb_middle', 'bb_lower',
+    'stoch_k', 'stoch_d'
+]
+
+# Bump when an indicator definition changes; stored states of another
+# version are discarded and the ticker is recomputed in full
+ENGINE_VERSION = 1
+
+INDICATOR_STATE_TABLE = 'technical_indicator_state'
+
+_NAN = float('nan')
+
+
+def _ema_step(previous: Optional[float], value: float, span: int) -> float:
+    """
+    One step of pandas ewm(span, adjust=False).mean().
+    
+    Mirrors the pandas recurrence operation for operation (including the
+    constant-series shortcut) so the engine reproduces compute_ema().
+    """
+    if previous is None:
+        return value
+    alpha = 2.0 / (span + 1.0)
+    old_weight = 1.0 - alpha
+    if previous == value:
+        return previous
+    return (old_weight * previous + alpha * value) / (old_weight + alpha)
+
+
+def _window_mean(window: Sequence[float], size: int) -> float:
+    """Mean of a full window, NaN while warming up or if it holds a NaN."""
+    if len(window) < size:
+        return _NAN
+    return math.fsum(window) / size
+
+
+def _window_std(window: Sequence[float], size: int, mean: float) -> float:
+    """Sample standard deviation (ddof=1) of a full window."""
+    if len(window) < size or math.isnan(mean):
+        return _NAN
+    return math.sqrt(math.fsum((x - mean) ** 2 for x in window) / (size - 1))
+
+
+class IncrementalIndicatorEngine:
+    """
+    Stateful indicator computation, one bar at a time.
+    
+    Definitions match the TechnicalIndicators.compute_* methods:
+    SMA 20/50/200, EMA 12/26, RSI 14 (rolling mean of gains and losses),
+    MACD 12/26/9, Bollinger 20/2 and Stochastic 14/3. The state holds
+    only what the next bar needs (at most 200 closes), so advancing by N
+    bars costs O(N) regardless of history length.
+    """
+    
+    def __init__(self, state: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the engine.
         
-        macd = self.compute_macd(close)
-        result_df['macd'] = macd['macd']
-        result_df['macd_signal'] = macd['signal']
-        result_df['macd_histogram'] = macd['histogram']
+        Args:
+            state: State from to_state() (default: no history)
+        """
+        state = state or {}
+        self.last_date: Optional[date] = (
+            date.fromisoformat(state['last_date']) if state.get('last_date') else None
+        )
+        self.bar_count: int = state.get('bar_count', 0)
+        self.prev_close: Optional[float] = state.get('prev_close')
+        self.ema: Dict[str, Optional[float]] = {
+            'ema_12': None, 'ema_26': None, 'macd_signal': None,
+            **state.get('ema', {})
+        }
+        self.closes = self._window(state, 'closes', 200)
+        self.highs = self._window(state, 'highs', 14)
+        self.lows = self._window(state, 'lows', 14)
+        self.gains = self._window(state, 'gains', 14)
+        self.losses = self._window(state, 'losses', 14)
+        self.stoch_k = self._window(state, 'stoch_k', 3)
+    
+    @staticmethod
+    def _window(state: Dict[str, Any], key: str, size: int) -> deque:
+        # NaN is stored as null (JSONB has no NaN)
+        return deque((_NAN if v is None else v for v in state.get(key, [])), maxlen=size)
+    
+    @staticmethod
+    def _dump(window: deque) -> List[Optional[float]]:
+        return [None if math.isnan(v) else v for v in window]
+    
+    def to_state(self) -> Dict[str, Any]:
+        """JSON-serializable state for technical_indicator_state."""
+        return {
+            'version': ENGINE_VERSION,
+            'last_date': self.last_date.isoformat() if self.last_date else None,
+            'bar_count': self.bar_count,
+            'prev_close': self.prev_close,
+            'ema': dict(self.ema),
+            'closes': self._dump(self.closes),
+            'highs': self._dump(self.highs),
+            'lows': self._dump(self.lows),
+            'gains': self._dump(self.gains),
+            'losses': self._dump(self.losses),
+            'stoch_k': self._dump(self.stoch_k),
+        }
+    
+    def step(self, high: float, low: float, close: float) -> Dict[str, float]:
+        """
+        Advance by one bar.
         
-        bb = self.compute_bollinger_bands(close)
-        result_df['bb_upper'] = bb['upper']
-        result_df['bb_middle'] = bb['middle']
-        result_df['bb_lower'] = bb['lower']
+        Returns:
+            Indicator name -> value for this bar (NaN while warming up)
+        """
+        self.closes.append(close)
+        self.highs.append(high)
+        self.lows.append(low)
+        
+        # SMA over the trailing closes
+        closes = list(self.closes)
+        values = {}
+        for window in (20, 50, 200):
+            values[f'sma_{window}'] = _window_mean(closes[-window:], window)
+        
+        # EMA / MACD
+        ema_12 = self.ema['ema_12'] = _ema_step(self.ema['ema_12'], close, 12)
+        ema_26 = self.ema['ema_26'] = _ema_step(self.ema['ema_26'], close, 26)
+        macd = ema_12 - ema_26
+        signal = self.ema['macd_signal'] = _ema_step(self.ema['macd_signal'], macd, 9)
+        values.update({
+            'ema_12': ema_12,
+            'ema_26': ema_26,
+            'macd': macd,
+            'macd_signal': signal,
+            'macd_histogram': macd - signal,
+        })
+        
+        # RSI: the first bar has no change and counts as zero gain/loss
+        delta = 0.0 if self.prev_close is None else close - self.prev_close
+        self.gains.append(delta if delta > 0 else 0.0)
+        self.losses.append(-delta if delta < 0 else 0.0)
+        self.prev_close = close
+        avg_gain = _window_mean(self.gains, 14)
+        avg_loss = _window_mean(self.losses, 14)
+        if math.isnan(avg_gain) or math.isnan(avg_loss):
+            rsi = _NAN
+        elif avg_loss == 0:
+            rsi = 100.0 if avg_gain > 0 else _NAN
+        else:
+            rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+        values['rsi'] = rsi
+        
+        # Bollinger Bands
+        middle = values['sma_20']
+        std = _window_std(closes[-20:], 20, middle)
+        values['bb_upper'] = middle + (std * 2.0)
+        values['bb_middle'] = middle
+        values['bb_lower'] = middle - (std * 2.0)
+        
+        # Stochastic Oscillator
+        if len(self.lows) < 14:
+            k_percent = _NAN
+        else:
+            low_min = min(self.lows)
+            price_range = max(self.highs) - low_min
+            k_percent = 100 * (close - low_min) / price_range if price_range else _NAN
+        self.stoch_k.append(k_percent)
+        values['stoch_k'] = k_percent
+        values['stoch_d'] = _window_mean(self.stoch_k, 3)
+        
+        self.bar_count += 1
+        return values
+    
+    def update(self, bars: Iterable[Tuple[Any, Any, Any, Any]]) -> pd.DataFrame:
+        """
+        Advance over bars in date order.
         
-        stoch = self.compute_stochastic(high, low, close)
-        result_df['stoch_k'] = stoch['k']
-        result_df['stoch_d'] = stoch['d']
+        Args:
+            bars: (trade_date, high, low, close) tuples after last_date
         
-        return result_df
+        Returns:
+            DataFrame indexed by date with 'close' and INDICATOR_NAMES columns
+        """
+        dates, rows = [], []
+        for trade_date, high, low, close in bars:
+            trade_date = pd.Timestamp(trade_date).date()
+            if self.last_date is not None and trade_date <= self.last_date:
+                continue
+            close = float(close)
+            values = self.step(float(high), float(low), close)
+            values['close'] = close
+            rows.append(values)
+            dates.append(pd.Timestamp(trade_date))
+            self.last_date = trade_date
+        
+        return pd.DataFrame(rows, index=pd.DatetimeIndex(dates, name='date'), columns=['close'] + INDICATOR_NAMES)
+
+
+def ensure_indicator_state_table() -> bool:
+    """
+    Create the technical_indicator_state table if it does not exist.
+    
+    Returns:
+        True if the table exists or was created, False on error.
+    """
+    if is_table_verified(INDICATOR_STATE_TABLE):
+        return True
+    
+    try:
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    CREATE TABLE IF NOT EXISTS technical_indicator_state (
+                        ticker VARCHAR(20) PRIMARY KEY,
+                        last_date DATE NOT NULL,
+                        bar_count INTEGER NOT NULL,
+                        engine_version INTEGER NOT NULL,
+                        state JSONB NOT NULL,
+                        updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+                    );
+                """)
+        mark_table_ready(INDICATOR_STATE_TABLE)
+        return True
+    except Exception as e:
+        invalidate_schema_cache(INDICATOR_STATE_TABLE)
+        logger.error(f"Failed to ensure technical_indicator_state table: {e}")
+        return False
+
+
+def lock_indicator_state(cur, ticker: str) -> None:
+    """
+    Serialize indicator runs for a ticker until the caller's transaction ends.
+    
+    An advisory lock also covers the first run, when no state row exists yet.
+    """
+    cur.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", (f"{INDICATOR_STATE_TABLE}:{ticker.upper()}",))
+
+
+def load_indicator_state(cur, ticker: str) -> Optional[Dict[str, Any]]:
+    """
+    Load a ticker's engine state within the caller's transaction.
+    
+    Returns:
+        State dict, or None if missing or written by another ENGINE_VERSION
+    """
+    cur.execute("""
+        SELECT engine_version, state FROM technical_indicator_state WHERE ticker = %s
+    """, (ticker.upper(),))
+    row = cur.fetchone()
+    if not row or row[0] != ENGINE_VERSION:
+        return None
+    return row[1] if isinstance(row[1], dict) else json.loads(row[1])
+
+
+def save_indicator_state(cur, ticker: str, engine: IncrementalIndicatorEngine) -> None:
+    """Store a ticker's engine state within the caller's transaction."""
+    if engine.last_date is None:
+        return
+    cur.execute("""
+        INSERT INTO technical_indicator_state
+        (ticker, last_date, bar_count, engine_version, state)
+        VALUES (%s, %s, %s, %s, %s)
+        ON CONFLICT (ticker) DO UPDATE
+        SET last_date = EXCLUDED.last_date,
+            bar_count = EXCLUDED.bar_count,
+            engine_version = EXCLUDED.engine_version,
+            state = EXCLUDED.state,
+            updated_at = CURRENT_TIMESTAMP
+    """, (ticker.upper(), engine.last_date, engine.bar_count, ENGINE_VERSION, Json(engine.to_state())))
+
+
+def fetch_ohlc_bars(
+    cur,
+    ticker: str,
+    end_date: date,
+    after: Optional[date] = None
+) -> List[Tuple[date, Any, Any, Any]]:
+    """
+    Read (trade_date, high, low, close) bars from ohlc_data.
+    
+    Args:
+        cur: Database cursor
+        ticker: Company ticker symbol
+        end_date: Last date (inclusive)
+        after: Only bars after this date (default: full history)
+    
+    Returns:
+        Bars in date order (empty if ohlc_data does not exist)
+    """
+    cur.execute("""
+        SELECT EXISTS (
+            SELECT FROM information_schema.tables
+            WHERE table_name = 'ohlc_data'
+        );
+    """)
+    if not cur.fetchone()[0]:
+        logger.warning("ohlc_data table does not exist. Cannot compute indicators.")
+        return []
+    
+    cur.execute("""
+        SELECT trade_date, high_price, low_price, close_price
+        FROM ohlc_data
+        WHERE ticker = %s
+        AND trade_date <= %s
+        AND (%s::date IS NULL OR trade_date > %s::date)
+        ORDER BY trade_date ASC
+    """, (ticker.upper(), end_date, after, after))
+    return cur.fetchall()
+
+
+def get_company_id(cur, ticker: str) -> Optional[int]:
+    """Active company id for a ticker, or None."""
+    cur.execute("""
+        SELECT id FROM companies WHERE ticker_symbol = %s AND is_active = TRUE
+    """, (ticker.upper(),))
+    result = cur.fetchone()
+    return result[0] if result else None
+
+
+def upsert_indicator_rows(cur, rows: List[Tuple[int, str, float, date, str]]) -> int:
+    """
+    Upsert indicator values in one set-based statement.
+    
+    Args:
+        cur: Cursor of the caller's transaction
+        rows: (company_id, indicator_name, indicator_value, calculated_date, source)
+    
+    Returns:
+        Number of rows written
+    """
+    if not rows:
+        return 0
+    execute_values(cur, """
+        INSERT INTO technical_indicators
+        (company_id, indicator_name, indicator_value, calculated_date, source)
+        VALUES %s
+        ON CONFLICT (company_id, indicator_name, calculated_date) DO UPDATE
+        SET indicator_value = EXCLUDED.indicator_value,
+            source = EXCLUDED.source,
+            updated_at = CURRENT_TIMESTAMP
+    """, rows, page_size=len(rows))
+    return len(rows)
+
+
+def indicator_rows(
+    company_id: int,
+    indicators_df: pd.DataFrame,
+    source: str = 'computed',
+    indicator_names: Optional[List[str]] = None
+) -> List[Tuple[int, str, float, date, str]]:
+    """
+    Flatten an indicator DataFrame (date index) into upsert rows, skipping NaN.
+    """
+    rows = []
+    names = [n for n in (indicator_names or INDICATOR_NAMES) if n in indicators_df.columns]
+    for calc_date, values in zip(indicators_df.index, indicators_df[names].itertuples(index=False)):
+        calc_date = calc_date.date() if isinstance(calc_date, pd.Timestamp) else calc_date
+        for name, value in zip(names, values):
+            # Skip NaN values
+            if value is None or pd.isna(value):
+                continue
+            rows.append((company_id, name, float(value), calc_date, source))
+    return rows
 
 
 def store_technical_indicators(
@@ -334,67 +694,33 @@ def store_technical_indicators(
         indicator_name: Name of indicator (e.g., 'SMA_20', 'RSI')
         indicator_values: Series with date index and indicator values
         source: Source of data ('computed' for calculated indicators)
-        calculated_date: Date when calculated (defaults to today)
-        
+        calculated_date: Date used for non-timestamp index entries (defaults to today)
+    
     Returns:
         Number of records inserted
     """
-    from tradingagents.database.connection import get_db_connection
-    
-    # Get company ID
-    with get_db_connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute("""
-                SELECT id FROM companies WHERE ticker_symbol = %s AND is_active = TRUE
-            """, (ticker.upper(),))
-            result = cur.fetchone()
-            if not result:
-                logger.error(f"Company {ticker} not found in database")
-                return 0
-            company_id = result[0]
-    
-    # Get company ID
-    company = FinancialDataAccess.get_company_by_ticker(ticker)
-    if not company:
-        logger.error(f"Company {ticker} not found in database")
-        return 0
-    
-    
     if calculated_date is None:
         calculated_date = date.today()
     
-    records_inserted = 0
-    
     with get_db_connection() as conn:
         with conn.cursor() as cur:
-            for calc_date, value in indicator_values.items():
-                # Skip NaN values
-                if pd.isna(value):
-                    continue
-                
-                try:
-                    cur.execute("""
-                        INSERT INTO technical_indicators 
-                        (company_id, indicator_name, indicator_value, calculated_date, source)
-                        VALUES (%s, %s, %s, %s, %s)
-                        ON CONFLICT (company_id, indicator_name, calculated_date) DO UPDATE
-                        SET indicator_value = EXCLUDED.indicator_value,
-                            source = EXCLUDED.source,
-                            updated_at = CURRENT_TIMESTAMP
-                    """, (
-                        company_id,
-                        indicator_name,
-                        float(value),
-                        calc_date.date() if isinstance(calc_date, pd.Timestamp) else calculated_date,
-                        source
-                    ))
-                    records_inserted += 1
-                except Exception as e:
-                    logger.warning(f"Failed to insert indicator {indicator_name} for {calc_date}: {e}")
-                    continue
+            company_id = get_company_id(cur, ticker)
+            if company_id is None:
+                logger.error(f"Company {ticker} not found in database")
+                return 0
             
-            conn.commit()
+            rows = [
+                (
+                    company_id,
+                    indicator_name,
+                    float(value),
+                    calc_date.date() if isinstance(calc_date, pd.Timestamp) else calculated_date,
+                    source
+                )
+                for calc_date, value in indicator_values.items()
+                if not pd.isna(value)
+            ]
+            records_inserted = upsert_indicator_rows(cur, rows)
     
     logger.info(f"Stored {records_inserted} {indicator_name} values for {ticker}")
     return records_inserted
-